@@ -1,7 +1,11 @@
+import multiprocessing
+
 from obs_scene_helper.app import OBSSceneHelperApp
 
 
 def main():
+    # The file pipeline workers are spawned from the frozen executable as well
+    multiprocessing.freeze_support()
     OBSSceneHelperApp.run()
 
 
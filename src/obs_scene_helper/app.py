@@ -11,21 +11,33 @@ from obs_scene_helper.controller.obs.connection_doctor import ConnectionDoctor
 from obs_scene_helper.controller.system.display_list import DisplayList
 
 from obs_scene_helper.controller.actions.pause_on_screen_lock import PauseOnScreenLock
+from obs_scene_helper.controller.actions.pause_on_silence import PauseOnSilence
 from obs_scene_helper.controller.actions.switch_profile_and_scene_collection import SwitchProfileAndSceneCollection
 from obs_scene_helper.controller.actions.run_script_on_output_file_change import RunScriptOnOutputFileChange
+from obs_scene_helper.controller.actions.detect_frozen_sources import DetectFrozenSources
+from obs_scene_helper.controller.actions.notify_hooks import NotifyHooks
+from obs_scene_helper.controller.actions.process_finished_recordings import ProcessFinishedRecordings
+from obs_scene_helper.controller.actions.catalogue_recordings import CatalogueRecordings
+from obs_scene_helper.controller.actions.forecast_disk_space import ForecastDiskSpace
+from obs_scene_helper.controller.actions.fall_back_on_frame_drops import FallBackOnFrameDrops
 
 from obs_scene_helper.controller.system.log import Log as LogController
+from obs_scene_helper.controller.system.metrics import Metrics as MetricsController
 
 from obs_scene_helper.view.tray_icon import TrayIcon
 from obs_scene_helper.view.settings.obs import OBSSettingsDialog
 from obs_scene_helper.view.settings.osh import OSHSettingsDialog
 from obs_scene_helper.view.widgets.preset_list import PresetList
 from obs_scene_helper.view.widgets.logs import Logs as LogsWidget
+from obs_scene_helper.view.widgets.switch_traces import SwitchTraces as SwitchTracesWidget
+from obs_scene_helper.view.widgets.file_pipeline import FilePipeline as FilePipelineWidget
+from obs_scene_helper.view.widgets.catalogue import Catalogue as CatalogueWidget
 
 
 class OBSSceneHelperApp:
     def __init__(self):
         LogController.setup()
+        MetricsController.setup()
 
         self.app = QApplication(sys.argv)
         self.app.setQuitOnLastWindowClosed(False)
@@ -42,15 +54,35 @@ class OBSSceneHelperApp:
         self.tray_icon.signals.obs_settings_requested.connect(self._obs_settings_requested)
         self.tray_icon.signals.osh_settings_requested.connect(self._osh_settings_requested)
         self.tray_icon.signals.logs_requested.connect(self._logs_requested)
+        self.tray_icon.signals.switch_traces_requested.connect(self._switch_traces_requested)
+        self.tray_icon.signals.file_pipeline_requested.connect(self._file_pipeline_requested)
+        self.tray_icon.signals.catalogue_requested.connect(self._catalogue_requested)
 
         self._setup_platform_specifics()
 
-        self.pause_action = PauseOnScreenLock(self.obs_connection)
+        self.pause_action = PauseOnScreenLock(self.obs_connection, self.settings)
+        self.silence_pause_action = PauseOnSilence(self.obs_connection, self.settings)
         self.display_switch_action = SwitchProfileAndSceneCollection(self.obs_connection, self.display_list,
                                                                      self.settings)
         self.display_switch_action.preset_activated.connect(lambda x: self.tray_icon.preset_activated(x))
 
         self.run_script_action = RunScriptOnOutputFileChange(self.obs_connection, self.settings)
+        self.frozen_sources_action = DetectFrozenSources(self.obs_connection, self.settings)
+
+        self.hooks_action = NotifyHooks(self.obs_connection, self.settings)
+        self.display_switch_action.preset_activated.connect(self.hooks_action.preset_activated)
+
+        self.file_pipeline_action = ProcessFinishedRecordings(self.obs_connection, self.settings)
+
+        self.catalogue_action = CatalogueRecordings(self.obs_connection)
+        self.display_switch_action.preset_activated.connect(self.catalogue_action.preset_activated)
+
+        self.disk_forecast_action = ForecastDiskSpace(self.obs_connection, self.settings)
+        self.disk_forecast_action.warning.connect(lambda x: self.tray_icon.show_warning("Disk space", x))
+
+        self.quality_fallback_action = FallBackOnFrameDrops(self.obs_connection, self.display_switch_action,
+                                                            self.settings)
+        self.quality_fallback_action.warning.connect(lambda x: self.tray_icon.show_warning("Frame drops", x))
 
         if sys.platform == 'darwin':
             from obs_scene_helper.controller.actions.workarounds.macos.fix_inputs_after_recording_resume import \
@@ -63,6 +95,9 @@ class OBSSceneHelperApp:
 
         self.presets = None  # type: Optional[PresetList]
         self.logs = None  # type: Optional[LogsWidget]
+        self.switch_traces = None  # type: Optional[SwitchTracesWidget]
+        self.file_pipeline = None  # type: Optional[FilePipelineWidget]
+        self.catalogue = None  # type: Optional[CatalogueWidget]
 
     def _make_preset_list_window(self) -> PresetList:
         self.presets = PresetList(self.settings, self.obs_connection)
@@ -70,16 +105,40 @@ class OBSSceneHelperApp:
         return self.presets
 
     def _make_logs_window(self) -> LogsWidget:
-        self.logs = LogsWidget()
+        self.logs = LogsWidget(self.obs_connection.stats)
         self.logs.destroyed.connect(self._handle_logs_window_destroyed)
         return self.logs
 
+    def _make_switch_traces_window(self) -> SwitchTracesWidget:
+        self.switch_traces = SwitchTracesWidget(self.display_switch_action.traces)
+        self.switch_traces.destroyed.connect(self._handle_switch_traces_window_destroyed)
+        return self.switch_traces
+
+    def _make_file_pipeline_window(self) -> FilePipelineWidget:
+        self.file_pipeline = FilePipelineWidget(self.file_pipeline_action.pipeline.table)
+        self.file_pipeline.destroyed.connect(self._handle_file_pipeline_window_destroyed)
+        return self.file_pipeline
+
+    def _make_catalogue_window(self) -> CatalogueWidget:
+        self.catalogue = CatalogueWidget(self.catalogue_action.catalogue)
+        self.catalogue.destroyed.connect(self._handle_catalogue_window_destroyed)
+        return self.catalogue
+
     def _handle_presets_window_destroyed(self):
         self.presets = None
 
     def _handle_logs_window_destroyed(self):
         self.logs = None
 
+    def _handle_switch_traces_window_destroyed(self):
+        self.switch_traces = None
+
+    def _handle_file_pipeline_window_destroyed(self):
+        self.file_pipeline = None
+
+    def _handle_catalogue_window_destroyed(self):
+        self.catalogue = None
+
     # noinspection PyPackageRequirements,PyUnresolvedReferences
     @staticmethod
     def _setup_platform_specifics():
@@ -115,7 +174,7 @@ class OBSSceneHelperApp:
         dialog.exec()
 
     def _osh_settings_requested(self):
-        dialog = OSHSettingsDialog(self.settings)
+        dialog = OSHSettingsDialog(self.settings, self.obs_connection)
         dialog.exec()
 
     def _logs_requested(self):
@@ -127,6 +186,33 @@ class OBSSceneHelperApp:
         else:
             self.logs.close()
 
+    def _switch_traces_requested(self):
+        if self.switch_traces is None:
+            self.switch_traces = self._make_switch_traces_window()
+            self.switch_traces.show()
+            self.switch_traces.raise_()
+            self.switch_traces.activateWindow()
+        else:
+            self.switch_traces.close()
+
+    def _file_pipeline_requested(self):
+        if self.file_pipeline is None:
+            self.file_pipeline = self._make_file_pipeline_window()
+            self.file_pipeline.show()
+            self.file_pipeline.raise_()
+            self.file_pipeline.activateWindow()
+        else:
+            self.file_pipeline.close()
+
+    def _catalogue_requested(self):
+        if self.catalogue is None:
+            self.catalogue = self._make_catalogue_window()
+            self.catalogue.show()
+            self.catalogue.raise_()
+            self.catalogue.activateWindow()
+        else:
+            self.catalogue.close()
+
     @staticmethod
     def run():
         app = OBSSceneHelperApp()
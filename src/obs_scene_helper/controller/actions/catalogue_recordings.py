@@ -0,0 +1,70 @@
+import os
+import time
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, QCoreApplication
+
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.system.catalogue import Catalogue
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.model.catalogue.recorder import CatalogueRecorder
+from obs_scene_helper.model.settings.preset import Preset
+
+
+class CatalogueRecordings(QObject):
+    """
+    Record every recording session, its files, and the active preset, profile and scene collection in the catalogue.
+    """
+
+    LOG_NAME = 'cr'
+
+    def __init__(self, obs_connection: Connection, catalogue: Optional[Catalogue] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.obs_connection = obs_connection
+        self.obs_connection.recording.state_changed.connect(self._handle_record_state_change)
+        self.obs_connection.output_file.changed.connect(self._handle_output_file_change)
+        self.obs_connection.profiles.active_changed.connect(self._handle_profile_change)
+        self.obs_connection.scene_collections.active_changed.connect(self._handle_scene_collection_change)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        self.catalogue = catalogue if catalogue is not None else Catalogue()
+        self.recorder = CatalogueRecorder()
+        self.recorder.profile_changed(self.obs_connection.profiles.active)
+        self.recorder.scene_collection_changed(self.obs_connection.scene_collections.active)
+
+        self.log.debug('Initialized')
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.catalogue.shutdown)
+
+    def _current_size(self) -> Optional[int]:
+        if self.recorder.segment is None:
+            return None
+
+        try:
+            return os.path.getsize(self.recorder.segment)
+        except OSError:
+            # E.g. the output directory is on another machine
+            return None
+
+    def _handle_record_state_change(self, state: RecordingState):
+        size = self._current_size() if state == RecordingState.Stopped else None
+        self.catalogue.submit(self.recorder.recording_state_changed(state.value, time.time(), size))
+
+    def _handle_output_file_change(self, new_path: str):
+        self.catalogue.submit(self.recorder.output_file_changed(new_path, time.time(), self._current_size()))
+
+    def _handle_profile_change(self, profile: Optional[str]):
+        self.recorder.profile_changed(profile)
+
+    def _handle_scene_collection_change(self, scene_collection: Optional[str]):
+        self.recorder.scene_collection_changed(scene_collection)
+
+    def preset_activated(self, preset: Preset):
+        self.catalogue.submit(self.recorder.preset_activated(preset.name, preset.profile, preset.scene_collection,
+                                                             time.time()))
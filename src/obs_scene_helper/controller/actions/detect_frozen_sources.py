@@ -0,0 +1,176 @@
+import time
+
+import numpy as np
+
+from PySide6.QtCore import QObject, QTimer, QByteArray, Signal
+from PySide6.QtGui import QImage
+
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.obs.batch import BatchRequest, send_batch
+from obs_scene_helper.controller.obs.input_recovery import InputRecovery, DEFAULT_ACTIONS
+from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.system.log import Log
+
+from obs_scene_helper.model.image.freeze import FreezeDetector
+from obs_scene_helper.model.image.perceptual_hash import difference_hash
+
+
+class DetectFrozenSources(QObject):
+    """
+    Periodically take tiny screenshots of the selected sources while recording, and flag the sources whose picture
+    didn't change for a while. Flagged sources are restarted with the input recovery machinery (if enabled).
+
+    A picture that legitimately stays the same (slides, a document left on screen, ...) is flagged as well, hence the
+    automatic restart being opt-in. The screenshots are fetched with a single blocking batch on the GUI thread: its
+    round trip counts against the CPU budget, so a slow OBS stretches the sampling interval instead of the GUI
+    stalling every few seconds.
+    """
+
+    LOG_NAME = 'dfs'
+
+    # Names of the sources that were just detected as frozen
+    frozen = Signal(list)
+
+    def __init__(self, obs_connection: Connection, settings: Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.obs_connection = obs_connection
+        self.obs_connection.recording.state_changed.connect(self._handle_record_state_change)
+
+        self.settings = settings
+        self.settings.osh_changed.connect(self._handle_settings_change)
+
+        self._detector = FreezeDetector(self._config.window, self._config.max_distance)
+
+        self._recovery = InputRecovery(obs_connection, DEFAULT_ACTIONS, parent=self)
+
+        self._sample_timer = QTimer(self)
+        self._sample_timer.setSingleShot(True)
+        self._sample_timer.timeout.connect(self._sample)
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @property
+    def _config(self):
+        return self.settings.osh.frozen_sources
+
+    @property
+    def _should_run(self) -> bool:
+        return (self._config.enabled and len(self._config.sources) != 0 and
+                self.obs_connection.recording.state == RecordingState.Active)
+
+    def _handle_settings_change(self):
+        self._restart()
+
+    def _handle_record_state_change(self, _: RecordingState):
+        self._restart()
+
+    def _restart(self):
+        # Frames captured before a pause or a settings change are not comparable with the new ones
+        self._detector = FreezeDetector(self._config.window, self._config.max_distance)
+
+        if self._should_run:
+            if not self._sample_timer.isActive():
+                self.log.debug('Starting frozen source detection')
+                self._sample_timer.start(self._config.sample_interval * 1000)
+        else:
+            self._sample_timer.stop()
+
+    @staticmethod
+    def _decode_thumbnail(image_data: str, min_height: int) -> np.ndarray:
+        # The image data is a data URI: "data:image/png;base64,..."
+        encoded = image_data.split(',', 1)[-1]
+        image = QImage.fromData(QByteArray.fromBase64(encoded.encode('ascii')))
+        if image.isNull():
+            raise ValueError('Invalid thumbnail data')
+
+        if image.height() < min_height:
+            # Very wide source: stretch it, so every source gets a hash of the same size
+            image = image.scaled(image.width(), min_height)
+
+        image = image.convertToFormat(QImage.Format.Format_Grayscale8)
+        pixels = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.sizeInBytes())
+        return pixels.reshape(image.height(), image.bytesPerLine())[:, :image.width()]
+
+    def _fetch_hashes(self, names: list[str]) -> dict[str, np.ndarray]:
+        # Only the width is set, OBS keeps the aspect ratio of the source
+        hash_size = self._config.effective_hash_size
+        requests = [BatchRequest('GetSourceScreenshot', {
+            'sourceName': name,
+            'imageFormat': 'png',
+            'imageWidth': self._config.thumbnail_size,
+            'imageCompressionQuality': -1,
+        }) for name in names]
+
+        results = send_batch(self.obs_connection.ws, requests)
+
+        hashes = {}
+        for name, result in zip(names, results):
+            if not result.success:
+                self.log.warning(f'Error taking a screenshot of "{name}": {result.comment}')
+                continue
+
+            try:
+                thumbnail = self._decode_thumbnail(result.data['imageData'], hash_size)
+                hashes[name] = difference_hash(thumbnail, hash_size)
+            except Exception as e:
+                self.log.warning(f'Error hashing a screenshot of "{name}": {str(e)}')
+
+        return hashes
+
+    def _sample(self):
+        if not self._should_run:
+            return
+
+        started = time.perf_counter()
+
+        existing = {x.name for x in self.obs_connection.inputs.list}
+        names = [x for x in self._config.sources if x in existing]
+
+        try:
+            hashes = self._fetch_hashes(names)
+        except Exception as e:
+            self.log.warning(f'Error sampling sources: {str(e)}')
+            hashes = {}
+
+        self._update_states(hashes)
+        self._schedule_next(time.perf_counter() - started)
+
+    def _update_states(self, hashes: dict[str, np.ndarray]):
+        now = time.monotonic()
+        frozen, thawed = self._detector.update(hashes, now)
+
+        for name in thawed:
+            self.log.info(f'Source "{name}" is not frozen anymore')
+
+        if len(frozen) != 0:
+            self._handle_frozen(frozen, now)
+
+    def _handle_frozen(self, names: list[str], now: float):
+        self.log.warning(f'Frozen sources detected: {names}')
+        self.frozen.emit(names)
+
+        if not self._config.auto_fix:
+            return
+
+        entries = [x for x in self.obs_connection.inputs.list if x.name in names and self._recovery.supports(x)]
+        if len(entries) == 0:
+            self.log.info('No recovery action for the frozen sources')
+            return
+
+        if self._recovery.recover(entries):
+            # Give the restarted captures a full window before flagging them again
+            self._detector.rearm([x.name for x in entries], now)
+
+    def _schedule_next(self, elapsed: float):
+        interval = self._config.sample_interval
+        budget = self._config.cpu_budget / 100
+
+        # Stay within the CPU budget by sampling less often if a single round takes too long
+        if budget > 0 and elapsed / budget > interval:
+            interval = elapsed / budget
+            self.log.debug(f'Sampling took {elapsed * 1000:.1f} ms, next sample in {interval:.1f} s')
+
+        self._sample_timer.start(int(interval * 1000))
@@ -0,0 +1,156 @@
+import math
+import time
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from obs_scene_helper.controller.actions.switch_profile_and_scene_collection import SwitchProfileAndSceneCollection
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.metrics.obs_stats import StatsSnapshot, summarize
+from obs_scene_helper.model.settings.preset import Preset
+from obs_scene_helper.model.switch.fallback import FallbackDecision, FallbackPolicy
+
+
+class FallBackOnFrameDrops(QObject):
+    """
+    Switch to a lighter "fallback" profile and/or scene collection once OBS keeps dropping frames while recording
+    (e.g. the encoder can't keep up after docking to a 4K display), and back to the previous preset once the drops
+    have stopped for a while.
+
+    The drop rate is computed from the OBS stats sampled by the connection, over the configured window: the larger
+    of the frames skipped by the renderer and by the outputs. The switch itself goes through the regular preset
+    switching, so it is traced and planned like any other.
+    """
+
+    LOG_NAME = 'qfb'
+
+    FALLBACK_UUID = 'quality-fallback'
+
+    # Part of the window the stats have to cover before the drop rate is trusted
+    MIN_WINDOW_COVERAGE = 0.9
+
+    warning = Signal(str)
+
+    def __init__(self, obs_connection: Connection, switch_action: SwitchProfileAndSceneCollection, settings: Settings,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.settings = settings
+        self.settings.osh_changed.connect(self._handle_settings_change)
+
+        self.obs_connection = obs_connection
+        self.obs_connection.stats.updated.connect(self._handle_stats)
+
+        self.switch_action = switch_action
+        self.switch_action.preset_activated.connect(self._handle_preset_activated)
+
+        fallback = self._settings
+        self.policy = FallbackPolicy(fallback.max_drop, fallback.restore_below, fallback.restore_after,
+                                     fallback.cooldown)
+
+        # Last preset activated by the display configuration, restored once the drops stop
+        self._previous = None  # type: Optional[Preset]
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @property
+    def _settings(self):
+        return self.settings.osh.quality_fallback
+
+    def _handle_settings_change(self):
+        fallback = self._settings
+        self.policy.configure(fallback.max_drop, fallback.restore_below, fallback.restore_after, fallback.cooldown)
+
+    def _handle_preset_activated(self, preset: Preset):
+        if preset.uuid == self.FALLBACK_UUID:
+            return
+
+        if self.policy.fallen_back:
+            self.log.info(f'Preset {preset.name} activated, no longer in fallback')
+
+        self._previous = preset
+        self.policy.reset()
+
+    @staticmethod
+    def _drop_rate(snapshot: StatsSnapshot) -> float:
+        values = [x for x in [snapshot.render_skip, snapshot.output_skip] if not math.isnan(x)]
+        return max(values) if len(values) != 0 else math.nan
+
+    @staticmethod
+    def _format_metrics(drop_rate: float, snapshot: StatsSnapshot) -> str:
+        return (f'{drop_rate:.2f} % of the frames dropped over {snapshot.window} s '
+                f'(render lag: {snapshot.render_skip:.2f} %, encoding lag: {snapshot.output_skip:.2f} %, '
+                f'render time: {snapshot.render_time:.2f} ms, OBS CPU: {snapshot.cpu:.1f} %, '
+                f'FPS: {snapshot.fps:.1f})')
+
+    def _handle_stats(self, _: StatsSnapshot):
+        if not self._settings.enabled or self.obs_connection.recording.state != RecordingState.Active:
+            return
+
+        series = self.obs_connection.stats.series
+        window = self._settings.window
+        timestamps = series.timestamps(window)
+        if len(timestamps) < 2 or timestamps[-1] - timestamps[0] < window * self.MIN_WINDOW_COVERAGE:
+            # Not enough history to tell a sustained drop from a hiccup
+            return
+
+        snapshot = summarize(series, window)
+        drop_rate = self._drop_rate(snapshot)
+        # Hundredths of a percent, gauges are integers
+        Metrics.gauge('qfb.drop_rate').set(int(drop_rate * 100) if not math.isnan(drop_rate) else -1)
+
+        decision = self.policy.update(time.monotonic(), drop_rate)
+        if decision == FallbackDecision.Fallback:
+            self._fall_back(drop_rate, snapshot)
+        elif decision == FallbackDecision.Restore:
+            self._restore(drop_rate, snapshot)
+
+    def _fall_back(self, drop_rate: float, snapshot: StatsSnapshot):
+        active_profile = self.obs_connection.profiles.active
+        active_scene_collection = self.obs_connection.scene_collections.active
+        metrics = self._format_metrics(drop_rate, snapshot)
+
+        if active_profile is None or active_scene_collection is None:
+            self.log.warning(f'{metrics}, but the active profile is unknown: not falling back')
+            self.policy.reset()
+            return
+
+        profile = self._settings.profile or active_profile
+        scene_collection = self._settings.scene_collection or active_scene_collection
+        if (profile, scene_collection) == (active_profile, active_scene_collection):
+            self.log.warning(f'{metrics}, but the fallback preset is already active')
+            self.policy.reset()
+            return
+
+        previous = self._previous
+        if previous is None or (previous.profile, previous.scene_collection) != (active_profile,
+                                                                                 active_scene_collection):
+            # Switched manually, or no preset matched the displays: go back to whatever was active
+            self._previous = Preset('', f'{active_profile} / {active_scene_collection}', [], active_profile,
+                                    active_scene_collection)
+
+        fallback = Preset(self.FALLBACK_UUID, 'Quality fallback', [], profile, scene_collection)
+
+        self.log.warning(f'{metrics}: falling back to {profile} / {scene_collection}')
+        if not self.switch_action.activate(fallback, 'frame drops'):
+            self.policy.reset()
+            return
+
+        Metrics.counter('qfb.fallbacks').increment()
+        self.warning.emit(f'OBS is dropping frames ({drop_rate:.1f} %), switched to the fallback preset')
+
+    def _restore(self, drop_rate: float, snapshot: StatsSnapshot):
+        previous = self._previous
+        metrics = self._format_metrics(drop_rate, snapshot)
+        self.log.info(f'{metrics}: restoring {previous.name} ({previous.profile} / {previous.scene_collection})')
+        if not self.switch_action.activate(previous, 'frame drops stopped'):
+            self.policy.fallen_back = True
+            return
+
+        Metrics.counter('qfb.restores').increment()
@@ -0,0 +1,185 @@
+import os
+import shutil
+import time
+
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.disk.forecast import DiskForecaster, DiskSample, HorizonAlarm
+
+MIB = 1024 * 1024
+
+
+class ForecastDiskSpace(QObject):
+    """
+    Forecast when the recording volume is going to be full, warn at the configured horizons, and optionally split or
+    stop the recording before that happens.
+
+    Sampling is cheap: the free space of the volume and the size of the current recording file. If the output
+    directory is not accessible (e.g. OBS is running on another machine), the free space is taken from the OBS stats.
+    """
+
+    LOG_NAME = 'dsf'
+
+    SAMPLE_INTERVAL_MS = 5000
+    WINDOW = 120.0  # Seconds
+
+    ACTION_NONE = 'none'
+    ACTION_SPLIT = 'split'
+    ACTION_STOP = 'stop'
+
+    # A split doesn't free any space: if the disk keeps filling, the recording is stopped at this share of the horizon
+    STOP_AFTER_SPLIT = 0.25
+
+    warning = Signal(str)
+
+    def __init__(self, obs_connection: Connection, settings: Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.settings = settings
+        self.settings.osh_changed.connect(self._handle_settings_change)
+
+        self.obs_connection = obs_connection
+        self.obs_connection.recording.state_changed.connect(self._handle_record_state_change)
+
+        self.forecaster = DiskForecaster(self.WINDOW)
+        self.warn_alarm = HorizonAlarm([])
+        self.action_alarm = HorizonAlarm([])
+        self._configure_alarms()
+
+        self.sample_timer = QTimer(self)
+        self.sample_timer.timeout.connect(self._sample)
+
+        self._using_stats = False
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @property
+    def _settings(self):
+        return self.settings.osh.disk_forecast
+
+    @property
+    def _action_horizon(self) -> float:
+        return self._settings.action_at * 60
+
+    def _configure_alarms(self):
+        self.warn_alarm = HorizonAlarm([x * 60 for x in self._settings.warn_at if x > 0])
+
+        horizons = []
+        if self._settings.action_at > 0:
+            horizons.append(self._action_horizon)
+            if self._settings.action == self.ACTION_SPLIT:
+                horizons.append(self._action_horizon * self.STOP_AFTER_SPLIT)
+        self.action_alarm = HorizonAlarm(horizons)
+
+    def _handle_settings_change(self):
+        self._configure_alarms()
+        self._update_sampling()
+
+    def _handle_record_state_change(self, _: RecordingState):
+        self._update_sampling()
+
+    def _update_sampling(self):
+        active = self.obs_connection.recording.state == RecordingState.Active
+        if self._settings.enabled and active:
+            if not self.sample_timer.isActive():
+                self.log.debug('Recording, sampling the disk space')
+                self.sample_timer.start(self.SAMPLE_INTERVAL_MS)
+                self._sample()
+            return
+
+        # Paused or stopped: nothing is being written, start over once the recording is active again
+        self.sample_timer.stop()
+        self.forecaster.reset()
+        self.warn_alarm.reset()
+        self.action_alarm.reset()
+
+    def _read_local(self, path: str) -> Tuple[int, int]:
+        free = shutil.disk_usage(os.path.dirname(path)).free
+        size = os.stat(path).st_size
+        return free, size
+
+    def _read_stats(self) -> Optional[int]:
+        ws = self.obs_connection.ws
+        if ws is None:
+            return None
+
+        try:
+            # Reported in MiB
+            return int(ws.get_stats().available_disk_space * MIB)
+        except Exception as e:
+            self.log.warning(f'Error getting OBS stats: {str(e)}')
+            return None
+
+    def _sample(self):
+        path = self.obs_connection.output_file.file
+        sample = None
+
+        if path is not None:
+            try:
+                free, size = self._read_local(path)
+                sample = DiskSample(time.monotonic(), free, size)
+                self._using_stats = False
+            except OSError:
+                pass
+
+        if sample is None:
+            free = self._read_stats()
+            if free is None:
+                return
+
+            if not self._using_stats:
+                self.log.info(f'Output file is not accessible ({path}), using the OBS stats')
+                self._using_stats = True
+            sample = DiskSample(time.monotonic(), free)
+
+        self.forecaster.add(sample)
+        self._check_forecast()
+
+    @staticmethod
+    def _format_forecast(time_to_full: float, free: int, rate: float) -> str:
+        return (f'Recording disk will be full in about {time_to_full / 60:.0f} minute(s) '
+                f'({free / (1024 * MIB):.1f} GiB free, writing {rate / MIB:.1f} MiB/s)')
+
+    def _check_forecast(self):
+        time_to_full = self.forecaster.time_to_full
+        Metrics.gauge('dsf.time_to_full').set(int(time_to_full) if time_to_full is not None else -1)
+
+        if self.warn_alarm.update(time_to_full) is not None:
+            message = self._format_forecast(time_to_full, self.forecaster.free, self.forecaster.rate)
+            self.log.warning(message)
+            self.warning.emit(message)
+
+        horizon = self.action_alarm.update(time_to_full)
+        if horizon is not None:
+            self._act(horizon)
+
+    def _act(self, horizon: float):
+        action = self._settings.action
+        recording = self.obs_connection.recording
+
+        if action == self.ACTION_SPLIT and horizon < self._action_horizon:
+            self.log.warning('Disk still filling up after the split')
+            action = self.ACTION_STOP
+
+        if action == self.ACTION_SPLIT:
+            self.log.warning('Disk almost full, splitting the recording file')
+            if recording.split():
+                self.warning.emit('Disk almost full: the recording file was split')
+                return
+
+            # Splitting is not possible, the file would be cut off anyway
+            self.log.warning('Splitting is not possible, stopping the recording instead')
+            action = self.ACTION_STOP
+
+        if action == self.ACTION_STOP:
+            self.log.warning('Disk almost full, stopping the recording')
+            recording.stop()
+            self.warning.emit('Disk almost full: the recording was stopped')
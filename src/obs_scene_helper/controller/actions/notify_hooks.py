@@ -0,0 +1,64 @@
+from typing import Optional
+
+from PySide6.QtCore import QObject, QCoreApplication
+
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.system.hooks import HookRunner
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.model.hooks.event import HookEvent, HookEventType
+from obs_scene_helper.model.settings.preset import Preset
+
+
+class NotifyHooks(QObject):
+    """
+    Forward the output file, recording state and preset activation events to the installed Python hooks.
+    """
+
+    LOG_NAME = 'nh'
+
+    def __init__(self, obs_connection: Connection, settings: Settings, runner: Optional[HookRunner] = None,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.settings = settings
+        self.settings.osh_changed.connect(self._handle_settings_change)
+
+        self.obs_connection = obs_connection
+        self.obs_connection.output_file.changed.connect(self._handle_output_file_change)
+        self.obs_connection.recording.state_changed.connect(self._handle_record_state_change)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        # Note: the hooks are only loaded once, a new hook directory is picked up on the next start
+        directory = self.settings.osh.hooks.directory
+        self.runner = runner if runner is not None else HookRunner(self._timeout, directory=directory or None)
+        self.log.debug(f'Initialized, hooks: {len(self.runner.names)}')
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.runner.shutdown)
+
+    @property
+    def _timeout(self) -> Optional[float]:
+        timeout = self.settings.osh.hooks.timeout
+        return timeout if timeout > 0 else None
+
+    def _handle_settings_change(self):
+        self.runner.timeout = self._timeout
+
+    def _notify(self, event_type: HookEventType, value: str):
+        if not self.settings.osh.hooks.enabled:
+            return
+
+        self.runner.notify(HookEvent(event_type, value))
+
+    def _handle_output_file_change(self, new_path: str):
+        self._notify(HookEventType.OutputFileChanged, new_path)
+
+    def _handle_record_state_change(self, state: RecordingState):
+        self._notify(HookEventType.RecordingStateChanged, state.value)
+
+    def preset_activated(self, preset: Preset):
+        self._notify(HookEventType.PresetActivated, preset.name)
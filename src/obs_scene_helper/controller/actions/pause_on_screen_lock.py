@@ -1,18 +1,25 @@
+import sys
+
 from enum import Enum
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer
 
 from obs_scene_helper.controller.obs.connection import Connection
 from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.settings.settings import Settings
 from obs_scene_helper.controller.system.screen_lock import ScreenLock
 
 from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
 
 
 class PauseOnScreenLock(QObject):
     """
-    - Pause the recording on a screen-locked event
+    - Pause the recording on a screen-locked event, once the screen stayed locked for the hold-off time
     - Resume the recording on a screen-unlocked event
+
+    A lock shorter than the hold-off never reaches OBS. Lock changes arriving while a pause or resume request is still
+    in flight are merged: the last lock state is applied once OBS reports the outcome of the current request.
     """
 
     LOG_NAME = 'posl'
@@ -22,7 +29,7 @@ class PauseOnScreenLock(QObject):
         WaitingForPauseEvent = 1
         WaitingForResumeEvent = 2
 
-    def __init__(self, obs_connection: Connection, *args, **kwargs):
+    def __init__(self, obs_connection: Connection, settings: Settings, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.state = PauseOnScreenLock.State.Idle
@@ -30,13 +37,25 @@ class PauseOnScreenLock(QObject):
         self.obs_connection = obs_connection
         self.obs_connection.recording.state_changed.connect(self._handle_record_state_change)
 
+        self.settings = settings
+
         self.screen_lock = ScreenLock()
         self.screen_lock.screen_locked.connect(self._handle_screen_locked)
         self.screen_lock.screen_unlocked.connect(self._handle_screen_unlocked)
 
+        self.hold_off_timer = QTimer(self)
+        self.hold_off_timer.setSingleShot(True)
+        self.hold_off_timer.timeout.connect(self._hold_off_expired)
+
+        self._locked = False
+
         self.log = Log.child(self.LOG_NAME)
         self.log.debug('Initialized')
 
+    @property
+    def _hold_off(self) -> float:
+        return self.settings.osh.screen_lock_pause.hold_off
+
     def _handle_record_state_change(self, new_state: RecordingState):
         self.log.debug(f'Handling record state change: {self.state} -> {new_state}')
 
@@ -54,34 +73,88 @@ class PauseOnScreenLock(QObject):
             self.state = PauseOnScreenLock.State.Idle
 
     def _pause_done(self):
-        # Nothing to do here
         self.state = PauseOnScreenLock.State.Idle
         self.log.info('Pause done')
 
+        if not self._locked:
+            # Unlocked while the pause request was in flight
+            Metrics.counter('posl.merged_requests').increment()
+            self.log.info('Screen unlocked in the meantime')
+            self._request_resume()
+
     def _resume_done(self):
         self.state = PauseOnScreenLock.State.Idle
         self.log.info('Resume done')
 
-    def _handle_screen_locked(self):
-        self.log.debug('Handling screen lock event')
-
-        if self.obs_connection.recording.state == RecordingState.Paused:
-            self.log.info('Screen lock: already paused')
-            return
+        if self._locked:
+            # Locked again while the resume request was in flight
+            Metrics.counter('posl.merged_requests').increment()
+            self.log.info('Screen locked in the meantime')
+            self._schedule_pause()
 
+    def _request_pause(self):
         self.log.info('Requesting pause')
         self.state = PauseOnScreenLock.State.WaitingForPauseEvent
         if not self.obs_connection.recording.pause():
             self.state = PauseOnScreenLock.State.Idle
 
+    def _request_resume(self):
+        self.log.info('Requesting resumption')
+        self.state = PauseOnScreenLock.State.WaitingForResumeEvent
+        if not self.obs_connection.recording.resume():
+            self.state = PauseOnScreenLock.State.Idle
+
+    def _schedule_pause(self):
+        if self.obs_connection.recording.state == RecordingState.Paused:
+            self.log.info('Screen lock: already paused')
+            return
+
+        if self._hold_off <= 0:
+            return self._request_pause()
+
+        self.log.info(f'Pausing if the screen stays locked for {self._hold_off:.1f} s')
+        self.hold_off_timer.start(int(self._hold_off * 1000))
+
+    def _hold_off_expired(self):
+        if self.obs_connection.recording.state != RecordingState.Active:
+            self.log.info(f'Screen lock: nothing to pause ({self.obs_connection.recording.state})')
+            return
+
+        self._request_pause()
+
+    def _handle_screen_locked(self):
+        self.log.debug('Handling screen lock event')
+        self._locked = True
+
+        if self.state != PauseOnScreenLock.State.Idle:
+            # Handled once the current request is done
+            self.log.info(f'Screen lock: request in flight ({self.state})')
+            return
+
+        self._schedule_pause()
+
     def _handle_screen_unlocked(self):
         self.log.debug('Handling screen unlock event')
+        self._locked = False
+
+        if self.hold_off_timer.isActive():
+            self.hold_off_timer.stop()
+
+            # Neither the pause nor the resume request (nor the capture fixes following the resume) are needed
+            Metrics.counter('posl.avoided_round_trips').increment()
+            if sys.platform == 'darwin':
+                Metrics.counter('posl.avoided_capture_restarts').increment()
+
+            self.log.info(f'Screen unlocked within the hold-off time, not pausing')
+            return
+
+        if self.state != PauseOnScreenLock.State.Idle:
+            # Handled once the current request is done
+            self.log.info(f'Screen unlock: request in flight ({self.state})')
+            return
 
         if self.obs_connection.recording.state == RecordingState.Active:
             self.log.info('Screen lock: already resumed')
             return
 
-        self.log.info('Requesting resumption')
-        self.state = PauseOnScreenLock.State.WaitingForResumeEvent
-        if not self.obs_connection.recording.resume():
-            self.state = PauseOnScreenLock.State.Idle
+        self._request_resume()
@@ -0,0 +1,197 @@
+import time
+
+from enum import Enum
+from typing import Optional
+
+from PySide6.QtCore import QObject
+
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.settings.settings import Settings
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+
+
+class PauseOnSilence(QObject):
+    """
+    - Pause the recording after all the selected inputs were silent for a while
+    - Resume the recording (only if it was paused by us) as soon as the audio on any of the inputs returns
+
+    The resume threshold is higher than the pause one, and the audio has to stay above it for a short time before
+    resuming, so background noise hovering around a single threshold doesn't make the recording flip-flop.
+    """
+
+    LOG_NAME = 'pos'
+
+    # Meter frames arrive every 50 ms, this makes sure consecutive checks overlap
+    FRAME_INTERVAL = 0.05
+
+    class State(Enum):
+        Idle = 0
+        WaitingForPauseEvent = 1
+        WaitingForResumeEvent = 2
+
+    def __init__(self, obs_connection: Connection, settings: Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.state = PauseOnSilence.State.Idle
+
+        self.obs_connection = obs_connection
+        self.obs_connection.recording.state_changed.connect(self._handle_record_state_change)
+
+        self.meters = obs_connection.audio_meters
+        self.meters.levels_changed.connect(self._handle_levels_change)
+
+        self.settings = settings
+        self.settings.osh_changed.connect(self._handle_settings_change)
+
+        self._paused_by_us = False
+        self._last_check = None  # type: Optional[float]
+        self._last_loud = None  # type: Optional[float]
+        self._loud_since = None  # type: Optional[float]
+        self._requested_at = None  # type: Optional[float]
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+        self._update_subscription()
+
+    @property
+    def _config(self):
+        return self.settings.osh.silence_pause
+
+    @property
+    def _enabled(self) -> bool:
+        return self._config.enabled and len(self._config.inputs) != 0
+
+    def _reset(self):
+        self._last_check = None
+        self._last_loud = None
+        self._loud_since = None
+
+    def _update_subscription(self):
+        self._reset()
+
+        if self._enabled:
+            self.meters.acquire(self)
+        else:
+            self.meters.release(self)
+
+    def _handle_settings_change(self):
+        self._update_subscription()
+
+    def _handle_record_state_change(self, new_state: RecordingState):
+        self.log.debug(f'Handling record state change: {self.state} -> {new_state}')
+
+        if self.state == PauseOnSilence.State.WaitingForPauseEvent and new_state == RecordingState.Paused:
+            return self._pause_done()
+
+        if self.state == PauseOnSilence.State.WaitingForResumeEvent and new_state == RecordingState.Active:
+            return self._resume_done()
+
+        if new_state == RecordingState.Active:
+            # Started or resumed by someone else: start counting the silence from scratch
+            self._paused_by_us = False
+            self._reset()
+
+        if self.state != PauseOnSilence.State.Idle and new_state in [RecordingState.Stopped,
+                                                                     RecordingState.Starting,
+                                                                     RecordingState.Stopping,
+                                                                     RecordingState.Unknown]:
+            self.log.debug(f'Inconsistent state: {self.state}')
+            self.state = PauseOnSilence.State.Idle
+
+        if new_state != RecordingState.Paused:
+            self._paused_by_us = False
+
+    def _pause_done(self):
+        self.state = PauseOnSilence.State.Idle
+        self._paused_by_us = True
+        self._reset()
+
+        timing = Metrics.timing('pos.pause_request')
+        timing.add(time.monotonic() - self._requested_at)
+        self.log.info(f'Pause done ({timing})')
+
+    def _resume_done(self):
+        self.state = PauseOnSilence.State.Idle
+        self._paused_by_us = False
+        self._reset()
+
+        timing = Metrics.timing('pos.resume_request')
+        timing.add(time.monotonic() - self._requested_at)
+        self.log.info(f'Resume done ({timing})')
+
+    def _selected_levels(self, threshold_db: float, now: float) -> list:
+        # Only look at the frames received since the previous check
+        window = now - self._last_check + self.FRAME_INTERVAL if self._last_check is not None else self.FRAME_INTERVAL
+        self._last_check = now
+
+        levels = self.meters.statistics(window, threshold_db)
+        return [levels[x] for x in self._config.inputs if x in levels]
+
+    def _handle_levels_change(self, _: dict):
+        if not self._enabled or self.state != PauseOnSilence.State.Idle:
+            return
+
+        recording_state = self.obs_connection.recording.state
+        if recording_state == RecordingState.Active:
+            self._check_silence()
+        elif recording_state == RecordingState.Paused and self._paused_by_us:
+            self._check_audio_returned()
+
+    def _check_silence(self):
+        now = time.monotonic()
+        selected = self._selected_levels(self._config.pause_threshold_db, now)
+        if len(selected) == 0:
+            # None of the inputs is reporting any levels, nothing to judge by
+            self._last_loud = None
+            return
+
+        for entry in selected:
+            if entry.loud_at is not None:
+                last_loud = entry.updated_at - entry.silent_for
+                self._last_loud = last_loud if self._last_loud is None else max(self._last_loud, last_loud)
+
+        if self._last_loud is None:
+            self._last_loud = now
+
+        silent_for = now - self._last_loud
+        if silent_for < self._config.pause_after:
+            return
+
+        Metrics.timing('pos.pause_detection').add(silent_for - self._config.pause_after)
+
+        self.log.info(f'No audio for {silent_for:.1f} s, requesting pause')
+        self._requested_at = now
+        self.state = PauseOnSilence.State.WaitingForPauseEvent
+        if not self.obs_connection.recording.pause():
+            self.state = PauseOnSilence.State.Idle
+            self._reset()
+
+    def _check_audio_returned(self):
+        now = time.monotonic()
+        threshold_db = max(self._config.resume_threshold_db, self._config.pause_threshold_db)
+        onsets = [x.loud_at for x in self._selected_levels(threshold_db, now) if x.loud_at is not None]
+        if len(onsets) == 0:
+            # Any gap resets the hold time
+            self._loud_since = None
+            return
+
+        if self._loud_since is None:
+            self._loud_since = min(onsets)
+
+        loud_for = now - self._loud_since
+        if loud_for < self._config.resume_hold:
+            return
+
+        # Time between the first loud frame and the resume request
+        Metrics.timing('pos.resume_detection').add(loud_for)
+
+        self.log.info(f'Audio is back for {loud_for:.2f} s, requesting resumption')
+        self._requested_at = now
+        self.state = PauseOnSilence.State.WaitingForResumeEvent
+        if not self.obs_connection.recording.resume():
+            self.state = PauseOnSilence.State.Idle
+            self._reset()
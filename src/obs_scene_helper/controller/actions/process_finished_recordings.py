@@ -0,0 +1,85 @@
+from collections import deque
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer, QCoreApplication
+
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.system.file_pipeline import FilePipeline
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.model.pipeline.stages import PipelineConfig
+
+MIB = 1024 * 1024
+
+
+class ProcessFinishedRecordings(QObject):
+    """
+    Pass every finished recording file through the file pipeline: the previous file is finished as soon as OBS
+    switches to a new one (e.g. a file split), and the current one once the recording stops.
+    """
+
+    LOG_NAME = 'pfr'
+
+    # OBS may still be writing the file trailer when the events arrive
+    FINISH_DELAY_MS = 3000
+
+    # Recently submitted files, so a file reported as finished twice (file change, then stop) is only processed once
+    MAX_RECENT_FILES = 100
+
+    def __init__(self, obs_connection: Connection, settings: Settings, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.settings = settings
+        self.settings.osh_changed.connect(self._handle_settings_change)
+
+        self.obs_connection = obs_connection
+        self.obs_connection.output_file.changed.connect(self._handle_output_file_change)
+        self.obs_connection.recording.state_changed.connect(self._handle_record_state_change)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        self.pipeline = FilePipeline(self._config, self.settings.osh.file_pipeline.max_workers)
+
+        self._current = None  # type: Optional[str]
+        self._submitted = deque(maxlen=self.MAX_RECENT_FILES)  # type: deque[str]
+
+        self.log.debug('Initialized')
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.pipeline.shutdown)
+
+    @property
+    def _config(self) -> PipelineConfig:
+        settings = self.settings.osh.file_pipeline
+        return PipelineConfig(hash_algorithm=settings.hash_algorithm, min_size=settings.min_size * MIB,
+                              command=settings.command, bandwidth=settings.bandwidth * MIB)
+
+    def _handle_settings_change(self):
+        self.pipeline.configure(self._config, self.settings.osh.file_pipeline.max_workers)
+
+    def _handle_output_file_change(self, new_path: str):
+        previous = self._current
+        self._current = new_path
+        if previous is not None and previous != new_path:
+            self._finished(previous)
+
+    def _handle_record_state_change(self, state: RecordingState):
+        if state != RecordingState.Stopped or self._current is None:
+            return
+
+        path = self._current
+        self._current = None
+        self._finished(path)
+
+    def _finished(self, path: str):
+        if not self.settings.osh.file_pipeline.enabled:
+            return
+
+        if path in self._submitted:
+            return
+
+        self._submitted.append(path)
+        self.log.debug(f'Recording file finished: {path}')
+        QTimer.singleShot(self.FINISH_DELAY_MS, self, lambda: self.pipeline.submit(path))
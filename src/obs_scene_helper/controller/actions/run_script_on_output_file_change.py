@@ -1,5 +1,7 @@
 import shlex
 
+from typing import Optional
+
 from PySide6.QtCore import QObject
 
 from obs_scene_helper.controller.obs.connection import Connection
@@ -19,21 +21,33 @@ class RunScriptOnOutputFileChange(QObject):
         super().__init__(*args, **kwargs)
 
         self.settings = settings
+        self.settings.osh_changed.connect(self._handle_settings_change)
 
         self.obs_connection = obs_connection
         self.obs_connection.output_file.changed.connect(self._handle_output_file_change)
 
-        self.launcher = ScriptLauncher()
-        self.launcher.script_done.connect(self._script_done)
-
         self.log = Log.child(self.LOG_NAME)
         self.log.debug('Initialized')
 
+        queue = self.settings.osh.script_queue
+        self.launcher = ScriptLauncher(queue.max_workers, self._timeout)
+        self.launcher.script_done.connect(self._script_done)
+
+    @property
+    def _timeout(self) -> Optional[float]:
+        timeout = self.settings.osh.script_queue.timeout
+        return timeout if timeout > 0 else None
+
+    def _handle_settings_change(self):
+        self.launcher.configure(self.settings.osh.script_queue.max_workers, self._timeout)
+
     def _script_done(self, result: ScriptLaunchResult):
+        job_id = result.job_id[:8]
         if not result.success:
-            self.log.error(f'Script failed: {result.logs}')
+            # The output was already logged while the script was running, repeat the tail for the context
+            self.log.error(f'Script {job_id} failed, last output lines:\n{result.logs}')
         else:
-            self.log.debug(f'Script done: {result.logs}')
+            self.log.debug(f'Script {job_id} done')
 
     def _handle_output_file_change(self, new_path: str):
         self.log.debug(f'New recording file: {new_path}')
@@ -1,16 +1,22 @@
+import time
+
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
-from PySide6.QtCore import QObject, QTimer, QThread, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from obs_scene_helper.controller.obs.connection import Connection, ConnectionState
 from obs_scene_helper.controller.obs.recording import RecordingState
 
 from obs_scene_helper.controller.system.display_list import DisplayList
 from obs_scene_helper.controller.settings.settings import Settings
-from obs_scene_helper.model.settings.preset import Preset
+from obs_scene_helper.model.settings.preset import Preset, MatchWeights
+from obs_scene_helper.model.metrics.trace import Trace, SpanKind
+from obs_scene_helper.model.metrics.trace_table import Table as TraceTable
+from obs_scene_helper.model.switch.plan import Step, plan_switch
 
 from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
 
 
 class SwitchProfileAndSceneCollection(QObject):
@@ -19,6 +25,27 @@ class SwitchProfileAndSceneCollection(QObject):
     """
     LOG_NAME = 'spasc'
 
+    # Recording output release probing: the interval doubles after each probe, until the deadline is reached
+    OUTPUT_PROBE_INITIAL_INTERVAL_MS = 100
+    OUTPUT_PROBE_MAX_INTERVAL_MS = 1000
+    OUTPUT_PROBE_DEADLINE_MS = 10000
+
+    # Number of switch traces to keep
+    MAX_TRACES = 50
+
+    # Trace phases, in the order they usually happen
+    PHASES = ['GracePeriod', 'SettlingDisplays', 'CheckingConfiguration', 'StoppingRecording',
+              'WaitingForOutputRelease', 'ChangingProfile', 'SplittingRecording', 'ChangingSceneCollection',
+              'StartingRecording']
+
+    # Phases during which nothing is recorded in a full stop/start switch
+    RESTART_PHASES = ['StoppingRecording', 'WaitingForOutputRelease', 'ChangingProfile', 'ChangingSceneCollection',
+                      'StartingRecording']
+
+    # Full stop/start gap estimation: used until we have observed some switches, and how many recent ones to average
+    DEFAULT_RESTART_GAP = 3.0
+    RESTART_GAP_SAMPLES = 5
+
     preset_activated = Signal(Preset)
 
     class State(Enum):
@@ -43,6 +70,7 @@ class SwitchProfileAndSceneCollection(QObject):
 
         self.display_list = display_list
         self.display_list.changed.connect(self._handle_display_list_change)
+        self.display_list.settled.connect(self._handle_display_list_settled)
 
         self.settings = settings
         self.settings.preset_list_changed.connect(self._handle_preset_list_change)
@@ -51,14 +79,53 @@ class SwitchProfileAndSceneCollection(QObject):
         self.recheck_timer.setSingleShot(True)
         self.recheck_timer.timeout.connect(self._recheck_config_timer)
 
+        self.output_probe_timer = QTimer(self)
+        self.output_probe_timer.setSingleShot(True)
+        self.output_probe_timer.timeout.connect(self._probe_output_released)
+
+        self._output_probe_started = None  # type: Optional[float]
+        self._output_probe_interval_ms = self.OUTPUT_PROBE_INITIAL_INTERVAL_MS
+
+        # Every switch attempt is traced: from the event arming the recheck timer until the preset is activated (or the
+        # attempt is abandoned)
+        self.traces = TraceTable(self.PHASES, self.MAX_TRACES)
+        self._trace = None  # type: Optional[Trace]
+
         self.log = Log.child(self.LOG_NAME)
         self.log.debug('Initialized')
 
     def _transition_to_idle(self):
         self.state = SwitchProfileAndSceneCollection.State.Idle
         self.target_preset = None
+        self.output_probe_timer.stop()
+        if not self._recheck_pending:
+            # Otherwise the trace goes on until the pending recheck
+            self._finish_trace('aborted')
         self.log.debug('Transition to IDLE')
 
+    @property
+    def _recheck_pending(self) -> bool:
+        return self.recheck_timer.isActive() or not self.display_list.is_settled
+
+    def _trace_phase(self, phase: str, kind: SpanKind, cause: str = 'recheck'):
+        if self._trace is None:
+            self._trace = self.traces.new_trace(cause)
+            self.log.debug(f'Starting switch trace #{self._trace.trace_id} ({cause})')
+
+        self._trace.enter(phase, kind)
+
+    def _finish_trace(self, outcome: str):
+        if self._trace is None:
+            return
+
+        trace = self._trace
+        self._trace = None
+        trace.finish(outcome)
+
+        phases = ', '.join(f'{k}: {v * 1000:.0f} ms' for k, v in trace.by_phase().items())
+        self.log.info(f'Switch trace #{trace.trace_id} ({trace.name}) {outcome} after {trace.duration:.2f} s: {phases}')
+        self.traces.add_trace(trace)
+
     def _handle_record_state_change(self, new_state: RecordingState):
         self.log.debug(f'Record state change: {new_state}')
 
@@ -75,11 +142,11 @@ class SwitchProfileAndSceneCollection(QObject):
         if new_state == ConnectionState.Disconnected:
             self._transition_to_idle()
         elif new_state == ConnectionState.Connected:
-            self._arm_recheck_timer()
+            self._arm_recheck_timer('connection')
 
     def _handle_obs_error(self, _: str):
         self._transition_to_idle()
-        self._arm_recheck_timer()
+        self._arm_recheck_timer('error')
 
     def _handle_recording_stopped(self):
         self.log.debug(f'Recording stopped: {self.state}')
@@ -98,9 +165,33 @@ class SwitchProfileAndSceneCollection(QObject):
 
         # OBS Reports an old recording status even after generating a recording-stopped event.
         # Trying to change the profile right away will result in an error: "cannot change profile
-        # while recording is active", so we have to sleep for some time here.
-        QThread.sleep(5)
+        # while recording is active", so we have to wait until the output is actually released.
+        self._trace_phase('WaitingForOutputRelease', SpanKind.OBS)
+        self._output_probe_started = time.monotonic()
+        self._output_probe_interval_ms = self.OUTPUT_PROBE_INITIAL_INTERVAL_MS
+        self._probe_output_released()
+
+    def _probe_output_released(self):
+        if self.state != SwitchProfileAndSceneCollection.State.ChangingProfile:
+            return
+
+        elapsed = time.monotonic() - self._output_probe_started
+        active = self.obs_connection.recording.is_output_active()
+        if active is False:
+            Metrics.timing('spasc.output_release_wait').add(elapsed)
+            self.log.debug(f'Recording output released after {elapsed * 1000:.0f} ms')
+            return self._switch_profile()
+
+        if elapsed * 1000 >= self.OUTPUT_PROBE_DEADLINE_MS:
+            Metrics.counter('spasc.output_release_timeouts').increment()
+            self.log.warning(f'Recording output still active after {elapsed:.1f} s, switching anyway')
+            return self._switch_profile()
+
+        self.output_probe_timer.start(self._output_probe_interval_ms)
+        self._output_probe_interval_ms = min(self._output_probe_interval_ms * 2, self.OUTPUT_PROBE_MAX_INTERVAL_MS)
 
+    def _switch_profile(self):
+        self._trace_phase('ChangingProfile', SpanKind.OBS)
         self.log.info(f"Switching profile: {self.target_preset.profile}")
         if not self.obs_connection.profiles.set_active(self.target_preset.profile):
             self._transition_to_idle()
@@ -114,6 +205,7 @@ class SwitchProfileAndSceneCollection(QObject):
 
         activated_preset = self.target_preset
 
+        self._finish_trace('activated')
         self._transition_to_idle()
 
         self.log.info(f'Activated preset: {activated_preset}')
@@ -138,6 +230,7 @@ class SwitchProfileAndSceneCollection(QObject):
             return
 
         self.log.info(f"Starting recording")
+        self._trace_phase('StartingRecording', SpanKind.OBS)
         if not self.obs_connection.recording.start():
             self._transition_to_idle()
 
@@ -157,66 +250,123 @@ class SwitchProfileAndSceneCollection(QObject):
             return
 
         self.log.info(f"Switching scene collection: {self.target_preset.scene_collection}")
+        self._trace_phase('ChangingSceneCollection', SpanKind.OBS)
         if not self.obs_connection.scene_collections.set_active(self.target_preset.scene_collection):
             self._transition_to_idle()
 
     def _handle_display_list_change(self, _: List[str]):
-        self.log.debug(f"Handling display list change")
-        self._arm_recheck_timer()
+        # More changes are likely to follow, the configuration is checked once the display list settles
+        self.log.debug(f"Handling display list change, waiting for the display list to settle")
+        self.recheck_timer.stop()
+        if self.state != SwitchProfileAndSceneCollection.State.Idle:
+            # The switch in flight was planned for the previous displays, the new ones get a trace of their own
+            self._finish_trace('superseded')
+        self._trace_phase('SettlingDisplays', SpanKind.Timer, 'display change')
+
+    def _handle_display_list_settled(self, _: List[str]):
+        self.log.debug(f"Handling settled display list")
+        self.recheck_timer.start(0)
 
     def _handle_preset_list_change(self):
         self.log.debug(f"Handling preset list change")
-        self._arm_recheck_timer()
+        self._arm_recheck_timer('preset list change')
 
-    def _arm_recheck_timer(self):
+    def _arm_recheck_timer(self, cause: str):
+        if not self.display_list.is_settled:
+            # The configuration will be checked once the display list settles
+            self.log.debug(f"Display list is still settling, ignoring: {cause}")
+            return
+
+        self._trace_phase('GracePeriod', SpanKind.Timer, cause)
         self.recheck_timer.start(self.settings.obs.grace_period * 1000)
 
     def _recheck_config_timer(self):
         self.log.debug(f"Checking configuration")
-
-        target_preset = self.settings.preset_list.find_matching(self.display_list.displays)
-        if target_preset is None:
-            self.log.info(f"No matching target preset found")
+        self._trace_phase('CheckingConfiguration', SpanKind.Local)
+
+        matching = self.settings.osh.preset_matching
+        weights = MatchWeights(missing=matching.missing_weight, extra=matching.extra_weight)
+        match = self.settings.preset_list.find_best_match(self.display_list.identities, matching.min_score, weights)
+        if match is None:
+            self.log.info(f"No matching target preset found (minimum score: {matching.min_score:.2f})")
+            self._finish_trace('no match')
             self._transition_to_idle()
             return
 
+        self.log.info(f"Best matching preset: {match.explain()}")
+        self._switch_to(match.preset)
+
+    def activate(self, preset: Preset, cause: str) -> bool:
+        """
+        Switch to a preset regardless of the display configuration (e.g. a fallback preset).
+
+        :return False if another switch is already pending or in progress.
+        """
+        idle = self.state == SwitchProfileAndSceneCollection.State.Idle
+        if not idle or self.recheck_timer.isActive() or not self.display_list.is_settled:
+            self.log.info(f"Switch in progress, not activating {preset.name} ({cause})")
+            return False
+
+        self._trace_phase('CheckingConfiguration', SpanKind.Local, cause)
+        self._switch_to(preset)
+        return True
+
+    def _switch_to(self, target_preset: Preset):
         self.target_preset = target_preset
         self.log.info(f"Target preset: {self.target_preset}")
 
-        should_change_scene_collection = target_preset.scene_collection != self.obs_connection.scene_collections.active
-        should_change_profile = target_preset.profile != self.obs_connection.profiles.active
-        if not should_change_profile and not should_change_scene_collection:
+        # Starting, stopping or unknown recordings could hold the output as well, so only a stopped one is skipped
+        recording = self.obs_connection.recording
+        plan = plan_switch(self.obs_connection.profiles.active, self.obs_connection.scene_collections.active,
+                           recording.state != RecordingState.Stopped, target_preset, recording.can_split,
+                           self._estimate_restart_gap())
+        self.log.info(f"Switch plan: {plan}")
+
+        if plan.noop:
             # Desired preset already active
             self.log.info(f"Target preset already active: {self.target_preset}")
+            self._finish_trace('already active')
             self.preset_activated.emit(self.target_preset)
             return
 
-        if should_change_profile:
+        if Step.SetProfile in plan.steps:
             # Profiles cannot be changed while the recording is still active, so we have to stop it first
             self.state = SwitchProfileAndSceneCollection.State.StoppingRecording
             self.log.debug(f"Transition to {self.state}")
 
-            if self.obs_connection.recording.state == RecordingState.Stopped:
+            self._trace_phase('StoppingRecording', SpanKind.OBS)
+            if Step.StopRecording not in plan.steps:
                 self.log.info(f"Recording already stopped")
                 self._handle_recording_stopped()
             else:
                 self.log.info(f"Stopping recording")
-                if not self.obs_connection.recording.stop():
+                if not recording.stop():
                     self._transition_to_idle()
 
             return
 
         self.log.info(f"Target profile already active")
 
-        # The profile is the same, but the scene collection might be different
-        if should_change_scene_collection:
-            # Pretend we just finished changing the profile
-            self.state = SwitchProfileAndSceneCollection.State.ChangingProfile
-            self.log.debug(f"Transition to {self.state}, simulating profile change")
-            self._handle_profile_change(self.obs_connection.profiles.active)
-            return
+        if Step.SplitRecordFile in plan.steps:
+            # Start a new file for the new scene collection, keep going with the same file if that fails
+            self._trace_phase('SplittingRecording', SpanKind.OBS)
+            if not recording.split():
+                self.log.warning(f"Could not split the recording file, swapping the scene collection anyway")
 
-        # Both the profile and the scene collection are the same: pretend we just finished switching
-        self.state = SwitchProfileAndSceneCollection.State.ChangingSceneCollection
-        self.log.debug(f"Transition to {self.state}, simulation scene collection change")
-        self._handle_scene_collection_change(self.obs_connection.scene_collections.active)
+        # The profile is the same, but the scene collection is different: pretend we just finished changing the profile
+        self.state = SwitchProfileAndSceneCollection.State.ChangingProfile
+        self.log.debug(f"Transition to {self.state}, simulating profile change")
+        self._handle_profile_change(self.obs_connection.profiles.active)
+
+    def _estimate_restart_gap(self) -> float:
+        """ Average recording gap of the recent full stop/start switches """
+        gaps = []
+        traces = self.traces.traces
+        for i in range(len(traces) - 1, -1, -1):
+            phases = traces[i].by_phase()
+            if traces[i].outcome == 'activated' and 'StoppingRecording' in phases:
+                gaps.append(sum(phases.get(x, 0.0) for x in self.RESTART_PHASES))
+            if len(gaps) == self.RESTART_GAP_SAMPLES:
+                break
+
+        return sum(gaps) / len(gaps) if len(gaps) != 0 else self.DEFAULT_RESTART_GAP
@@ -0,0 +1,132 @@
+import threading
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from obsws_python.subs import Subs
+
+from obs_scene_helper.controller.obs.connection import Connection, ConnectionState
+from obs_scene_helper.controller.system.log import Log
+
+from obs_scene_helper.model.audio.levels import AudioLevels, LevelHistory, decode_volume_meters
+
+
+class AudioMeters(QObject):
+    """
+    Rolling audio level statistics for all the inputs, based on the InputVolumeMeters events.
+
+    The events are high-volume (OBS sends them ~20 times per second), so the subscription is opt-in: components
+    interested in the audio levels have to call acquire(), and release() once they are done.
+
+    Meter frames are only decoded and appended to the level history on the event thread, statistics are computed
+    periodically on the main thread.
+    """
+
+    LOG_NAME = 'obs.am'
+
+    HISTORY_SECONDS = 30
+    FRAMES_PER_SECOND = 20
+    UPDATE_INTERVAL_MS = 250
+
+    DEFAULT_WINDOW = 3.0
+    DEFAULT_SILENCE_THRESHOLD_DB = -60.0
+
+    # Input name -> AudioLevels
+    levels_changed = Signal(dict)
+
+    def __init__(self, connection: Connection):
+        super().__init__()
+
+        self._connection = connection
+        self._connection.connection_state_changed.connect(self._connection_state_changed)
+        self._connection.inputs.list_changed.connect(self._input_list_changed)
+
+        self.window = self.DEFAULT_WINDOW
+        self.silence_threshold_db = self.DEFAULT_SILENCE_THRESHOLD_DB
+
+        self.levels = {}  # type: dict[str, AudioLevels]
+
+        self._consumers = set()  # type: set[int]
+
+        # Guards the history, which is written by the event thread
+        self._lock = threading.Lock()
+        self._history = LevelHistory(self.HISTORY_SECONDS * self.FRAMES_PER_SECOND)
+        self._dirty = False
+
+        self._update_timer = QTimer(self)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._update)
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @property
+    def active(self) -> bool:
+        return len(self._consumers) != 0
+
+    def raw_obs_callbacks(self) -> dict:
+        return {'InputVolumeMeters': self.on_input_volume_meters}
+
+    def acquire(self, consumer: QObject):
+        """ Start receiving the audio levels on behalf of the consumer """
+        if id(consumer) in self._consumers:
+            return
+
+        self._consumers.add(id(consumer))
+        if len(self._consumers) == 1:
+            self.log.debug('Subscribing to the volume meters')
+            self._connection.acquire_subscription(Subs.INPUTVOLUMEMETERS)
+            self._update_timer.start()
+
+    def release(self, consumer: QObject):
+        if id(consumer) not in self._consumers:
+            return
+
+        self._consumers.remove(id(consumer))
+        if len(self._consumers) == 0:
+            self.log.debug('Unsubscribing from the volume meters')
+            self._connection.release_subscription(Subs.INPUTVOLUMEMETERS)
+            self._update_timer.stop()
+            self._reset()
+
+    def _reset(self):
+        with self._lock:
+            self._history.clear()
+            self._dirty = False
+
+        self.levels = {}
+
+    def _connection_state_changed(self, state: ConnectionState, _: str):
+        if state != ConnectionState.Connected:
+            self._reset()
+
+    def _input_list_changed(self):
+        known = {x.name for x in self._connection.inputs.list}
+        with self._lock:
+            for name in self._history.names:
+                if name not in known:
+                    self._history.forget(name)
+
+    def on_input_volume_meters(self, data: dict):
+        # Note: called from the event thread, keep it short
+        names, magnitudes, peaks = decode_volume_meters(data.get('inputs', []))
+        now = time.monotonic()
+
+        with self._lock:
+            self._history.append(now, names, magnitudes, peaks)
+            self._dirty = True
+
+    def statistics(self, window: float, silence_threshold_db: float) -> dict[str, AudioLevels]:
+        """ Compute the statistics with custom parameters, see LevelHistory.statistics """
+        with self._lock:
+            return self._history.statistics(window, silence_threshold_db)
+
+    def _update(self):
+        with self._lock:
+            if not self._dirty:
+                return
+
+            self._dirty = False
+
+        self.levels = self.statistics(self.window, self.silence_threshold_db)
+        self.levels_changed.emit(self.levels)
@@ -0,0 +1,93 @@
+"""
+Minimal request batch support (obs-websocket OpCode 8/9), which is not exposed by the obsws-python library.
+
+A batch is sent over the request client websocket and answered with a single message, so N requests only cost a single
+round trip instead of N.
+"""
+
+import json
+
+from enum import IntEnum
+from dataclasses import dataclass, field
+from random import randint
+from typing import Optional
+
+import obsws_python as obs
+from obsws_python.error import OBSSDKError, OBSSDKTimeoutError
+
+from websocket import WebSocketTimeoutException
+
+
+REQUEST_BATCH_OP = 8
+REQUEST_BATCH_RESPONSE_OP = 9
+
+
+class ExecutionType(IntEnum):
+    SerialRealtime = 0
+    SerialFrame = 1
+    Parallel = 2
+
+
+@dataclass
+class BatchRequest:
+    request_type: str
+    request_data: Optional[dict] = None
+
+    def to_dict(self) -> dict:
+        res = {'requestType': self.request_type}
+        if self.request_data is not None:
+            res['requestData'] = self.request_data
+        return res
+
+
+@dataclass
+class BatchResult:
+    request_type: str
+    success: bool
+    code: int
+    comment: Optional[str] = None
+    data: dict = field(default_factory=dict)
+
+    @staticmethod
+    def from_dict(val: dict) -> 'BatchResult':
+        status = val.get('requestStatus', {})
+        return BatchResult(val.get('requestType', ''), status.get('result', False), status.get('code', 0),
+                           status.get('comment'), val.get('responseData', {}))
+
+
+def send_batch(ws: obs.ReqClient, requests: list[BatchRequest], halt_on_failure: bool = False,
+               execution_type: ExecutionType = ExecutionType.SerialRealtime) -> list[BatchResult]:
+    """
+    Send a request batch and wait for the response.
+    :param ws: Request client to use.
+    :param requests: Requests to send, results are returned in the same order.
+    :param halt_on_failure: Whether OBS should stop processing the batch after the first failed request.
+    :param execution_type: How OBS should execute the requests.
+    :return: List of results, could be shorter than the list of requests if halt_on_failure is set.
+    :raises OBSSDKError: if the batch cannot be sent or the response is malformed.
+    """
+    if len(requests) == 0:
+        return []
+
+    base_client = ws.base_client
+    request_id = str(randint(1, 1000000))
+    payload = {
+        'op': REQUEST_BATCH_OP,
+        'd': {
+            'requestId': request_id,
+            'haltOnFailure': halt_on_failure,
+            'executionType': int(execution_type),
+            'requests': [x.to_dict() for x in requests],
+        }
+    }
+
+    try:
+        base_client.ws.send(json.dumps(payload))
+        response = json.loads(base_client.ws.recv())
+    except WebSocketTimeoutException as e:
+        raise OBSSDKTimeoutError('Timeout while waiting for a request batch response') from e
+
+    if response.get('op') != REQUEST_BATCH_RESPONSE_OP or response['d'].get('requestId') != request_id:
+        raise OBSSDKError(f'Unexpected request batch response: {response}')
+
+    return [BatchResult.from_dict(x) for x in response['d'].get('results', [])]
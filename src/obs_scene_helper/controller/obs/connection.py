@@ -6,6 +6,7 @@ import logging
 from PySide6.QtCore import QObject, QThread, Signal
 
 import obsws_python as obs
+from obsws_python.subs import Subs
 
 from obs_scene_helper.controller.obs.event_client import EventClient
 
@@ -34,7 +35,10 @@ class Connection(QObject):
         from obs_scene_helper.controller.obs.profiles import Profiles
         from obs_scene_helper.controller.obs.scene_collections import SceneCollections
         from obs_scene_helper.controller.obs.inputs import Inputs
+        from obs_scene_helper.controller.obs.scenes import Scenes
         from obs_scene_helper.controller.obs.output_file import OutputFile
+        from obs_scene_helper.controller.obs.audio_meters import AudioMeters
+        from obs_scene_helper.controller.obs.stats import Stats
 
         super().__init__(*args, **kwargs)
 
@@ -50,6 +54,9 @@ class Connection(QObject):
 
         self.shutting_down = False
 
+        # Reference counts for the opt-in high-volume event subscriptions
+        self._extra_subscriptions = {}  # type: dict[Subs, int]
+
         self.recording = Recording(self)
         self.recording.on_error.connect(lambda msg: self._on_connection_error(msg))
 
@@ -62,8 +69,15 @@ class Connection(QObject):
         self.inputs = Inputs(self)
         self.inputs.on_error.connect(lambda msg: self._on_connection_error(msg))
 
+        self.scenes = Scenes(self)
+        self.scenes.on_error.connect(lambda msg: self._on_connection_error(msg))
+
         self.output_file = OutputFile(self)
 
+        self.audio_meters = AudioMeters(self)
+
+        self.stats = Stats(self, settings)
+
         self.connection_state = ConnectionState.Disconnected  # type: ConnectionState
 
         self.log = Log.child(self.LOG_NAME)
@@ -73,6 +87,43 @@ class Connection(QObject):
     def ws(self) -> obs.ReqClient | None:
         return self._ws
 
+    @property
+    def event_subscriptions(self) -> int:
+        subs = Subs.LOW_VOLUME
+        for entry in self._extra_subscriptions.keys():
+            subs |= entry
+        return subs
+
+    def acquire_subscription(self, subs: Subs):
+        """ Subscribe to additional (usually high-volume) events, has to be matched with a release_subscription call """
+        count = self._extra_subscriptions.get(subs, 0)
+        self._extra_subscriptions[subs] = count + 1
+        if count == 0:
+            self._update_subscriptions()
+
+    def release_subscription(self, subs: Subs):
+        count = self._extra_subscriptions.get(subs, 0)
+        if count == 0:
+            self.log.warning(f'Releasing an unknown subscription: {subs}')
+            return
+
+        if count == 1:
+            del self._extra_subscriptions[subs]
+            self._update_subscriptions()
+        else:
+            self._extra_subscriptions[subs] = count - 1
+
+    def _update_subscriptions(self):
+        if self._events is None:
+            # Will be picked up on the next (re)connect
+            return
+
+        try:
+            self.log.debug(f'Updating event subscriptions: {self.event_subscriptions}')
+            self._events.reidentify(self.event_subscriptions)
+        except Exception as e:
+            self._on_connection_error(str(e))
+
     def launch(self):
         self._thread.start()
 
@@ -165,7 +216,8 @@ class Connection(QObject):
             self.log.info(f'Restarting')
 
             self._ws = obs.ReqClient(**args)
-            self._events = EventClient(on_disconnected=self._on_event_client_disconnected, **args)
+            self._events = EventClient(on_disconnected=self._on_event_client_disconnected,
+                                       subs=self.event_subscriptions, **args)
             self._setup_logging()
 
             callbacks = []
@@ -173,10 +225,13 @@ class Connection(QObject):
             callbacks.extend(self.profiles.obs_callbacks())
             callbacks.extend(self.scene_collections.obs_callbacks())
             callbacks.extend(self.inputs.obs_callbacks())
+            callbacks.extend(self.scenes.obs_callbacks())
             callbacks.extend(self.output_file.obs_callbacks())
 
             # Register event callbacks
             self._events.callback.register(callbacks)
+            self._events.raw_callbacks.update(self.audio_meters.raw_obs_callbacks())
+            self._events.raw_callbacks.update(self.scenes.raw_obs_callbacks())
 
             self._update_connection_state(ConnectionState.Connected, None)
         except Exception as e:
@@ -7,6 +7,8 @@ import json
 import logging
 import threading
 
+from typing import Callable
+
 from websocket import WebSocketConnectionClosedException, WebSocketTimeoutException
 
 from obsws_python.baseclient import ObsClient
@@ -24,6 +26,9 @@ https://github.com/obsproject/obs-websocket/blob/master/docs/generated/protocol.
 
 logger = logging.getLogger(__name__)
 
+EVENT_OP = 5
+REIDENTIFY_OP = 3
+
 
 class EventClient:
     LOG_NAME = 'ec'
@@ -47,6 +52,11 @@ class EventClient:
             raise
 
         self.callback = Callback()
+
+        # High-volume events (e.g. InputVolumeMeters) arrive multiple times per second, so they are dispatched with
+        # the raw event data: no logging and no dataclass conversion.
+        self.raw_callbacks = {}  # type: dict[str, Callable[[dict], None]]
+
         self.subscribe()
 
     def _report_disconnect(self):
@@ -87,11 +97,21 @@ class EventClient:
             try:
                 if response := self.base_client.ws.recv():
                     event = json.loads(response)
-                    self.logger.debug(f"Event received {event}")
+                    if event.get("op") != EVENT_OP:
+                        # E.g. an "Identified" response to a re-identify request
+                        self.logger.debug(f"Non-event message received {event}")
+                        continue
+
                     type_, data = (
                         event["d"].get("eventType"),
                         event["d"].get("eventData"),
                     )
+
+                    if (raw_callback := self.raw_callbacks.get(type_)) is not None:
+                        raw_callback(data if data else {})
+                        continue
+
+                    self.logger.debug(f"Event received {event}")
                     self.callback.trigger(type_, data if data else {})
             except WebSocketTimeoutException as e:
                 self.logger.exception(f"{type(e).__name__}: {e}")
@@ -102,6 +122,11 @@ class EventClient:
 
         self._report_disconnect()
 
+    def reidentify(self, subs: int):
+        """ Change the event subscriptions without reconnecting """
+        self.base_client.subs = subs
+        self.base_client.ws.send(json.dumps({"op": REIDENTIFY_OP, "d": {"eventSubscriptions": int(subs)}}))
+
     def disconnect(self):
         """stop listening for events"""
 
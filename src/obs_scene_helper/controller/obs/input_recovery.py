@@ -0,0 +1,274 @@
+import time
+
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.controller.obs.inputs import Input
+
+from obs_scene_helper.controller.system.log import Log
+
+
+class RecoveryAction:
+    """
+    Describes how an input of a specific kind is recovered: a sequence of settings overlays, each one of them has to be
+    acknowledged by OBS (via an InputSettingsChanged event) before the next one is applied.
+    """
+
+    def steps(self, entry: Input) -> list[dict]:
+        raise NotImplementedError()
+
+    def acknowledged(self, step: dict, reported: dict) -> bool:
+        """ Check if the settings reported by OBS match the step """
+        return all(reported.get(k) == v for k, v in step.items())
+
+
+class ToggleSetting(RecoveryAction):
+    """ Flip a boolean setting and then restore it, this is enough to restart most of the capture sources. """
+
+    def __init__(self, name: str, default: bool = True):
+        self.name = name
+        self.default = default
+
+    def steps(self, entry: Input) -> list[dict]:
+        current = bool(entry.settings.get(self.name, self.default))
+        return [{self.name: not current}, {self.name: current}]
+
+    def acknowledged(self, step: dict, reported: dict) -> bool:
+        # OBS doesn't report the settings matching their default values
+        return bool(reported.get(self.name, self.default)) == step[self.name]
+
+
+# Known capture input kinds and the settings we can toggle to restart them
+DEFAULT_ACTIONS = {
+    'screen_capture': ToggleSetting('show_cursor'),  # macOS ScreenCaptureKit
+    'monitor_capture': ToggleSetting('capture_cursor'),  # Windows display capture
+    'window_capture': ToggleSetting('cursor'),  # Windows window capture
+    'xshm_input': ToggleSetting('show_cursor'),  # Linux X11 screen capture
+    'pipewire-desktop-capture-source': ToggleSetting('ShowCursor'),  # Linux PipeWire screen capture
+}
+
+
+@dataclass
+class _Job:
+    entry: Input
+    action: RecoveryAction
+    steps: list[dict]
+    step: int = 0
+    attempts: int = 0
+    deadline: float | None = field(default=None)  # Set while waiting for an acknowledgement
+
+    @property
+    def done(self) -> bool:
+        return self.step >= len(self.steps)
+
+    @property
+    def waiting(self) -> bool:
+        return self.deadline is not None
+
+
+class InputRecovery(QObject):
+    """
+    Restart a set of inputs concurrently.
+
+    Every recovery step is sent for all the inputs ready for it as a single request batch, acknowledgements are tracked
+    per input with a deadline, and only the inputs that didn't acknowledge in time are retried.
+    """
+
+    LOG_NAME = 'obs.irec'
+
+    DEFAULT_ACK_TIMEOUT_MS = 2000
+    DEFAULT_MAX_RETRIES = 2
+
+    # (recovered inputs, failed inputs)
+    finished = Signal(list, list)
+
+    def __init__(self, connection: Connection, actions: dict[str, RecoveryAction] | None = None,
+                 ack_timeout_ms: int = DEFAULT_ACK_TIMEOUT_MS, max_retries: int = DEFAULT_MAX_RETRIES,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._connection = connection
+        self._connection.inputs.settings_changed.connect(self._handle_input_settings_change)
+
+        self._actions = dict(actions) if actions is not None else {}
+        self.ack_timeout_ms = ack_timeout_ms
+        self.max_retries = max_retries
+
+        self._running = False
+        self._jobs: dict[str, _Job] = {}
+        self._recovered: list[Input] = []
+        self._failed: list[Input] = []
+
+        # Acknowledgements usually arrive in bursts, so instead of sending the next step for every input right away,
+        # we collect all the inputs ready for the next step and send them together on the next event loop iteration.
+        self._send_timer = QTimer(self)
+        self._send_timer.setSingleShot(True)
+        self._send_timer.timeout.connect(self._send_pending)
+
+        self._deadline_timer = QTimer(self)
+        self._deadline_timer.setSingleShot(True)
+        self._deadline_timer.timeout.connect(self._check_deadlines)
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @property
+    def busy(self) -> bool:
+        return len(self._jobs) != 0
+
+    def register(self, kind: str, action: RecoveryAction):
+        self._actions[kind] = action
+
+    def supports(self, entry: Input) -> bool:
+        return entry.kind in self._actions
+
+    def recover(self, entries: list[Input] | None = None) -> bool:
+        """
+        Start recovering the inputs.
+        :param entries: Inputs to recover, all the inputs with a registered recovery action if None.
+        :return: False if a recovery is already in progress, True otherwise.
+        """
+        if self.busy:
+            self.log.warning('Recovery already in progress')
+            return False
+
+        if entries is None:
+            entries = self._connection.inputs.list
+
+        self._running = True
+        self._recovered = []
+        self._failed = []
+        for entry in entries:
+            action = self._actions.get(entry.kind)
+            if action is None:
+                self.log.debug(f'No recovery action for "{entry.name}" ({entry.kind})')
+                continue
+
+            self._jobs[entry.uuid] = _Job(entry, action, action.steps(entry))
+
+        if not self.busy:
+            self.log.info('Nothing to recover')
+            self._check_finished()
+            return True
+
+        self.log.info(f'Recovering {len(self._jobs)} inputs: {[x.entry.name for x in self._jobs.values()]}')
+        self._send_pending()
+        return True
+
+    def cancel(self):
+        if not self.busy:
+            return
+
+        self.log.debug('Canceling recovery')
+
+        self._send_timer.stop()
+        self._deadline_timer.stop()
+        self._jobs = {}
+        self._running = False
+
+    def _send_pending(self):
+        ready = [job for job in self._jobs.values() if not job.waiting and not job.done]
+        if len(ready) == 0:
+            return
+
+        failed = self._connection.inputs.set_settings_batch([(job.entry, job.steps[job.step]) for job in ready])
+        if failed is None:
+            self.log.warning('Error sending recovery batch, canceling')
+            self._fail_all()
+            return
+
+        deadline = time.monotonic() + self.ack_timeout_ms / 1000
+        for job in ready:
+            job.attempts += 1
+            job.deadline = deadline
+
+        for entry in failed:
+            self._fail(self._jobs[entry.uuid])
+
+        self._arm_deadline_timer()
+        self._check_finished()
+
+    def _arm_deadline_timer(self):
+        deadlines = [job.deadline for job in self._jobs.values() if job.waiting]
+        if len(deadlines) == 0:
+            self._deadline_timer.stop()
+            return
+
+        remaining_ms = max(0, int((min(deadlines) - time.monotonic()) * 1000))
+        self._deadline_timer.start(remaining_ms)
+
+    def _check_deadlines(self):
+        now = time.monotonic()
+        for job in list(self._jobs.values()):
+            if not job.waiting or job.deadline > now:
+                continue
+
+            job.deadline = None
+            if job.attempts > self.max_retries:
+                self.log.warning(f'No acknowledgement for "{job.entry.name}" after {job.attempts} attempts')
+                self._fail(job)
+            else:
+                self.log.debug(f'No acknowledgement for "{job.entry.name}", retrying step {job.step}')
+
+        self._send_pending()
+        self._arm_deadline_timer()
+        self._check_finished()
+
+    def _handle_input_settings_change(self, entry: Input, _, reported: dict):
+        job = self._jobs.get(entry.uuid)
+        if job is None or not job.waiting:
+            return
+
+        expected = job.steps[job.step]
+        if not job.action.acknowledged(expected, reported):
+            # Somebody else changed the settings in the meantime, or OBS didn't apply ours
+            job.deadline = None
+            if job.attempts > self.max_retries:
+                self.log.warning(f'Settings mismatch for "{entry.name}" after {job.attempts} attempts: {reported}, '
+                                 f'expected: {expected}')
+                self._fail(job)
+                self._check_finished()
+            else:
+                self.log.debug(f'Settings mismatch for "{entry.name}": {reported}, expected: {expected}, retrying')
+                self._send_timer.start(0)
+
+            self._arm_deadline_timer()
+            return
+
+        job.step += 1
+        job.attempts = 0
+        job.deadline = None
+
+        if job.done:
+            self.log.debug(f'Recovered "{entry.name}"')
+            del self._jobs[entry.uuid]
+            self._recovered.append(job.entry)
+            self._check_finished()
+        else:
+            self._send_timer.start(0)
+
+        self._arm_deadline_timer()
+
+    def _fail(self, job: _Job):
+        self._jobs.pop(job.entry.uuid, None)
+        self._failed.append(job.entry)
+
+    def _fail_all(self):
+        for job in list(self._jobs.values()):
+            self._fail(job)
+
+        self._check_finished()
+
+    def _check_finished(self):
+        if not self._running or self.busy:
+            return
+
+        self._running = False
+
+        self._send_timer.stop()
+        self._deadline_timer.stop()
+
+        self.log.info(f'Recovery done: {len(self._recovered)} recovered, {len(self._failed)} failed')
+        self.finished.emit(self._recovered, self._failed)
@@ -3,6 +3,7 @@ from PySide6.QtCore import QObject, Signal
 import obsws_python as obs
 
 from obs_scene_helper.controller.obs.connection import Connection, ConnectionState
+from obs_scene_helper.controller.obs.batch import BatchRequest, send_batch
 from obs_scene_helper.controller.system.log import Log
 
 from dataclasses import dataclass
@@ -27,9 +28,10 @@ class Inputs(QObject):
     # inputs on request (make sure to handle non-existent input errors correctly).
     list_changed = Signal()
 
-    # Settings changed for input (input, old_settings).
-    # The input itself will contain the new settings.
-    settings_changed = Signal(Input, dict)
+    # Settings changed for input (input, old_settings, reported_settings).
+    # The input itself will contain the new settings, merged with the old ones. The reported settings are the ones from
+    # the event: OBS leaves out the settings matching their default values.
+    settings_changed = Signal(Input, dict, dict)
 
     # Input name changed (input, old_name).
     # The input itself will contain the new name.
@@ -120,7 +122,7 @@ class Inputs(QObject):
         old_settings = existing.settings
         existing.settings = old_settings | new_settings
 
-        self.settings_changed.emit(existing, old_settings)
+        self.settings_changed.emit(existing, old_settings, new_settings)
 
     def on_input_created(self, event):
         uuid = event.input_uuid
@@ -195,3 +197,32 @@ class Inputs(QObject):
             self.log.warning(f'Error updating settings for "{entry.name}": {str(e)}')
             self.on_error.emit(str(e))
             return False
+
+    def set_settings_batch(self, changes: list[tuple[Input, dict]], overlay: bool = True) -> list[Input] | None:
+        """
+        Update the settings for multiple inputs with a single request batch.
+        :param changes: List of (input, new settings) pairs.
+        :param overlay: See set_settings.
+        :return: List of inputs the update has failed for (empty in case of success), or None if the batch itself
+                 could not be sent.
+        """
+        try:
+            self.log.debug(f'Updating settings for {len(changes)} inputs')
+            requests = [BatchRequest('SetInputSettings',
+                                     {'inputUuid': entry.uuid, 'inputSettings': settings, 'overlay': overlay})
+                        for entry, settings in changes]
+            results = send_batch(self._ws, requests)
+        except Exception as e:
+            self.log.warning(f'Error updating settings for {len(changes)} inputs: {str(e)}')
+            self.on_error.emit(str(e))
+            return None
+
+        failed = []
+        for i, (entry, _) in enumerate(changes):
+            result = results[i] if i < len(results) else None
+            if result is None or not result.success:
+                comment = result.comment if result is not None else 'no response'
+                self.log.warning(f'Error updating settings for "{entry.name}": {comment}')
+                failed.append(entry)
+
+        return failed
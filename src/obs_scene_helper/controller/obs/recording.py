@@ -32,6 +32,9 @@ class Recording(QObject):
 
         self.state = RecordingState.Unknown
 
+        # Whether the connected OBS supports splitting the recording file (obs-websocket 5.5+)
+        self.can_split = False
+
         self.log = Log.child(self.LOG_NAME)
         self.log.debug('Initialized')
 
@@ -68,6 +71,22 @@ class Recording(QObject):
             self.log.warning(f"Error checking recording status: {str(e)}")
             self.on_error.emit(str(e))
 
+    def is_output_active(self) -> bool | None:
+        """
+        Query the recording output status without updating the tracked state.
+        OBS keeps reporting an active output for a while after the recording-stopped event, so this can be used to
+        check when the output is actually released.
+        :return: Output status, or None if the status cannot be queried.
+        """
+        try:
+            if self._ws is None:
+                return None
+
+            return self._ws.get_record_status().output_active
+        except Exception as e:
+            self.log.warning(f"Error querying recording output status: {str(e)}")
+            return None
+
     def on_record_state_changed(self, event):
         output = OutputState(event.output_state)
 
@@ -92,12 +111,23 @@ class Recording(QObject):
     def obs_callbacks(self) -> list:
         return [self.on_record_state_changed]
 
+    def _check_capabilities(self):
+        try:
+            version = self._ws.get_version()
+            self.can_split = 'SplitRecordFile' in version.available_requests
+            self.log.debug(f'Recording file splitting supported: {self.can_split}')
+        except Exception as e:
+            self.log.warning(f"Error checking capabilities: {str(e)}")
+            self.can_split = False
+
     def _connection_state_changed(self, state: ConnectionState, _: str | None):
         if state != ConnectionState.Connected:
             self.log.debug(f'Resetting recording state')
+            self.can_split = False
             self._update_recording_state(RecordingState.Unknown)
             return
 
+        self._check_capabilities()
         self._check_recording_status()
 
     def pause(self) -> bool:
@@ -130,6 +160,30 @@ class Recording(QObject):
             self.on_error.emit(str(e))
             return False
 
+    def split(self) -> bool:
+        """
+        Continue recording into a new file.
+        Note: OBS refuses to split if the automatic file splitting is disabled in the output settings, this is not
+        treated as a connection error.
+        :return: True if the file was split, False otherwise.
+        """
+        self.log.debug(f"Splitting recording file")
+
+        if not self.can_split:
+            self.log.info(f"Skipping split: not supported")
+            return False
+
+        if self.state != RecordingState.Active:
+            self.log.info(f"Skipping split: not active ({self.state.value})")
+            return False
+
+        try:
+            self._ws.split_record_file()
+            return True
+        except Exception as e:
+            self.log.warning(f"Split error: {str(e)}")
+            return False
+
     def start(self) -> bool:
         self.log.debug(f"Starting")
 
@@ -0,0 +1,444 @@
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import QObject, Signal
+
+import obsws_python as obs
+from obsws_python.subs import Subs
+
+from obs_scene_helper.controller.obs.connection import Connection, ConnectionState
+from obs_scene_helper.controller.obs.batch import BatchRequest, send_batch
+from obs_scene_helper.controller.system.log import Log
+
+
+@dataclass
+class SceneItem:
+    scene_uuid: str
+    item_id: int
+    source_uuid: str
+    source_name: str
+    index: int = 0
+    enabled: bool = True
+    locked: bool = False
+    is_group: bool = False
+    transform: dict = field(default_factory=dict)
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return self.scene_uuid, self.item_id
+
+    @staticmethod
+    def from_dict(scene_uuid: str, val: dict) -> 'SceneItem':
+        return SceneItem(scene_uuid, val['sceneItemId'], val['sourceUuid'], val['sourceName'],
+                         val.get('sceneItemIndex', 0), val.get('sceneItemEnabled', True),
+                         val.get('sceneItemLocked', False), bool(val.get('isGroup')),
+                         val.get('sceneItemTransform', {}))
+
+
+@dataclass
+class Scene:
+    uuid: str
+    name: str
+    is_group: bool = False
+    items: dict[int, SceneItem] = field(default_factory=dict)  # Item ID -> item
+
+    @property
+    def sorted_items(self) -> list[SceneItem]:
+        """ Items from the bottom to the top """
+        return sorted(self.items.values(), key=lambda x: x.index)
+
+
+class Scenes(QObject):
+    """
+    In-memory copy of the scene graph: scenes, groups and their items.
+
+    The graph is fetched once per connection (all the item lists in a single request batch), and then kept current
+    with the scene and scene item events, so queries don't need any requests.
+
+    Scene item transforms are only kept current while someone is interested in them (see acquire_transforms), because
+    the transform events are high-volume.
+    """
+
+    LOG_NAME = 'obs.scn'
+
+    # Scenes were (re)fetched, created, removed or renamed
+    list_changed = Signal()
+
+    # Current program scene changed (scene name)
+    current_changed = Signal(str)
+
+    # Items were added to, removed from or reordered in a scene (scene)
+    items_changed = Signal(Scene)
+
+    # Scene item state changed (enabled, locked or transform)
+    item_changed = Signal(SceneItem)
+
+    on_error = Signal(str)
+
+    # An event arrived on the event thread (handler, event)
+    _event_received = Signal(object, object)
+
+    def __init__(self, connection: Connection):
+        super().__init__()
+
+        self._connection = connection
+        self._connection.connection_state_changed.connect(self._connection_state_changed)
+
+        self.scenes: dict[str, Scene] = {}  # Scene UUID -> scene
+        self.current: str | None = None
+
+        self._scene_uuids: dict[str, str] = {}  # Scene name -> UUID
+        self._source_uuids: dict[str, str] = {}  # Source name -> UUID
+        self._items_by_source: dict[str, dict[tuple[str, int], SceneItem]] = {}  # Source UUID -> items
+
+        self._transform_consumers = set()  # type: set[int]
+
+        self._event_received.connect(self._handle_event)
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @property
+    def _ws(self) -> obs.ReqClient | None:
+        return self._connection.ws
+
+    def obs_callbacks(self) -> list:
+        return [self.on_scene_created, self.on_scene_removed, self.on_scene_name_changed,
+                self.on_current_program_scene_changed, self.on_scene_item_created, self.on_scene_item_removed,
+                self.on_scene_item_list_reindexed, self.on_scene_item_enable_state_changed,
+                self.on_scene_item_lock_state_changed, self.on_input_name_changed]
+
+    def raw_obs_callbacks(self) -> dict:
+        return {'SceneItemTransformChanged': self.on_scene_item_transform_changed}
+
+    ################################################################################
+    # Queries
+    ################################################################################
+
+    def scene(self, name: str) -> Scene | None:
+        uuid = self._scene_uuids.get(name)
+        return self.scenes.get(uuid) if uuid is not None else None
+
+    def items(self, scene_name: str) -> list[SceneItem]:
+        """ Items of a scene (or a group), from the bottom to the top """
+        scene = self.scene(scene_name)
+        return scene.sorted_items if scene is not None else []
+
+    def items_for_source(self, source_name: str) -> list[SceneItem]:
+        """ All the scene items, showing the source """
+        uuid = self._source_uuids.get(source_name)
+        return list(self._items_by_source.get(uuid, {}).values()) if uuid is not None else []
+
+    def find_item(self, scene_name: str, source_name: str) -> SceneItem | None:
+        scene = self.scene(scene_name)
+        if scene is None:
+            return None
+
+        return next((x for x in self.items_for_source(source_name) if x.scene_uuid == scene.uuid), None)
+
+    ################################################################################
+    # Index maintenance
+    ################################################################################
+
+    def _reset(self):
+        self.scenes = {}
+        self._scene_uuids = {}
+        self._source_uuids = {}
+        self._items_by_source = {}
+
+    def _add_scene(self, scene: Scene):
+        self.scenes[scene.uuid] = scene
+        self._scene_uuids[scene.name] = scene.uuid
+
+        # Scenes can be nested, so they are sources as well
+        self._source_uuids[scene.name] = scene.uuid
+
+    def _remove_scene(self, uuid: str):
+        scene = self.scenes.pop(uuid, None)
+        if scene is None:
+            return
+
+        for item in list(scene.items.values()):
+            self._remove_item(item)
+
+        self._scene_uuids.pop(scene.name, None)
+
+    def _add_item(self, item: SceneItem):
+        scene = self.scenes.get(item.scene_uuid)
+        if scene is None:
+            return
+
+        scene.items[item.item_id] = item
+        self._source_uuids[item.source_name] = item.source_uuid
+        self._items_by_source.setdefault(item.source_uuid, {})[item.key] = item
+
+    def _remove_item(self, item: SceneItem):
+        scene = self.scenes.get(item.scene_uuid)
+        if scene is not None:
+            scene.items.pop(item.item_id, None)
+
+        items = self._items_by_source.get(item.source_uuid, {})
+        items.pop(item.key, None)
+        if len(items) == 0:
+            self._items_by_source.pop(item.source_uuid, None)
+
+    def _rename_source(self, uuid: str, old_name: str, new_name: str):
+        if self._source_uuids.get(old_name) == uuid:
+            del self._source_uuids[old_name]
+        self._source_uuids[new_name] = uuid
+
+        for item in self._items_by_source.get(uuid, {}).values():
+            item.source_name = new_name
+
+    def _item(self, scene_uuid: str, item_id: int) -> SceneItem | None:
+        scene = self.scenes.get(scene_uuid)
+        return scene.items.get(item_id) if scene is not None else None
+
+    ################################################################################
+    # Hydration
+    ################################################################################
+
+    def _fetch_items(self, scenes: list[Scene]) -> list[Scene]:
+        """ Fetch the item lists for the scenes in a single batch, returns the groups found along the way """
+        requests = [BatchRequest('GetGroupSceneItemList' if x.is_group else 'GetSceneItemList', {'sceneName': x.name})
+                    for x in scenes]
+        results = send_batch(self._ws, requests)
+
+        groups = []
+        for scene, result in zip(scenes, results):
+            if not result.success:
+                self.log.warning(f'Error fetching items of "{scene.name}": {result.comment}')
+                continue
+
+            for entry in result.data.get('sceneItems', []):
+                item = SceneItem.from_dict(scene.uuid, entry)
+                self._add_item(item)
+
+                if item.is_group and item.source_uuid not in self.scenes:
+                    group = Scene(item.source_uuid, item.source_name, True)
+                    self._add_scene(group)
+                    groups.append(group)
+
+        return groups
+
+    def _fetch(self):
+        try:
+            self.log.debug(f'Fetching scenes')
+            res = self._ws.get_scene_list()
+
+            self._reset()
+            for entry in res.scenes:
+                self._add_scene(Scene(entry['sceneUuid'], entry['sceneName']))
+
+            pending = list(self.scenes.values())
+            while len(pending) != 0:
+                pending = self._fetch_items(pending)
+
+            self.log.debug(f'Scenes fetched: {len(self.scenes)} scenes, '
+                           f'{sum(len(x.items) for x in self.scenes.values())} items')
+
+            self.list_changed.emit()
+            self._update_current(res.current_program_scene_name)
+        except Exception as e:
+            self.log.warning(f'Error fetching scenes: {str(e)}')
+            self.on_error.emit(str(e))
+
+    def _fetch_item(self, scene_uuid: str, item_id: int):
+        """ Scene item creation events don't carry the item state, so it has to be fetched separately """
+        item = self._item(scene_uuid, item_id)
+        if item is None:
+            return
+
+        data = {'sceneUuid': scene_uuid, 'sceneItemId': item_id}
+        try:
+            enabled, locked, transform = send_batch(self._ws, [BatchRequest('GetSceneItemEnabled', data),
+                                                               BatchRequest('GetSceneItemLocked', data),
+                                                               BatchRequest('GetSceneItemTransform', data)])
+        except Exception as e:
+            self.log.warning(f'Error fetching scene item "{item.source_name}": {str(e)}')
+            self.on_error.emit(str(e))
+            return
+
+        if enabled.success:
+            item.enabled = enabled.data['sceneItemEnabled']
+        if locked.success:
+            item.locked = locked.data['sceneItemLocked']
+        if transform.success:
+            item.transform = transform.data['sceneItemTransform']
+
+        self.item_changed.emit(item)
+
+    def _update_current(self, name: str | None):
+        if name != self.current:
+            self.log.info(f'Current scene changed: {self.current} -> {name}')
+            self.current = name
+            self.current_changed.emit(self.current)
+
+    def _connection_state_changed(self, state: ConnectionState, _: str | None):
+        if state != ConnectionState.Connected:
+            self.log.debug(f'Resetting scenes')
+            self._reset()
+            self.list_changed.emit()
+            self._update_current(None)
+            return
+
+        self._fetch()
+
+    ################################################################################
+    # Transform tracking
+    ################################################################################
+
+    def acquire_transforms(self, consumer: QObject):
+        """ Keep the scene item transforms current on behalf of the consumer """
+        if id(consumer) in self._transform_consumers:
+            return
+
+        self._transform_consumers.add(id(consumer))
+        if len(self._transform_consumers) == 1:
+            self.log.debug('Subscribing to the scene item transform changes')
+            self._connection.acquire_subscription(Subs.SCENEITEMTRANSFORMCHANGED)
+
+            # Transforms could have changed while we weren't listening
+            if self._connection.connection_state == ConnectionState.Connected:
+                self._fetch()
+
+    def release_transforms(self, consumer: QObject):
+        if id(consumer) not in self._transform_consumers:
+            return
+
+        self._transform_consumers.remove(id(consumer))
+        if len(self._transform_consumers) == 0:
+            self.log.debug('Unsubscribing from the scene item transform changes')
+            self._connection.release_subscription(Subs.SCENEITEMTRANSFORMCHANGED)
+
+    ################################################################################
+    # Events
+    ################################################################################
+
+    # Note: the callbacks are called on the event thread, the events are handled on the thread owning the scenes, so
+    # the index is only ever touched (and the requests sent) from a single thread
+
+    def _handle_event(self, handler, event):
+        handler(event)
+
+    def on_scene_created(self, event):
+        self._event_received.emit(self._handle_scene_created, event)
+
+    def on_scene_removed(self, event):
+        self._event_received.emit(self._handle_scene_removed, event)
+
+    def on_scene_name_changed(self, event):
+        self._event_received.emit(self._handle_scene_name_changed, event)
+
+    def on_current_program_scene_changed(self, event):
+        self._event_received.emit(self._handle_current_program_scene_changed, event)
+
+    def on_input_name_changed(self, event):
+        self._event_received.emit(self._handle_input_name_changed, event)
+
+    def on_scene_item_created(self, event):
+        self._event_received.emit(self._handle_scene_item_created, event)
+
+    def on_scene_item_removed(self, event):
+        self._event_received.emit(self._handle_scene_item_removed, event)
+
+    def on_scene_item_list_reindexed(self, event):
+        self._event_received.emit(self._handle_scene_item_list_reindexed, event)
+
+    def on_scene_item_enable_state_changed(self, event):
+        self._event_received.emit(self._handle_scene_item_enable_state_changed, event)
+
+    def on_scene_item_lock_state_changed(self, event):
+        self._event_received.emit(self._handle_scene_item_lock_state_changed, event)
+
+    def on_scene_item_transform_changed(self, data: dict):
+        self._event_received.emit(self._handle_scene_item_transform_changed, data)
+
+    def _handle_scene_created(self, event):
+        self.log.info(f'Scene created: "{event.scene_name}"')
+        self._add_scene(Scene(event.scene_uuid, event.scene_name, event.is_group))
+        self.list_changed.emit()
+
+    def _handle_scene_removed(self, event):
+        if event.scene_uuid not in self.scenes:
+            self.log.warning(f'Non-existent scene removed: "{event.scene_name}". Re-fetching scenes.')
+            return self._fetch()
+
+        self.log.info(f'Scene removed: "{event.scene_name}"')
+        self._remove_scene(event.scene_uuid)
+        self.list_changed.emit()
+
+    def _handle_scene_name_changed(self, event):
+        scene = self.scenes.get(event.scene_uuid)
+        if scene is None:
+            self.log.warning(f'Name update for non-existent scene: "{event.old_scene_name}" -> "{event.scene_name}". '
+                             f'Re-fetching scenes.')
+            return self._fetch()
+
+        self.log.info(f'Scene renamed: "{event.old_scene_name}" -> "{event.scene_name}"')
+        self._scene_uuids.pop(scene.name, None)
+        scene.name = event.scene_name
+        self._scene_uuids[scene.name] = scene.uuid
+        self._rename_source(scene.uuid, event.old_scene_name, event.scene_name)
+
+        if self.current == event.old_scene_name:
+            self._update_current(event.scene_name)
+
+        self.list_changed.emit()
+
+    def _handle_current_program_scene_changed(self, event):
+        self._update_current(event.scene_name)
+
+    def _handle_input_name_changed(self, event):
+        self._rename_source(event.input_uuid, event.old_input_name, event.input_name)
+
+    def _handle_scene_item_created(self, event):
+        scene = self.scenes.get(event.scene_uuid)
+        if scene is None:
+            self.log.warning(f'Item created in non-existent scene: "{event.scene_name}". Re-fetching scenes.')
+            return self._fetch()
+
+        self._add_item(SceneItem(scene.uuid, event.scene_item_id, event.source_uuid, event.source_name,
+                                 event.scene_item_index))
+        self._fetch_item(scene.uuid, event.scene_item_id)
+        self.items_changed.emit(scene)
+
+    def _handle_scene_item_removed(self, event):
+        item = self._item(event.scene_uuid, event.scene_item_id)
+        if item is None:
+            # Happens for the items of a removed scene
+            self.log.debug(f'Non-existent item removed: "{event.source_name}" in "{event.scene_name}"')
+            return
+
+        self._remove_item(item)
+        self.items_changed.emit(self.scenes[event.scene_uuid])
+
+    def _handle_scene_item_list_reindexed(self, event):
+        scene = self.scenes.get(event.scene_uuid)
+        if scene is None:
+            return
+
+        for entry in event.scene_items:
+            item = scene.items.get(entry['sceneItemId'])
+            if item is not None:
+                item.index = entry['sceneItemIndex']
+
+        self.items_changed.emit(scene)
+
+    def _handle_scene_item_enable_state_changed(self, event):
+        item = self._item(event.scene_uuid, event.scene_item_id)
+        if item is not None:
+            item.enabled = event.scene_item_enabled
+            self.item_changed.emit(item)
+
+    def _handle_scene_item_lock_state_changed(self, event):
+        item = self._item(event.scene_uuid, event.scene_item_id)
+        if item is not None:
+            item.locked = event.scene_item_locked
+            self.item_changed.emit(item)
+
+    def _handle_scene_item_transform_changed(self, data: dict):
+        # Note: raw event data, see raw_obs_callbacks
+        item = self._item(data.get('sceneUuid'), data.get('sceneItemId'))
+        if item is not None:
+            item.transform = data.get('sceneItemTransform', {})
+            self.item_changed.emit(item)
@@ -0,0 +1,140 @@
+import math
+import time
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+import obsws_python as obs
+
+from obs_scene_helper.controller.obs.batch import BatchRequest, send_batch
+from obs_scene_helper.controller.obs.connection import Connection, ConnectionState
+from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.model.metrics.obs_stats import FIELDS, StatsSnapshot, make_sample, summarize
+from obs_scene_helper.model.metrics.series import SeriesBuffer
+
+
+class Stats(QObject):
+    """
+    Periodically samples the OBS performance stats (GetStats and GetRecordStatus, sent as a single batch) into a
+    fixed-size history, and computes the rolling aggregates over the configured window.
+
+    Every aggregate with a configured threshold is watched: `threshold_exceeded` is emitted once the aggregate goes
+    above the threshold, and `threshold_recovered` once it drops well below it again.
+    """
+
+    LOG_NAME = 'obs.stats'
+
+    # Samples kept in the history: 2 hours at the default interval
+    HISTORY = 3600
+
+    # An exceeded threshold only recovers below this fraction of it
+    RECOVERY_FACTOR = 0.8
+
+    # Aggregate -> telemetry settings field holding its threshold
+    THRESHOLDS = {
+        'render_time': 'max_render_time',
+        'render_skip': 'max_render_skip',
+        'output_skip': 'max_output_skip',
+        'cpu': 'max_cpu',
+    }
+
+    updated = Signal(StatsSnapshot)
+
+    # Aggregate name, value, threshold
+    threshold_exceeded = Signal(str, float, float)
+    threshold_recovered = Signal(str, float, float)
+
+    def __init__(self, connection: Connection, settings: Settings):
+        super().__init__()
+
+        self._connection = connection
+        self._connection.connection_state_changed.connect(self._connection_state_changed)
+
+        self._settings = settings
+        self._settings.osh_changed.connect(self._handle_settings_change)
+
+        self.series = SeriesBuffer(FIELDS, self.HISTORY)
+        self.snapshot = None  # type: Optional[StatsSnapshot]
+
+        self._totals = {}  # type: dict
+        self._exceeded = set()  # type: set[str]
+        self._failing = False
+
+        self._sample_timer = QTimer(self)
+        self._sample_timer.timeout.connect(self.sample)
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @property
+    def _ws(self) -> obs.ReqClient | None:
+        return self._connection.ws
+
+    @property
+    def _telemetry(self):
+        return self._settings.osh.telemetry
+
+    @property
+    def exceeded(self) -> set[str]:
+        return set(self._exceeded)
+
+    def _interval_ms(self) -> int:
+        return max(100, int(self._telemetry.interval * 1000))
+
+    def _handle_settings_change(self):
+        if self._sample_timer.isActive():
+            self._sample_timer.setInterval(self._interval_ms())
+
+    def _connection_state_changed(self, state: ConnectionState, _: str | None):
+        if state != ConnectionState.Connected:
+            self._sample_timer.stop()
+            return
+
+        # OBS could have been restarted, the totals start from zero in this case
+        self._totals = {}
+        self._failing = False
+        self._sample_timer.start(self._interval_ms())
+
+    def sample(self):
+        if self._ws is None:
+            return
+
+        try:
+            stats, record_status = send_batch(self._ws, [BatchRequest('GetStats'), BatchRequest('GetRecordStatus')])
+        except Exception as e:
+            if not self._failing:
+                self.log.warning(f'Error getting OBS stats: {str(e)}')
+                self._failing = True
+            return
+
+        self._failing = False
+        self.add_sample(time.monotonic(), stats.data, record_status.data if record_status.success else {})
+
+    def add_sample(self, timestamp: float, stats: dict, record_status: dict):
+        self.series.append(timestamp, make_sample(stats, record_status, self._totals))
+
+        self.snapshot = summarize(self.series, self._telemetry.window)
+        self.updated.emit(self.snapshot)
+        self._check_thresholds(self.snapshot)
+
+    def _check_thresholds(self, snapshot: StatsSnapshot):
+        for name, setting in self.THRESHOLDS.items():
+            threshold = getattr(self._telemetry, setting)
+            value = snapshot.value(name)
+
+            if threshold <= 0 or math.isnan(value):
+                if name in self._exceeded:
+                    self._exceeded.discard(name)
+                    self.threshold_recovered.emit(name, value, threshold)
+                continue
+
+            if name not in self._exceeded and value > threshold:
+                self._exceeded.add(name)
+                self.log.warning(f'{name} is above the threshold: {value:.2f} > {threshold:.2f}')
+                self.threshold_exceeded.emit(name, value, threshold)
+            elif name in self._exceeded and value < threshold * self.RECOVERY_FACTOR:
+                self._exceeded.discard(name)
+                self.log.info(f'{name} is back below the threshold: {value:.2f} < {threshold:.2f}')
+                self.threshold_recovered.emit(name, value, threshold)
@@ -1,9 +1,15 @@
 import json
-from typing import Optional, List
+import queue
+import threading
+import time
 
-from PySide6.QtCore import QObject, Signal, QSettings
+from typing import Optional, List, Dict
+
+from PySide6.QtCore import QObject, Signal, QSettings, QTimer, QCoreApplication
 
 from obs_scene_helper.controller.system.display_list import DisplayList
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
 
 from obs_scene_helper.model.settings.obs import OBS
 from obs_scene_helper.model.settings.preset import PresetList
@@ -12,6 +18,17 @@ from obs_scene_helper.model.settings.osh import OSH
 
 
 class Settings(QObject):
+    """
+    Persisted application settings.
+
+    Every section is saved separately: a change only marks its section as dirty, and all the changes made within a
+    short window are written together. Only the dirty sections are serialized (on the calling thread, so the snapshot
+    is consistent), the actual writing and syncing is done by a writer thread. QSettings commits every sync
+    atomically, so a crash never leaves a half-written settings file behind. Pending changes are flushed on quit.
+    """
+
+    LOG_NAME = 'settings'
+
     ORG_NAME = 'yobasoft'
     APP_NAME = 'ObsSceneHelper'
 
@@ -25,9 +42,27 @@ class Settings(QObject):
     all_displays_changed = Signal()
     osh_changed = Signal()
 
+    # Changes made within this window are written together
+    SAVE_DELAY_MS = 500
+
+    # Time to wait for the writer to finish on quit
+    STOP_TIMEOUT = 5.0
+
     def __init__(self, display_list: DisplayList, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self.log = Log.child(self.LOG_NAME)
+
+        self._dirty = set()  # type: set[str]
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.flush)
+
+        self._queue = queue.Queue()  # type: queue.Queue[Optional[Dict[str, str]]]
+        self._writer = threading.Thread(target=self._write, name='osh-settings', daemon=True)
+        self._writer.start()
+
         self.display_list = display_list
         self.display_list.changed.connect(self._on_current_display_list_changed)
 
@@ -39,25 +74,33 @@ class Settings(QObject):
         self.settings = QSettings(Settings.ORG_NAME, Settings.APP_NAME)
         self._load_settings()
 
-        self.all_displays.update(self.display_list.displays)
+        self._on_current_display_list_changed(self.display_list.displays)
+
+        self.log.debug('Initialized')
 
-    def _on_current_display_list_changed(self, displays: List[str]):
-        self.all_displays.update(displays)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def _on_current_display_list_changed(self, _: List[str]):
+        identities = self.display_list.identities
+        self.all_displays.update(identities)
+        self.preset_list.migrate_fingerprints(identities)
 
     def _on_obs_changed(self):
-        self._save_settings()
+        self._mark_dirty(Settings.OBS_KEY)
         self.obs_changed.emit()
 
     def _on_presets_changed(self):
-        self._save_settings()
+        self._mark_dirty(Settings.PRESETS_KEY)
         self.preset_list_changed.emit()
 
     def _on_all_displays_changed(self):
-        self._save_settings()
+        self._mark_dirty(Settings.ALL_DISPLAYS_KEY)
         self.all_displays_changed.emit()
 
     def _on_osh_changed(self):
-        self._save_settings()
+        self._mark_dirty(Settings.OSH_KEY)
         self.osh_changed.emit()
 
     def _load_settings(self):
@@ -89,11 +132,94 @@ class Settings(QObject):
         else:
             self.osh = OSH.from_json_dict(json.loads(osh_str), self._on_osh_changed)
 
-    def _save_settings(self, sync=True):
-        self.settings.setValue(Settings.OBS_KEY, json.dumps(self.obs.to_dict()))
-        self.settings.setValue(Settings.PRESETS_KEY, json.dumps(self.preset_list.to_dict()))
-        self.settings.setValue(Settings.ALL_DISPLAYS_KEY, json.dumps(self.all_displays.to_dict()))
-        self.settings.setValue(Settings.OSH_KEY, json.dumps(self.osh.to_json_dict()))
-
-        if sync:
-            self.settings.sync()
+    def _serialize(self, key: str) -> str:
+        if key == Settings.OBS_KEY:
+            return json.dumps(self.obs.to_dict())
+        elif key == Settings.PRESETS_KEY:
+            return json.dumps(self.preset_list.to_dict())
+        elif key == Settings.ALL_DISPLAYS_KEY:
+            return json.dumps(self.all_displays.to_dict())
+        elif key == Settings.OSH_KEY:
+            return json.dumps(self.osh.to_json_dict())
+
+        raise KeyError(key)
+
+    def _mark_dirty(self, key: str):
+        self._dirty.add(key)
+
+        if not self._writer.is_alive():
+            # Shutting down, nobody is going to write the change later
+            self.flush()
+            return
+
+        # Not restarted by the following changes, so a steady stream of them is still saved regularly
+        if not self.save_timer.isActive():
+            self.save_timer.start(self.SAVE_DELAY_MS)
+
+    def flush(self):
+        """ Serialize the dirty sections, and hand them over to the writer """
+        self.save_timer.stop()
+        if len(self._dirty) == 0:
+            return
+
+        values = {x: self._serialize(x) for x in sorted(self._dirty)}
+        self._dirty.clear()
+
+        if self._writer.is_alive():
+            self._queue.put(values)
+        else:
+            self._write_values(self.settings, values)
+
+    def wait(self):
+        """ Block until everything handed over to the writer is written """
+        self._queue.join()
+
+    def shutdown(self):
+        self.flush()
+        if not self._writer.is_alive():
+            return
+
+        self._queue.put(None)
+        self._writer.join(self.STOP_TIMEOUT)
+        if self._writer.is_alive():
+            self.log.warning(f'Settings writer did not finish in {self.STOP_TIMEOUT} s')
+
+    def _write_values(self, settings: QSettings, values: Dict[str, str]):
+        started = time.monotonic()
+        for key, value in values.items():
+            settings.setValue(key, value)
+        settings.sync()
+
+        if settings.status() != QSettings.Status.NoError:
+            self.log.error(f'Error saving the settings ({", ".join(values.keys())}): {settings.status()}')
+            return
+
+        Metrics.timing('settings.write').add(time.monotonic() - started)
+        Metrics.counter('settings.sections_written').increment(len(values))
+
+    def _write(self):
+        # QSettings instances are not thread-safe, the writer has its own
+        settings = QSettings(Settings.ORG_NAME, Settings.APP_NAME)
+        while True:
+            values = self._queue.get()
+            try:
+                if values is None:
+                    return
+
+                # Only the latest value of every section matters
+                while True:
+                    try:
+                        more = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                    self._queue.task_done()
+                    if more is None:
+                        self._queue.put(None)
+                        break
+
+                    values.update(more)
+
+                self._write_values(settings, values)
+            finally:
+                self._queue.task_done()
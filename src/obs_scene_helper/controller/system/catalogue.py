@@ -0,0 +1,130 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QStandardPaths, Signal
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.catalogue import store
+from obs_scene_helper.model.catalogue.store import Operation, Segment, SegmentQuery
+
+
+def default_path() -> str:
+    root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
+    return os.path.join(root, 'yobasoft', 'ObsSceneHelper', 'catalogue.sqlite3')
+
+
+class Catalogue(QObject):
+    """
+    SQLite catalogue of the recordings.
+
+    Writes are queued and applied by a single writer thread, which batches everything queued within a short window
+    into one transaction, so the event handlers never wait for the disk. Queries use a separate connection in the
+    calling thread, the write-ahead log makes sure they don't wait for the writer either.
+    """
+
+    LOG_NAME = 'cat'
+
+    # Time to wait for more operations before committing a batch
+    BATCH_WINDOW = 0.5
+    MAX_BATCH_SIZE = 500
+
+    # Time to wait for the writer to flush the pending operations on shutdown
+    STOP_TIMEOUT = 5.0
+
+    # Emitted from the writer thread once a batch is committed
+    changed = Signal()
+
+    def __init__(self, path: Optional[str] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        self.path = path if path is not None else default_path()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._reader = store.connect(self.path)
+
+        self._queue = queue.Queue()  # type: queue.Queue[Optional[Operation]]
+        self._writer = threading.Thread(target=self._write, name='osh-catalogue', daemon=True)
+        self._writer.start()
+
+        self.log.debug(f'Initialized: {self.path}')
+
+    def submit(self, operations: List[Operation]):
+        for operation in operations:
+            self._queue.put(operation)
+
+    def shutdown(self):
+        if not self._writer.is_alive():
+            return
+
+        self._queue.put(None)
+        self._writer.join(self.STOP_TIMEOUT)
+        if self._writer.is_alive():
+            self.log.warning(f'Catalogue writer did not finish in {self.STOP_TIMEOUT} s')
+
+    def find_segments(self, query: SegmentQuery) -> List[Segment]:
+        started = time.monotonic()
+        res = store.find_segments(self._reader, query)
+        Metrics.timing('cat.query').add(time.monotonic() - started)
+        return res
+
+    def known_presets(self) -> List[str]:
+        return store.known_presets(self._reader)
+
+    def _next_batch(self) -> Optional[List[Operation]]:
+        """ Block for the first operation, then collect the ones following it. None means stop. """
+        first = self._queue.get()
+        if first is None:
+            self._queue.task_done()
+            return None
+
+        batch = [first]
+        deadline = time.monotonic() + self.BATCH_WINDOW
+        while len(batch) < self.MAX_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                operation = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+            if operation is None:
+                # Write what we have, and stop afterwards
+                self._queue.task_done()
+                self._queue.put(None)
+                break
+
+            batch.append(operation)
+
+        return batch
+
+    def _write(self):
+        conn = store.connect(self.path)
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+
+                started = time.monotonic()
+                try:
+                    store.apply_batch(conn, batch)
+                    Metrics.timing('cat.batch').add(time.monotonic() - started)
+                    Metrics.counter('cat.writes').increment(len(batch))
+                    self.changed.emit()
+                except sqlite3.Error as e:
+                    self.log.error(f'Error writing {len(batch)} catalogue change(s): {str(e)}')
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            conn.close()
@@ -1,15 +1,33 @@
-from typing import List
+import time
+
+from typing import List, Optional
 from sys import platform
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.display.identity import DisplayIdentity
+from obs_scene_helper.model.display.settle import SettleWindow
 
 
 class DisplayList(QObject):
+    """
+    Current display list, as reported by the platform-specific provider.
+
+    Every change is propagated right away with the `changed` signal. Display configuration changes usually come in
+    bursts (e.g. docking a laptop), so once no change was seen for a while, the `settled` signal is emitted with the
+    final display list. The settle window adapts to the bursts observed so far.
+    """
     LOG_NAME = 'dl'
 
+    # Settle window bounds, in seconds
+    SETTLE_INITIAL_WINDOW = 2.0
+    SETTLE_MIN_WINDOW = 0.5
+    SETTLE_MAX_WINDOW = 10.0
+
     changed = Signal(list)
+    settled = Signal(list)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -17,10 +35,22 @@ class DisplayList(QObject):
         self.log = Log.child(self.LOG_NAME)
         self.log.debug('Initialized')
 
+        self._settle_window = SettleWindow(self.SETTLE_INITIAL_WINDOW, self.SETTLE_MIN_WINDOW, self.SETTLE_MAX_WINDOW)
+        self._burst_started = None  # type: Optional[float]
+        self._burst_changes = 0
+
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.timeout.connect(self._handle_settled)
+
         if platform == 'win32':
             from obs_scene_helper.controller.system.provider.display_list.windows import WindowsProvider
             self._provider = WindowsProvider(*args, **kwargs)
             self.log.info('Configured windows provider')
+        elif platform.startswith('linux') and self._drm_available():
+            from obs_scene_helper.controller.system.provider.display_list.linux import LinuxProvider
+            self._provider = LinuxProvider(*args, **kwargs)
+            self.log.info('Configured Linux DRM provider')
         else:
             from obs_scene_helper.controller.system.provider.display_list.qt import QtProvider
             self._provider = QtProvider(*args, **kwargs)
@@ -31,13 +61,51 @@ class DisplayList(QObject):
 
             # Simulate a display list changed event.
             # This way the clients will start with a valid list of displays
-            self._handle_display_list_change(self._provider.displays)
+            self._propagate_change(self._provider.displays)
+
+    @staticmethod
+    def _drm_available() -> bool:
+        # No connected outputs in sysfs (e.g. a VM or a container): fall back to whatever Qt reports
+        from obs_scene_helper.controller.system.provider.display_list.linux import LinuxProvider
+        return LinuxProvider.is_available()
 
     @property
     def displays(self):
         return self._provider.displays
 
-    def _handle_display_list_change(self, displays: List[str]):
+    @property
+    def identities(self) -> List[DisplayIdentity]:
+        return self._provider.identities
+
+    @property
+    def is_settled(self) -> bool:
+        return not self.settle_timer.isActive()
+
+    def _propagate_change(self, displays: List[str]):
         # Just propagate the signal
         self.log.info(f'Display list change: {displays}')
         self.changed.emit(displays)
+
+    def _handle_display_list_change(self, displays: List[str]):
+        now = time.monotonic()
+        Metrics.counter('dl.changes').increment()
+
+        if self._burst_started is None:
+            self._burst_started = now
+            self._burst_changes = 0
+
+        self._burst_changes += 1
+        self._settle_window.change(now)
+
+        self._propagate_change(displays)
+        self.settle_timer.start(int(self._settle_window.window * 1000))
+
+    def _handle_settled(self):
+        displays = self.displays
+        burst_duration = time.monotonic() - self._burst_started
+        self._burst_started = None
+
+        timing = Metrics.timing('dl.settle_time')
+        timing.add(burst_duration)
+        self.log.info(f'Display list settled after {self._burst_changes} change(s): {displays} ({timing})')
+        self.settled.emit(displays)
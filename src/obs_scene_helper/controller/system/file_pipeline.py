@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+import threading
+import time
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.pipeline import worker
+from obs_scene_helper.model.pipeline.job_table import Table as JobTable, PipelineJob, JobState
+from obs_scene_helper.model.pipeline.stages import FileReport, PipelineConfig, StageResult
+
+
+def available_cores() -> int:
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+class FilePipeline(QObject):
+    """
+    Passes the finished recording files through the pipeline stages (see `model.pipeline.stages`) on a pool of worker
+    processes, so hashing large files neither blocks the UI nor competes with OBS for the GIL.
+
+    The read bandwidth limit is shared between the workers, and the workers run with a lower priority, so the
+    recording itself is not disturbed. The pool is started with the first file, and terminated on shutdown.
+    """
+
+    LOG_NAME = 'fpl'
+
+    # Time to wait for the progress reader to exit
+    STOP_TIMEOUT = 2.0
+
+    file_done = Signal(FileReport)
+
+    # Emitted from the pool threads, handled in the GUI thread
+    _progress_received = Signal(str, int, int)
+    _job_done = Signal(str, object)
+
+    def __init__(self, config: PipelineConfig, max_workers: int = 0, table: Optional[JobTable] = None,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        self.config = config
+        self.max_workers = max_workers
+        self.table = table if table is not None else JobTable()
+
+        self._context = multiprocessing.get_context('spawn')
+        self._pool = None
+        self._pool_workers = 0
+        self._progress_queue = None
+        self._progress_reader = None  # type: Optional[threading.Thread]
+        self._bandwidth_free_at = None
+        self._active = 0
+
+        self._progress_received.connect(self._handle_progress)
+        self._job_done.connect(self._handle_job_done)
+
+        self.log.debug('Initialized')
+
+    @property
+    def workers(self) -> int:
+        """ Leave half of the cores to OBS unless told otherwise """
+        return self.max_workers if self.max_workers > 0 else max(1, available_cores() // 2)
+
+    @property
+    def idle(self) -> bool:
+        return self._active == 0
+
+    def configure(self, config: PipelineConfig, max_workers: int):
+        self.config = config
+        self.max_workers = max_workers
+
+        # A new pool size only takes effect once the current files are done
+        if self._pool is not None and self.idle and self._pool_workers != self.workers:
+            self._stop_pool()
+
+    def _start_pool(self):
+        self._pool_workers = self.workers
+        self.log.info(f'Starting {self._pool_workers} pipeline worker(s)')
+
+        self._progress_queue = self._context.SimpleQueue()
+        self._bandwidth_free_at = self._context.Value('d', 0.0)
+        self._pool = self._context.Pool(self._pool_workers, worker.init_worker,
+                                        (self._progress_queue, self._bandwidth_free_at))
+
+        self._progress_reader = threading.Thread(target=self._read_progress, args=(self._progress_queue,),
+                                                 name='osh-pipeline-progress', daemon=True)
+        self._progress_reader.start()
+
+    def _stop_pool(self):
+        if self._pool is None:
+            return
+
+        self._pool.terminate()
+        self._pool.join()
+        self._pool = None
+
+        self._progress_queue.put(None)
+        self._progress_reader.join(self.STOP_TIMEOUT)
+        self._progress_queue.close()
+        self._progress_queue = None
+        self._progress_reader = None
+        self._bandwidth_free_at = None
+
+    def shutdown(self):
+        if self._active != 0:
+            self.log.warning(f'Shutting down with {self._active} file(s) still being processed')
+        self._stop_pool()
+
+    def _read_progress(self, queue):
+        while True:
+            message = queue.get()
+            if message is None:
+                return
+            self._progress_received.emit(*message)
+
+    def submit(self, path: str):
+        if self._pool is None:
+            self._start_pool()
+
+        self.log.info(f'Queued {path}')
+        job = PipelineJob(path, time.time())
+        self.table.add(job)
+
+        self._active += 1
+        Metrics.gauge('fpl.active').set(self._active)
+        self._pool.apply_async(worker.run, (path, self.config),
+                               callback=lambda report: self._job_done.emit(path, report),
+                               error_callback=lambda error: self._job_done.emit(path, error))
+
+    def _handle_progress(self, path: str, done: int, total: int):
+        job = self.table.job(path)
+        if job is None or job.state not in [JobState.Queued, JobState.Running]:
+            # Progress is reported on a separate channel, and can arrive after the result
+            return
+
+        job.state = JobState.Running
+        job.done = done
+        job.total = total
+        self.table.update(path)
+
+    def _handle_job_done(self, path: str, result):
+        self._active -= 1
+        Metrics.gauge('fpl.active').set(self._active)
+
+        if isinstance(result, FileReport):
+            report = result
+        else:
+            report = FileReport(path, results=[StageResult('worker', False, str(result))])
+
+        job = self.table.job(path)
+        if job is not None:
+            job.report = report
+            if report.success:
+                job.done = job.total = report.size
+            job.state = JobState.Done if report.success else JobState.Failed
+            self.table.update(path)
+
+        Metrics.timing('fpl.file').add(report.duration)
+        if report.success:
+            self.log.info(f'Processed {path} in {report.duration:.1f} s: {report.summary}')
+        else:
+            Metrics.counter('fpl.failures').increment()
+            self.log.error(f'Processing {path} failed: {report.summary}')
+
+        self.file_done.emit(report)
@@ -0,0 +1,208 @@
+import importlib.util
+import os
+import time
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.hooks.event import HookEvent
+
+ENTRY_POINT_GROUP = 'obs_scene_helper.hooks'
+
+# Callable looked up in the hook files of the hook directory
+DIRECTORY_HOOK_NAME = 'on_event'
+
+Hook = Callable[[HookEvent], None]
+
+
+@dataclass
+class _HookState:
+    name: str
+    func: Hook
+    pending: deque = field(default_factory=deque)  # type: deque[HookEvent]
+    call_id: int = 0
+    started: Optional[float] = None  # Start of the call in flight, None if idle
+    stalled: bool = False
+
+
+class HookRunner(QObject):
+    """
+    Calls the in-process Python hooks, registered by the installed packages as entry points in the
+    "obs_scene_helper.hooks" group. Every entry point has to reference a callable accepting a single `HookEvent`.
+
+    Frozen builds don't see the installed packages (nor their entry points), so hooks can also be dropped as Python
+    files into a hook directory, every file defining an `on_event` callable.
+
+    The hooks are loaded once, and called on a thread pool, so they never block the UI thread. Every hook receives the
+    events in order, one call at a time. A hook that doesn't return in time is considered stalled: its events are
+    dropped until the call in flight returns, so it can't pile up work (Python threads cannot be killed).
+    """
+
+    LOG_NAME = 'hooks'
+
+    MAX_WORKERS = 4
+
+    # Events waiting for a busy hook, the oldest ones are dropped
+    MAX_PENDING = 100
+
+    # Emitted from the worker threads, handled in the GUI thread
+    _call_done = Signal(str, int, float, object)
+
+    def __init__(self, timeout: Optional[float] = None, hooks: Optional[Dict[str, Hook]] = None,
+                 directory: Optional[str] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        self.timeout = timeout
+
+        if hooks is None:
+            hooks = self._load_entry_points()
+            if directory is not None:
+                hooks.update(self._load_directory(directory))
+
+        self._hooks = {name: _HookState(name, func, deque(maxlen=self.MAX_PENDING))
+                       for name, func in hooks.items()}  # type: Dict[str, _HookState]
+
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        if len(self._hooks) != 0:
+            self._executor = ThreadPoolExecutor(min(len(self._hooks), self.MAX_WORKERS), 'osh-hook')
+
+        self._call_done.connect(self._handle_call_done)
+
+        self.log.debug('Initialized')
+
+    @property
+    def names(self):
+        return list(self._hooks.keys())
+
+    @property
+    def idle(self) -> bool:
+        return all(x.started is None and len(x.pending) == 0 for x in self._hooks.values())
+
+    def _load_entry_points(self) -> Dict[str, Hook]:
+        res = {}
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            name = f'{entry_point.name} ({entry_point.value})'
+            try:
+                func = entry_point.load()
+            except Exception as e:
+                self.log.error(f'Error loading hook {name}: {str(e)}')
+                continue
+
+            if not callable(func):
+                self.log.error(f'Hook {name} is not callable, skipping')
+                continue
+
+            self.log.info(f'Loaded hook {name}')
+            res[name] = func
+
+        return res
+
+    def _load_directory(self, directory: str) -> Dict[str, Hook]:
+        try:
+            files = sorted(x for x in os.listdir(directory) if x.endswith('.py'))
+        except OSError as e:
+            self.log.error(f'Error listing the hook directory {directory}: {str(e)}')
+            return {}
+
+        res = {}
+        for file_name in files:
+            path = os.path.join(directory, file_name)
+            name = f'{file_name[:-3]} ({path})'
+            try:
+                spec = importlib.util.spec_from_file_location(f'osh_hooks.{file_name[:-3]}', path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+            except Exception as e:
+                self.log.error(f'Error loading hook {name}: {str(e)}')
+                continue
+
+            func = getattr(module, DIRECTORY_HOOK_NAME, None)
+            if not callable(func):
+                self.log.error(f'Hook {name} has no {DIRECTORY_HOOK_NAME} callable, skipping')
+                continue
+
+            self.log.info(f'Loaded hook {name}')
+            res[name] = func
+
+        return res
+
+    def notify(self, event: HookEvent):
+        for hook in self._hooks.values():
+            if hook.stalled:
+                Metrics.counter('hooks.dropped').increment()
+                continue
+
+            if len(hook.pending) == hook.pending.maxlen:
+                Metrics.counter('hooks.dropped').increment()
+                self.log.warning(f'Hook {hook.name} is falling behind, dropping its oldest event')
+
+            hook.pending.append(event)
+            self._call_next(hook)
+
+    def shutdown(self):
+        if self._executor is not None:
+            # Stalled hooks are not waited for
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _call_next(self, hook: _HookState):
+        if hook.started is not None or len(hook.pending) == 0 or self._executor is None:
+            return
+
+        event = hook.pending.popleft()
+        hook.call_id += 1
+        hook.started = time.monotonic()
+
+        call_id = hook.call_id
+        self._executor.submit(self._call, hook.name, hook.func, call_id, event)
+
+        if self.timeout is not None:
+            QTimer.singleShot(int(self.timeout * 1000), self, lambda: self._check_timeout(hook, call_id))
+
+    def _call(self, name: str, func: Hook, call_id: int, event: HookEvent):
+        # Runs on a worker thread
+        started = time.monotonic()
+        error = None
+        try:
+            func(event)
+        except Exception as e:
+            error = e
+
+        self._call_done.emit(name, call_id, time.monotonic() - started, error)
+
+    def _check_timeout(self, hook: _HookState, call_id: int):
+        if hook.call_id != call_id or hook.started is None or hook.stalled:
+            return
+
+        hook.stalled = True
+        Metrics.counter('hooks.timeouts').increment()
+        self.log.warning(f'Hook {hook.name} did not return in {self.timeout} s, dropping its events until it does')
+
+        Metrics.counter('hooks.dropped').increment(len(hook.pending))
+        hook.pending.clear()
+
+    def _handle_call_done(self, name: str, call_id: int, duration: float, error: Optional[Exception]):
+        hook = self._hooks.get(name)
+        if hook is None or hook.call_id != call_id:
+            return
+
+        Metrics.timing('hooks.call').add(duration)
+        if error is not None:
+            Metrics.counter('hooks.errors').increment()
+            self.log.error(f'Hook {name} failed: {str(error)}')
+
+        if hook.stalled:
+            self.log.info(f'Hook {name} returned after {duration:.1f} s')
+            hook.stalled = False
+
+        hook.started = None
+        self._call_next(hook)
@@ -0,0 +1,40 @@
+import threading
+
+from typing import Optional
+
+from obs_scene_helper.model.metrics.metric import Counter, Gauge, Timing
+
+
+class Metrics:
+    """ Process-wide registry of the named counters and timings """
+
+    INSTANCE = None  # type: Optional[Metrics]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}  # type: dict[str, Counter]
+        self.gauges = {}  # type: dict[str, Gauge]
+        self.timings = {}  # type: dict[str, Timing]
+
+    @staticmethod
+    def setup():
+        if Metrics.INSTANCE is None:
+            Metrics.INSTANCE = Metrics()
+
+    @staticmethod
+    def counter(name: str) -> Counter:
+        instance = Metrics.INSTANCE
+        with instance._lock:
+            return instance.counters.setdefault(name, Counter(name))
+
+    @staticmethod
+    def gauge(name: str) -> Gauge:
+        instance = Metrics.INSTANCE
+        with instance._lock:
+            return instance.gauges.setdefault(name, Gauge(name))
+
+    @staticmethod
+    def timing(name: str) -> Timing:
+        instance = Metrics.INSTANCE
+        with instance._lock:
+            return instance.timings.setdefault(name, Timing(name))
@@ -0,0 +1,203 @@
+import os
+import socket
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QSocketNotifier, QTimer, Signal, QCoreApplication
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.model.display.edid import Edid, InvalidEdid, parse_edid
+from obs_scene_helper.model.display.identity import DisplayIdentity
+
+# Connected outputs are read straight from the DRM subsystem: every connector has a sysfs directory (e.g.
+# "card0-HDMI-A-1") with a "status" file ("connected", "disconnected" or "unknown") and the raw "edid" of the attached
+# monitor. Hotplug events are delivered by the kernel as uevents over a netlink socket.
+#
+# The displays are named after their connector, spelled the way X11 (xrandr) and therefore Qt spell them, so the presets
+# saved with the Qt provider keep their names. Wayland compositors use the DRM spelling, which is kept as an alias.
+
+DRM_ROOT = '/sys/class/drm'
+
+NETLINK_KOBJECT_UEVENT = 15
+KERNEL_UEVENT_GROUP = 1
+
+# DRM connector types spelled differently by X11, e.g. "HDMI-A-1" is "HDMI-1"
+XRANDR_CONNECTOR_TYPES = {'HDMI-A': 'HDMI', 'Unknown': 'None'}
+
+
+@dataclass
+class DrmOutput:
+    connector: str  # Connector name without the card prefix, e.g. "HDMI-A-1"
+    edid: Optional[Edid] = None
+
+    @property
+    def name(self) -> str:
+        """ Connector name as reported by X11 and Qt, e.g. "HDMI-1" """
+        connector_type, sep, index = self.connector.rpartition('-')
+        if not sep:
+            return self.connector
+        return f'{XRANDR_CONNECTOR_TYPES.get(connector_type, connector_type)}-{index}'
+
+
+def _read(path: str, mode: str = 'r'):
+    try:
+        with open(path, mode) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def scan_drm(root: str = DRM_ROOT) -> List[DrmOutput]:
+    """ List the connected outputs, sorted by connector """
+    try:
+        entries = sorted(os.listdir(root))
+    except OSError:
+        return []
+
+    res = []
+    for entry in entries:
+        # Connector directories are prefixed with the card they belong to, skip the cards themselves
+        card, sep, connector = entry.partition('-')
+        if not sep or not card.startswith('card'):
+            continue
+
+        status = _read(os.path.join(root, entry, 'status'))
+        if status is None or status.strip() != 'connected':
+            continue
+
+        edid = None
+        edid_data = _read(os.path.join(root, entry, 'edid'), 'rb')
+        if edid_data:
+            try:
+                edid = parse_edid(edid_data)
+            except InvalidEdid:
+                pass
+
+        res.append(DrmOutput(connector, edid))
+
+    return res
+
+
+def display_names(outputs: List[DrmOutput]) -> List[str]:
+    return [x.name for x in outputs]
+
+
+def display_identities(outputs: List[DrmOutput]) -> List[DisplayIdentity]:
+    res = []
+    for output in outputs:
+        aliases = (output.connector,) if output.connector != output.name else ()
+        edid = output.edid
+        if edid is None:
+            res.append(DisplayIdentity(output.name, aliases=aliases))
+            continue
+
+        res.append(DisplayIdentity(output.name, edid.manufacturer, f'{edid.product_code:04X}', edid.device_serial,
+                                   aliases))
+
+    return res
+
+
+class LinuxProvider(QObject):
+    LOG_NAME = 'ldl'
+
+    # Hotplugging a monitor generates a couple of uevents, only rescan once they stop coming
+    RESCAN_DEBOUNCE_MS = 250
+
+    # Used if the netlink socket is not available (e.g. in a sandbox)
+    POLL_INTERVAL_MS = 2000
+
+    changed = Signal(list)
+
+    def __init__(self, *args, root: str = DRM_ROOT, use_netlink: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        self.root = root
+
+        self.rescan_timer = QTimer(self)
+        self.rescan_timer.setSingleShot(True)
+        self.rescan_timer.timeout.connect(self.rescan)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.rescan)
+
+        self._socket = None  # type: Optional[socket.socket]
+        self._notifier = None  # type: Optional[QSocketNotifier]
+
+        if not use_netlink or not self._open_netlink():
+            self.log.info(f'Polling {self.root} every {self.POLL_INTERVAL_MS} ms')
+            self.poll_timer.start(self.POLL_INTERVAL_MS)
+
+        self._identities = display_identities(scan_drm(self.root))
+
+        self.log.debug('Initialized')
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._about_to_quit)
+
+    @staticmethod
+    def is_available(root: str = DRM_ROOT) -> bool:
+        return len(scan_drm(root)) != 0
+
+    @property
+    def displays(self):
+        return [x.name for x in self._identities]
+
+    @property
+    def identities(self):
+        return self._identities
+
+    def _open_netlink(self) -> bool:
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+            sock.bind((0, KERNEL_UEVENT_GROUP))
+            sock.setblocking(False)
+        except (AttributeError, OSError) as e:
+            self.log.warning(f'Hotplug events are not available: {str(e)}')
+            return False
+
+        self._socket = sock
+        self._notifier = QSocketNotifier(sock.fileno(), QSocketNotifier.Type.Read, self)
+        self._notifier.activated.connect(self._handle_uevents)
+        return True
+
+    def _about_to_quit(self):
+        self.poll_timer.stop()
+        self.rescan_timer.stop()
+
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier = None
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _handle_uevents(self, *_):
+        drm_event = False
+        while True:
+            try:
+                message = self._socket.recv(16384)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                self.log.warning(f'Error reading hotplug events: {str(e)}')
+                break
+
+            # Messages are NUL-separated "KEY=VALUE" fields, preceded by an "action@devpath" header
+            if b'\0SUBSYSTEM=drm\0' in message:
+                drm_event = True
+
+        if drm_event:
+            self.log.debug('DRM hotplug event')
+            self.rescan_timer.start(self.RESCAN_DEBOUNCE_MS)
+
+    def rescan(self):
+        identities = display_identities(scan_drm(self.root))
+        if sorted(x.fingerprint for x in identities) != sorted(x.fingerprint for x in self._identities):
+            self._identities = identities
+            self.log.info(f'Display list changed')
+            self.changed.emit(self.displays)
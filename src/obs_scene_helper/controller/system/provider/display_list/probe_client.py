@@ -0,0 +1,222 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+
+from typing import List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.controller.system.provider.display_list import probe_server
+
+
+class ProbeClient(QObject):
+    """
+    Talks to a long-lived probe server process (see `probe_server`), restarting it whenever it dies.
+
+    Requests are asynchronous: the answer is delivered with the `displays_received` signal. Only the latest request
+    matters, so a new request supersedes any pending one, and a pending request is re-sent after a restart.
+
+    A fresh request is answered by a new server instance, for the changes the Qt instance of a long-lived server never
+    hears about (see the Windows provider).
+    """
+
+    LOG_NAME = 'dlp'
+
+    # Restart delay: doubled after every crash, reset once the server answers a request
+    RESTART_INITIAL_DELAY_MS = 500
+    RESTART_MAX_DELAY_MS = 30000
+
+    # Kill (and restart) the server if it doesn't answer in time
+    REQUEST_TIMEOUT_MS = 5000
+
+    # Time to wait for the server to exit after closing its stdin
+    STOP_TIMEOUT = 2.0
+
+    displays_received = Signal(list)
+
+    # Emitted from the stdout reader thread, handled in the GUI thread
+    _line_received = Signal(object, str)
+    _output_closed = Signal(object)
+
+    def __init__(self, command: List[str], popen_flags: Optional[dict] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.command = command
+        self.popen_flags = popen_flags if popen_flags is not None else {}
+
+        self._process = None  # type: Optional[subprocess.Popen]
+        self._ready = False
+        self._stopping = False
+
+        self._next_id = 1
+        self._pending_id = None  # type: Optional[int]
+        self._requested_at = None  # type: Optional[float]
+
+        self._restart_delay_ms = self.RESTART_INITIAL_DELAY_MS
+
+        self._line_received.connect(self._handle_line)
+        self._output_closed.connect(self._handle_output_closed)
+
+        self.restart_timer = QTimer(self)
+        self.restart_timer.setSingleShot(True)
+        self.restart_timer.timeout.connect(self.start)
+
+        self.request_timer = QTimer(self)
+        self.request_timer.setSingleShot(True)
+        self.request_timer.timeout.connect(self._handle_request_timeout)
+
+        self.log = Log.child(self.LOG_NAME)
+        self.log.debug('Initialized')
+
+    @staticmethod
+    def interpreted_command() -> List[str]:
+        return [sys.executable, '-m', probe_server.__name__]
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    def start(self):
+        if self.running:
+            return
+
+        self._stopping = False
+        self._ready = False
+        self.restart_timer.stop()
+
+        try:
+            self.log.debug(f'Starting probe server: {self.command}')
+            process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                       stderr=subprocess.DEVNULL, text=True, bufsize=1, **self.popen_flags)
+        except Exception as e:
+            self.log.error(f'Error starting probe server: {str(e)}')
+            self._schedule_restart()
+            return
+
+        self._process = process
+        reader = threading.Thread(target=self._read_responses, args=(process,), name='osh-probe-client', daemon=True)
+        reader.start()
+
+    def stop(self):
+        self._stopping = True
+        self.restart_timer.stop()
+        self.request_timer.stop()
+
+        process = self._process
+        self._process = None
+        self._ready = False
+        if process is None:
+            return
+
+        try:
+            process.stdin.close()
+            process.wait(self.STOP_TIMEOUT)
+        except Exception as e:
+            self.log.warning(f'Probe server did not exit, killing it: {str(e)}')
+            process.kill()
+
+    def request_displays(self, fresh: bool = False):
+        self._pending_id = self._next_id
+        self._next_id += 1
+        self._requested_at = time.monotonic()
+
+        if fresh and self._process is not None:
+            Metrics.counter('dlp.fresh_requests').increment()
+            self.log.debug('Restarting the probe server for a fresh display list')
+            self.stop()
+
+        if not self.running:
+            # The request is sent once the server is ready
+            self.start()
+            return
+
+        if self._ready:
+            self._send_pending()
+
+    def _send_pending(self):
+        if self._pending_id is None:
+            return
+
+        try:
+            request = {'id': self._pending_id, 'method': probe_server.METHOD_DISPLAYS}
+            self._process.stdin.write(json.dumps(request) + '\n')
+            self._process.stdin.flush()
+            self.request_timer.start(self.REQUEST_TIMEOUT_MS)
+        except Exception as e:
+            # The reader will notice the server is gone and restart it
+            self.log.warning(f'Error sending request to the probe server: {str(e)}')
+
+    def _read_responses(self, process: subprocess.Popen):
+        for line in process.stdout:
+            self._line_received.emit(process, line)
+
+        self._output_closed.emit(process)
+
+    def _handle_line(self, process: subprocess.Popen, line: str):
+        if process is not self._process:
+            # Leftovers from a previous instance
+            return
+
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            self.log.warning(f'Unexpected probe server output: {line.strip()}')
+            return
+
+        if message.get('event') == probe_server.EVENT_READY:
+            self.log.debug(f'Probe server ready, PID: {process.pid}')
+            self._ready = True
+            self._send_pending()
+            return
+
+        if message.get('id') != self._pending_id:
+            # Superseded request
+            return
+
+        self.request_timer.stop()
+        self._pending_id = None
+        self._restart_delay_ms = self.RESTART_INITIAL_DELAY_MS
+
+        if 'error' in message:
+            self.log.error(f"Error getting display list: {message['error']}")
+            return
+
+        timing = Metrics.timing('dlp.request')
+        timing.add(time.monotonic() - self._requested_at)
+        self.log.debug(f'Display list received ({timing})')
+        self.displays_received.emit(message['result'])
+
+    def _handle_output_closed(self, process: subprocess.Popen):
+        if process is not self._process or self._stopping:
+            return
+
+        self._process = None
+        self._ready = False
+        self.request_timer.stop()
+
+        process.kill()
+        process.wait()
+        self.log.warning(f'Probe server exited unexpectedly: {process.returncode}')
+        Metrics.counter('dlp.restarts').increment()
+        self._schedule_restart()
+
+    def _handle_request_timeout(self):
+        if self._process is None:
+            return
+
+        # Killing the server closes its output, which triggers a restart (and re-sends the pending request)
+        self.log.warning(f'Probe server did not answer in {self.REQUEST_TIMEOUT_MS} ms, killing it')
+        self._process.kill()
+
+    def _schedule_restart(self):
+        self.log.info(f'Restarting probe server in {self._restart_delay_ms} ms')
+        self.restart_timer.start(self._restart_delay_ms)
+        self._restart_delay_ms = min(self._restart_delay_ms * 2, self.RESTART_MAX_DELAY_MS)
@@ -0,0 +1,107 @@
+"""
+Long-lived display probe.
+
+Keeps a Qt instance alive and answers display queries over stdin/stdout, one JSON object per line:
+
+    -> {"id": 1, "method": "displays"}
+    <- {"id": 1, "result": [{"name": "...", "model": "...", "serial": "...", "manufacturer": "..."}]}
+
+Failed requests are answered with an "error" string instead of the "result". The server announces itself with
+{"event": "ready"} once it is able to answer requests, and exits as soon as its stdin is closed.
+"""
+
+import json
+import sys
+import threading
+
+from typing import List, TextIO
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QGuiApplication, QScreen
+
+METHOD_DISPLAYS = 'displays'
+METHOD_PING = 'ping'
+
+EVENT_READY = 'ready'
+
+
+def describe_screens(screens: List[QScreen]) -> List[dict]:
+    res = []
+    for screen in screens:
+        if len(screen.name()) == 0:
+            continue
+
+        res.append({
+            'name': screen.name(),
+            'model': screen.model(),
+            'serial': screen.serialNumber(),
+            'manufacturer': screen.manufacturer(),
+        })
+
+    return res
+
+
+class ProbeServer(QObject):
+    # Emitted from the stdin reader thread, handled in the GUI thread
+    request_received = Signal(str)
+    input_closed = Signal()
+
+    def __init__(self, app: QGuiApplication, input_stream: TextIO, output_stream: TextIO, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._app = app
+        self._input = input_stream
+        self._output = output_stream
+
+        self.request_received.connect(self._handle_request)
+        self.input_closed.connect(self._app.quit)
+
+        self._reader = threading.Thread(target=self._read_requests, name='osh-probe-reader', daemon=True)
+
+    def start(self):
+        self._reader.start()
+        self._write({'event': EVENT_READY})
+
+    def _read_requests(self):
+        for line in self._input:
+            line = line.strip()
+            if len(line) != 0:
+                self.request_received.emit(line)
+
+        self.input_closed.emit()
+
+    def _write(self, message: dict):
+        self._output.write(json.dumps(message) + '\n')
+        self._output.flush()
+
+    def _handle_request(self, line: str):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            method = request.get('method')
+
+            if method == METHOD_DISPLAYS:
+                # Make sure all the pending screen change notifications are processed before answering. Changes Qt
+                # doesn't get notified about at all are caught by the client, asking a fresh server instance
+                self._app.processEvents()
+                result = describe_screens(self._app.screens())
+            elif method == METHOD_PING:
+                result = 'pong'
+            else:
+                raise ValueError(f'Unknown method: {method}')
+
+            self._write({'id': request_id, 'result': result})
+        except Exception as e:
+            self._write({'id': request_id, 'error': str(e)})
+
+
+def serve() -> int:
+    app = QGuiApplication([])
+    server = ProbeServer(app, sys.stdin, sys.stdout)
+    server.start()
+    return app.exec()
+
+
+if __name__ == '__main__':
+    sys.exit(serve())
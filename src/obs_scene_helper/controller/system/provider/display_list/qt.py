@@ -1,6 +1,9 @@
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QGuiApplication, QScreen
 
+from obs_scene_helper.controller.system.provider.display_list.probe_server import describe_screens
+from obs_scene_helper.model.display.identity import DisplayIdentity
+
 
 class QtProvider(QObject):
     changed = Signal(list)
@@ -15,15 +18,24 @@ class QtProvider(QObject):
         self._app.screenRemoved.connect(self.screen_removed)
 
         self._displays = [x.name() for x in self._app.screens()]
+        self._identities = self._screen_identities()
 
     @property
     def displays(self):
         return self._displays
 
+    @property
+    def identities(self):
+        return self._identities
+
+    def _screen_identities(self):
+        return [DisplayIdentity.from_dict(x) for x in describe_screens(self._app.screens())]
+
     def _update_display_list(self):
         new_displays = [x.name() for x in self._app.screens() if len(x.name()) != 0]
         if sorted(new_displays) != sorted(self._displays):
             self._displays = new_displays
+            self._identities = self._screen_identities()
             self.changed.emit(self._displays)
 
     def screen_added(self, _: QScreen):
@@ -1,11 +1,10 @@
-from typing import Callable
+from typing import Callable, List
 
 import sys
 import os
-import subprocess
-import json
 
-from PySide6.QtCore import QObject, Signal, QCoreApplication
+from PySide6.QtCore import QObject, QTimer, Signal, QCoreApplication
+from PySide6.QtGui import QGuiApplication
 
 import win32con
 from win32gui import CreateWindowEx, WNDCLASS, RegisterClass, DefWindowProc, DestroyWindow, UnregisterClass
@@ -13,11 +12,21 @@ from win32api import GetModuleHandle
 
 from obs_scene_helper.controller.system.log import Log
 from obs_scene_helper.controller.system.provider.script_launcher.windows import ScriptLauncher
+from obs_scene_helper.controller.system.provider.display_list.probe_client import ProbeClient
+from obs_scene_helper.controller.system.provider.display_list.probe_server import describe_screens, serve
+from obs_scene_helper.model.display.identity import DisplayIdentity
 
 
 # On Windows 10 the Qt does not correctly react to display configuration changes, for example: switching from
 # the "PC screen only" to the "Second screen only" doesn't generate any events. So we have to react to the low-level
-# Windows API messages and get the display list manually by calling a dedicated function in another interpreter instance
+# Windows API messages and get the display list from a separate probe process, which has its own Qt instance.
+#
+# The probe is long-lived, so most queries don't pay for starting an interpreter and Qt. Its Qt instance is just as
+# deaf to the projection changes as ours though: when a WM_DISPLAYCHANGE is answered with an unchanged list, the list
+# is fetched again from a freshly started probe, which enumerates the screens from scratch.
+
+# Makes the standalone osh-display-list binary act as a probe server, instead of printing the display list once
+SERVE_FLAG = '--serve'
 
 
 class ScreenChangeObserver:
@@ -69,6 +78,10 @@ class ScreenChangeObserver:
 class WindowsProvider(QObject):
     LOG_NAME = 'wdl'
 
+    # A single configuration change generates a couple of WM_DISPLAYCHANGE messages, only fetch the display list once
+    # they stop coming
+    FETCH_DEBOUNCE_MS = 250
+
     changed = Signal(list)
 
     def __init__(self, *args, **kwargs):
@@ -78,7 +91,19 @@ class WindowsProvider(QObject):
 
         self._screen_change_observer = ScreenChangeObserver(self._on_screen_configuration_changed)
 
-        self._displays = []
+        self.fetch_timer = QTimer(self)
+        self.fetch_timer.setSingleShot(True)
+        self.fetch_timer.timeout.connect(self._fetch_display_list)
+
+        self._probe = ProbeClient(self._probe_command(), ScriptLauncher.extra_run_flags())
+
+        # A display change was reported, and the long-lived probe didn't see it (yet)
+        self._change_unconfirmed = False
+        self._probe.displays_received.connect(self._handle_displays_received)
+
+        # Qt in our own process is good enough for the initial list, the probe confirms it as soon as it's up
+        self._identities = [DisplayIdentity.from_dict(x) for x in describe_screens(QGuiApplication.screens())]
+        self._displays = [x.name for x in self._identities]
         self._fetch_display_list()
 
         self.log.debug('Initialized')
@@ -86,92 +111,78 @@ class WindowsProvider(QObject):
         QCoreApplication.instance().aboutToQuit.connect(self._about_to_quit)
 
     def _about_to_quit(self):
+        self.fetch_timer.stop()
+        self._probe.stop()
         self._screen_change_observer.destroy()
 
     def _on_screen_configuration_changed(self, *_):
         self.log.debug(f'Screen configuration changed')
-        self._fetch_display_list()
+        self._change_unconfirmed = True
+        self.fetch_timer.start(self.FETCH_DEBOUNCE_MS)
 
     @property
     def displays(self):
         return self._displays
 
+    @property
+    def identities(self):
+        return self._identities
+
     # When bundled as a standalone binary, we cannot just delegate a function call to a new python interpreter instance,
-    # we have to run another standalone binary to get the fresh display list :facepalm:
+    # we have to run another standalone binary to serve the fresh display lists :facepalm:
     @staticmethod
     def _is_running_from_exe():
         # PyInstaller sets sys.frozen; Nuitka sets __compiled__ on compiled modules
         return getattr(sys, 'frozen', False) or "__compiled__" in globals()
 
     @staticmethod
-    def _extra_run_flags() -> dict:
-        return {
-            'capture_output': True,
-            'check': True,
-            **ScriptLauncher.extra_run_flags(),
-        }
+    def _probe_command() -> List[str]:
+        if not WindowsProvider._is_running_from_exe():
+            return ProbeClient.interpreted_command()
 
-    @staticmethod
-    def _get_display_list_standalone() -> str:
         # sys.argv[0] points to the original exe in both PyInstaller and Nuitka onefile
         our_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-        list_getter = os.path.join(our_dir, 'osh-display-list.exe')
-        return subprocess.run([list_getter], text=True, **WindowsProvider._extra_run_flags()).stdout
-
-    @staticmethod
-    def _get_display_list_interpreted() -> str:
-        code = 'from obs_scene_helper.controller.system.provider.display_list.windows import get_display_list\r\n' \
-               'get_display_list()'
-
-        return subprocess.run([sys.executable, "-c", code], text=True, **WindowsProvider._extra_run_flags()).stdout
+        return [os.path.join(our_dir, 'osh-display-list.exe'), SERVE_FLAG]
 
     def _fetch_display_list(self):
-        try:
-            self.log.debug('Fetching display list')
-
-            if self._is_running_from_exe():
-                get_result = self._get_display_list_standalone()
-            else:
-                get_result = self._get_display_list_interpreted()
-
-            displays_json = json.loads(get_result)
-            new_list = [x['name'] for x in displays_json]
-            self.log.debug(f'New temporary list: {new_list}')
-
-            if sorted(self._displays) != sorted(new_list):
-                self._displays = new_list
-                self.changed.emit(self._displays)
-                self.log.info(f'Display list changed')
-            else:
-                self.log.info(f'Display list not unchanged')
+        self.log.debug('Fetching display list')
+        self._probe.request_displays()
 
-        except Exception as e:
-            self.log.error(f"Error getting display list: {str(e)}")
+    @staticmethod
+    def _fingerprints(identities: List[DisplayIdentity]) -> List[str]:
+        return sorted(x.fingerprint for x in identities)
+
+    def _handle_displays_received(self, displays_json: List[dict]):
+        identities = [DisplayIdentity.from_dict(x) for x in displays_json]
+        new_list = [x.name for x in identities]
+        self.log.debug(f'New temporary list: {new_list}')
+
+        # Same names might belong to different monitors now, so compare the fingerprints as well
+        if self._fingerprints(self._identities) != self._fingerprints(identities):
+            self._change_unconfirmed = False
+            self._displays = new_list
+            self._identities = identities
+            self.changed.emit(self._displays)
+            self.log.info(f'Display list changed')
+        elif self._change_unconfirmed:
+            # Possibly a change the long-lived Qt instance missed (e.g. a projection mode switch)
+            self._change_unconfirmed = False
+            self.log.info(f'Display list unchanged after a display change, asking a fresh probe')
+            self._probe.request_displays(fresh=True)
+        else:
+            self.log.info(f'Display list unchanged')
 
 
 def get_display_list():
     from PySide6.QtWidgets import QApplication
-    from PySide6.QtGui import QScreen
-    from typing import List
     import json
 
     app = QApplication([])
-    screens = app.screens()  # type: List[QScreen]
-
-    res = []
-    for screen in screens:
-        if len(screen.name()) == 0:
-            continue
-
-        res.append({
-            'name': screen.name(),
-            'model': screen.model(),
-            'serial': screen.serialNumber(),
-            'manufacturer': screen.manufacturer(),
-        })
-
-    print(json.dumps(res))
+    print(json.dumps(describe_screens(app.screens())))
 
 
 if __name__ == '__main__':
+    if SERVE_FLAG in sys.argv:
+        sys.exit(serve())
+
     get_display_list()
@@ -0,0 +1,132 @@
+import os
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal, Slot, SLOT
+from PySide6.QtDBus import QDBusConnection, QDBusMessage, QDBusPendingCallWatcher
+
+from obs_scene_helper.controller.system.log import Log
+
+# Screen savers implementing the freedesktop.org interface (KDE, Xfce, ...), and the GNOME one
+SCREENSAVER_INTERFACES = [
+    ('org.freedesktop.ScreenSaver', '/org/freedesktop/ScreenSaver'),
+    ('org.gnome.ScreenSaver', '/org/gnome/ScreenSaver'),
+]
+
+LOGIN1_SERVICE = 'org.freedesktop.login1'
+LOGIN1_SESSION_INTERFACE = 'org.freedesktop.login1.Session'
+LOGIN1_SESSION_PATH = '/org/freedesktop/login1/session/'
+
+
+def escape_bus_path_label(value: str) -> str:
+    """ Escape a D-Bus object path label the way systemd does: every non-alphanumeric char, and a leading digit """
+    res = ''
+    for i, char in enumerate(value):
+        if (char.isascii() and char.isalpha()) or (char.isascii() and char.isdigit() and i != 0):
+            res += char
+        else:
+            res += ''.join(f'_{x:02x}' for x in char.encode('utf-8'))
+
+    return res if len(res) != 0 else '_'
+
+
+class LinuxScreenLockProvider(QObject):
+    """
+    Listens to the logind session Lock/Unlock signals on the system bus, and to the screen saver ActiveChanged signals
+    on the session bus. Everything is delivered by the Qt event loop, no polling involved.
+
+    Multiple sources can report the same transition (e.g. logind asking the screen saver to lock the session), so only
+    the actual state changes are propagated.
+    """
+
+    LOG_NAME = 'lsl'
+
+    screen_locked = Signal()
+    screen_unlocked = Signal()
+
+    def __init__(self, *args, session_bus: Optional[QDBusConnection] = None,
+                 system_bus: Optional[QDBusConnection] = None, session_id: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.log = Log.child(self.LOG_NAME)
+
+        self.session_bus = session_bus if session_bus is not None else QDBusConnection.sessionBus()
+        self.system_bus = system_bus if system_bus is not None else QDBusConnection.systemBus()
+
+        self._locked = False
+        self._pending_query = None  # type: Optional[QDBusPendingCallWatcher]
+
+        self._subscribe_to_screensaver()
+        self._subscribe_to_logind(session_id if session_id is not None else os.environ.get('XDG_SESSION_ID'))
+        self._query_screensaver_state()
+
+        self.log.debug('Initialized')
+
+    @property
+    def locked(self) -> bool:
+        return self._locked
+
+    def _subscribe_to_screensaver(self):
+        if not self.session_bus.isConnected():
+            self.log.warning('Session bus is not available, screen saver state is unknown')
+            return
+
+        for interface, path in SCREENSAVER_INTERFACES:
+            if not self.session_bus.connect('', path, interface, 'ActiveChanged', self,
+                                            SLOT('_on_screensaver_active_changed(bool)')):
+                self.log.warning(f'Error subscribing to {interface}: {self.session_bus.lastError().message()}')
+
+    def _subscribe_to_logind(self, session_id: Optional[str]):
+        if not self.system_bus.isConnected():
+            self.log.warning('System bus is not available, session lock state is unknown')
+            return
+
+        # Only interested in our own session, but listen to all of them if we don't know which one is ours
+        path = LOGIN1_SESSION_PATH + escape_bus_path_label(session_id) if session_id else ''
+        for name, slot in [('Lock', SLOT('_on_session_lock()')), ('Unlock', SLOT('_on_session_unlock()'))]:
+            if not self.system_bus.connect(LOGIN1_SERVICE, path, LOGIN1_SESSION_INTERFACE, name, self, slot):
+                self.log.warning(f'Error subscribing to logind: {self.system_bus.lastError().message()}')
+
+    def _query_screensaver_state(self):
+        if not self.session_bus.isConnected():
+            return
+
+        interface, path = SCREENSAVER_INTERFACES[0]
+        message = QDBusMessage.createMethodCall(interface, path, interface, 'GetActive')
+        self._pending_query = QDBusPendingCallWatcher(self.session_bus.asyncCall(message), self)
+        self._pending_query.finished.connect(self._handle_screensaver_state)
+
+    def _handle_screensaver_state(self, watcher: QDBusPendingCallWatcher):
+        self._pending_query = None
+        reply = watcher.reply()
+        watcher.deleteLater()
+
+        if watcher.isError() or len(reply.arguments()) == 0:
+            # No screen saver service running, nothing to worry about
+            self.log.debug(f'Screen saver state is unknown: {watcher.error().message()}')
+            return
+
+        self._set_locked(bool(reply.arguments()[0]), 'screen saver')
+
+    def _set_locked(self, locked: bool, source: str):
+        if locked == self._locked:
+            return
+
+        self._locked = locked
+        self.log.debug(f'{"Locked" if locked else "Unlocked"} by {source}')
+        if locked:
+            self.screen_locked.emit()
+        else:
+            self.screen_unlocked.emit()
+
+    @Slot(bool)
+    def _on_screensaver_active_changed(self, active: bool):
+        self._set_locked(active, 'screen saver')
+
+    @Slot()
+    def _on_session_lock(self):
+        self._set_locked(True, 'logind')
+
+    @Slot()
+    def _on_session_unlock(self):
+        self._set_locked(False, 'logind')
@@ -0,0 +1,122 @@
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from typing import List, Optional
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.script_launcher import ScriptLaunchResult as Result
+from obs_scene_helper.model.script.output import LineThrottle, OutputTail
+
+LOG_NAME = 'scrlau.out'
+
+# Lines forwarded to the log: a burst of the first lines, and then a steady trickle
+MAX_LINES_PER_SECOND = 20
+MAX_LINE_BURST = 100
+
+# Kept for the final result
+TAIL_LINES = 50
+MAX_LINE_LENGTH = 1000
+
+
+def _group_flags(popen_flags: dict) -> dict:
+    """ Start the command in a process group of its own, so its children can be killed along with it """
+    if sys.platform == 'win32':
+        creation_flags = popen_flags.get('creationflags', 0) | subprocess.CREATE_NEW_PROCESS_GROUP
+        return popen_flags | {'creationflags': creation_flags}
+
+    return popen_flags | {'start_new_session': True}
+
+
+def _kill_group(process: subprocess.Popen):
+    """
+    Kill the process and everything it started: the children (e.g. ffmpeg started by a remux script) inherit the output
+    pipe, and the output is read until every one of them is gone.
+    """
+    try:
+        if sys.platform == 'win32':
+            subprocess.run(['taskkill', '/T', '/F', '/PID', str(process.pid)], stdin=subprocess.DEVNULL,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+    # Taskkill can't walk the tree once the direct child is gone, and the group could be gone already
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+
+def run_streaming(command: List[str], job_id: str, timeout: Optional[float], **popen_flags) -> Result:
+    """
+    Run the command, forwarding its output to the log line by line while it's produced.
+
+    Text mode translates the carriage returns used by progress indicators (e.g. ffmpeg) into line breaks, so every
+    progress update is a separate line, which is why the lines are rate-limited.
+    """
+    log = Log.child(LOG_NAME)
+    short_id = job_id[:8]
+
+    app = command[0]
+    working_dir = os.path.dirname(app) or None
+
+    process = subprocess.Popen(command, text=True, errors='replace', bufsize=1, stdin=subprocess.DEVNULL,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=working_dir,
+                               **_group_flags(popen_flags))
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        _kill_group(process)
+
+    watchdog = None
+    if timeout is not None:
+        watchdog = threading.Timer(timeout, kill)
+        watchdog.daemon = True
+        watchdog.start()
+
+    throttle = LineThrottle(MAX_LINES_PER_SECOND, MAX_LINE_BURST)
+    tail = OutputTail(TAIL_LINES, MAX_LINE_LENGTH)
+
+    try:
+        # Reads are bounded, so output without line breaks can't pile up in memory: lines longer than the limit come in
+        # pieces, only the first one is kept (OutputTail marks it as truncated)
+        overflow = False
+        for line in iter(lambda: process.stdout.readline(MAX_LINE_LENGTH + 1), ''):
+            continued = overflow
+            overflow = not line.endswith('\n')
+            if continued or len(line.rstrip('\r\n')) == 0:
+                continue
+
+            line = tail.add(line)
+            if not throttle.allow(time.monotonic()):
+                continue
+
+            suppressed = throttle.take_suppressed()
+            if suppressed != 0:
+                log.debug(f'[{short_id}] ... {suppressed} line(s) suppressed')
+            log.debug(f'[{short_id}] {line}')
+    finally:
+        process.stdout.close()
+        process.wait()
+        if watchdog is not None:
+            watchdog.cancel()
+
+    # The last line usually is the summary, always forward it
+    suppressed = throttle.take_suppressed()
+    if suppressed != 0:
+        if suppressed > 1:
+            log.debug(f'[{short_id}] ... {suppressed - 1} line(s) suppressed')
+        log.debug(f'[{short_id}] {tail.lines[-1]}')
+
+    if timed_out.is_set():
+        return Result(False, f'Timed out after {timeout} s\n{tail}', job_id, True)
+
+    return Result(process.returncode == 0, str(tail), job_id)
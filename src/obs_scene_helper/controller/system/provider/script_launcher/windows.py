@@ -1,18 +1,20 @@
-from typing import List
+from typing import List, Optional
 import subprocess
-import os
 
 from PySide6.QtCore import QObject, Signal
 
+from obs_scene_helper.controller.system.provider.script_launcher.streaming import run_streaming
 from obs_scene_helper.controller.system.script_launcher import ScriptLaunchResult as Result
 
 
 class ScriptLauncher(QObject):
     script_done = Signal(Result)
 
-    def __init__(self, command: List[str], *args, **kwargs):
+    def __init__(self, command: List[str], job_id: str = '', timeout: Optional[float] = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.command = command
+        self.job_id = job_id
+        self.timeout = timeout
 
     @staticmethod
     def _get_startup_info():
@@ -33,21 +35,8 @@ class ScriptLauncher(QObject):
 
     def launch(self):
         try:
-            app = self.command[0]
-            working_dir = os.path.dirname(app)
-
-            result = subprocess.run(
-                self.command,
-                text=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                cwd=working_dir,
-                **ScriptLauncher.extra_run_flags()
-            )
-
-            success = result.returncode == 0
-            output = result.stdout
-
-            self.script_done.emit(Result(success, output))
+            result = run_streaming(self.command, self.job_id, self.timeout, **ScriptLauncher.extra_run_flags())
         except Exception as e:
-            self.script_done.emit(Result(False, str(e)))
+            result = Result(False, str(e), self.job_id)
+
+        self.script_done.emit(result)
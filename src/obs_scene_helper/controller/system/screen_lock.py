@@ -37,8 +37,13 @@ class ScreenLock(QObject):
             self._provider.screen_locked.connect(self._handle_screen_locked)
             self._provider.screen_unlocked.connect(self._handle_screen_unlocked)
             self.log.debug('Configured windows provider')
+        elif platform.startswith('linux'):
+            from obs_scene_helper.controller.system.provider.screen_lock.linux import LinuxScreenLockProvider
+            self._provider = LinuxScreenLockProvider(*args, **kwargs)
+            self._provider.screen_locked.connect(self._handle_screen_locked)
+            self._provider.screen_unlocked.connect(self._handle_screen_unlocked)
+            self.log.debug('Configured Linux provider')
         else:
-            # TODO: Linux provider
             self._provider = None
 
     def _handle_screen_locked(self):
@@ -1,66 +1,169 @@
+import json
+import time
+
+from collections import deque
 from dataclasses import dataclass
 from sys import platform
-from typing import List
+from typing import List, Optional, Dict, Tuple
 
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, Signal, QThread, QSettings
 
 from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.script.job import Job, JobBacklog
 
 
 @dataclass
 class ScriptLaunchResult:
     success: bool
     logs: str
+    job_id: str = ''
+    timed_out: bool = False
 
 
 class ScriptLauncher(QObject):
+    """
+    Runs the commands on a pool of worker threads, queueing them while all the workers are busy.
+
+    Every queued command is recorded in a persisted backlog until it finishes, so the commands that were still queued
+    or running when the app was closed are run again on the next start.
+    """
+
     LOG_NAME = 'scrlau'
 
+    ORG_NAME = 'yobasoft'
+    APP_NAME = 'ObsSceneHelper'
+    BACKLOG_KEY = 'script_backlog'
+
     script_done = Signal(ScriptLaunchResult)
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, max_workers: int = 1, timeout: Optional[float] = None,
+                 backlog_settings: Optional[QSettings] = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.log = Log.child(self.LOG_NAME)
+
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+
+        self._queue = deque()  # type: deque[Job]
+        self._running = {}  # type: Dict[str, Tuple[Job, QObject, QThread, float]]
+        self._finishing = set()  # type: set[QThread]
+
+        self._settings = backlog_settings if backlog_settings is not None else QSettings(self.ORG_NAME, self.APP_NAME)
+        self.backlog = self._load_backlog()
+
         self.log.debug('Initialized')
-        self.runner = None
-        self.thread = None
+
+        if len(self.backlog) != 0:
+            self.log.info(f'Resuming {len(self.backlog)} job(s) from the previous session')
+            self._queue.extend(self.backlog.jobs)
+            self._start_next()
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    @property
+    def idle(self) -> bool:
+        return self.queued == 0 and self.running == 0
+
+    def configure(self, max_workers: int, timeout: Optional[float]):
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self._start_next()
+
+    def _load_backlog(self) -> JobBacklog:
+        # noinspection PyTypeChecker
+        backlog_str = self._settings.value(self.BACKLOG_KEY, None)  # type: Optional[str]
+        if backlog_str is None:
+            return JobBacklog([], self._save_backlog)
+
+        try:
+            return JobBacklog.from_dict(json.loads(backlog_str), self._save_backlog)
+        except (ValueError, KeyError, TypeError) as e:
+            self.log.error(f'Error loading the script backlog: {str(e)}')
+            return JobBacklog([], self._save_backlog)
+
+    def _save_backlog(self):
+        self._settings.setValue(self.BACKLOG_KEY, json.dumps(self.backlog.to_dict()))
+        self._settings.sync()
 
     @staticmethod
-    def _get_launcher(command: List[str]):
+    def _get_launcher(job: Job, timeout: Optional[float]):
         if platform == 'win32':
             from obs_scene_helper.controller.system.provider.script_launcher.windows import ScriptLauncher as WinSL
-            result = WinSL(command)
+            result = WinSL(job.command, job.job_id, timeout)
         else:
             from obs_scene_helper.controller.system.provider.script_launcher.default import ScriptLauncher as DefSL
-            result = DefSL(command)
+            result = DefSL(job.command, job.job_id, timeout)
 
         return result
 
-    def _script_done(self, result: ScriptLaunchResult):
-        self.thread.quit()
-        self.runner.deleteLater()
-        self.runner = None
-        self.script_done.emit(result)
+    def _update_queue_metrics(self):
+        Metrics.gauge('scrlau.queued').set(self.queued)
+        Metrics.gauge('scrlau.running').set(self.running)
 
-    def _thread_done(self):
-        self.thread.deleteLater()
-        self.thread = None
+    def launch(self, command: List[str]) -> Job:
+        job = Job.make(command)
+        self.backlog.add(job)
+        self._queue.append(job)
+
+        if self.running >= self.max_workers:
+            self.log.info(f'All {self.max_workers} worker(s) busy, queued job {job.short_id} '
+                          f'({self.queued} waiting): {" ".join(command)}')
+
+        self._start_next()
+        return job
+
+    def _start_next(self):
+        while len(self._queue) != 0 and self.running < self.max_workers:
+            self._start(self._queue.popleft())
+
+        self._update_queue_metrics()
+
+    def _start(self, job: Job):
+        Metrics.timing('scrlau.queue_wait').add(max(0.0, time.time() - job.created_at))
+        self.log.info(f'Running job {job.short_id}: {" ".join(job.command)}')
 
-    def launch(self, command: List[str]):
-        command_txt = " ".join(command)
-        if self.runner is not None:
-            self.log.warning(f'Skipping command, already running: {command_txt}')
+        runner = self._get_launcher(job, self.timeout)
+
+        thread = QThread()
+        thread.started.connect(runner.launch)
+        thread.finished.connect(self._thread_done)
+
+        runner.moveToThread(thread)
+        runner.script_done.connect(self._script_done)
+
+        self._running[job.job_id] = (job, runner, thread, time.monotonic())
+        thread.start()
+
+    def _script_done(self, result: ScriptLaunchResult):
+        entry = self._running.pop(result.job_id, None)
+        if entry is None:
             return
 
-        self.log.info(f'Running command: {command_txt}')
-        self.runner = self._get_launcher(command)
+        job, runner, thread, started = entry
+        Metrics.timing('scrlau.run_time').add(time.monotonic() - started)
+        if result.timed_out:
+            Metrics.counter('scrlau.timeouts').increment()
+            self.log.warning(f'Job {job.short_id} timed out after {self.timeout} s')
+
+        # The thread is kept alive until it actually finishes
+        self._finishing.add(thread)
+        thread.quit()
+        runner.deleteLater()
 
-        self.thread = QThread()
-        self.thread.started.connect(self.runner.launch)
-        self.thread.finished.connect(self._thread_done)
+        self.backlog.remove(job.job_id)
+        self.script_done.emit(result)
 
-        self.runner.moveToThread(self.thread)
-        self.runner.script_done.connect(self._script_done)
+        self._start_next()
 
-        self.thread.start()
+    def _thread_done(self):
+        thread = self.sender()
+        self._finishing.discard(thread)
+        thread.deleteLater()
@@ -0,0 +1,167 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+# Floor for the reported levels (OBS reports silence as -inf)
+MIN_DB = -100.0
+_MIN_MUL = 10 ** (MIN_DB / 20)
+
+
+def to_db(mul: np.ndarray | float) -> np.ndarray | float:
+    """ Convert linear amplitude values to dBFS, clamped to MIN_DB """
+    return 20 * np.log10(np.maximum(mul, _MIN_MUL))
+
+
+@dataclass
+class AudioLevels:
+    rms_db: float  # Rolling RMS over the window
+    peak_db: float  # Rolling peak over the window
+    current_db: float  # Peak of the latest meter frame
+    silent_ratio: float  # Fraction of the frames in the window below the silence threshold
+    silent_for: float  # Seconds since the last frame above the silence threshold (capped at the window length)
+    loud_at: Optional[float]  # Timestamp of the first frame above the silence threshold in the window
+    updated_at: float  # Timestamp of the latest frame
+
+
+def decode_volume_meters(inputs: list[dict]) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """
+    Decode the "inputs" field of an InputVolumeMeters event.
+    Every input reports [magnitude, peak, input peak] per audio channel, channels are reduced to the loudest one.
+    :return: (input names, magnitudes, peaks), inputs without audio channels are skipped.
+    """
+    names = []
+    channel_counts = []
+    channels = []
+    for entry in inputs:
+        levels = entry.get('inputLevelsMul')
+        if not levels:
+            continue
+
+        names.append(entry['inputName'])
+        channel_counts.append(len(levels))
+        channels.extend(levels)
+
+    if len(names) == 0:
+        empty = np.zeros(0, dtype=np.float32)
+        return names, empty, empty
+
+    flat = np.array([x[:2] for x in channels], dtype=np.float32)
+    offsets = np.cumsum([0] + channel_counts[:-1])
+    return names, np.maximum.reduceat(flat[:, 0], offsets), np.maximum.reduceat(flat[:, 1], offsets)
+
+
+class LevelHistory:
+    """
+    Fixed-size history of the audio levels for a set of inputs.
+
+    All the inputs share a single time axis: every meter frame occupies one column in preallocated (inputs, capacity)
+    arrays, inputs not present in a frame are recorded as silent. Statistics are computed for all the inputs at once.
+    """
+
+    def __init__(self, capacity: int, rows: int = 8):
+        if capacity <= 0:
+            raise ValueError(f'Invalid capacity: {capacity}')
+
+        self.capacity = capacity
+        self._rows: dict[str, int] = {}
+        self._free_rows: list[int] = list(range(rows - 1, -1, -1))
+
+        self._magnitude = np.zeros((rows, capacity), dtype=np.float32)
+        self._peak = np.zeros((rows, capacity), dtype=np.float32)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+
+        self._head = 0  # Next column to write
+        self._count = 0  # Number of valid columns
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._rows.keys())
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._magnitude.fill(0)
+        self._peak.fill(0)
+        self._head = 0
+        self._count = 0
+
+    def forget(self, name: str):
+        """ Stop tracking an input, its row will be reused """
+        row = self._rows.pop(name, None)
+        if row is not None:
+            self._magnitude[row].fill(0)
+            self._peak[row].fill(0)
+            self._free_rows.append(row)
+
+    def _row(self, name: str) -> int:
+        row = self._rows.get(name)
+        if row is not None:
+            return row
+
+        if len(self._free_rows) == 0:
+            # Double the number of rows, this only happens when new inputs show up
+            rows = self._magnitude.shape[0]
+            self._magnitude = np.vstack([self._magnitude, np.zeros_like(self._magnitude)])
+            self._peak = np.vstack([self._peak, np.zeros_like(self._peak)])
+            self._free_rows = list(range(2 * rows - 1, rows - 1, -1))
+
+        row = self._free_rows.pop()
+        self._rows[name] = row
+        return row
+
+    def append(self, timestamp: float, names: list[str], magnitudes: np.ndarray, peaks: np.ndarray):
+        """ Record a single meter frame, see decode_volume_meters """
+        rows = np.fromiter((self._row(x) for x in names), dtype=np.intp, count=len(names))
+
+        column = self._head
+        self._magnitude[:, column] = 0
+        self._peak[:, column] = 0
+        self._magnitude[rows, column] = magnitudes
+        self._peak[rows, column] = peaks
+        self._timestamps[column] = timestamp
+
+        self._head = (column + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def statistics(self, window: float, silence_threshold_db: float) -> dict[str, AudioLevels]:
+        """
+        Compute the rolling statistics for all the known inputs.
+        :param window: Window length in seconds, counting back from the latest frame.
+        :param silence_threshold_db: Frames with a peak below this level are counted as silent.
+        """
+        if self._count == 0 or len(self._rows) == 0:
+            return {}
+
+        # Columns in chronological order
+        columns = (self._head - self._count + np.arange(self._count)) % self.capacity
+        timestamps = self._timestamps[columns]
+        latest = timestamps[-1]
+
+        columns = columns[timestamps >= latest - window]
+        timestamps = self._timestamps[columns]
+
+        names = list(self._rows.keys())
+        rows = np.fromiter(self._rows.values(), dtype=np.intp, count=len(names))
+        magnitude = self._magnitude[np.ix_(rows, columns)]
+        peak = self._peak[np.ix_(rows, columns)]
+
+        rms_db = to_db(np.sqrt(np.mean(np.square(magnitude, dtype=np.float64), axis=1)))
+        peak_db = to_db(peak.max(axis=1))
+        current_db = to_db(peak[:, -1])
+
+        loud = peak >= 10 ** (silence_threshold_db / 20)
+        silent_ratio = 1.0 - loud.mean(axis=1)
+
+        # Time since the last loud frame (or the whole window if there was none)
+        frames = len(columns)
+        any_loud = loud.any(axis=1)
+        last_loud = frames - 1 - np.argmax(loud[:, ::-1], axis=1)
+        silent_for = np.where(any_loud, latest - timestamps[last_loud], latest - timestamps[0])
+        loud_at = timestamps[np.argmax(loud, axis=1)]
+
+        return {name: AudioLevels(float(rms_db[i]), float(peak_db[i]), float(current_db[i]),
+                                  float(silent_ratio[i]), float(silent_for[i]),
+                                  float(loud_at[i]) if any_loud[i] else None, float(latest))
+                for i, name in enumerate(names)}
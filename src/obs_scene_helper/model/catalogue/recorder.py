@@ -0,0 +1,82 @@
+import uuid
+
+from typing import List, Optional
+
+from obs_scene_helper.model.catalogue.store import Operation, SessionStarted, SessionEnded, SegmentStarted, \
+    SegmentEnded, EventRecorded
+
+
+class CatalogueRecorder:
+    """
+    Turns the recording events into catalogue operations: a session lasts from the recording start to its stop, and is
+    made of segments, one per recording file.
+    """
+
+    # Recording states, as reported by `RecordingState.value`
+    STATE_ACTIVE = 'active'
+    STATE_PAUSED = 'paused'
+    STATE_STOPPED = 'stopped'
+
+    def __init__(self):
+        self.session = None  # type: Optional[str]
+        self.segment = None  # type: Optional[str]
+
+        self.preset = None  # type: Optional[str]
+        self.profile = None  # type: Optional[str]
+        self.scene_collection = None  # type: Optional[str]
+
+    def _start_session(self, now: float) -> List[Operation]:
+        self.session = uuid.uuid4().hex
+        return [SessionStarted(self.session, now, self.preset, self.profile, self.scene_collection)]
+
+    def _end_segment(self, now: float, size: Optional[int]) -> List[Operation]:
+        if self.segment is None:
+            return []
+
+        res = [SegmentEnded(self.session, self.segment, now, size)]
+        self.segment = None
+        return res
+
+    def recording_state_changed(self, state: str, now: float, size: Optional[int] = None) -> List[Operation]:
+        """ `size` is the final size of the current file, if the recording stopped """
+        res = []
+        if state in [self.STATE_ACTIVE, self.STATE_PAUSED] and self.session is None:
+            res += self._start_session(now)
+
+        if self.session is None:
+            return res
+
+        res.append(EventRecorded(self.session, now, 'state', state))
+
+        if state == self.STATE_STOPPED:
+            res += self._end_segment(now, size)
+            res.append(SessionEnded(self.session, now))
+            self.session = None
+
+        return res
+
+    def output_file_changed(self, path: str, now: float, previous_size: Optional[int] = None) -> List[Operation]:
+        """ `previous_size` is the final size of the previous file """
+        if path == self.segment:
+            return []
+
+        res = []
+        if self.session is None:
+            res += self._start_session(now)
+
+        res += self._end_segment(now, previous_size)
+        self.segment = path
+        res.append(SegmentStarted(self.session, path, now, self.preset, self.profile, self.scene_collection))
+        return res
+
+    def preset_activated(self, name: str, profile: str, scene_collection: str, now: float) -> List[Operation]:
+        self.preset = name
+        self.profile = profile
+        self.scene_collection = scene_collection
+        return [EventRecorded(self.session, now, 'preset', name)]
+
+    def profile_changed(self, profile: Optional[str]):
+        self.profile = profile
+
+    def scene_collection_changed(self, scene_collection: Optional[str]):
+        self.scene_collection = scene_collection
@@ -0,0 +1,199 @@
+import sqlite3
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+# Timestamps are stored as UNIX time, durations in seconds. Every filter of the search view is backed by an index, so
+# the queries stay fast no matter how many years of recordings are in the catalogue.
+
+SCHEMA_VERSION = 1
+
+SCHEMA = [
+    '''CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY,
+        started_at REAL NOT NULL,
+        ended_at REAL,
+        preset TEXT,
+        profile TEXT,
+        scene_collection TEXT
+    )''',
+    '''CREATE TABLE IF NOT EXISTS segments (
+        id INTEGER PRIMARY KEY,
+        session TEXT NOT NULL,
+        path TEXT NOT NULL,
+        started_at REAL NOT NULL,
+        ended_at REAL,
+        duration REAL,
+        size INTEGER,
+        preset TEXT,
+        profile TEXT,
+        scene_collection TEXT
+    )''',
+    '''CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        session TEXT,
+        at REAL NOT NULL,
+        kind TEXT NOT NULL,
+        value TEXT
+    )''',
+    'CREATE INDEX IF NOT EXISTS sessions_started_at ON sessions (started_at)',
+    'CREATE INDEX IF NOT EXISTS segments_started_at ON segments (started_at)',
+    'CREATE INDEX IF NOT EXISTS segments_preset ON segments (preset, started_at)',
+    'CREATE INDEX IF NOT EXISTS segments_duration ON segments (duration)',
+    'CREATE INDEX IF NOT EXISTS segments_session ON segments (session)',
+    'CREATE INDEX IF NOT EXISTS segments_path ON segments (path)',
+    'CREATE INDEX IF NOT EXISTS events_session ON events (session, at)',
+]
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """ Open the catalogue, creating the schema if necessary """
+    conn = sqlite3.connect(path, isolation_level=None)
+
+    # The write-ahead log lets the search view read while the writer thread appends
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+
+    version = conn.execute('PRAGMA user_version').fetchone()[0]
+    if version < SCHEMA_VERSION:
+        with conn:
+            conn.execute('BEGIN')
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+
+    return conn
+
+
+class Operation:
+    """ A single catalogue change, applied by the writer in a batch together with the other pending ones """
+
+    def apply(self, conn: sqlite3.Connection):
+        raise NotImplementedError
+
+
+@dataclass
+class SessionStarted(Operation):
+    session: str
+    at: float
+    preset: Optional[str]
+    profile: Optional[str]
+    scene_collection: Optional[str]
+
+    def apply(self, conn: sqlite3.Connection):
+        conn.execute('INSERT OR IGNORE INTO sessions (id, started_at, preset, profile, scene_collection) '
+                     'VALUES (?, ?, ?, ?, ?)',
+                     (self.session, self.at, self.preset, self.profile, self.scene_collection))
+
+
+@dataclass
+class SessionEnded(Operation):
+    session: str
+    at: float
+
+    def apply(self, conn: sqlite3.Connection):
+        conn.execute('UPDATE sessions SET ended_at = ? WHERE id = ?', (self.at, self.session))
+
+
+@dataclass
+class SegmentStarted(Operation):
+    session: str
+    path: str
+    at: float
+    preset: Optional[str]
+    profile: Optional[str]
+    scene_collection: Optional[str]
+
+    def apply(self, conn: sqlite3.Connection):
+        conn.execute('INSERT INTO segments (session, path, started_at, preset, profile, scene_collection) '
+                     'VALUES (?, ?, ?, ?, ?, ?)',
+                     (self.session, self.path, self.at, self.preset, self.profile, self.scene_collection))
+
+
+@dataclass
+class SegmentEnded(Operation):
+    session: str
+    path: str
+    at: float
+    size: Optional[int]
+
+    def apply(self, conn: sqlite3.Connection):
+        conn.execute('UPDATE segments SET ended_at = ?, duration = ? - started_at, size = ? '
+                     'WHERE session = ? AND path = ? AND ended_at IS NULL',
+                     (self.at, self.at, self.size, self.session, self.path))
+
+
+@dataclass
+class EventRecorded(Operation):
+    session: Optional[str]
+    at: float
+    kind: str
+    value: str
+
+    def apply(self, conn: sqlite3.Connection):
+        conn.execute('INSERT INTO events (session, at, kind, value) VALUES (?, ?, ?, ?)',
+                     (self.session, self.at, self.kind, self.value))
+
+
+def apply_batch(conn: sqlite3.Connection, operations: List[Operation]):
+    """ Apply all the operations in a single transaction """
+    with conn:
+        conn.execute('BEGIN')
+        for operation in operations:
+            operation.apply(conn)
+
+
+@dataclass
+class Segment:
+    path: str
+    started_at: float
+    ended_at: Optional[float]
+    duration: Optional[float]
+    size: Optional[int]
+    preset: Optional[str]
+    profile: Optional[str]
+    scene_collection: Optional[str]
+
+
+@dataclass
+class SegmentQuery:
+    since: Optional[float] = None  # Started at or after
+    until: Optional[float] = None  # Started before
+    preset: Optional[str] = None
+    min_duration: Optional[float] = None
+    text: str = ''  # Part of the file path
+    limit: int = 1000
+
+
+def find_segments(conn: sqlite3.Connection, query: SegmentQuery) -> List[Segment]:
+    """ Latest segments first """
+    conditions = []
+    params = []
+
+    if query.since is not None:
+        conditions.append('started_at >= ?')
+        params.append(query.since)
+    if query.until is not None:
+        conditions.append('started_at < ?')
+        params.append(query.until)
+    if query.preset is not None:
+        conditions.append('preset = ?')
+        params.append(query.preset)
+    if query.min_duration is not None:
+        conditions.append('duration >= ?')
+        params.append(query.min_duration)
+    if query.text:
+        # Only narrows down the rows selected by the indexed filters
+        conditions.append("path LIKE ? ESCAPE '\\'")
+        escaped = query.text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        params.append(f'%{escaped}%')
+
+    where = f'WHERE {" AND ".join(conditions)}' if len(conditions) != 0 else ''
+    rows = conn.execute(f'SELECT path, started_at, ended_at, duration, size, preset, profile, scene_collection '
+                        f'FROM segments {where} ORDER BY started_at DESC LIMIT ?', params + [query.limit])
+    return [Segment(*row) for row in rows]
+
+
+def known_presets(conn: sqlite3.Connection) -> List[str]:
+    rows = conn.execute('SELECT DISTINCT preset FROM segments WHERE preset IS NOT NULL ORDER BY preset')
+    return [row[0] for row in rows]
@@ -0,0 +1,87 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from typing import Optional, List
+from datetime import datetime
+
+import os
+
+from obs_scene_helper.model.catalogue.store import Segment
+
+
+class Table(QAbstractTableModel):
+    """ Catalogue search results, one recording file per row """
+
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    HEADERS = ['Started', 'Duration', 'Size', 'Preset', 'Profile', 'Scene collection', 'File']
+
+    def __init__(self):
+        super().__init__()
+        self._segments = []  # type: List[Segment]
+
+    def rowCount(self, parent: Optional[QModelIndex] = None):
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self._segments)
+
+    def columnCount(self, parent: Optional[QModelIndex] = None):
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self.HEADERS)
+
+    @staticmethod
+    def _format_duration(value: Optional[float]) -> str:
+        if value is None:
+            return ''
+
+        value = int(value)
+        return f'{value // 3600}:{value // 60 % 60:02}:{value % 60:02}'
+
+    @staticmethod
+    def _format_size(value: Optional[int]) -> str:
+        return f'{value / (1024 * 1024):.0f} MiB' if value is not None else ''
+
+    def _get_display_role_for_item(self, segment: Segment, column: int) -> Optional[str]:
+        header = self.HEADERS[column]
+        if header == 'Started':
+            return datetime.fromtimestamp(segment.started_at).strftime(self.TIMESTAMP_FORMAT)
+        elif header == 'Duration':
+            return self._format_duration(segment.duration)
+        elif header == 'Size':
+            return self._format_size(segment.size)
+        elif header == 'Preset':
+            return segment.preset or ''
+        elif header == 'Profile':
+            return segment.profile or ''
+        elif header == 'Scene collection':
+            return segment.scene_collection or ''
+        elif header == 'File':
+            return os.path.basename(segment.path)
+
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        segment = self._segments[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._get_display_role_for_item(segment, index.column())
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            return segment.path
+
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def set_segments(self, segments: List[Segment]):
+        self.beginResetModel()
+        self._segments = segments
+        self.endResetModel()
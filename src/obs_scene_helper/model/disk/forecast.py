@@ -0,0 +1,99 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class DiskSample:
+    at: float  # Seconds, monotonic
+    free: int  # Free space on the output volume, bytes
+    file_size: Optional[int] = None  # Size of the current recording file, if known
+
+
+class DiskForecaster:
+    """
+    Write throughput over a rolling window, and the time until the output volume is full at that rate.
+
+    Two rates are tracked: the growth of the recording file, and the decline of the free space (which also accounts
+    for anything else writing to the volume). The higher one is used, so the forecast errs on the early side.
+    """
+
+    # Minimal span of the samples before a forecast is made
+    MIN_SPAN_FRACTION = 0.25
+
+    def __init__(self, window: float):
+        self.window = window
+        self._samples = deque()  # type: deque[DiskSample]
+
+    def reset(self):
+        self._samples.clear()
+
+    def add(self, sample: DiskSample):
+        self._samples.append(sample)
+        while len(self._samples) > 2 and sample.at - self._samples[1].at >= self.window:
+            self._samples.popleft()
+
+    @property
+    def free(self) -> Optional[int]:
+        return self._samples[-1].free if len(self._samples) != 0 else None
+
+    @property
+    def rate(self) -> Optional[float]:
+        """ Bytes per second, None if there are not enough samples yet """
+        if len(self._samples) < 2:
+            return None
+
+        first, last = self._samples[0], self._samples[-1]
+        span = last.at - first.at
+        if span < self.window * self.MIN_SPAN_FRACTION:
+            return None
+
+        free_rate = (first.free - last.free) / span
+
+        # A file split restarts the size from zero, so only the growth is accumulated
+        growth = 0
+        previous = None
+        for sample in self._samples:
+            if sample.file_size is not None and previous is not None:
+                growth += max(0, sample.file_size - previous)
+            if sample.file_size is not None:
+                previous = sample.file_size
+
+        return max(0.0, free_rate, growth / span)
+
+    @property
+    def time_to_full(self) -> Optional[float]:
+        """ Seconds, None if unknown or if the disk is not filling up """
+        rate = self.rate
+        if rate is None or rate <= 0:
+            return None
+
+        return self.free / rate
+
+
+class HorizonAlarm:
+    """
+    Reports every horizon once when the forecast drops below it. A horizon is re-armed once the forecast goes back
+    above it by a margin, so a forecast hovering around a horizon doesn't keep warning.
+    """
+
+    def __init__(self, horizons: List[float], rearm_factor: float = 1.2):
+        self.horizons = sorted(horizons, reverse=True)
+        self.rearm_factor = rearm_factor
+        self._fired = set()  # type: set[float]
+
+    def reset(self):
+        self._fired.clear()
+
+    def update(self, time_to_full: Optional[float]) -> Optional[float]:
+        """ The smallest newly crossed horizon, if any """
+        for horizon in self.horizons:
+            if time_to_full is None or time_to_full > horizon * self.rearm_factor:
+                self._fired.discard(horizon)
+
+        if time_to_full is None:
+            return None
+
+        crossed = [x for x in self.horizons if time_to_full <= x and x not in self._fired]
+        self._fired.update(crossed)
+        return min(crossed) if len(crossed) != 0 else None
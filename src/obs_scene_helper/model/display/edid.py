@@ -0,0 +1,62 @@
+import struct
+
+from dataclasses import dataclass
+from typing import Optional
+
+HEADER = b'\x00\xff\xff\xff\xff\xff\xff\x00'
+BLOCK_SIZE = 128
+
+DESCRIPTOR_OFFSETS = [54, 72, 90, 108]
+DESCRIPTOR_SIZE = 18
+TAG_SERIAL = 0xFF
+TAG_NAME = 0xFC
+
+
+class InvalidEdid(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Edid:
+    manufacturer: str  # Three-letter PNP ID, e.g. "DEL"
+    product_code: int
+    serial_number: int  # Numeric serial, often zero
+    name: Optional[str] = None  # Monitor name descriptor, e.g. "DELL U2415"
+    serial: Optional[str] = None  # Serial number descriptor
+
+    @property
+    def device_serial(self) -> str:
+        """ Serial number of the individual device: the descriptor if present, the numeric one otherwise ('' if none) """
+        return self.serial if self.serial else (str(self.serial_number) if self.serial_number else '')
+
+
+def _decode_manufacturer(value: int) -> str:
+    letters = [(value >> 10) & 0x1F, (value >> 5) & 0x1F, value & 0x1F]
+    return ''.join(chr(ord('A') + x - 1) for x in letters if 1 <= x <= 26)
+
+
+def _decode_text(data: bytes) -> str:
+    return data.split(b'\x0a', 1)[0].decode('cp437', errors='replace').strip()
+
+
+def parse_edid(data: bytes) -> Edid:
+    """ Parse the base EDID block, extension blocks are ignored """
+    if len(data) < BLOCK_SIZE or not data.startswith(HEADER):
+        raise InvalidEdid(f'Not an EDID block ({len(data)} bytes)')
+
+    manufacturer, = struct.unpack_from('>H', data, 8)
+    product_code, serial_number = struct.unpack_from('<HI', data, 10)
+
+    texts = {}
+    for offset in DESCRIPTOR_OFFSETS:
+        descriptor = data[offset:offset + DESCRIPTOR_SIZE]
+        # Display descriptors start with a zero pixel clock, detailed timing descriptors don't
+        if descriptor[0:2] != b'\x00\x00':
+            continue
+
+        tag = descriptor[3]
+        if tag in (TAG_NAME, TAG_SERIAL):
+            texts.setdefault(tag, _decode_text(descriptor[5:]))
+
+    return Edid(_decode_manufacturer(manufacturer), product_code, serial_number, texts.get(TAG_NAME) or None,
+                texts.get(TAG_SERIAL) or None)
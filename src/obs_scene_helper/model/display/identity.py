@@ -0,0 +1,63 @@
+import hashlib
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Union
+
+FINGERPRINT_SIZE = 8  # Bytes, rendered as 16 hex digits
+
+
+@dataclass(frozen=True)
+class DisplayIdentity:
+    """
+    A display, as reported by a display list provider.
+
+    Names (e.g. "\\\\.\\DISPLAY2" on Windows) are assigned by the OS and can change from one docking to the next, so the
+    fingerprint is derived from the manufacturer, model and serial number whenever the provider knows them. The name is
+    only used as a fallback.
+
+    Identical monitors without a serial number share a fingerprint: they are interchangeable, a preset listing two of
+    them matches any two such monitors, whichever connector they are plugged into. The connector is deliberately left
+    out, as it's exactly the kind of name that changes from one docking to the next.
+    """
+
+    name: str
+    manufacturer: str = ''
+    model: str = ''
+    serial: str = ''
+
+    # Other names the display went by (e.g. with another display list provider), only used to migrate the presets
+    aliases: Tuple[str, ...] = field(default=(), compare=False)
+
+    @property
+    def has_hardware_id(self) -> bool:
+        return any(len(x.strip()) != 0 for x in (self.manufacturer, self.model, self.serial))
+
+    @property
+    def fingerprint(self) -> str:
+        if self.has_hardware_id:
+            source = '\0'.join(['hw', self.manufacturer.strip(), self.model.strip(), self.serial.strip()])
+        else:
+            source = '\0'.join(['name', self.name.strip()])
+
+        return hashlib.blake2b(source.casefold().encode('utf-8'), digest_size=FINGERPRINT_SIZE).hexdigest()
+
+    @staticmethod
+    def from_name(name: str) -> 'DisplayIdentity':
+        return DisplayIdentity(name)
+
+    @staticmethod
+    def from_dict(val: Dict) -> 'DisplayIdentity':
+        return DisplayIdentity(val['name'], val.get('manufacturer', ''), val.get('model', ''), val.get('serial', ''))
+
+
+def fingerprint_of(display: Union[DisplayIdentity, str]) -> str:
+    if isinstance(display, DisplayIdentity):
+        return display.fingerprint
+    elif isinstance(display, str):
+        return DisplayIdentity.from_name(display).fingerprint
+
+    raise TypeError(f'Display name or identity expected: {type(display)}')
+
+
+def fingerprints_of(displays: List[Union[DisplayIdentity, str]]) -> List[str]:
+    return [fingerprint_of(x) for x in displays]
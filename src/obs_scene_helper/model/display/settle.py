@@ -0,0 +1,44 @@
+from collections import deque
+from typing import Optional
+
+
+class SettleWindow:
+    """
+    Learns how long a burst of display configuration changes usually takes.
+
+    Docking, undocking or switching the projection mode generates a couple of change events in quick succession. Gaps
+    between consecutive changes shorter than the maximum window are considered to be part of the same burst, and the
+    settle window is the largest of the recent in-burst gaps (plus a safety margin), clamped to the [minimum, maximum]
+    range. Until enough gaps have been observed, the initial window is used.
+    """
+
+    def __init__(self, initial: float, minimum: float, maximum: float, margin: float = 1.5, samples: int = 20,
+                 min_samples: int = 3):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.margin = margin
+        self.min_samples = min_samples
+
+        self._gaps = deque(maxlen=samples)
+        self._last_change = None  # type: Optional[float]
+
+    @property
+    def window(self) -> float:
+        if len(self._gaps) < self.min_samples:
+            return self.initial
+
+        return min(max(max(self._gaps) * self.margin, self.minimum), self.maximum)
+
+    def change(self, now: float):
+        """ Record a change event, timestamps are expected to be monotonic """
+        if self._last_change is not None:
+            gap = now - self._last_change
+            if 0 <= gap < self.maximum:
+                self._gaps.append(gap)
+
+        self._last_change = now
+
+    def reset(self):
+        self._gaps.clear()
+        self._last_change = None
@@ -0,0 +1,21 @@
+import time
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class HookEventType(Enum):
+    OutputFileChanged = 'output_file_changed'  # value: full path of the new recording file
+    RecordingStateChanged = 'recording_state_changed'  # value: new state, e.g. "active" or "paused"
+    PresetActivated = 'preset_activated'  # value: preset name
+
+
+@dataclass(frozen=True)
+class HookEvent:
+    """
+    Passed to the hooks. Only plain values are exposed: the hooks run on worker threads, and must not touch the Qt
+    objects of the app.
+    """
+    type: HookEventType
+    value: str
+    timestamp: float = field(default_factory=time.time)
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from obs_scene_helper.model.image.perceptual_hash import hamming_distance
+
+
+@dataclass
+class _SourceState:
+    hash: np.ndarray
+    unchanged_since: float
+    frozen: bool = False
+
+
+class FreezeDetector:
+    """
+    Tracks the picture hashes of a set of sources, and flags the ones that didn't change for a whole window.
+
+    A source is flagged once per freeze: it is only flagged again after its picture changed (or after `rearm`).
+    """
+
+    def __init__(self, window: float, max_distance: int):
+        self.window = window
+        self.max_distance = max_distance  # Hash bits allowed to change for a frame to count as unchanged
+        self._states: dict[str, _SourceState] = {}
+
+    def reset(self):
+        self._states = {}
+
+    def is_frozen(self, name: str) -> bool:
+        state = self._states.get(name)
+        return state is not None and state.frozen
+
+    def update(self, hashes: dict[str, np.ndarray], now: float) -> tuple[list[str], list[str]]:
+        """
+        :param hashes: Latest hashes by source name, sources missing from the dictionary keep their state.
+        :param now: Current time, seconds.
+        :return: (sources that just froze, sources that are not frozen anymore)
+        """
+        # Compare all the known sources at once
+        known = [name for name in hashes if name in self._states]
+        if len(known) != 0:
+            distances = hamming_distance(np.stack([hashes[x] for x in known]),
+                                         np.stack([self._states[x].hash for x in known]))
+        else:
+            distances = []
+
+        frozen = []
+        thawed = []
+        for name, distance in zip(known, distances):
+            state = self._states[name]
+            state.hash = hashes[name]
+
+            if distance > self.max_distance:
+                if state.frozen:
+                    thawed.append(name)
+
+                state.unchanged_since = now
+                state.frozen = False
+            elif not state.frozen and now - state.unchanged_since >= self.window:
+                state.frozen = True
+                frozen.append(name)
+
+        for name in hashes:
+            if name not in self._states:
+                self._states[name] = _SourceState(hashes[name], now)
+
+        return frozen, thawed
+
+    def rearm(self, names: list[str], now: float):
+        """ Give the sources a full window before flagging them again (e.g. after restarting them) """
+        for name in names:
+            state = self._states.get(name)
+            if state is not None:
+                state.unchanged_since = now
+                state.frozen = False
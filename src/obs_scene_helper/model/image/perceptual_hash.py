@@ -0,0 +1,46 @@
+import numpy as np
+
+
+def downscale(gray: np.ndarray, height: int, width: int) -> np.ndarray:
+    """
+    Area-average a grayscale image down to the requested size.
+    :param gray: 2D array with the image luminance values.
+    :param height: Target height, should not be bigger than the source height.
+    :param width: Target width, should not be bigger than the source width.
+    :return: 2D float32 array of the requested size.
+    """
+    src_height, src_width = gray.shape
+    if height > src_height or width > src_width:
+        raise ValueError(f'Cannot downscale {gray.shape} to {(height, width)}')
+
+    # Sum up the pixels in every block, and then divide by the block sizes
+    row_starts = (np.arange(height) * src_height) // height
+    col_starts = (np.arange(width) * src_width) // width
+
+    sums = np.add.reduceat(np.add.reduceat(gray.astype(np.float32), row_starts, axis=0), col_starts, axis=1)
+
+    row_sizes = np.diff(np.append(row_starts, src_height))
+    col_sizes = np.diff(np.append(col_starts, src_width))
+
+    return sums / np.outer(row_sizes, col_sizes)
+
+
+def difference_hash(gray: np.ndarray, hash_size: int = 8) -> np.ndarray:
+    """
+    Compute a difference hash ("dHash") of an image: every bit tells if the brightness increases between two
+    horizontally neighbouring cells of the downscaled image.
+    :param gray: 2D array with the image luminance values.
+    :param hash_size: Hash will have hash_size * hash_size bits.
+    :return: Packed hash bits as an uint8 array.
+    """
+    cells = downscale(gray, hash_size, hash_size + 1)
+    return np.packbits(cells[:, 1:] > cells[:, :-1])
+
+
+def hamming_distance(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Count the differing bits between packed hashes.
+    Works both for a single pair of hashes and for stacked (N, hash bytes) arrays, in which case an array with N
+    distances is returned.
+    """
+    return np.unpackbits(np.bitwise_xor(first, second), axis=-1).sum(axis=-1)
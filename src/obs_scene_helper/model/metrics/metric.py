@@ -0,0 +1,55 @@
+import math
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Counter:
+    name: str
+    value: int = 0
+
+    def increment(self, amount: int = 1):
+        self.value += amount
+
+
+@dataclass
+class Gauge:
+    """ Current value of something going up and down (e.g. a queue depth), and the highest value seen so far """
+
+    name: str
+    value: int = 0
+    max: int = 0
+
+    def set(self, value: int):
+        self.value = value
+        self.max = max(self.max, value)
+
+
+@dataclass
+class Timing:
+    """ Running statistics of a duration, in seconds """
+
+    name: str
+    count: int = 0
+    total: float = 0.0
+    min: float = field(default=math.inf)
+    max: float = field(default=-math.inf)
+    last: float = field(default=math.nan)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count != 0 else math.nan
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+
+    def __str__(self):
+        if self.count == 0:
+            return f'{self.name}: no samples'
+
+        return (f'{self.name}: last {self.last * 1000:.0f} ms, mean {self.mean * 1000:.0f} ms, '
+                f'min {self.min * 1000:.0f} ms, max {self.max * 1000:.0f} ms ({self.count} samples)')
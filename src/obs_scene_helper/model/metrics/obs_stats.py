@@ -0,0 +1,106 @@
+import math
+
+import numpy as np
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from obs_scene_helper.model.metrics.series import SeriesBuffer
+
+# Fields of a single sample. OBS reports the frame and byte counts as totals, those are stored as the difference to
+# the previous sample, so the aggregates over any window are simple sums.
+FIELDS = ['cpu', 'memory', 'fps', 'render_time', 'disk_space', 'render_skipped', 'render_frames', 'output_skipped',
+          'output_frames', 'record_bytes']
+
+# Totals reported by OBS, and the sample field holding their difference
+COUNTERS = {
+    'renderSkippedFrames': 'render_skipped',
+    'renderTotalFrames': 'render_frames',
+    'outputSkippedFrames': 'output_skipped',
+    'outputTotalFrames': 'output_frames',
+    'outputBytes': 'record_bytes',
+}
+
+
+def make_sample(stats: dict, record_status: dict, previous: Optional[dict]) -> Dict[str, float]:
+    """
+    Turn the GetStats and GetRecordStatus responses into a sample.
+    :param previous: The raw totals of the previous sample, updated in place.
+    """
+    res = {
+        'cpu': stats.get('cpuUsage', math.nan),
+        'memory': stats.get('memoryUsage', math.nan),
+        'fps': stats.get('activeFps', math.nan),
+        'render_time': stats.get('averageFrameRenderTime', math.nan),
+        'disk_space': stats.get('availableDiskSpace', math.nan),
+    }
+
+    totals = {**stats, **(record_status if record_status.get('outputActive') else {})}
+    for key, name in COUNTERS.items():
+        value = totals.get(key)
+        last = previous.get(key) if previous is not None else None
+        if value is not None and last is not None and value >= last:
+            res[name] = value - last
+
+        # A restarted output (or OBS) starts counting from zero again, skip the difference in that case
+        if previous is not None:
+            if value is None:
+                previous.pop(key, None)
+            else:
+                previous[key] = value
+
+    return res
+
+
+@dataclass
+class StatsSnapshot:
+    """ Rolling aggregates over a window """
+    window: float
+    cpu: float = math.nan  # Percent, mean
+    memory: float = math.nan  # MiB, latest
+    fps: float = math.nan  # Mean
+    render_time: float = math.nan  # Milliseconds, mean
+    render_skip: float = math.nan  # Percent of the frames skipped by the renderer (render lag)
+    output_skip: float = math.nan  # Percent of the frames skipped by the outputs (encoder overload)
+    record_bitrate: float = math.nan  # Kbit/s
+    output_frames: float = 0  # Number of output frames in the window
+
+    def value(self, name: str) -> float:
+        return getattr(self, name)
+
+
+def _ratio(skipped: float, total: float) -> float:
+    return skipped / total * 100 if total > 0 else math.nan
+
+
+def summarize(series: SeriesBuffer, window: float) -> StatsSnapshot:
+    timestamps = series.timestamps(window)
+    span = timestamps[-1] - timestamps[0] if len(timestamps) > 1 else 0.0
+
+    # The first difference in the window was written before the window started
+    record_bytes = series.values('record_bytes', window)[1:]
+    record_bytes = record_bytes[~np.isnan(record_bytes)]
+    record_bitrate = float(record_bytes.sum() * 8 / 1000 / span) if len(record_bytes) != 0 and span > 0 else math.nan
+    output_frames = series.aggregate('output_frames', window).total
+
+    return StatsSnapshot(
+        window=window,
+        cpu=series.aggregate('cpu', window).mean,
+        memory=series.latest('memory'),
+        fps=series.aggregate('fps', window).mean,
+        render_time=series.aggregate('render_time', window).mean,
+        render_skip=_ratio(series.aggregate('render_skipped', window).total,
+                           series.aggregate('render_frames', window).total),
+        output_skip=_ratio(series.aggregate('output_skipped', window).total, output_frames),
+        record_bitrate=record_bitrate,
+        output_frames=output_frames,
+    )
+
+
+def interval_skip(series: SeriesBuffer, skipped: str, total: str) -> np.ndarray:
+    """ Percent of the frames skipped in every sample, for plotting """
+    frames = series.values(total)
+    with_frames = frames > 0
+    res = np.full_like(frames, np.nan)
+    res[with_frames] = series.values(skipped)[with_frames] / frames[with_frames] * 100
+    return res
@@ -0,0 +1,87 @@
+import math
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class Aggregate:
+    count: int = 0
+    min: float = math.nan
+    max: float = math.nan
+    mean: float = math.nan
+    total: float = 0.0
+    last: float = math.nan
+
+
+class SeriesBuffer:
+    """
+    Fixed-size history of a set of numeric fields sharing a single time axis.
+
+    Every sample occupies one column in a preallocated (fields, capacity) array, the oldest samples are overwritten, so
+    the memory use doesn't depend on how long the app is running. Missing values are stored as NaN, and ignored by the
+    aggregates.
+    """
+
+    def __init__(self, fields: List[str], capacity: int):
+        if capacity <= 0:
+            raise ValueError(f'Invalid capacity: {capacity}')
+
+        self.fields = fields
+        self.capacity = capacity
+        self._rows = {name: i for i, name in enumerate(fields)}
+
+        self._values = np.full((len(fields), capacity), np.nan, dtype=np.float64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+
+        self._head = 0  # Next column to write
+        self._count = 0  # Number of valid columns
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._values.fill(np.nan)
+        self._head = 0
+        self._count = 0
+
+    def append(self, timestamp: float, values: Dict[str, float]):
+        column = self._head
+        self._values[:, column] = np.nan
+        for name, value in values.items():
+            self._values[self._rows[name], column] = value
+        self._timestamps[column] = timestamp
+
+        self._head = (column + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _columns(self, window: Optional[float]) -> np.ndarray:
+        """ Columns in chronological order, limited to the window counting back from the latest sample """
+        columns = (self._head - self._count + np.arange(self._count)) % self.capacity
+        if window is None or self._count == 0:
+            return columns
+
+        timestamps = self._timestamps[columns]
+        return columns[timestamps > timestamps[-1] - window]
+
+    def timestamps(self, window: Optional[float] = None) -> np.ndarray:
+        return self._timestamps[self._columns(window)]
+
+    def values(self, name: str, window: Optional[float] = None) -> np.ndarray:
+        return self._values[self._rows[name], self._columns(window)]
+
+    def latest(self, name: str) -> float:
+        if self._count == 0:
+            return math.nan
+        return float(self._values[self._rows[name], (self._head - 1) % self.capacity])
+
+    def aggregate(self, name: str, window: Optional[float] = None) -> Aggregate:
+        values = self.values(name, window)
+        valid = values[~np.isnan(values)]
+        if len(valid) == 0:
+            return Aggregate()
+
+        return Aggregate(len(valid), float(valid.min()), float(valid.max()), float(valid.mean()), float(valid.sum()),
+                         float(valid[-1]))
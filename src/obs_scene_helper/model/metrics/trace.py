@@ -0,0 +1,111 @@
+import time
+
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional
+
+
+class SpanKind(Enum):
+    Timer = 'timer'  # Waiting on one of our own timers
+    OBS = 'obs'  # Waiting on OBS to do something
+    Local = 'local'  # Doing something ourselves
+
+
+@dataclass
+class Span:
+    name: str
+    kind: SpanKind
+    started: float  # time.monotonic()
+    ended: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.ended if self.ended is not None else time.monotonic()) - self.started
+
+
+@dataclass
+class Trace:
+    """ A sequence of consecutive spans, only one span is open at any time """
+
+    trace_id: int
+    name: str
+    started_at: float = field(default_factory=time.time)  # Wall time, for display
+    spans: list[Span] = field(default_factory=list)
+    outcome: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.outcome is not None
+
+    @property
+    def current(self) -> Optional[Span]:
+        if len(self.spans) == 0 or self.spans[-1].ended is not None:
+            return None
+        return self.spans[-1]
+
+    @property
+    def duration(self) -> float:
+        if len(self.spans) == 0:
+            return 0.0
+        return sum(x.duration for x in self.spans)
+
+    def enter(self, name: str, kind: SpanKind, now: Optional[float] = None):
+        """ Close the current span (if any) and open a new one """
+        now = time.monotonic() if now is None else now
+        self._close_current(now)
+        self.spans.append(Span(name, kind, now))
+
+    def finish(self, outcome: str, now: Optional[float] = None):
+        self._close_current(time.monotonic() if now is None else now)
+        self.outcome = outcome
+
+    def _close_current(self, now: float):
+        current = self.current
+        if current is not None:
+            current.ended = now
+
+    def by_phase(self) -> dict[str, float]:
+        """ Total duration per span name (phases can be entered multiple times, e.g. a re-armed timer) """
+        res = {}
+        for span in self.spans:
+            res[span.name] = res.get(span.name, 0.0) + span.duration
+        return res
+
+    def by_kind(self) -> dict[SpanKind, float]:
+        res = {x: 0.0 for x in SpanKind}
+        for span in self.spans:
+            res[span.kind] += span.duration
+        return res
+
+
+class TraceBuffer:
+    """ Keeps the last N finished traces """
+
+    def __init__(self, max_entries: int):
+        self._traces = deque(maxlen=max_entries)
+        self._next_id = 1
+
+    def __len__(self):
+        return len(self._traces)
+
+    def __getitem__(self, index: int) -> Trace:
+        return self._traces[index]
+
+    @property
+    def full(self) -> bool:
+        return len(self._traces) == self._traces.maxlen
+
+    def new_trace(self, name: str) -> Trace:
+        trace = Trace(self._next_id, name)
+        self._next_id += 1
+        return trace
+
+    def add(self, trace: Trace):
+        self._traces.append(trace)
+
+    def drop_oldest(self):
+        self._traces.popleft()
+
+    def clear(self):
+        self._traces.clear()
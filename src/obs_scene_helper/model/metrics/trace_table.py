@@ -0,0 +1,100 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from typing import Optional
+from datetime import datetime
+
+from obs_scene_helper.model.metrics.trace import Trace, TraceBuffer, SpanKind
+
+
+class Table(QAbstractTableModel):
+    """ Finished traces, one per row, with a column per phase """
+
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    FIXED_HEADERS = ['Time', 'Outcome', 'Total', 'Timers', 'OBS']
+
+    def __init__(self, phases: list[str], max_entries: int):
+        super().__init__()
+        self.phases = phases
+        self.headers = self.FIXED_HEADERS + phases
+        self._traces = TraceBuffer(max_entries)
+
+    @property
+    def traces(self) -> TraceBuffer:
+        return self._traces
+
+    def rowCount(self, parent: Optional[QModelIndex] = None):
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self._traces)
+
+    def columnCount(self, parent: Optional[QModelIndex] = None):
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self.headers)
+
+    @staticmethod
+    def _format_duration(value: Optional[float]) -> str:
+        return f'{value:.2f} s' if value is not None else ''
+
+    def _get_display_role_for_item(self, trace: Trace, column: int) -> Optional[str]:
+        header = self.headers[column]
+        if header == 'Time':
+            return datetime.fromtimestamp(trace.started_at).strftime(self.TIMESTAMP_FORMAT)
+        elif header == 'Outcome':
+            return trace.outcome
+        elif header == 'Total':
+            return self._format_duration(trace.duration)
+        elif header == 'Timers':
+            return self._format_duration(trace.by_kind()[SpanKind.Timer])
+        elif header == 'OBS':
+            return self._format_duration(trace.by_kind()[SpanKind.OBS])
+
+        return self._format_duration(trace.by_phase().get(header))
+
+    @staticmethod
+    def _get_tooltip_role_for_item(trace: Trace) -> str:
+        lines = [f'Trace #{trace.trace_id}: {trace.name} ({trace.outcome})']
+        for span in trace.spans:
+            lines.append(f'{span.name:<26} {span.kind.value:<6} {span.duration * 1000:8.0f} ms')
+        return '\n'.join(lines)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        trace = self._traces[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._get_display_role_for_item(trace, index.column())
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            return self._get_tooltip_role_for_item(trace)
+
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section]
+        return None
+
+    def new_trace(self, name: str) -> Trace:
+        return self._traces.new_trace(name)
+
+    def add_trace(self, trace: Trace):
+        if self._traces.full:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._traces.drop_oldest()
+            self.endRemoveRows()
+
+        row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._traces.add(trace)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._traces.clear()
+        self.endResetModel()
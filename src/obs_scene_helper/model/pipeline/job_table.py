@@ -0,0 +1,126 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, List, Dict
+from datetime import datetime
+
+import os
+
+from obs_scene_helper.model.pipeline.stages import FileReport
+
+
+class JobState(Enum):
+    Queued = 'queued'
+    Running = 'running'
+    Done = 'done'
+    Failed = 'failed'
+
+
+@dataclass
+class PipelineJob:
+    path: str
+    queued_at: float
+    state: JobState = JobState.Queued
+    done: int = 0
+    total: int = 0
+    report: Optional[FileReport] = None
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total > 0 else 0.0
+
+
+class Table(QAbstractTableModel):
+    """ Files passed through the post-recording pipeline, the latest ones at the bottom """
+
+    TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    HEADERS = ['Time', 'File', 'State', 'Progress', 'Result']
+
+    def __init__(self, max_entries: int = 200):
+        super().__init__()
+        self.max_entries = max_entries
+        self._jobs = []  # type: List[PipelineJob]
+        self._rows = {}  # type: Dict[str, int]
+
+    def rowCount(self, parent: Optional[QModelIndex] = None):
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self._jobs)
+
+    def columnCount(self, parent: Optional[QModelIndex] = None):
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self.HEADERS)
+
+    def job(self, path: str) -> Optional[PipelineJob]:
+        row = self._rows.get(path)
+        return self._jobs[row] if row is not None else None
+
+    @staticmethod
+    def _format_size(value: int) -> str:
+        return f'{value / (1024 * 1024):.0f} MiB'
+
+    def _get_display_role_for_item(self, job: PipelineJob, column: int) -> Optional[str]:
+        header = self.HEADERS[column]
+        if header == 'Time':
+            return datetime.fromtimestamp(job.queued_at).strftime(self.TIMESTAMP_FORMAT)
+        elif header == 'File':
+            return os.path.basename(job.path)
+        elif header == 'State':
+            return job.state.value
+        elif header == 'Progress':
+            if job.total == 0:
+                return ''
+            return f'{job.progress * 100:.0f}% ({self._format_size(job.done)} / {self._format_size(job.total)})'
+        elif header == 'Result':
+            return job.report.summary if job.report is not None else ''
+
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        job = self._jobs[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._get_display_role_for_item(job, index.column())
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            return job.path
+
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def add(self, job: PipelineJob):
+        if len(self._jobs) >= self.max_entries:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._jobs.pop(0)
+            self.endRemoveRows()
+
+        row = len(self._jobs)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._jobs.append(job)
+        self.endInsertRows()
+        self._rows = {x.path: i for i, x in enumerate(self._jobs)}
+
+    def update(self, path: str):
+        row = self._rows.get(path)
+        if row is None:
+            return
+
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def clear(self):
+        self.beginResetModel()
+        self._jobs = [x for x in self._jobs if x.state in [JobState.Queued, JobState.Running]]
+        self._rows = {x.path: i for i, x in enumerate(self._jobs)}
+        self.endResetModel()
@@ -0,0 +1,192 @@
+import hashlib
+import os
+import shlex
+import subprocess
+import time
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from obs_scene_helper.model.pipeline.throttle import BandwidthLimiter
+
+# Stages run in the pipeline worker processes, everything here has to be picklable and must not depend on Qt
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Hashes are stored next to the recording, in the format understood by e.g. `sha256sum -c`
+HASH_FILE_SUFFIX = '.{algorithm}'
+
+
+@dataclass
+class StageResult:
+    stage: str
+    success: bool
+    message: str = ''
+
+
+@dataclass
+class FileReport:
+    path: str
+    size: int = 0
+    duration: float = 0.0
+    digest: str = ''
+    results: List[StageResult] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return all(x.success for x in self.results)
+
+    @property
+    def summary(self) -> str:
+        return ', '.join(f'{x.stage}: {x.message if x.message else ("ok" if x.success else "failed")}'
+                         for x in self.results)
+
+
+class Stage:
+    """ Receives the file contents chunk by chunk, and reports its result once the whole file was read """
+
+    name = ''
+
+    def update(self, chunk: memoryview):
+        pass
+
+    def finish(self, report: FileReport) -> StageResult:
+        raise NotImplementedError
+
+
+class HashStage(Stage):
+    name = 'hash'
+
+    def __init__(self, algorithm: str, write_hash_file: bool = True):
+        self.algorithm = algorithm
+        self.write_hash_file = write_hash_file
+        self._hash = hashlib.new(algorithm)
+
+    def update(self, chunk: memoryview):
+        self._hash.update(chunk)
+
+    def finish(self, report: FileReport) -> StageResult:
+        report.digest = self._hash.hexdigest()
+        if not self.write_hash_file:
+            return StageResult(self.name, True, report.digest)
+
+        hash_path = report.path + HASH_FILE_SUFFIX.format(algorithm=self.algorithm)
+        try:
+            with open(hash_path, 'w') as f:
+                f.write(f'{report.digest} *{os.path.basename(report.path)}\n')
+        except OSError as e:
+            return StageResult(self.name, False, f'Error writing {hash_path}: {str(e)}')
+
+        return StageResult(self.name, True, report.digest)
+
+
+class SizeCheckStage(Stage):
+    """ Flags truncated or suspiciously small recordings """
+
+    name = 'size'
+
+    def __init__(self, min_size: int):
+        self.min_size = min_size
+        self._read = 0
+
+    def update(self, chunk: memoryview):
+        self._read += len(chunk)
+
+    def finish(self, report: FileReport) -> StageResult:
+        if self._read != report.size:
+            return StageResult(self.name, False, f'Read {self._read} bytes, expected {report.size}')
+
+        if self._read < self.min_size:
+            return StageResult(self.name, False, f'Only {self._read} bytes, expected at least {self.min_size}')
+
+        return StageResult(self.name, True, f'{self._read} bytes')
+
+
+class CommandStage(Stage):
+    """ Runs a command (e.g. a remux) once the file was read, with the file path as the last argument """
+
+    name = 'command'
+
+    def __init__(self, command: str, timeout: Optional[float] = None):
+        self.command = command
+        self.timeout = timeout
+
+    def finish(self, report: FileReport) -> StageResult:
+        try:
+            result = subprocess.run(shlex.split(self.command) + [report.path], stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, text=True, errors='replace',
+                                    timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            return StageResult(self.name, False, f'Timed out after {self.timeout} s')
+        except Exception as e:
+            return StageResult(self.name, False, str(e))
+
+        if result.returncode != 0:
+            last_line = result.stdout.strip().splitlines()[-1:] if result.stdout else []
+            return StageResult(self.name, False, f'Exit code {result.returncode}: {"".join(last_line)}')
+
+        return StageResult(self.name, True)
+
+
+@dataclass
+class PipelineConfig:
+    hash_algorithm: str = 'sha256'  # Empty to skip hashing
+    min_size: int = 0  # Bytes
+    command: str = ''  # Empty to skip
+    command_timeout: Optional[float] = None
+    bandwidth: float = 0.0  # Read rate limit in bytes per second, 0 means no limit
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+
+    def make_stages(self) -> List[Stage]:
+        stages = [SizeCheckStage(self.min_size)]  # type: List[Stage]
+        if self.hash_algorithm:
+            stages.append(HashStage(self.hash_algorithm))
+        if self.command:
+            stages.append(CommandStage(self.command, self.command_timeout))
+        return stages
+
+
+def process_file(path: str, config: PipelineConfig, on_progress: Optional[Callable[[int, int], None]] = None,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic,
+                 limiter: Optional[BandwidthLimiter] = None) -> FileReport:
+    """
+    Stream the file through the stages in large chunks, reading at most `config.bandwidth` bytes per second.
+    `on_progress` is called with the bytes read so far and the total size after every chunk. A `limiter` shared with
+    the other readers makes the bandwidth a common budget instead of a per-file one.
+    """
+    started = clock()
+    report = FileReport(path)
+
+    try:
+        report.size = os.path.getsize(path)
+        stages = config.make_stages()
+        limiter = limiter if limiter is not None else BandwidthLimiter(config.bandwidth)
+
+        buffer = bytearray(config.chunk_size)
+        view = memoryview(buffer)
+        done = 0
+
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                count = f.readinto(buffer)
+                if not count:
+                    break
+
+                chunk = view[:count]
+                for stage in stages:
+                    stage.update(chunk)
+
+                done += count
+                if on_progress is not None:
+                    on_progress(done, report.size)
+
+                delay = limiter.consume(count, clock())
+                if delay > 0:
+                    sleep(delay)
+
+        report.results = [stage.finish(report) for stage in stages]
+    except Exception as e:
+        report.results.append(StageResult('read', False, str(e)))
+
+    report.duration = clock() - started
+    return report
@@ -0,0 +1,33 @@
+class BandwidthLimiter:
+    """
+    Keeps the average read rate below the limit: every chunk "occupies" the time it would take to read it at the
+    limited rate, and the reader is told how long to sleep until its budget catches up.
+
+    Readers in several processes can share the limit through a `multiprocessing.Value('d')` holding the time the
+    bandwidth is free again, as long as they use a system-wide clock (e.g. `time.monotonic`).
+    """
+
+    def __init__(self, rate: float, shared_free_at=None):
+        self.rate = rate  # Bytes per second, 0 means no limit
+        self._shared_free_at = shared_free_at
+        self._free_at = None
+
+    def consume(self, amount: int, now: float) -> float:
+        """ Account for `amount` bytes read at `now`, return the time to sleep (in seconds) """
+        if self.rate <= 0:
+            return 0.0
+
+        if self._shared_free_at is None:
+            return self._reserve(amount, now)
+
+        with self._shared_free_at.get_lock():
+            self._free_at = self._shared_free_at.value
+            delay = self._reserve(amount, now)
+            self._shared_free_at.value = self._free_at
+
+        return delay
+
+    def _reserve(self, amount: int, now: float) -> float:
+        start = now if self._free_at is None else max(now, self._free_at)
+        self._free_at = start + amount / self.rate
+        return self._free_at - now
@@ -0,0 +1,44 @@
+import os
+import time
+
+from obs_scene_helper.model.pipeline.stages import FileReport, PipelineConfig, process_file
+from obs_scene_helper.model.pipeline.throttle import BandwidthLimiter
+
+# Runs in the pipeline worker processes. Kept free of Qt, so the processes start quickly.
+
+# Minimal time between two progress reports of the same file
+PROGRESS_INTERVAL = 0.25
+
+# Niceness increment of the worker processes, so the recording always wins the CPU
+NICE_INCREMENT = 10
+
+_progress_queue = None
+_bandwidth_free_at = None  # Shared by all the workers of the pool, see BandwidthLimiter
+
+
+def init_worker(progress_queue, bandwidth_free_at=None):
+    global _progress_queue, _bandwidth_free_at
+    _progress_queue = progress_queue
+    _bandwidth_free_at = bandwidth_free_at
+
+    if hasattr(os, 'nice'):
+        try:
+            os.nice(NICE_INCREMENT)
+        except OSError:
+            pass
+
+
+def run(path: str, config: PipelineConfig) -> FileReport:
+    last_report = 0.0
+
+    def on_progress(done: int, total: int):
+        nonlocal last_report
+        now = time.monotonic()
+        if done != total and now - last_report < PROGRESS_INTERVAL:
+            return
+
+        last_report = now
+        if _progress_queue is not None:
+            _progress_queue.put((path, done, total))
+
+    return process_file(path, config, on_progress, limiter=BandwidthLimiter(config.bandwidth, _bandwidth_free_at))
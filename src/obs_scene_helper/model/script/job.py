@@ -0,0 +1,61 @@
+import time
+
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Callable
+
+
+@dataclass
+class Job:
+    job_id: str
+    command: List[str]
+    created_at: float = field(default_factory=time.time)  # Wall time, survives restarts
+
+    @staticmethod
+    def make(command: List[str]) -> 'Job':
+        from uuid import uuid4
+        return Job(str(uuid4()), command)
+
+    @property
+    def short_id(self) -> str:
+        return self.job_id[:8]
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(val: Dict) -> 'Job':
+        return Job(val['job_id'], val['command'], val.get('created_at', time.time()))
+
+
+class JobBacklog:
+    """ Jobs that were queued, but didn't finish yet, in the order they were queued """
+
+    def __init__(self, jobs: List[Job], on_changed: Optional[Callable[[], None]]):
+        self._jobs = {x.job_id: x for x in jobs}
+        self._on_changed = on_changed
+
+    def _notify_changed(self):
+        if self._on_changed is not None:
+            self._on_changed()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    @property
+    def jobs(self) -> List[Job]:
+        return list(self._jobs.values())
+
+    def add(self, job: Job):
+        self._jobs[job.job_id] = job
+        self._notify_changed()
+
+    def remove(self, job_id: str):
+        if self._jobs.pop(job_id, None) is not None:
+            self._notify_changed()
+
+    def to_dict(self) -> Dict:
+        return {'jobs': [x.to_dict() for x in self._jobs.values()]}
+
+    @staticmethod
+    def from_dict(val: Dict, on_changed: Optional[Callable[[], None]]) -> 'JobBacklog':
+        return JobBacklog([Job.from_dict(x) for x in val.get('jobs', [])], on_changed)
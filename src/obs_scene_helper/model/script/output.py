@@ -0,0 +1,68 @@
+from collections import deque
+from typing import List
+
+
+class LineThrottle:
+    """
+    Token bucket limiting how many output lines are forwarded per second.
+
+    Scripts printing progress (e.g. ffmpeg) produce hundreds of lines per second: a short burst is let through, after
+    that only `rate` lines per second are, and the rest is only counted.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._last = None
+        self.suppressed = 0
+
+    def allow(self, now: float) -> bool:
+        if self._last is not None:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+
+        self.suppressed += 1
+        return False
+
+    def take_suppressed(self) -> int:
+        """ Number of lines suppressed since the last call """
+        res = self.suppressed
+        self.suppressed = 0
+        return res
+
+
+class OutputTail:
+    """ Last lines of a script output, with overly long lines truncated """
+
+    def __init__(self, max_lines: int, max_line_length: int):
+        self.max_line_length = max_line_length
+        self._lines = deque(maxlen=max_lines)
+        self.total_lines = 0
+
+    @property
+    def lines(self) -> List[str]:
+        return list(self._lines)
+
+    def truncate(self, line: str) -> str:
+        line = line.rstrip('\r\n')
+        if len(line) > self.max_line_length:
+            return line[:self.max_line_length] + '…'
+        return line
+
+    def add(self, line: str) -> str:
+        """ Store a line, return it in its stored (truncated) form """
+        line = self.truncate(line)
+        self._lines.append(line)
+        self.total_lines += 1
+        return line
+
+    def __str__(self):
+        skipped = self.total_lines - len(self._lines)
+        prefix = f'[{skipped} earlier lines omitted]\n' if skipped > 0 else ''
+        return prefix + '\n'.join(self._lines)
@@ -1,11 +1,20 @@
 from typing import List, Optional, Callable, Dict, Union
 
+from obs_scene_helper.model.display.identity import DisplayIdentity, fingerprint_of
+
 
 class AllDisplays:
-    """ Stores all displays we've ever seen, making the preset construction easier """
+    """
+    Stores all displays we've ever seen, making the preset construction easier.
+
+    Presets are edited by display name, the fingerprints map translates the names back to the fingerprint of the display
+    last seen under that name.
+    """
 
-    def __init__(self, all_displays: List[str], on_changed: Optional[Callable[[], None]]):
+    def __init__(self, all_displays: List[str], on_changed: Optional[Callable[[], None]],
+                 fingerprints: Optional[Dict[str, str]] = None):
         self.all_displays = all_displays
+        self.fingerprints = fingerprints if fingerprints is not None else {}
         self._on_changed = on_changed
 
     def _notify_changed(self):
@@ -13,28 +22,40 @@ class AllDisplays:
             self._on_changed()
 
     def to_dict(self) -> Dict:
-        return {'all_displays': self.all_displays}
+        return {'all_displays': self.all_displays, 'fingerprints': self.fingerprints}
 
     @staticmethod
     def from_dict(val: Dict, on_changed: Optional[Callable[[], None]]) -> 'AllDisplays':
         all_displays = val['all_displays']
-        return AllDisplays(all_displays, on_changed)
+        fingerprints = val.get('fingerprints', {})
+        return AllDisplays(all_displays, on_changed, fingerprints)
+
+    def fingerprint_for(self, name: str) -> str:
+        return self.fingerprints.get(name, fingerprint_of(name))
 
     @staticmethod
     def _comparable_display_list(displays: List[str]) -> List[str]:
         return [x.lower() for x in sorted(displays) if len(x) != 0]
 
     @staticmethod
-    def _display_list_from_other(other: Union['AllDisplays', List[str]]):
+    def _display_list_from_other(other: Union['AllDisplays', List[str], List[DisplayIdentity]]):
         if isinstance(other, AllDisplays):
             res = other.all_displays
         elif isinstance(other, list):
-            res = other
+            res = [x.name if isinstance(x, DisplayIdentity) else x for x in other]
         else:
             raise TypeError('Display list expected')
 
         return [x for x in res if len(x) != 0]
 
+    @staticmethod
+    def _fingerprints_from_other(other: Union['AllDisplays', List[str], List[DisplayIdentity]]) -> Dict[str, str]:
+        if isinstance(other, AllDisplays):
+            return other.fingerprints
+
+        # Plain names don't tell us anything new
+        return {x.name: x.fingerprint for x in other if isinstance(x, DisplayIdentity) and len(x.name) != 0}
+
     def __eq__(self, other: Union['AllDisplays', List[str]]):
         other_displays = AllDisplays._display_list_from_other(other)
         return self._comparable_display_list(self.all_displays) == AllDisplays._comparable_display_list(other_displays)
@@ -45,7 +66,7 @@ class AllDisplays:
     def will_change_from(self, other: Union['AllDisplays', List[str]]):
         return self != other
 
-    def update(self, other: Union['AllDisplays', List[str]]):
+    def update(self, other: Union['AllDisplays', List[str], List[DisplayIdentity]]):
         # The new display list might be smaller than the old one, but can still contain some new entries.
         # So we make use an intersection of both lists as the new list.
 
@@ -53,8 +74,11 @@ class AllDisplays:
         our_displays = set(self.all_displays)
         new_display_list = list(our_displays | other_displays)
 
-        if not self.will_change_from(new_display_list):
+        new_fingerprints = {**self.fingerprints, **AllDisplays._fingerprints_from_other(other)}
+
+        if not self.will_change_from(new_display_list) and new_fingerprints == self.fingerprints:
             return
 
         self.all_displays = new_display_list
+        self.fingerprints = new_fingerprints
         self._notify_changed()
@@ -1,5 +1,5 @@
-from typing import Dict, Optional, Callable
-from dataclasses import dataclass, field
+from typing import Dict, Optional, Callable, List
+from dataclasses import dataclass, field, asdict, replace
 
 
 @dataclass
@@ -12,8 +12,133 @@ class OSH:
             macos = OSH.MacOS(self.fix_inputs_after_recording_resume_delay)
             return macos
 
+    @dataclass
+    class FrozenSources:
+        # Static content (e.g. slides or a document left on screen) is flagged too: the detection only reports by
+        # default, restarting the sources has to be enabled explicitly
+        enabled: bool = False
+        sources: List[str] = field(default_factory=list)
+        sample_interval: int = 5  # Seconds between two thumbnails
+        window: int = 30  # Seconds without a change before a source is considered frozen
+        thumbnail_size: int = 32  # Pixels, the thumbnail width (the height follows the aspect ratio of the source)
+        hash_size: int = 8  # Hash bits per row and column, limited by the thumbnail width
+        max_distance: int = 0  # Hash bits that are allowed to change for a frame to count as unchanged
+        cpu_budget: float = 1.0  # Percent of the wall time we are allowed to spend on the detection
+        auto_fix: bool = False  # Restart the frozen sources with the input recovery
+
+        @property
+        def effective_hash_size(self) -> int:
+            """ Hash size fitting the thumbnail: the hash needs one column more than its size """
+            return max(1, min(self.hash_size, self.thumbnail_size - 1))
+
+        def copy(self) -> 'OSH.FrozenSources':
+            return replace(self, sources=[x for x in self.sources])
+
+    @dataclass
+    class SilencePause:
+        enabled: bool = False
+        inputs: List[str] = field(default_factory=list)
+        pause_after: int = 60  # Seconds of silence on all the inputs before pausing
+        pause_threshold_db: float = -50.0  # Levels below this count as silence
+        resume_threshold_db: float = -40.0  # Levels above this resume the recording, should be above the pause one
+        resume_hold: float = 0.3  # Seconds the audio has to stay above the resume threshold
+
+        def copy(self) -> 'OSH.SilencePause':
+            return replace(self, inputs=[x for x in self.inputs])
+
+    @dataclass
+    class PresetMatching:
+        min_score: float = 1.0  # 1.0 only accepts presets with exactly the same displays
+        missing_weight: float = 1.0  # Penalty for a preset display that is not connected
+        extra_weight: float = 0.5  # Penalty for a connected display that is not in the preset
+
+        def copy(self) -> 'OSH.PresetMatching':
+            return replace(self)
+
+    @dataclass
+    class ScriptQueue:
+        max_workers: int = 1  # Output file scripts running at the same time, the rest is queued
+        timeout: int = 0  # Seconds before a script is killed, 0 means no limit
+
+        def copy(self) -> 'OSH.ScriptQueue':
+            return replace(self)
+
+    @dataclass
+    class ScreenLockPause:
+        hold_off: float = 5.0  # Seconds the screen has to stay locked before pausing, 0 pauses right away
+
+        def copy(self) -> 'OSH.ScreenLockPause':
+            return replace(self)
+
+    @dataclass
+    class Hooks:
+        enabled: bool = True
+        timeout: float = 5.0  # Seconds before a hook is considered stalled, 0 means no limit
+        directory: str = ''  # Hook files loaded on top of the entry points (e.g. for the frozen builds), empty for none
+
+        def copy(self) -> 'OSH.Hooks':
+            return replace(self)
+
+    @dataclass
+    class FilePipeline:
+        enabled: bool = False
+        hash_algorithm: str = 'sha256'  # Empty to skip hashing
+        min_size: int = 1  # MiB, smaller recordings are flagged
+        command: str = ''  # E.g. a remux, called with the file path as the last argument
+        bandwidth: float = 50.0  # MiB/s shared by all the workers, 0 means no limit
+        max_workers: int = 0  # 0 uses half of the cores
+
+        def copy(self) -> 'OSH.FilePipeline':
+            return replace(self)
+
+    @dataclass
+    class DiskForecast:
+        enabled: bool = True
+        warn_at: List[int] = field(default_factory=lambda: [30, 10])  # Minutes before the disk is full
+        action: str = 'none'  # What to do before the disk is full: 'none', 'split' or 'stop'
+        action_at: int = 2  # Minutes before the disk is full
+
+        def copy(self) -> 'OSH.DiskForecast':
+            return replace(self, warn_at=[x for x in self.warn_at])
+
+    @dataclass
+    class Telemetry:
+        interval: float = 2.0  # Seconds between two OBS stats samples
+        window: int = 60  # Seconds the rolling aggregates are computed over
+        max_render_time: float = 0.0  # Milliseconds, 0 disables the threshold
+        max_render_skip: float = 1.0  # Percent of the frames skipped by the renderer, 0 disables the threshold
+        max_output_skip: float = 1.0  # Percent of the frames skipped by the outputs, 0 disables the threshold
+        max_cpu: float = 0.0  # Percent, 0 disables the threshold
+
+        def copy(self) -> 'OSH.Telemetry':
+            return replace(self)
+
+    @dataclass
+    class QualityFallback:
+        enabled: bool = False
+        profile: str = ''  # Empty keeps the current one
+        scene_collection: str = ''  # Empty keeps the current one
+        window: int = 30  # Seconds the drop rate is computed over
+        max_drop: float = 5.0  # Percent of the frames dropped before falling back
+        restore_below: float = 0.5  # Percent of the frames dropped below which the previous preset can be restored
+        restore_after: int = 600  # Seconds the drop rate has to stay low before restoring, 0 never restores
+        cooldown: int = 300  # Minimal number of seconds between two switches
+
+        def copy(self) -> 'OSH.QualityFallback':
+            return replace(self)
+
     output_file_change_script: str = field(default="")
     macos: MacOS = field(default_factory=lambda: OSH.MacOS())
+    frozen_sources: FrozenSources = field(default_factory=lambda: OSH.FrozenSources())
+    silence_pause: SilencePause = field(default_factory=lambda: OSH.SilencePause())
+    preset_matching: PresetMatching = field(default_factory=lambda: OSH.PresetMatching())
+    screen_lock_pause: ScreenLockPause = field(default_factory=lambda: OSH.ScreenLockPause())
+    script_queue: ScriptQueue = field(default_factory=lambda: OSH.ScriptQueue())
+    hooks: Hooks = field(default_factory=lambda: OSH.Hooks())
+    file_pipeline: FilePipeline = field(default_factory=lambda: OSH.FilePipeline())
+    disk_forecast: DiskForecast = field(default_factory=lambda: OSH.DiskForecast())
+    telemetry: Telemetry = field(default_factory=lambda: OSH.Telemetry())
+    quality_fallback: QualityFallback = field(default_factory=lambda: OSH.QualityFallback())
 
     _on_changed: Optional[Callable[[], None]] = field(default=None, init=False, repr=False, compare=False, hash=False)
 
@@ -25,13 +150,34 @@ class OSH:
         return {
             'macos': self.macos.__dict__,
             'output_file_change_script': self.output_file_change_script,
+            'frozen_sources': asdict(self.frozen_sources),
+            'silence_pause': asdict(self.silence_pause),
+            'preset_matching': asdict(self.preset_matching),
+            'screen_lock_pause': asdict(self.screen_lock_pause),
+            'script_queue': asdict(self.script_queue),
+            'hooks': asdict(self.hooks),
+            'file_pipeline': asdict(self.file_pipeline),
+            'disk_forecast': asdict(self.disk_forecast),
+            'telemetry': asdict(self.telemetry),
+            'quality_fallback': asdict(self.quality_fallback),
         }
 
     @staticmethod
     def from_json_dict(val: Dict, on_changed: Optional[Callable[[], None]]) -> 'OSH':
         macos = OSH.MacOS(**val['macos'])
         output_file_change_script = val.get('output_file_change_script', "")
-        osh = OSH(output_file_change_script, macos)
+        frozen_sources = OSH.FrozenSources(**val.get('frozen_sources', {}))
+        silence_pause = OSH.SilencePause(**val.get('silence_pause', {}))
+        preset_matching = OSH.PresetMatching(**val.get('preset_matching', {}))
+        screen_lock_pause = OSH.ScreenLockPause(**val.get('screen_lock_pause', {}))
+        script_queue = OSH.ScriptQueue(**val.get('script_queue', {}))
+        hooks = OSH.Hooks(**val.get('hooks', {}))
+        file_pipeline = OSH.FilePipeline(**val.get('file_pipeline', {}))
+        disk_forecast = OSH.DiskForecast(**val.get('disk_forecast', {}))
+        telemetry = OSH.Telemetry(**val.get('telemetry', {}))
+        quality_fallback = OSH.QualityFallback(**val.get('quality_fallback', {}))
+        osh = OSH(output_file_change_script, macos, frozen_sources, silence_pause, preset_matching, screen_lock_pause,
+                  script_queue, hooks, file_pipeline, disk_forecast, telemetry, quality_fallback)
         osh._on_changed = on_changed
         return osh
 
@@ -46,7 +192,10 @@ class OSH:
 
     def copy(self, on_changed: Optional[Callable[[], None]]) -> 'OSH':
         """ Make a copy of the settings instance """
-        osh = OSH(self.output_file_change_script, self.macos.copy())
+        osh = OSH(self.output_file_change_script, self.macos.copy(), self.frozen_sources.copy(),
+                  self.silence_pause.copy(), self.preset_matching.copy(), self.screen_lock_pause.copy(),
+                  self.script_queue.copy(), self.hooks.copy(), self.file_pipeline.copy(), self.disk_forecast.copy(),
+                  self.telemetry.copy(), self.quality_fallback.copy())
         osh._on_changed = on_changed
         return osh
 
@@ -57,4 +206,14 @@ class OSH:
 
         self.output_file_change_script = other.output_file_change_script
         self.macos = other.macos
+        self.frozen_sources = other.frozen_sources
+        self.silence_pause = other.silence_pause
+        self.preset_matching = other.preset_matching
+        self.screen_lock_pause = other.screen_lock_pause
+        self.script_queue = other.script_queue
+        self.hooks = other.hooks
+        self.file_pipeline = other.file_pipeline
+        self.disk_forecast = other.disk_forecast
+        self.telemetry = other.telemetry
+        self.quality_fallback = other.quality_fallback
         self._notify_changed()
@@ -1,5 +1,11 @@
-from dataclasses import dataclass
-from typing import List, Dict, Union, Optional, Any, Callable
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Dict, Union, Optional, Any, Callable, Tuple
+
+from obs_scene_helper.model.display.identity import DisplayIdentity, fingerprint_of, fingerprints_of
+
+# Display lists can be passed either as plain names or as identities reported by the display list providers
+Displays = List[Union[DisplayIdentity, str]]
 
 
 class InvalidDisplayListArgument(TypeError):
@@ -12,15 +18,22 @@ class InvalidDisplayListArgument(TypeError):
 class Preset:
     uuid: str
     name: str
-    displays: List[str]
+    displays: List[str]  # Display names, for humans
     profile: str
     scene_collection: str
+    fingerprints: List[str] = field(default_factory=list)  # Display fingerprints, same order as the names
+
+    def __post_init__(self):
+        if len(self.fingerprints) != len(self.displays):
+            # Legacy preset (or one made from names only): fall back to the name-based fingerprints
+            self.fingerprints = fingerprints_of(self.displays)
 
     def to_dict(self) -> Dict:
         return {
             'uuid': self.uuid,
             'name': self.name,
             'displays': self.displays,
+            'fingerprints': self.fingerprints,
             'profile': self.profile,
             'scene_collection': self.scene_collection,
         }
@@ -29,17 +42,63 @@ class Preset:
     def from_dict(val: Dict) -> 'Preset':
         uuid = val['uuid']
         name = val['name']
-        displays = [x for x in sorted(val['displays'])]
+        displays = val['displays']
+        fingerprints = val.get('fingerprints', [])
+        if len(fingerprints) != len(displays):
+            fingerprints = fingerprints_of(displays)
+        displays, fingerprints = Preset._sorted_displays(displays, fingerprints)
         profile = val['profile']
         scene_collection = val['scene_collection']
-        return Preset(uuid, name, displays, profile, scene_collection)
+        return Preset(uuid, name, displays, profile, scene_collection, fingerprints)
 
     @staticmethod
-    def _comparable_display_list(displays: List[str]) -> List[str]:
-        return [x.lower() for x in sorted(displays)]
+    def _sorted_displays(displays: List[str], fingerprints: List[str]) -> Tuple[List[str], List[str]]:
+        pairs = sorted(zip(displays, fingerprints))
+        return [x for x, _ in pairs], [x for _, x in pairs]
+
+    @staticmethod
+    def display_key(displays: Displays) -> Tuple[str, ...]:
+        """ Canonical, hashable representation of a display list: sorted display fingerprints """
+        return tuple(sorted(fingerprints_of(displays)))
+
+    @property
+    def key(self) -> Tuple[str, ...]:
+        return tuple(sorted(self.fingerprints))
+
+    def set_displays(self, displays: List[str], fingerprints: List[str]):
+        self.displays = displays
+        self.fingerprints = fingerprints
+
+    def migrate_fingerprints(self, identities: List[DisplayIdentity]) -> bool:
+        """
+        Replace the name-based fingerprints with the hardware-based ones, for the displays currently connected under
+        the same names (or aliases, see `DisplayIdentity.aliases`). Names matching several connected displays (names
+        are compared case-insensitively) are left alone, as there is no telling which display the preset meant.
+
+        :return True if any of the fingerprints changed
+        """
+        by_name = {}  # type: Dict[str, List[DisplayIdentity]]
+        for identity in identities:
+            for name in {x.casefold() for x in (identity.name,) + identity.aliases}:
+                by_name.setdefault(name, []).append(identity)
+
+        changed = False
+        for i, display in enumerate(self.displays):
+            candidates = by_name.get(display.casefold(), [])
+            if len(candidates) != 1 or not candidates[0].has_hardware_id:
+                continue
+
+            identity = candidates[0]
+            if self.fingerprints[i] != fingerprint_of(display):
+                continue
+
+            self.fingerprints[i] = identity.fingerprint
+            changed = True
+
+        return changed
 
     def _values_as_tuple(self):
-        return self.name, Preset._comparable_display_list(self.displays), self.profile, self.scene_collection
+        return self.name, self.key, self.profile, self.scene_collection
 
     def will_change_from(self, other: 'Preset'):
         return self._values_as_tuple() != other._values_as_tuple()
@@ -51,6 +110,7 @@ class Preset:
 
         self.name = other.name
         self.displays = other.displays
+        self.fingerprints = other.fingerprints
         self.profile = other.profile
         self.scene_collection = other.scene_collection
 
@@ -60,7 +120,7 @@ class Preset:
     def make(template: Optional['Preset'] = None) -> 'Preset':
         from uuid import uuid4
 
-        result = Preset(str(uuid4()), '', [], '', '')
+        result = Preset(str(uuid4()), '', [], '', '', [])
         if template is not None:
             result.update(template)
 
@@ -68,9 +128,10 @@ class Preset:
 
     def copy(self) -> 'Preset':
         """ Make a deep copy of a preset """
-        return Preset(self.uuid, self.name, [x for x in self.displays], self.profile, self.scene_collection)
+        return Preset(self.uuid, self.name, [x for x in self.displays], self.profile, self.scene_collection,
+                      [x for x in self.fingerprints])
 
-    def displays_unique_enough(self, other: Union['Preset', List[str]]):
+    def displays_unique_enough(self, other: Union['Preset', Displays]):
         """
         Compare the display lists.
 
@@ -80,18 +141,38 @@ class Preset:
         :return True if the display lists are unique enough, False otherwise
         """
         if isinstance(other, Preset):
-            displays = other.displays
+            key = other.key
         elif isinstance(other, list):
-            displays = other
+            key = Preset.display_key(other)
         else:
             raise InvalidDisplayListArgument(other)
 
-        return Preset._comparable_display_list(self.displays) != Preset._comparable_display_list(displays)
+        return self.key != key
 
     def __str__(self):
         return self.name
 
 
+@dataclass
+class MatchWeights:
+    matched: float = 1.0  # Per display present both in the preset and in the current configuration
+    missing: float = 1.0  # Per preset display, not present in the current configuration
+    extra: float = 0.5  # Per current display, not mentioned in the preset (e.g. a virtual display)
+
+
+@dataclass
+class PresetMatch:
+    preset: Preset
+    score: float  # 0..1, 1 means the display lists are the same
+    matched: int
+    missing: int
+    extra: int
+
+    def explain(self) -> str:
+        return (f'"{self.preset.name}" scored {self.score:.2f}: {self.matched} matched, {self.missing} missing, '
+                f'{self.extra} extra displays')
+
+
 class PresetNotFoundException(RuntimeError):
     def __init__(self, uuid: str):
         super().__init__(f'Unknown preset: {uuid}')
@@ -128,6 +209,12 @@ class PresetList:
         super().__init__()
         self._presets = presets
         self._by_uuid = self._arrange_by_uuid(self._presets)
+        self._by_name = self._arrange_by(self._presets, lambda x: x.name)
+        self._by_key = self._arrange_by(self._presets, lambda x: x.key)
+        self._by_display = {}  # type: Dict[str, Dict[str, Preset]]
+        self._key_counts = {}  # type: Dict[str, Counter]  # UUID -> display fingerprint counts, for ranking
+        for preset in self._presets:
+            self._index_displays(preset)
         self._on_changed = on_changed
 
     def _notify_changed(self):
@@ -142,15 +229,15 @@ class PresetList:
         if preset.uuid in self._by_uuid:
             raise NonUniqueUUID(self._by_uuid[preset.uuid])
 
-        for existing in self._presets:
-            if existing.name == preset.name:
-                raise NonUniqueName(existing.name)
+        if preset.name in self._by_name:
+            raise NonUniqueName(preset.name)
 
-            if not existing.displays_unique_enough(preset):
-                raise NonUniquePreset(existing, preset)
+        existing = self._by_key.get(preset.key)
+        if existing is not None:
+            raise NonUniquePreset(existing, preset)
 
         self._presets.append(preset)
-        self._by_uuid[preset.uuid] = preset
+        self._index(preset)
 
         self._notify_changed()
 
@@ -170,26 +257,55 @@ class PresetList:
     def remove(self, preset: Union[Preset, str]):
         existing = self._find_preset(preset)
         self._presets.remove(existing)
-        del self._by_uuid[existing.uuid]
+        self._unindex(existing)
         self._notify_changed()
 
     def update(self, existing: Union[Preset, str], updated: Preset):
         """ Update the existing preset with the new values (all values except UUID will be copied over) """
         existing = self._find_preset(existing)
 
-        for in_current_list in self._presets:
-            if in_current_list.uuid == existing.uuid:
-                continue
+        same_name = self._by_name.get(updated.name)
+        if same_name is not None and same_name is not existing:
+            raise NonUniqueName(existing.name)
 
-            if in_current_list.name == updated.name:
-                raise NonUniqueName(existing.name)
+        same_key = self._by_key.get(updated.key)
+        if same_key is not None and same_key is not existing:
+            raise NonUniquePreset(same_key, updated)
 
-            if not in_current_list.displays_unique_enough(updated):
-                raise NonUniquePreset(in_current_list, updated)
+        self._unindex(existing)
+        changed = existing.update(updated)
+        self._index(existing)
 
-        if existing.update(updated):
+        if changed:
             self._notify_changed()
 
+    def _index(self, preset: Preset):
+        self._by_uuid[preset.uuid] = preset
+        self._by_name.setdefault(preset.name, preset)
+        self._by_key.setdefault(preset.key, preset)
+        self._index_displays(preset)
+
+    def _index_displays(self, preset: Preset):
+        self._key_counts[preset.uuid] = Counter(preset.key)
+        for display in set(preset.key):
+            self._by_display.setdefault(display, {})[preset.uuid] = preset
+
+    def _unindex(self, preset: Preset):
+        del self._by_uuid[preset.uuid]
+
+        if self._by_name.get(preset.name) is preset:
+            del self._by_name[preset.name]
+
+        if self._by_key.get(preset.key) is preset:
+            del self._by_key[preset.key]
+
+        del self._key_counts[preset.uuid]
+        for display in set(preset.key):
+            presets = self._by_display.get(display, {})
+            presets.pop(preset.uuid, None)
+            if len(presets) == 0:
+                self._by_display.pop(display, None)
+
     @staticmethod
     def _arrange_by_uuid(presets: List[Preset]) -> Dict:
         res = {}
@@ -199,6 +315,16 @@ class PresetList:
 
         return res
 
+    @staticmethod
+    def _arrange_by(presets: List[Preset], key: Callable[[Preset], Any]) -> Dict:
+        # Note: the first preset wins if the loaded list contains duplicates, same as with a linear search
+        res = {}
+
+        for preset in presets:
+            res.setdefault(key(preset), preset)
+
+        return res
+
     def to_dict(self) -> Dict:
         return {'presets': [x.to_dict() for x in self._presets]}
 
@@ -212,9 +338,68 @@ class PresetList:
 
         return PresetList(presets, on_changed)
 
-    def find_matching(self, displays: List[str]) -> Optional[Preset]:
+    def migrate_fingerprints(self, identities: List[DisplayIdentity]):
+        """ Upgrade the name-based fingerprints of the legacy presets, see `Preset.migrate_fingerprints` """
+        changed = False
         for preset in self._presets:
-            if not preset.displays_unique_enough(displays):
-                return preset
+            migrated = preset.copy()
+            if not migrated.migrate_fingerprints(identities):
+                continue
+
+            self._unindex(preset)
+            preset.update(migrated)
+            self._index(preset)
+
+            changed = True
+
+        if changed:
+            self._notify_changed()
+
+    def find_matching(self, displays: Displays) -> Optional[Preset]:
+        return self._by_key.get(Preset.display_key(displays))
+
+    def rank(self, displays: Displays, weights: Optional[MatchWeights] = None) -> List[PresetMatch]:
+        """
+        Score all the presets sharing at least one display with the display list, best matches first.
+        Only the presets found via the display index are scored, so the cost grows with the number of presets sharing a
+        display with the list (all of them in the worst case, e.g. a built-in display present in every preset).
+        """
+        weights = weights if weights is not None else MatchWeights()
+        current = Counter(Preset.display_key(displays))
+
+        candidates = {}
+        for display in current:
+            candidates.update(self._by_display.get(display, {}))
+
+        res = []
+        for preset in candidates.values():
+            wanted = self._key_counts[preset.uuid]
+            matched = sum((wanted & current).values())
+            missing = sum((wanted - current).values())
+            extra = sum((current - wanted).values())
+
+            positive = weights.matched * matched
+            total = positive + weights.missing * missing + weights.extra * extra
+            score = positive / total if total > 0 else 0.0
+            res.append(PresetMatch(preset, score, matched, missing, extra))
+
+        res.sort(key=lambda x: (-x.score, -x.matched, x.preset.name))
+        return res
+
+    def find_best_match(self, displays: Displays, min_score: float = 1.0,
+                        weights: Optional[MatchWeights] = None) -> Optional[PresetMatch]:
+        """
+        Find the best scoring preset for the display list.
+        :param displays: Current display list.
+        :param min_score: Minimum acceptable score, 1.0 only accepts exact matches.
+        :param weights: Scoring weights.
+        """
+        exact = self.find_matching(displays)
+        if exact is not None:
+            return PresetMatch(exact, 1.0, len(exact.fingerprints), 0, 0)
+
+        ranked = self.rank(displays, weights)
+        if len(ranked) == 0 or ranked[0].score < min_score:
+            return None
 
-        return None
+        return ranked[0]
@@ -0,0 +1,76 @@
+import math
+
+from enum import Enum
+from typing import Optional
+
+
+class FallbackDecision(Enum):
+    Fallback = 'fallback'
+    Restore = 'restore'
+
+
+class FallbackPolicy:
+    """
+    Decides when to switch to the fallback preset, and when to switch back.
+
+    The drop rate is expected to be aggregated over a window already, so a single value above the limit means the
+    frames were being dropped for the whole window. Switching back needs the drop rate to stay below a lower limit
+    (hysteresis) for a while, and two switches are always at least a cooldown apart, so the presets never flap.
+    """
+
+    def __init__(self, max_drop: float, restore_below: float, restore_after: float, cooldown: float):
+        self.max_drop = max_drop
+        self.restore_below = restore_below
+        self.restore_after = restore_after  # 0 never switches back
+        self.cooldown = cooldown
+
+        self.fallen_back = False
+        self._last_switch = None  # type: Optional[float]
+        self._below_since = None  # type: Optional[float]
+
+    def configure(self, max_drop: float, restore_below: float, restore_after: float, cooldown: float):
+        self.max_drop = max_drop
+        self.restore_below = restore_below
+        self.restore_after = restore_after
+        self.cooldown = cooldown
+
+    def reset(self):
+        """ Another preset was activated, start over (keeping the cooldown) """
+        self.fallen_back = False
+        self._below_since = None
+
+    def cooling_down(self, now: float) -> bool:
+        return self._last_switch is not None and now - self._last_switch < self.cooldown
+
+    def update(self, now: float, drop_rate: float) -> Optional[FallbackDecision]:
+        """
+        :param now: Current time, seconds.
+        :param drop_rate: Percent of the frames dropped over the window, NaN if unknown.
+        """
+        if math.isnan(drop_rate):
+            self._below_since = None
+            return None
+
+        if not self.fallen_back:
+            if drop_rate <= self.max_drop or self.cooling_down(now):
+                return None
+
+            self.fallen_back = True
+            self._last_switch = now
+            self._below_since = None
+            return FallbackDecision.Fallback
+
+        if self.restore_after <= 0 or drop_rate >= self.restore_below:
+            self._below_since = None
+            return None
+
+        if self._below_since is None:
+            self._below_since = now
+
+        if now - self._below_since < self.restore_after or self.cooling_down(now):
+            return None
+
+        self.fallen_back = False
+        self._last_switch = now
+        self._below_since = None
+        return FallbackDecision.Restore
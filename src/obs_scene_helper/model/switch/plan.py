@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+from obs_scene_helper.model.settings.preset import Preset
+
+
+class Step(Enum):
+    SplitRecordFile = 'split recording file'
+    StopRecording = 'stop recording'
+    SetProfile = 'set profile'
+    SetSceneCollection = 'set scene collection'
+    StartRecording = 'start recording'
+
+
+@dataclass
+class SwitchPlan:
+    steps: list[Step] = field(default_factory=list)
+    expected_gap: float = 0.0  # Seconds of footage we expect to lose
+    reason: str = ''
+
+    @property
+    def noop(self) -> bool:
+        return len(self.steps) == 0
+
+    def __str__(self):
+        steps = ' -> '.join(x.value for x in self.steps) if not self.noop else 'nothing to do'
+        return f'{steps} (expected recording gap: {self.expected_gap:.1f} s, {self.reason})'
+
+
+def plan_switch(profile: str | None, scene_collection: str | None, recording: bool, target: Preset,
+                can_split: bool, restart_gap: float) -> SwitchPlan:
+    """
+    Compute the least disruptive way of activating a preset.
+
+    Profiles cannot be changed while the recording output is active, so a profile change while recording always means a
+    full stop/start. Scene collections, on the other hand, can be swapped mid-recording, in which case the recording
+    file is split first (if supported), so every file only contains a single layout.
+
+    :param profile: Currently active profile.
+    :param scene_collection: Currently active scene collection.
+    :param recording: Whether the recording output could be active (anything but a stopped recording).
+    :param target: Preset to activate.
+    :param can_split: Whether OBS supports splitting the recording file.
+    :param restart_gap: Expected duration of a full stop/start cycle, in seconds.
+    """
+    change_profile = target.profile != profile
+    change_scene_collection = target.scene_collection != scene_collection
+
+    if not change_profile and not change_scene_collection:
+        return SwitchPlan(reason='already active')
+
+    if change_profile:
+        steps = [Step.StopRecording] if recording else []
+        steps.append(Step.SetProfile)
+        if change_scene_collection:
+            steps.append(Step.SetSceneCollection)
+        steps.append(Step.StartRecording)
+
+        if recording:
+            return SwitchPlan(steps, restart_gap, 'profile change requires a stopped recording')
+        return SwitchPlan(steps, 0.0, 'not recording')
+
+    if not recording:
+        return SwitchPlan([Step.SetSceneCollection, Step.StartRecording], 0.0, 'not recording')
+
+    if can_split:
+        return SwitchPlan([Step.SplitRecordFile, Step.SetSceneCollection], 0.0,
+                          'scene collection swapped mid-recording, new file')
+
+    return SwitchPlan([Step.SetSceneCollection], 0.0, 'scene collection swapped mid-recording')
@@ -113,9 +113,9 @@ class OBSSettingsDialog(QDialog):
             "Time to wait (seconds) before attempting to reconnect after a connection failure"
         )
         self.grace_period_input.setToolTip(
-            "Time to wait before applying a new preset (in seconds)\n"
-            "Should be a higher value if you expect multiple configuration changes\n"
-            "to occur one after another (e.g.: Disconnecting multiple displays)"
+            "Time to wait before applying a new preset after connecting to OBS\n"
+            "or changing the preset list (in seconds)\n"
+            "Display changes are applied as soon as the display configuration settles"
         )
 
     def toggle_password_visibility(self):
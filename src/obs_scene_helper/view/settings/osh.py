@@ -1,16 +1,22 @@
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QLineEdit, QSpinBox, QHBoxLayout, QPushButton
-from PySide6.QtWidgets import QDialogButtonBox, QFileDialog
+from PySide6.QtWidgets import QDialogButtonBox, QFileDialog, QGroupBox, QCheckBox, QDoubleSpinBox, QComboBox
 
 from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.obs.connection import Connection
+from obs_scene_helper.view.widgets.editable_list_widget import EditableListWidget
 
 import os
 
 
 class OSHSettingsDialog(QDialog):
-    def __init__(self, settings: Settings, *args, **kwargs):
+    HASH_ALGORITHMS = ['', 'md5', 'sha1', 'sha256', 'blake2b']
+    DISK_FORECAST_ACTIONS = [('none', "Only warn"), ('split', "Split the recording file"), ('stop', "Stop recording")]
+
+    def __init__(self, settings: Settings, connection: Connection, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.settings = settings
+        self.connection = connection
         self.osh = settings.osh.copy(None)
         self.setWindowTitle("OSH Settings")
 
@@ -34,6 +40,316 @@ class OSHSettingsDialog(QDialog):
 
         form_layout.addRow("Output file change script:", on_change_script_layout)
 
+        self.script_workers = QSpinBox()
+        self.script_workers.setRange(1, 16)
+        self.script_workers.valueChanged.connect(self._script_workers_changed)
+        form_layout.addRow("Parallel scripts:", self.script_workers)
+
+        self.script_timeout = QSpinBox()
+        self.script_timeout.setRange(0, 24 * 3600)
+        self.script_timeout.setSpecialValueText("No limit")
+        self.script_timeout.setSuffix(" s")
+        self.script_timeout.valueChanged.connect(self._script_timeout_changed)
+        form_layout.addRow("Script timeout:", self.script_timeout)
+
+        # Frozen source detection
+        frozen_sources_box = QGroupBox("Frozen source detection")
+        frozen_sources_layout = QFormLayout(frozen_sources_box)
+
+        self.frozen_sources_enabled = QCheckBox()
+        self.frozen_sources_enabled.toggled.connect(self._frozen_sources_enabled_changed)
+        frozen_sources_layout.addRow("Enabled:", self.frozen_sources_enabled)
+
+        self.frozen_sources_list = EditableListWidget(self.osh.frozen_sources.sources,
+                                                      [x.name for x in self.connection.inputs.list])
+        self.frozen_sources_list.item_added.connect(self._frozen_sources_list_changed)
+        self.frozen_sources_list.item_removed.connect(self._frozen_sources_list_changed)
+        self.frozen_sources_list.item_changed.connect(self._frozen_sources_list_changed)
+        frozen_sources_layout.addRow("Sources:", self.frozen_sources_list)
+
+        self.frozen_sources_interval = QSpinBox()
+        self.frozen_sources_interval.setRange(1, 300)
+        self.frozen_sources_interval.valueChanged.connect(self._frozen_sources_interval_changed)
+        frozen_sources_layout.addRow("Sample interval:", self.frozen_sources_interval)
+
+        self.frozen_sources_window = QSpinBox()
+        self.frozen_sources_window.setRange(5, 3600)
+        self.frozen_sources_window.valueChanged.connect(self._frozen_sources_window_changed)
+        frozen_sources_layout.addRow("Window:", self.frozen_sources_window)
+
+        self.frozen_sources_thumbnail_size = QSpinBox()
+        self.frozen_sources_thumbnail_size.setRange(16, 256)
+        self.frozen_sources_thumbnail_size.valueChanged.connect(self._frozen_sources_thumbnail_size_changed)
+        frozen_sources_layout.addRow("Thumbnail size:", self.frozen_sources_thumbnail_size)
+
+        self.frozen_sources_cpu_budget = QDoubleSpinBox()
+        self.frozen_sources_cpu_budget.setRange(0.1, 100.0)
+        self.frozen_sources_cpu_budget.setSuffix(" %")
+        self.frozen_sources_cpu_budget.valueChanged.connect(self._frozen_sources_cpu_budget_changed)
+        frozen_sources_layout.addRow("CPU budget:", self.frozen_sources_cpu_budget)
+
+        self.frozen_sources_auto_fix = QCheckBox()
+        self.frozen_sources_auto_fix.toggled.connect(self._frozen_sources_auto_fix_changed)
+        frozen_sources_layout.addRow("Restart frozen sources:", self.frozen_sources_auto_fix)
+
+        # Pause on silence
+        silence_pause_box = QGroupBox("Pause on silence")
+        silence_pause_layout = QFormLayout(silence_pause_box)
+
+        self.silence_pause_enabled = QCheckBox()
+        self.silence_pause_enabled.toggled.connect(self._silence_pause_enabled_changed)
+        silence_pause_layout.addRow("Enabled:", self.silence_pause_enabled)
+
+        self.silence_pause_inputs = EditableListWidget(self.osh.silence_pause.inputs,
+                                                       [x.name for x in self.connection.inputs.list])
+        self.silence_pause_inputs.item_added.connect(self._silence_pause_inputs_changed)
+        self.silence_pause_inputs.item_removed.connect(self._silence_pause_inputs_changed)
+        self.silence_pause_inputs.item_changed.connect(self._silence_pause_inputs_changed)
+        silence_pause_layout.addRow("Inputs:", self.silence_pause_inputs)
+
+        self.silence_pause_after = QSpinBox()
+        self.silence_pause_after.setRange(5, 3600)
+        self.silence_pause_after.valueChanged.connect(self._silence_pause_after_changed)
+        silence_pause_layout.addRow("Pause after:", self.silence_pause_after)
+
+        self.silence_pause_threshold = QDoubleSpinBox()
+        self.silence_pause_threshold.setRange(-100.0, 0.0)
+        self.silence_pause_threshold.setSuffix(" dB")
+        self.silence_pause_threshold.valueChanged.connect(self._silence_pause_threshold_changed)
+        silence_pause_layout.addRow("Pause threshold:", self.silence_pause_threshold)
+
+        self.silence_resume_threshold = QDoubleSpinBox()
+        self.silence_resume_threshold.setRange(-100.0, 0.0)
+        self.silence_resume_threshold.setSuffix(" dB")
+        self.silence_resume_threshold.valueChanged.connect(self._silence_resume_threshold_changed)
+        silence_pause_layout.addRow("Resume threshold:", self.silence_resume_threshold)
+
+        self.silence_resume_hold = QDoubleSpinBox()
+        self.silence_resume_hold.setRange(0.0, 5.0)
+        self.silence_resume_hold.setSingleStep(0.1)
+        self.silence_resume_hold.valueChanged.connect(self._silence_resume_hold_changed)
+        silence_pause_layout.addRow("Resume hold:", self.silence_resume_hold)
+
+        # Preset matching
+        preset_matching_box = QGroupBox("Preset matching")
+        preset_matching_layout = QFormLayout(preset_matching_box)
+
+        self.preset_min_score = QDoubleSpinBox()
+        self.preset_min_score.setRange(0.05, 1.0)
+        self.preset_min_score.setSingleStep(0.05)
+        self.preset_min_score.valueChanged.connect(self._preset_min_score_changed)
+        preset_matching_layout.addRow("Minimum score:", self.preset_min_score)
+
+        self.preset_missing_weight = QDoubleSpinBox()
+        self.preset_missing_weight.setRange(0.0, 10.0)
+        self.preset_missing_weight.setSingleStep(0.1)
+        self.preset_missing_weight.valueChanged.connect(self._preset_missing_weight_changed)
+        preset_matching_layout.addRow("Missing display weight:", self.preset_missing_weight)
+
+        self.preset_extra_weight = QDoubleSpinBox()
+        self.preset_extra_weight.setRange(0.0, 10.0)
+        self.preset_extra_weight.setSingleStep(0.1)
+        self.preset_extra_weight.valueChanged.connect(self._preset_extra_weight_changed)
+        preset_matching_layout.addRow("Extra display weight:", self.preset_extra_weight)
+
+        # Pause on screen lock
+        screen_lock_pause_box = QGroupBox("Pause on screen lock")
+        screen_lock_pause_layout = QFormLayout(screen_lock_pause_box)
+
+        self.screen_lock_hold_off = QDoubleSpinBox()
+        self.screen_lock_hold_off.setRange(0.0, 600.0)
+        self.screen_lock_hold_off.setSingleStep(1.0)
+        self.screen_lock_hold_off.setSuffix(" s")
+        self.screen_lock_hold_off.valueChanged.connect(self._screen_lock_hold_off_changed)
+        screen_lock_pause_layout.addRow("Hold-off:", self.screen_lock_hold_off)
+
+        # Python hooks
+        hooks_box = QGroupBox("Python hooks")
+        hooks_layout = QFormLayout(hooks_box)
+
+        self.hooks_enabled = QCheckBox()
+        self.hooks_enabled.toggled.connect(self._hooks_enabled_changed)
+        hooks_layout.addRow("Enabled:", self.hooks_enabled)
+
+        self.hooks_timeout = QDoubleSpinBox()
+        self.hooks_timeout.setRange(0.0, 3600.0)
+        self.hooks_timeout.setSingleStep(1.0)
+        self.hooks_timeout.setSpecialValueText("No limit")
+        self.hooks_timeout.setSuffix(" s")
+        self.hooks_timeout.valueChanged.connect(self._hooks_timeout_changed)
+        hooks_layout.addRow("Timeout:", self.hooks_timeout)
+
+        hooks_directory_layout = QHBoxLayout()
+        self.hooks_directory = QLineEdit()
+        self.hooks_directory.textChanged.connect(self._hooks_directory_changed)
+        hooks_directory_layout.addWidget(self.hooks_directory)
+
+        select_hooks_directory_button = QPushButton("...")
+        select_hooks_directory_button.pressed.connect(self._select_hooks_directory)
+        hooks_directory_layout.addWidget(select_hooks_directory_button)
+
+        hooks_layout.addRow("Hook directory:", hooks_directory_layout)
+
+        # Recording file pipeline
+        file_pipeline_box = QGroupBox("Recording file pipeline")
+        file_pipeline_layout = QFormLayout(file_pipeline_box)
+
+        self.file_pipeline_enabled = QCheckBox()
+        self.file_pipeline_enabled.toggled.connect(self._file_pipeline_enabled_changed)
+        file_pipeline_layout.addRow("Enabled:", self.file_pipeline_enabled)
+
+        self.file_pipeline_hash = QComboBox()
+        for algorithm in self.HASH_ALGORITHMS:
+            self.file_pipeline_hash.addItem(algorithm if algorithm else "None", algorithm)
+        self.file_pipeline_hash.currentIndexChanged.connect(self._file_pipeline_hash_changed)
+        file_pipeline_layout.addRow("Hash:", self.file_pipeline_hash)
+
+        self.file_pipeline_min_size = QSpinBox()
+        self.file_pipeline_min_size.setRange(0, 1024 * 1024)
+        self.file_pipeline_min_size.setSuffix(" MiB")
+        self.file_pipeline_min_size.valueChanged.connect(self._file_pipeline_min_size_changed)
+        file_pipeline_layout.addRow("Minimum size:", self.file_pipeline_min_size)
+
+        self.file_pipeline_command = QLineEdit()
+        self.file_pipeline_command.textChanged.connect(self._file_pipeline_command_changed)
+        file_pipeline_layout.addRow("Command:", self.file_pipeline_command)
+
+        self.file_pipeline_bandwidth = QDoubleSpinBox()
+        self.file_pipeline_bandwidth.setRange(0.0, 10000.0)
+        self.file_pipeline_bandwidth.setSingleStep(10.0)
+        self.file_pipeline_bandwidth.setSpecialValueText("No limit")
+        self.file_pipeline_bandwidth.setSuffix(" MiB/s")
+        self.file_pipeline_bandwidth.valueChanged.connect(self._file_pipeline_bandwidth_changed)
+        file_pipeline_layout.addRow("Read bandwidth:", self.file_pipeline_bandwidth)
+
+        self.file_pipeline_workers = QSpinBox()
+        self.file_pipeline_workers.setRange(0, 64)
+        self.file_pipeline_workers.setSpecialValueText("Auto")
+        self.file_pipeline_workers.valueChanged.connect(self._file_pipeline_workers_changed)
+        file_pipeline_layout.addRow("Worker processes:", self.file_pipeline_workers)
+
+        # Disk space forecast
+        disk_forecast_box = QGroupBox("Disk space forecast")
+        disk_forecast_layout = QFormLayout(disk_forecast_box)
+
+        self.disk_forecast_enabled = QCheckBox()
+        self.disk_forecast_enabled.toggled.connect(self._disk_forecast_enabled_changed)
+        disk_forecast_layout.addRow("Enabled:", self.disk_forecast_enabled)
+
+        self.disk_forecast_warn_at = QLineEdit()
+        self.disk_forecast_warn_at.setPlaceholderText("e.g. 30, 10")
+        self.disk_forecast_warn_at.textChanged.connect(self._disk_forecast_warn_at_changed)
+        disk_forecast_layout.addRow("Warn at (minutes):", self.disk_forecast_warn_at)
+
+        self.disk_forecast_action = QComboBox()
+        for action, text in self.DISK_FORECAST_ACTIONS:
+            self.disk_forecast_action.addItem(text, action)
+        self.disk_forecast_action.currentIndexChanged.connect(self._disk_forecast_action_changed)
+        disk_forecast_layout.addRow("Before the disk is full:", self.disk_forecast_action)
+
+        self.disk_forecast_action_at = QSpinBox()
+        self.disk_forecast_action_at.setRange(1, 120)
+        self.disk_forecast_action_at.setSuffix(" min")
+        self.disk_forecast_action_at.valueChanged.connect(self._disk_forecast_action_at_changed)
+        disk_forecast_layout.addRow("Act at:", self.disk_forecast_action_at)
+
+        # OBS telemetry
+        telemetry_box = QGroupBox("OBS telemetry")
+        telemetry_layout = QFormLayout(telemetry_box)
+
+        self.telemetry_interval = QDoubleSpinBox()
+        self.telemetry_interval.setRange(0.5, 60.0)
+        self.telemetry_interval.setSingleStep(0.5)
+        self.telemetry_interval.setSuffix(" s")
+        self.telemetry_interval.valueChanged.connect(self._telemetry_interval_changed)
+        telemetry_layout.addRow("Sample every:", self.telemetry_interval)
+
+        self.telemetry_window = QSpinBox()
+        self.telemetry_window.setRange(5, 3600)
+        self.telemetry_window.setSuffix(" s")
+        self.telemetry_window.valueChanged.connect(self._telemetry_window_changed)
+        telemetry_layout.addRow("Averaging window:", self.telemetry_window)
+
+        self.telemetry_max_render_time = QDoubleSpinBox()
+        self.telemetry_max_render_time.setRange(0.0, 1000.0)
+        self.telemetry_max_render_time.setSuffix(" ms")
+        self.telemetry_max_render_time.setSpecialValueText("Off")
+        self.telemetry_max_render_time.valueChanged.connect(self._telemetry_max_render_time_changed)
+        telemetry_layout.addRow("Max render time:", self.telemetry_max_render_time)
+
+        self.telemetry_max_render_skip = QDoubleSpinBox()
+        self.telemetry_max_render_skip.setRange(0.0, 100.0)
+        self.telemetry_max_render_skip.setSuffix(" %")
+        self.telemetry_max_render_skip.setSpecialValueText("Off")
+        self.telemetry_max_render_skip.valueChanged.connect(self._telemetry_max_render_skip_changed)
+        telemetry_layout.addRow("Max skipped (render):", self.telemetry_max_render_skip)
+
+        self.telemetry_max_output_skip = QDoubleSpinBox()
+        self.telemetry_max_output_skip.setRange(0.0, 100.0)
+        self.telemetry_max_output_skip.setSuffix(" %")
+        self.telemetry_max_output_skip.setSpecialValueText("Off")
+        self.telemetry_max_output_skip.valueChanged.connect(self._telemetry_max_output_skip_changed)
+        telemetry_layout.addRow("Max skipped (encoding):", self.telemetry_max_output_skip)
+
+        self.telemetry_max_cpu = QDoubleSpinBox()
+        self.telemetry_max_cpu.setRange(0.0, 100.0)
+        self.telemetry_max_cpu.setSuffix(" %")
+        self.telemetry_max_cpu.setSpecialValueText("Off")
+        self.telemetry_max_cpu.valueChanged.connect(self._telemetry_max_cpu_changed)
+        telemetry_layout.addRow("Max OBS CPU usage:", self.telemetry_max_cpu)
+
+        # Quality fallback
+        quality_fallback_box = QGroupBox("Quality fallback on frame drops")
+        quality_fallback_layout = QFormLayout(quality_fallback_box)
+
+        self.quality_fallback_enabled = QCheckBox()
+        self.quality_fallback_enabled.toggled.connect(self._quality_fallback_enabled_changed)
+        quality_fallback_layout.addRow("Enabled:", self.quality_fallback_enabled)
+
+        self.quality_fallback_profile = QComboBox()
+        self._fill_fallback_choices(self.quality_fallback_profile, self.connection.profiles.list,
+                                    self.osh.quality_fallback.profile)
+        self.quality_fallback_profile.currentIndexChanged.connect(self._quality_fallback_profile_changed)
+        quality_fallback_layout.addRow("Fallback profile:", self.quality_fallback_profile)
+
+        self.quality_fallback_scene_collection = QComboBox()
+        self._fill_fallback_choices(self.quality_fallback_scene_collection, self.connection.scene_collections.list,
+                                    self.osh.quality_fallback.scene_collection)
+        self.quality_fallback_scene_collection.currentIndexChanged.connect(
+            self._quality_fallback_scene_collection_changed)
+        quality_fallback_layout.addRow("Fallback scene collection:", self.quality_fallback_scene_collection)
+
+        self.quality_fallback_window = QSpinBox()
+        self.quality_fallback_window.setRange(5, 600)
+        self.quality_fallback_window.setSuffix(" s")
+        self.quality_fallback_window.valueChanged.connect(self._quality_fallback_window_changed)
+        quality_fallback_layout.addRow("Window:", self.quality_fallback_window)
+
+        self.quality_fallback_max_drop = QDoubleSpinBox()
+        self.quality_fallback_max_drop.setRange(0.1, 100.0)
+        self.quality_fallback_max_drop.setSuffix(" %")
+        self.quality_fallback_max_drop.valueChanged.connect(self._quality_fallback_max_drop_changed)
+        quality_fallback_layout.addRow("Fall back above:", self.quality_fallback_max_drop)
+
+        self.quality_fallback_restore_below = QDoubleSpinBox()
+        self.quality_fallback_restore_below.setRange(0.0, 100.0)
+        self.quality_fallback_restore_below.setSuffix(" %")
+        self.quality_fallback_restore_below.valueChanged.connect(self._quality_fallback_restore_below_changed)
+        quality_fallback_layout.addRow("Restore below:", self.quality_fallback_restore_below)
+
+        self.quality_fallback_restore_after = QSpinBox()
+        self.quality_fallback_restore_after.setRange(0, 24 * 3600)
+        self.quality_fallback_restore_after.setSuffix(" s")
+        self.quality_fallback_restore_after.setSpecialValueText("Never")
+        self.quality_fallback_restore_after.valueChanged.connect(self._quality_fallback_restore_after_changed)
+        quality_fallback_layout.addRow("Restore after:", self.quality_fallback_restore_after)
+
+        self.quality_fallback_cooldown = QSpinBox()
+        self.quality_fallback_cooldown.setRange(0, 24 * 3600)
+        self.quality_fallback_cooldown.setSuffix(" s")
+        self.quality_fallback_cooldown.valueChanged.connect(self._quality_fallback_cooldown_changed)
+        quality_fallback_layout.addRow("Cooldown:", self.quality_fallback_cooldown)
+
         # Dialog buttons
         button_box = QDialogButtonBox()
 
@@ -45,6 +361,15 @@ class OSHSettingsDialog(QDialog):
 
         # Final layout
         main_layout.addLayout(form_layout)
+        main_layout.addWidget(frozen_sources_box)
+        main_layout.addWidget(silence_pause_box)
+        main_layout.addWidget(preset_matching_box)
+        main_layout.addWidget(screen_lock_pause_box)
+        main_layout.addWidget(hooks_box)
+        main_layout.addWidget(file_pipeline_box)
+        main_layout.addWidget(disk_forecast_box)
+        main_layout.addWidget(telemetry_box)
+        main_layout.addWidget(quality_fallback_box)
         main_layout.addWidget(button_box)
 
         self._load_current_values()
@@ -55,6 +380,68 @@ class OSHSettingsDialog(QDialog):
     def _load_current_values(self):
         self.input_fix_delay.setValue(self.osh.macos.fix_inputs_after_recording_resume_delay)
         self.output_file_change_script.setText(self.osh.output_file_change_script)
+        self.script_workers.setValue(self.osh.script_queue.max_workers)
+        self.script_timeout.setValue(self.osh.script_queue.timeout)
+
+        frozen_sources = self.osh.frozen_sources
+        self.frozen_sources_enabled.setChecked(frozen_sources.enabled)
+        self.frozen_sources_interval.setValue(frozen_sources.sample_interval)
+        self.frozen_sources_window.setValue(frozen_sources.window)
+        self.frozen_sources_thumbnail_size.setValue(frozen_sources.thumbnail_size)
+        self.frozen_sources_cpu_budget.setValue(frozen_sources.cpu_budget)
+        self.frozen_sources_auto_fix.setChecked(frozen_sources.auto_fix)
+
+        silence_pause = self.osh.silence_pause
+        self.silence_pause_enabled.setChecked(silence_pause.enabled)
+        self.silence_pause_after.setValue(silence_pause.pause_after)
+        self.silence_pause_threshold.setValue(silence_pause.pause_threshold_db)
+        self.silence_resume_threshold.setValue(silence_pause.resume_threshold_db)
+        self.silence_resume_hold.setValue(silence_pause.resume_hold)
+
+        preset_matching = self.osh.preset_matching
+        self.preset_min_score.setValue(preset_matching.min_score)
+        self.preset_missing_weight.setValue(preset_matching.missing_weight)
+        self.preset_extra_weight.setValue(preset_matching.extra_weight)
+
+        self.screen_lock_hold_off.setValue(self.osh.screen_lock_pause.hold_off)
+
+        self.hooks_enabled.setChecked(self.osh.hooks.enabled)
+        self.hooks_timeout.setValue(self.osh.hooks.timeout)
+        self.hooks_directory.setText(self.osh.hooks.directory)
+
+        file_pipeline = self.osh.file_pipeline
+        self.file_pipeline_enabled.setChecked(file_pipeline.enabled)
+        self.file_pipeline_hash.setCurrentIndex(max(0, self.file_pipeline_hash.findData(file_pipeline.hash_algorithm)))
+        self.file_pipeline_min_size.setValue(file_pipeline.min_size)
+        self.file_pipeline_command.setText(file_pipeline.command)
+        self.file_pipeline_bandwidth.setValue(file_pipeline.bandwidth)
+        self.file_pipeline_workers.setValue(file_pipeline.max_workers)
+
+        disk_forecast = self.osh.disk_forecast
+        self.disk_forecast_enabled.setChecked(disk_forecast.enabled)
+        self.disk_forecast_warn_at.setText(', '.join(str(x) for x in disk_forecast.warn_at))
+        self.disk_forecast_action.setCurrentIndex(max(0, self.disk_forecast_action.findData(disk_forecast.action)))
+        self.disk_forecast_action_at.setValue(disk_forecast.action_at)
+
+        telemetry = self.osh.telemetry
+        self.telemetry_interval.setValue(telemetry.interval)
+        self.telemetry_window.setValue(telemetry.window)
+        self.telemetry_max_render_time.setValue(telemetry.max_render_time)
+        self.telemetry_max_render_skip.setValue(telemetry.max_render_skip)
+        self.telemetry_max_output_skip.setValue(telemetry.max_output_skip)
+        self.telemetry_max_cpu.setValue(telemetry.max_cpu)
+
+        quality_fallback = self.osh.quality_fallback
+        self.quality_fallback_enabled.setChecked(quality_fallback.enabled)
+        self.quality_fallback_profile.setCurrentIndex(
+            max(0, self.quality_fallback_profile.findData(quality_fallback.profile)))
+        self.quality_fallback_scene_collection.setCurrentIndex(
+            max(0, self.quality_fallback_scene_collection.findData(quality_fallback.scene_collection)))
+        self.quality_fallback_window.setValue(quality_fallback.window)
+        self.quality_fallback_max_drop.setValue(quality_fallback.max_drop)
+        self.quality_fallback_restore_below.setValue(quality_fallback.restore_below)
+        self.quality_fallback_restore_after.setValue(quality_fallback.restore_after)
+        self.quality_fallback_cooldown.setValue(quality_fallback.cooldown)
 
     def _setup_tooltips(self):
         self.input_fix_delay.setToolTip(
@@ -72,6 +459,127 @@ class OSHSettingsDialog(QDialog):
             "\n"
             f"Current script: {current_script}"
         )
+        self.script_workers.setToolTip(
+            "Number of scripts allowed to run at the same time.\n"
+            "New recording files are queued while all of them are busy,\n"
+            "and the queue is picked up again after a restart."
+        )
+        self.script_timeout.setToolTip("Time after which a script is killed (in seconds).")
+
+        self.frozen_sources_list.setToolTip(
+            "Sources to watch while recording. A source is considered frozen\n"
+            "if its picture doesn't change for the whole window.\n"
+            "Static content (slides, a document left on screen) is flagged as well."
+        )
+        self.frozen_sources_interval.setToolTip("Time between two thumbnails of the same source (in seconds).")
+        self.frozen_sources_window.setToolTip("Time without a picture change before a source is flagged (in seconds).")
+        self.frozen_sources_thumbnail_size.setToolTip("Thumbnail width (in pixels), the height follows the source.")
+        self.frozen_sources_cpu_budget.setToolTip(
+            "Share of time the detection is allowed to take, including the wait for OBS\n"
+            "to answer (the application doesn't respond meanwhile).\n"
+            "The sampling interval is stretched if the detection takes longer."
+        )
+        self.frozen_sources_auto_fix.setToolTip(
+            "Restart the frozen capture sources automatically.\n"
+            "Leave it off if the sources can show static content, which would be restarted too."
+        )
+
+        self.silence_pause_inputs.setToolTip(
+            "Audio inputs to listen to. The recording is paused when all of them\n"
+            "are silent, and resumed as soon as any of them is audible again.\n"
+            "Only the pauses made by this action are resumed."
+        )
+        self.silence_pause_after.setToolTip("Time without audio before pausing the recording (in seconds).")
+        self.silence_pause_threshold.setToolTip("Audio below this level counts as silence.")
+        self.silence_resume_threshold.setToolTip(
+            "Audio above this level resumes the recording.\n"
+            "Keep it above the pause threshold to avoid flip-flopping on background noise."
+        )
+        self.silence_resume_hold.setToolTip("Time the audio has to stay above the resume threshold (in seconds).")
+
+        self.preset_min_score.setToolTip(
+            "Presets are scored by how well their displays match the connected ones.\n"
+            "1.0 only accepts presets with exactly the same displays, lower values\n"
+            "also accept presets with some missing or extra displays."
+        )
+        self.preset_missing_weight.setToolTip("Penalty for every preset display that is not connected.")
+        self.preset_extra_weight.setToolTip("Penalty for every connected display that is not in the preset.")
+
+        self.screen_lock_hold_off.setToolTip(
+            "Time the screen has to stay locked before the recording is paused (in seconds).\n"
+            "Shorter locks (e.g. the screen saver kicking in) don't pause the recording at all."
+        )
+
+        self.hooks_enabled.setToolTip(
+            "Call the Python hooks installed as \"obs_scene_helper.hooks\" entry points\n"
+            "on output file, recording state and preset changes."
+        )
+        self.hooks_timeout.setToolTip(
+            "Time after which a hook is considered stalled (in seconds).\n"
+            "Events for a stalled hook are dropped until it returns."
+        )
+        self.hooks_directory.setToolTip(
+            "Python files defining an \"on_event\" function, called like the entry point hooks\n"
+            "(the packaged app can't see the installed packages). Loaded on the next start."
+        )
+
+        self.file_pipeline_enabled.setToolTip(
+            "Check every finished recording file in the background\n"
+            "(after a file split, or once the recording stops)."
+        )
+        self.file_pipeline_hash.setToolTip("Checksum stored next to the recording file, e.g. \"video.mkv.sha256\".")
+        self.file_pipeline_min_size.setToolTip("Recordings smaller than this are reported as failed.")
+        self.file_pipeline_command.setToolTip(
+            "An optional command (e.g. a remux) to run once the file was checked.\n"
+            "The full path to the recording file is passed as the last argument."
+        )
+        self.file_pipeline_bandwidth.setToolTip(
+            "Read rate shared by all the workers, keeps the disk available for the recording."
+        )
+        self.file_pipeline_workers.setToolTip("Number of worker processes, \"Auto\" uses half of the CPU cores.")
+
+        self.disk_forecast_enabled.setToolTip(
+            "Track how fast the recording fills up its disk while recording,\n"
+            "and forecast when the disk is going to be full."
+        )
+        self.disk_forecast_warn_at.setToolTip(
+            "Comma-separated list of forecasts (in minutes before the disk is full)\n"
+            "at which a tray notification is shown."
+        )
+        self.disk_forecast_action.setToolTip(
+            "Splitting keeps the current file intact if the disk fills up,\n"
+            "stopping prevents losing the end of the recording.\n"
+            "A split frees no space: if the disk keeps filling up, the recording\n"
+            "is stopped at a quarter of the forecast."
+        )
+        self.disk_forecast_action_at.setToolTip("Forecast at which the recording is split or stopped (in minutes).")
+
+        self.telemetry_interval.setToolTip("How often the OBS performance stats are polled.")
+        self.telemetry_window.setToolTip("Time span the averages and the skipped frame ratios are computed over.")
+        self.telemetry_max_render_time.setToolTip("Warn if the average frame render time goes above this value.")
+        self.telemetry_max_render_skip.setToolTip(
+            "Warn if OBS skips more frames than this because of rendering lag (GPU overload)."
+        )
+        self.telemetry_max_output_skip.setToolTip(
+            "Warn if OBS skips more frames than this because of encoding lag (encoder overload)."
+        )
+        self.telemetry_max_cpu.setToolTip("Warn if the average OBS CPU usage goes above this value.")
+
+        self.quality_fallback_enabled.setToolTip(
+            "Switch to a lighter profile and/or scene collection if OBS keeps dropping frames while recording,\n"
+            "and back once it stops."
+        )
+        self.quality_fallback_profile.setToolTip("Profile with lighter encoder settings, e.g. a lower resolution.")
+        self.quality_fallback_scene_collection.setToolTip("Scene collection with fewer or cheaper sources.")
+        self.quality_fallback_window.setToolTip("Time span the dropped frames are counted over.")
+        self.quality_fallback_max_drop.setToolTip(
+            "Fall back once this share of the frames is dropped (by the renderer or the encoder) over the window."
+        )
+        self.quality_fallback_restore_below.setToolTip(
+            "The previous preset is only restored once the drops stay below this share of the frames."
+        )
+        self.quality_fallback_restore_after.setToolTip("How long the drops have to stay low before restoring.")
+        self.quality_fallback_cooldown.setToolTip("Minimal time between two switches, prevents flapping.")
 
     def _select_file_change_script(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select script", "", "All Files (*)")
@@ -80,6 +588,13 @@ class OSHSettingsDialog(QDialog):
 
         self.output_file_change_script.setText(file_path)
 
+    def _select_hooks_directory(self):
+        directory = QFileDialog.getExistingDirectory(self, "Select hook directory", self.hooks_directory.text())
+        if not directory:
+            return
+
+        self.hooks_directory.setText(directory)
+
     def _on_osh_changed(self):
         if self.settings.osh.will_change_from(self.osh):
             self.setWindowTitle("OSH Settings *")
@@ -95,6 +610,204 @@ class OSHSettingsDialog(QDialog):
         self.osh.output_file_change_script = value
         self._on_osh_changed()
 
+    def _frozen_sources_enabled_changed(self, value):
+        self.osh.frozen_sources.enabled = value
+        self._on_osh_changed()
+
+    def _frozen_sources_list_changed(self, *_, **__):
+        self.osh.frozen_sources.sources = self.frozen_sources_list.items
+        self._on_osh_changed()
+
+    def _frozen_sources_interval_changed(self, value):
+        self.osh.frozen_sources.sample_interval = value
+        self._on_osh_changed()
+
+    def _frozen_sources_window_changed(self, value):
+        self.osh.frozen_sources.window = value
+        self._on_osh_changed()
+
+    def _frozen_sources_thumbnail_size_changed(self, value):
+        self.osh.frozen_sources.thumbnail_size = value
+        self._on_osh_changed()
+
+    def _frozen_sources_cpu_budget_changed(self, value):
+        self.osh.frozen_sources.cpu_budget = value
+        self._on_osh_changed()
+
+    def _frozen_sources_auto_fix_changed(self, value):
+        self.osh.frozen_sources.auto_fix = value
+        self._on_osh_changed()
+
+    def _silence_pause_enabled_changed(self, value):
+        self.osh.silence_pause.enabled = value
+        self._on_osh_changed()
+
+    def _silence_pause_inputs_changed(self, *_, **__):
+        self.osh.silence_pause.inputs = self.silence_pause_inputs.items
+        self._on_osh_changed()
+
+    def _silence_pause_after_changed(self, value):
+        self.osh.silence_pause.pause_after = value
+        self._on_osh_changed()
+
+    def _silence_pause_threshold_changed(self, value):
+        self.osh.silence_pause.pause_threshold_db = value
+        self.silence_resume_threshold.setMinimum(value)
+        self._on_osh_changed()
+
+    def _silence_resume_threshold_changed(self, value):
+        self.osh.silence_pause.resume_threshold_db = value
+        self._on_osh_changed()
+
+    def _silence_resume_hold_changed(self, value):
+        self.osh.silence_pause.resume_hold = value
+        self._on_osh_changed()
+
+    def _preset_min_score_changed(self, value):
+        self.osh.preset_matching.min_score = value
+        self._on_osh_changed()
+
+    def _preset_missing_weight_changed(self, value):
+        self.osh.preset_matching.missing_weight = value
+        self._on_osh_changed()
+
+    def _preset_extra_weight_changed(self, value):
+        self.osh.preset_matching.extra_weight = value
+        self._on_osh_changed()
+
+    def _script_workers_changed(self, value):
+        self.osh.script_queue.max_workers = value
+        self._on_osh_changed()
+
+    def _script_timeout_changed(self, value):
+        self.osh.script_queue.timeout = value
+        self._on_osh_changed()
+
+    def _screen_lock_hold_off_changed(self, value):
+        self.osh.screen_lock_pause.hold_off = value
+        self._on_osh_changed()
+
+    def _hooks_enabled_changed(self, value):
+        self.osh.hooks.enabled = value
+        self._on_osh_changed()
+
+    def _hooks_timeout_changed(self, value):
+        self.osh.hooks.timeout = value
+        self._on_osh_changed()
+
+    def _hooks_directory_changed(self, value):
+        self.osh.hooks.directory = value
+        self._on_osh_changed()
+
+    def _file_pipeline_enabled_changed(self, value):
+        self.osh.file_pipeline.enabled = value
+        self._on_osh_changed()
+
+    def _file_pipeline_hash_changed(self, index):
+        self.osh.file_pipeline.hash_algorithm = self.file_pipeline_hash.itemData(index)
+        self._on_osh_changed()
+
+    def _file_pipeline_min_size_changed(self, value):
+        self.osh.file_pipeline.min_size = value
+        self._on_osh_changed()
+
+    def _file_pipeline_command_changed(self, value):
+        self.osh.file_pipeline.command = value
+        self._on_osh_changed()
+
+    def _file_pipeline_bandwidth_changed(self, value):
+        self.osh.file_pipeline.bandwidth = value
+        self._on_osh_changed()
+
+    def _file_pipeline_workers_changed(self, value):
+        self.osh.file_pipeline.max_workers = value
+        self._on_osh_changed()
+
+    def _disk_forecast_enabled_changed(self, value):
+        self.osh.disk_forecast.enabled = value
+        self._on_osh_changed()
+
+    def _disk_forecast_warn_at_changed(self, value):
+        horizons = []
+        for item in value.split(','):
+            try:
+                horizons.append(int(item.strip()))
+            except ValueError:
+                continue
+
+        self.osh.disk_forecast.warn_at = sorted(set(x for x in horizons if x > 0), reverse=True)
+        self._on_osh_changed()
+
+    def _disk_forecast_action_changed(self, index):
+        self.osh.disk_forecast.action = self.disk_forecast_action.itemData(index)
+        self._on_osh_changed()
+
+    def _disk_forecast_action_at_changed(self, value):
+        self.osh.disk_forecast.action_at = value
+        self._on_osh_changed()
+
+    def _telemetry_interval_changed(self, value):
+        self.osh.telemetry.interval = value
+        self._on_osh_changed()
+
+    def _telemetry_window_changed(self, value):
+        self.osh.telemetry.window = value
+        self._on_osh_changed()
+
+    def _telemetry_max_render_time_changed(self, value):
+        self.osh.telemetry.max_render_time = value
+        self._on_osh_changed()
+
+    def _telemetry_max_render_skip_changed(self, value):
+        self.osh.telemetry.max_render_skip = value
+        self._on_osh_changed()
+
+    def _telemetry_max_output_skip_changed(self, value):
+        self.osh.telemetry.max_output_skip = value
+        self._on_osh_changed()
+
+    def _telemetry_max_cpu_changed(self, value):
+        self.osh.telemetry.max_cpu = value
+        self._on_osh_changed()
+
+    @staticmethod
+    def _fill_fallback_choices(combo: QComboBox, names: list[str], current: str):
+        combo.addItem("Keep current", '')
+        for name in names + ([current] if current and current not in names else []):
+            combo.addItem(name, name)
+
+    def _quality_fallback_enabled_changed(self, value):
+        self.osh.quality_fallback.enabled = value
+        self._on_osh_changed()
+
+    def _quality_fallback_profile_changed(self, index):
+        self.osh.quality_fallback.profile = self.quality_fallback_profile.itemData(index)
+        self._on_osh_changed()
+
+    def _quality_fallback_scene_collection_changed(self, index):
+        self.osh.quality_fallback.scene_collection = self.quality_fallback_scene_collection.itemData(index)
+        self._on_osh_changed()
+
+    def _quality_fallback_window_changed(self, value):
+        self.osh.quality_fallback.window = value
+        self._on_osh_changed()
+
+    def _quality_fallback_max_drop_changed(self, value):
+        self.osh.quality_fallback.max_drop = value
+        self._on_osh_changed()
+
+    def _quality_fallback_restore_below_changed(self, value):
+        self.osh.quality_fallback.restore_below = value
+        self._on_osh_changed()
+
+    def _quality_fallback_restore_after_changed(self, value):
+        self.osh.quality_fallback.restore_after = value
+        self._on_osh_changed()
+
+    def _quality_fallback_cooldown_changed(self, value):
+        self.osh.quality_fallback.cooldown = value
+        self._on_osh_changed()
+
     def accept(self):
         self.settings.osh.update(self.osh)
         super().accept()
@@ -91,7 +91,8 @@ class AddEditPresetDialog(QDialog):
         self._update_title()
 
     def _display_list_changed(self, *_, **__):
-        self.updated.displays = self.display_list_input.items
+        displays = self.display_list_input.items
+        self.updated.set_displays(displays, [self.settings.all_displays.fingerprint_for(x) for x in displays])
         self._update_title()
 
     def _load_current_values(self):
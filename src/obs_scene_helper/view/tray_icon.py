@@ -15,6 +15,9 @@ class SystemTraySignals(QObject):
     obs_settings_requested = Signal()
     osh_settings_requested = Signal()
     logs_requested = Signal()
+    switch_traces_requested = Signal()
+    file_pipeline_requested = Signal()
+    catalogue_requested = Signal()
 
 
 class TrayIcon(QSystemTrayIcon):
@@ -40,6 +43,9 @@ class TrayIcon(QSystemTrayIcon):
         self.menu.addSeparator()
         self.menu.addAction("Settings", lambda: self.signals.osh_settings_requested.emit())
         self.menu.addAction("Logs", lambda: self.signals.logs_requested.emit())
+        self.menu.addAction("Switch Traces", lambda: self.signals.switch_traces_requested.emit())
+        self.menu.addAction("File Pipeline", lambda: self.signals.file_pipeline_requested.emit())
+        self.menu.addAction("Recordings", lambda: self.signals.catalogue_requested.emit())
         self.menu.addSeparator()
         self.menu.addAction("Quit", lambda: self.signals.quit_requested.emit())
         self.setContextMenu(self.menu)
@@ -53,6 +59,9 @@ class TrayIcon(QSystemTrayIcon):
         self.obs_connection.recording.state_changed.connect(self._recording_state_changed)
         self.obs_connection.on_error.connect(self._on_error)
 
+    def show_warning(self, title: str, message: str):
+        self.showMessage(title, message, QSystemTrayIcon.MessageIcon.Warning)
+
     def preset_activated(self, new_preset: Preset):
         self.last_preset = new_preset
         self._update_state()
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QLabel, QLineEdit, QComboBox
+from PySide6.QtWidgets import QCheckBox, QDateEdit, QSpinBox
+
+from PySide6.QtCore import QSize, QTimer, QDate
+
+from obs_scene_helper.controller.system.catalogue import Catalogue as CatalogueController
+from obs_scene_helper.model.catalogue.store import SegmentQuery
+from obs_scene_helper.model.catalogue.table import Table as CatalogueTable
+
+from obs_scene_helper.view.widgets.app_window import AppWindow
+
+
+class Catalogue(AppWindow):
+    """ Search through the recorded files """
+
+    # Typing into the search field only triggers a query once the user pauses
+    SEARCH_DELAY_MS = 250
+
+    def __init__(self, catalogue: CatalogueController):
+        super().__init__("Recordings")
+
+        self.catalogue = catalogue
+        self.model = CatalogueTable()
+
+        layout = QVBoxLayout()
+
+        filter_layout = QHBoxLayout()
+
+        self.text = QLineEdit()
+        self.text.setPlaceholderText("File name")
+        filter_layout.addWidget(self.text)
+
+        self.preset = QComboBox()
+        filter_layout.addWidget(QLabel("Preset:"))
+        filter_layout.addWidget(self.preset)
+
+        self.day_enabled = QCheckBox("Day:")
+        self.day = QDateEdit(QDate.currentDate())
+        self.day.setCalendarPopup(True)
+        filter_layout.addWidget(self.day_enabled)
+        filter_layout.addWidget(self.day)
+
+        self.min_duration = QSpinBox()
+        self.min_duration.setRange(0, 24 * 60)
+        self.min_duration.setSpecialValueText("Any")
+        self.min_duration.setSuffix(" min")
+        filter_layout.addWidget(QLabel("Longer than:"))
+        filter_layout.addWidget(self.min_duration)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+
+        self.status = QLabel()
+
+        layout.addLayout(filter_layout)
+        layout.addWidget(self.table)
+        layout.addWidget(self.status)
+
+        self.setLayout(layout)
+
+        self.setMinimumSize(QSize(1000, 400))
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self._search)
+
+        self._load_presets()
+
+        self.text.textChanged.connect(self._schedule_search)
+        self.preset.currentIndexChanged.connect(self._schedule_search)
+        self.day_enabled.toggled.connect(self._schedule_search)
+        self.day.dateChanged.connect(self._schedule_search)
+        self.min_duration.valueChanged.connect(self._schedule_search)
+        self.catalogue.changed.connect(self._schedule_search)
+
+        self._search()
+
+    def _load_presets(self):
+        self.preset.addItem("Any", None)
+        for preset in self.catalogue.known_presets():
+            self.preset.addItem(preset, preset)
+
+    def _schedule_search(self, *_):
+        self.search_timer.start(self.SEARCH_DELAY_MS)
+
+    def _make_query(self) -> SegmentQuery:
+        query = SegmentQuery(text=self.text.text().strip(), preset=self.preset.currentData())
+
+        if self.day_enabled.isChecked():
+            date = self.day.date()
+            start = datetime(date.year(), date.month(), date.day())
+            query.since = start.timestamp()
+            query.until = (start + timedelta(days=1)).timestamp()
+
+        if self.min_duration.value() > 0:
+            query.min_duration = self.min_duration.value() * 60
+
+        return query
+
+    def _search(self):
+        query = self._make_query()
+        segments = self.catalogue.find_segments(query)
+        self.model.set_segments(segments)
+
+        suffix = f' (only the latest {query.limit} are shown)' if len(segments) == query.limit else ''
+        self.status.setText(f'{len(segments)} file(s){suffix}')
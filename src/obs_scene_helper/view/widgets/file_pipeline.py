@@ -0,0 +1,40 @@
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QPushButton, QLabel
+
+from PySide6.QtCore import QSize
+
+from obs_scene_helper.model.pipeline.job_table import Table as JobTable
+
+from obs_scene_helper.view.widgets.app_window import AppWindow
+
+
+class FilePipeline(AppWindow):
+    """ Progress and results of the post-recording file pipeline """
+
+    def __init__(self, model: JobTable):
+        super().__init__("File Pipeline")
+
+        layout = QVBoxLayout()
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(QLabel("Finished recording files are processed in the background."))
+        header_layout.addStretch()
+
+        clear_button = QPushButton("Clear finished")
+        header_layout.addWidget(clear_button)
+
+        self.table = QTableView()
+        self.model = model
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+
+        layout.addLayout(header_layout)
+        layout.addWidget(self.table)
+
+        self.setLayout(layout)
+
+        self.setMinimumSize(QSize(1000, 300))
+
+        clear_button.clicked.connect(self.model.clear)
@@ -1,12 +1,19 @@
+import math
+
+from typing import Optional
+
 from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QLineEdit, QTableView, QHeaderView
-from PySide6.QtWidgets import QPushButton
+from PySide6.QtWidgets import QPushButton, QWidget
 
 from PySide6.QtCore import Qt, QSortFilterProxyModel, QSize
 
+from obs_scene_helper.controller.obs.stats import Stats
 from obs_scene_helper.controller.system.log import Log
 from obs_scene_helper.model.log.table import Column, Table as LogTable
+from obs_scene_helper.model.metrics.obs_stats import StatsSnapshot, interval_skip
 
 from obs_scene_helper.view.widgets.app_window import AppWindow
+from obs_scene_helper.view.widgets.sparkline import LabeledSparkline
 
 
 class LogFilterProxyModel(QSortFilterProxyModel):
@@ -47,12 +54,69 @@ class AutoScrollTableView(QTableView):
             self.scrollToBottom()
 
 
+class StatsPanel(QWidget):
+    """ Sparklines of the most recent OBS stats samples """
+
+    # Number of the most recent samples shown
+    SAMPLES = 120
+
+    def __init__(self, stats: Stats, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.stats = stats
+
+        self.cpu = LabeledSparkline("CPU")
+        self.fps = LabeledSparkline("FPS")
+        self.render_time = LabeledSparkline("Render time")
+        self.render_skip = LabeledSparkline("Render lag")
+        self.output_skip = LabeledSparkline("Encoding lag")
+        self.bitrate = LabeledSparkline("Bitrate")
+
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        for widget in [self.cpu, self.fps, self.render_time, self.render_skip, self.output_skip, self.bitrate]:
+            layout.addWidget(widget)
+        self.setLayout(layout)
+
+        self.stats.updated.connect(self._update)
+        if self.stats.snapshot is not None:
+            self._update(self.stats.snapshot)
+
+    @staticmethod
+    def _format(value: float, fmt: str) -> str:
+        return '-' if math.isnan(value) else fmt.format(value)
+
+    def _update(self, snapshot: StatsSnapshot):
+        series = self.stats.series
+        count = self.SAMPLES
+
+        timestamps = series.timestamps()[-count:]
+        bitrate = series.values('record_bytes')[-count:] * 8 / 1000
+        if len(timestamps) > 1:
+            intervals = timestamps[1:] - timestamps[:-1]
+            bitrate[1:] = bitrate[1:] / intervals
+        bitrate[:1] = math.nan
+
+        self.cpu.set_values(series.values('cpu')[-count:], self._format(snapshot.cpu, '{:.1f} %'), 100.0)
+        self.fps.set_values(series.values('fps')[-count:], self._format(snapshot.fps, '{:.1f}'))
+        self.render_time.set_values(series.values('render_time')[-count:],
+                                    self._format(snapshot.render_time, '{:.2f} ms'))
+        self.render_skip.set_values(interval_skip(series, 'render_skipped', 'render_frames')[-count:],
+                                    self._format(snapshot.render_skip, '{:.2f} %'))
+        self.output_skip.set_values(interval_skip(series, 'output_skipped', 'output_frames')[-count:],
+                                    self._format(snapshot.output_skip, '{:.2f} %'))
+        self.bitrate.set_values(bitrate, self._format(snapshot.record_bitrate, '{:.0f} kbit/s'))
+
+
 class Logs(AppWindow):
-    def __init__(self):
+    def __init__(self, stats: Optional[Stats] = None):
         super().__init__("Logs")
 
         layout = QVBoxLayout()
 
+        if stats is not None:
+            layout.addWidget(StatsPanel(stats))
+
         # Filtering
         filter_layout = QHBoxLayout()
 
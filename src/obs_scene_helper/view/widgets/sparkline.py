@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+
+from PySide6.QtCore import QPointF, QSize
+from PySide6.QtGui import QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
+
+
+class Sparkline(QWidget):
+    """ Word-sized line chart of a series, gaps (NaN values) are not drawn """
+
+    MARGIN = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values = np.empty(0)
+        self._maximum = None  # type: float | None
+        self.setMinimumSize(QSize(120, 24))
+
+    def set_values(self, values: np.ndarray, maximum: float | None = None):
+        """ Plot the values, scaled to `maximum` if set (or to the largest value otherwise) """
+        self._values = values
+        self._maximum = maximum
+        self.update()
+
+    def paintEvent(self, _):
+        valid = ~np.isnan(self._values)
+        if not valid.any():
+            return
+
+        top = self._maximum if self._maximum is not None else float(np.max(self._values[valid]))
+        top = top if top > 0 else 1.0
+
+        width = self.width() - 2 * self.MARGIN
+        height = self.height() - 2 * self.MARGIN
+        step = width / max(1, len(self._values) - 1)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(self.palette().windowText().color(), 1.0))
+
+        segment = QPolygonF()
+        for i, value in enumerate(self._values):
+            if math.isnan(value):
+                if segment.size() != 0:
+                    painter.drawPolyline(segment)
+                    segment = QPolygonF()
+                continue
+
+            y = self.MARGIN + height * (1.0 - min(float(value), top) / top)
+            segment.append(QPointF(self.MARGIN + i * step, y))
+
+        if segment.size() != 0:
+            painter.drawPolyline(segment)
+
+        painter.end()
+
+
+class LabeledSparkline(QWidget):
+    """ Sparkline with a caption showing the latest value """
+
+    def __init__(self, title: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.title = title
+        self.caption = QLabel(f'{title}: -')
+        self.sparkline = Sparkline()
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.caption)
+        layout.addWidget(self.sparkline)
+        self.setLayout(layout)
+
+    def set_values(self, values: np.ndarray, text: str, maximum: float | None = None):
+        self.caption.setText(f'{self.title}: {text}')
+        self.sparkline.set_values(values, maximum)
@@ -0,0 +1,40 @@
+from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QPushButton, QLabel
+
+from PySide6.QtCore import QSize
+
+from obs_scene_helper.model.metrics.trace_table import Table as TraceTable
+
+from obs_scene_helper.view.widgets.app_window import AppWindow
+
+
+class SwitchTraces(AppWindow):
+    """ Per-phase timing breakdown of the recent preset switches """
+
+    def __init__(self, model: TraceTable):
+        super().__init__("Switch Traces")
+
+        layout = QVBoxLayout()
+
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(QLabel("Hover over a switch to see all of its steps."))
+        header_layout.addStretch()
+
+        clear_button = QPushButton("Clear")
+        header_layout.addWidget(clear_button)
+
+        self.table = QTableView()
+        self.model = model
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table.setMouseTracking(True)
+
+        layout.addLayout(header_layout)
+        layout.addWidget(self.table)
+
+        self.setLayout(layout)
+
+        self.setMinimumSize(QSize(1000, 400))
+
+        clear_button.clicked.connect(self.model.clear)
@@ -0,0 +1,50 @@
+import pytest
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QSettings, QTimer
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """ Qt application for the tests relying on the event loop, with the logs and metrics set up """
+    Log.setup()
+    Metrics.setup()
+
+    # Keep the tests away from the user's settings
+    path = str(tmp_path_factory.mktemp('qsettings'))
+    for settings_format in [QSettings.Format.NativeFormat, QSettings.Format.IniFormat]:
+        QSettings.setPath(settings_format, QSettings.Scope.UserScope, path)
+
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _wait_until(condition, timeout_ms: int = 5000):
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.timeout.connect(lambda: loop.quit() if condition() else None)
+    timer.start(10)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    assert condition()
+
+
+@pytest.fixture
+def wait_until(app):
+    """ Run the event loop until the condition holds (or the timeout is reached, failing the test) """
+    return _wait_until
+
+
+def pytest_addoption(parser):
+    parser.addoption('--benchmark', action='store_true', help="run the benchmarks and report their timings")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmark'):
+        return
+
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+import pytest
+
+from PySide6.QtCore import QObject, Signal
+
+from obs_scene_helper.controller.actions.forecast_disk_space import ForecastDiskSpace
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.model.settings.osh import OSH
+
+
+class FakeRecording(QObject):
+    state_changed = Signal(RecordingState)
+
+    def __init__(self):
+        super().__init__()
+        self.state = RecordingState.Active
+        self.requests = []
+
+    def split(self) -> bool:
+        self.requests.append('split')
+        return True
+
+    def stop(self) -> bool:
+        self.requests.append('stop')
+        return True
+
+
+class FakeSettings(QObject):
+    osh_changed = Signal()
+
+    def __init__(self, action: str):
+        super().__init__()
+        self.osh = OSH.make_default(None)
+        self.osh.disk_forecast = OSH.DiskForecast(enabled=True, warn_at=[], action=action, action_at=2)
+
+
+def make_action(action: str) -> tuple[ForecastDiskSpace, FakeRecording]:
+    connection = SimpleNamespace(recording=FakeRecording())
+    return ForecastDiskSpace(connection, FakeSettings(action)), connection.recording
+
+
+def forecast(action: ForecastDiskSpace, time_to_full: float):
+    action.forecaster = SimpleNamespace(time_to_full=time_to_full, free=0, rate=0.0)
+    action._check_forecast()
+
+
+def test_split_then_stop_while_the_disk_keeps_filling(app):
+    action, recording = make_action(ForecastDiskSpace.ACTION_SPLIT)
+
+    forecast(action, 200.0)
+    assert recording.requests == []
+
+    forecast(action, 110.0)
+    assert recording.requests == ['split']
+
+    # The new segment fills the same disk
+    forecast(action, 60.0)
+    assert recording.requests == ['split']
+
+    forecast(action, 25.0)
+    assert recording.requests == ['split', 'stop']
+
+
+def test_split_skipped_when_the_disk_is_about_to_be_full(app):
+    action, recording = make_action(ForecastDiskSpace.ACTION_SPLIT)
+
+    forecast(action, 10.0)
+    assert recording.requests == ['stop']
+
+
+@pytest.mark.parametrize('name,expected', [(ForecastDiskSpace.ACTION_STOP, ['stop']),
+                                           (ForecastDiskSpace.ACTION_NONE, [])])
+def test_other_actions_act_once(app, name, expected):
+    action, recording = make_action(name)
+
+    for time_to_full in [110.0, 60.0, 25.0, 5.0]:
+        forecast(action, time_to_full)
+    assert recording.requests == expected
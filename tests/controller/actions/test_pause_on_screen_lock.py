@@ -0,0 +1,142 @@
+import pytest
+
+from PySide6.QtCore import QObject, Signal
+
+from obs_scene_helper.controller.actions import pause_on_screen_lock
+from obs_scene_helper.controller.actions.pause_on_screen_lock import PauseOnScreenLock
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.settings.osh import OSH
+
+State = PauseOnScreenLock.State
+
+
+class FakeScreenLock(QObject):
+    screen_locked = Signal()
+    screen_unlocked = Signal()
+
+
+class FakeRecording(QObject):
+    """ Records the requests, the test reports their outcome with set_state """
+
+    state_changed = Signal(RecordingState)
+
+    def __init__(self):
+        super().__init__()
+        self.state = RecordingState.Active
+        self.requests = []
+
+    def pause(self) -> bool:
+        self.requests.append('pause')
+        return True
+
+    def resume(self) -> bool:
+        self.requests.append('resume')
+        return True
+
+    def set_state(self, state: RecordingState):
+        self.state = state
+        self.state_changed.emit(state)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.recording = FakeRecording()
+
+
+class FakeSettings:
+    def __init__(self, hold_off: float):
+        self.osh = OSH.make_default(None)
+        self.osh.screen_lock_pause = OSH.ScreenLockPause(hold_off)
+
+
+def make_action(hold_off: float) -> tuple[PauseOnScreenLock, FakeRecording, FakeScreenLock]:
+    connection = FakeConnection()
+    action = PauseOnScreenLock(connection, FakeSettings(hold_off))
+    return action, connection.recording, action.screen_lock
+
+
+@pytest.fixture(autouse=True)
+def fake_screen_lock(app, monkeypatch):
+    monkeypatch.setattr(pause_on_screen_lock, 'ScreenLock', FakeScreenLock)
+
+
+def counter(name: str) -> int:
+    return Metrics.counter(name).value
+
+
+def test_pauses_once_the_hold_off_expires(wait_until):
+    action, recording, lock = make_action(0.05)
+
+    lock.screen_locked.emit()
+    assert recording.requests == []
+
+    wait_until(lambda: recording.requests == ['pause'])
+    recording.set_state(RecordingState.Paused)
+    assert action.state == State.Idle
+
+    lock.screen_unlocked.emit()
+    assert recording.requests == ['pause', 'resume']
+    recording.set_state(RecordingState.Active)
+    assert action.state == State.Idle
+
+
+def test_unlock_within_the_hold_off_never_reaches_obs():
+    action, recording, lock = make_action(60.0)
+    avoided = counter('posl.avoided_round_trips')
+
+    lock.screen_locked.emit()
+    assert action.hold_off_timer.isActive()
+
+    lock.screen_unlocked.emit()
+    assert not action.hold_off_timer.isActive()
+    assert recording.requests == []
+    assert counter('posl.avoided_round_trips') == avoided + 1
+
+
+def test_unlock_while_the_pause_is_in_flight_resumes_afterwards():
+    action, recording, lock = make_action(0.0)
+    merged = counter('posl.merged_requests')
+
+    lock.screen_locked.emit()
+    assert recording.requests == ['pause'] and action.state == State.WaitingForPauseEvent
+
+    lock.screen_unlocked.emit()
+    assert recording.requests == ['pause']
+
+    recording.set_state(RecordingState.Paused)
+    assert recording.requests == ['pause', 'resume'] and action.state == State.WaitingForResumeEvent
+    assert counter('posl.merged_requests') == merged + 1
+
+
+def test_relock_while_the_resume_is_in_flight_pauses_again():
+    action, recording, lock = make_action(0.0)
+    merged = counter('posl.merged_requests')
+
+    lock.screen_locked.emit()
+    recording.set_state(RecordingState.Paused)
+    lock.screen_unlocked.emit()
+    assert action.state == State.WaitingForResumeEvent
+
+    lock.screen_locked.emit()
+    assert recording.requests == ['pause', 'resume']
+
+    recording.set_state(RecordingState.Active)
+    assert recording.requests == ['pause', 'resume', 'pause'] and action.state == State.WaitingForPauseEvent
+    assert counter('posl.merged_requests') == merged + 1
+
+
+@pytest.mark.parametrize('state', [RecordingState.Stopped, RecordingState.Stopping, RecordingState.Unknown])
+def test_inconsistent_recording_state_resets_the_request(state):
+    action, recording, lock = make_action(0.0)
+
+    lock.screen_locked.emit()
+    assert action.state == State.WaitingForPauseEvent
+
+    recording.set_state(state)
+    assert action.state == State.Idle
+
+    # Nothing to resume: the recording isn't paused
+    recording.state = RecordingState.Active
+    lock.screen_unlocked.emit()
+    assert recording.requests == ['pause']
@@ -0,0 +1,174 @@
+import pytest
+
+from PySide6.QtCore import QObject, Signal
+
+from obs_scene_helper.controller.actions import pause_on_silence
+from obs_scene_helper.controller.actions.pause_on_silence import PauseOnSilence
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.model.audio.levels import AudioLevels
+from obs_scene_helper.model.settings.osh import OSH
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRecording(QObject):
+    state_changed = Signal(RecordingState)
+
+    def __init__(self):
+        super().__init__()
+        self.state = RecordingState.Active
+        self.requests = []
+
+    def pause(self) -> bool:
+        self.requests.append('pause')
+        return True
+
+    def resume(self) -> bool:
+        self.requests.append('resume')
+        return True
+
+    def set_state(self, state: RecordingState):
+        self.state = state
+        self.state_changed.emit(state)
+
+
+class FakeMeters(QObject):
+    """ A single "mic" input at a controlled level """
+
+    levels_changed = Signal(dict)
+
+    def __init__(self, clock: Clock):
+        super().__init__()
+        self.clock = clock
+        self.level_db = -100.0
+        self.changed_at = clock.now
+
+    def acquire(self, _):
+        pass
+
+    def release(self, _):
+        pass
+
+    def set_level(self, level_db: float):
+        self.level_db = level_db
+        self.changed_at = self.clock.now
+
+    def statistics(self, window: float, threshold_db: float) -> dict[str, AudioLevels]:
+        now = self.clock.now
+        loud = self.level_db >= threshold_db
+        silent_for = 0.0 if loud else min(window, now - self.changed_at)
+        loud_at = max(self.changed_at, now - window) if loud else None
+        return {'mic': AudioLevels(self.level_db, self.level_db, self.level_db, 0.0 if loud else 1.0, silent_for,
+                                   loud_at, now)}
+
+
+class FakeConnection:
+    def __init__(self, clock: Clock):
+        self.recording = FakeRecording()
+        self.audio_meters = FakeMeters(clock)
+
+
+class FakeSettings(QObject):
+    osh_changed = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.osh = OSH.make_default(None)
+        self.osh.silence_pause = OSH.SilencePause(enabled=True, inputs=['mic'], pause_after=60,
+                                                  pause_threshold_db=-50.0, resume_threshold_db=-40.0,
+                                                  resume_hold=0.3)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    res = Clock()
+    monkeypatch.setattr(pause_on_silence.time, 'monotonic', res)
+    return res
+
+
+@pytest.fixture
+def setup(app, clock):
+    connection = FakeConnection(clock)
+    action = PauseOnSilence(connection, FakeSettings())
+    return action, connection.recording, connection.audio_meters
+
+
+def advance(clock: Clock, meters: FakeMeters, seconds: float, step: float = 0.5):
+    """ Deliver the meter frames for the given amount of time """
+    end = clock.now + seconds
+    while clock.now < end:
+        clock.now = min(end, clock.now + step)
+        meters.levels_changed.emit({})
+
+
+def test_pauses_after_the_silence_window_and_resumes_on_audio(setup, clock):
+    action, recording, meters = setup
+
+    advance(clock, meters, 59.0)
+    assert recording.requests == []
+
+    advance(clock, meters, 1.5)
+    assert recording.requests == ['pause']
+    assert action.state == PauseOnSilence.State.WaitingForPauseEvent
+
+    recording.set_state(RecordingState.Paused)
+    assert action.state == PauseOnSilence.State.Idle
+
+    # Audio is back, but it has to stay above the resume threshold for a moment
+    meters.set_level(-20.0)
+    advance(clock, meters, 0.2, step=0.1)
+    assert recording.requests == ['pause']
+
+    advance(clock, meters, 0.2, step=0.1)
+    assert recording.requests == ['pause', 'resume']
+
+    recording.set_state(RecordingState.Active)
+    assert action.state == PauseOnSilence.State.Idle
+
+
+def test_audio_restarts_the_silence_window(setup, clock):
+    _, recording, meters = setup
+
+    advance(clock, meters, 40.0)
+    meters.set_level(-30.0)
+    advance(clock, meters, 1.0)
+    meters.set_level(-100.0)
+
+    advance(clock, meters, 58.0)
+    assert recording.requests == []
+
+    advance(clock, meters, 3.0)
+    assert recording.requests == ['pause']
+
+
+def test_noise_between_the_thresholds_neither_pauses_nor_resumes(setup, clock):
+    action, recording, meters = setup
+
+    # Above the pause threshold: not silent
+    meters.set_level(-45.0)
+    advance(clock, meters, 120.0)
+    assert recording.requests == []
+
+    meters.set_level(-100.0)
+    advance(clock, meters, 61.0)
+    recording.set_state(RecordingState.Paused)
+
+    # Below the resume threshold: still paused
+    meters.set_level(-45.0)
+    advance(clock, meters, 10.0)
+    assert recording.requests == ['pause']
+
+
+def test_only_resumes_recordings_paused_by_itself(setup, clock):
+    _, recording, meters = setup
+
+    recording.set_state(RecordingState.Paused)
+    meters.set_level(-20.0)
+    advance(clock, meters, 5.0)
+    assert recording.requests == []
@@ -0,0 +1,151 @@
+from types import SimpleNamespace
+
+import pytest
+
+from PySide6.QtCore import QObject, Signal
+
+from obs_scene_helper.controller.actions.switch_profile_and_scene_collection import SwitchProfileAndSceneCollection
+from obs_scene_helper.controller.obs.connection import ConnectionState
+from obs_scene_helper.controller.obs.recording import RecordingState
+from obs_scene_helper.model.settings.osh import OSH
+from obs_scene_helper.model.settings.preset import Preset
+
+TARGET = Preset('uuid', 'Docked', ['Display 1'], 'Docked Profile', 'Docked Scenes')
+
+
+class FakeRecording(QObject):
+    state_changed = Signal(RecordingState)
+
+    def __init__(self):
+        super().__init__()
+        self.state = RecordingState.Active
+        self.can_split = True
+        self.requests = []
+
+    def stop(self) -> bool:
+        self.requests.append('stop')
+        return True
+
+    def start(self) -> bool:
+        self.requests.append('start')
+        return True
+
+    def split(self) -> bool:
+        self.requests.append('split')
+        return True
+
+    def is_output_active(self) -> bool:
+        return False
+
+
+class FakeActive(QObject):
+    """ Profiles or scene collections """
+
+    active_changed = Signal(str)
+
+    def __init__(self, active: str):
+        super().__init__()
+        self.active = active
+        self.requests = []
+
+    def set_active(self, name: str) -> bool:
+        self.requests.append(name)
+        return True
+
+
+class FakeConnection(QObject):
+    connection_state_changed = Signal(ConnectionState)
+    on_error = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.recording = FakeRecording()
+        self.profiles = FakeActive('Other Profile')
+        self.scene_collections = FakeActive('Other Scenes')
+
+
+class FakeDisplayList(QObject):
+    changed = Signal(list)
+    settled = Signal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.is_settled = True
+        self.identities = []
+
+
+class FakeSettings(QObject):
+    preset_list_changed = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.obs = SimpleNamespace(grace_period=0.05)
+        self.osh = OSH.make_default(None)
+        self.preset_list = SimpleNamespace(find_best_match=lambda *_: None)
+
+
+@pytest.fixture
+def setup(app):
+    connection = FakeConnection()
+    display_list = FakeDisplayList()
+    action = SwitchProfileAndSceneCollection(connection, display_list, FakeSettings())
+    return action, connection, display_list
+
+
+def outcomes(action: SwitchProfileAndSceneCollection) -> list[tuple[str, str]]:
+    return [(x.name, x.outcome) for x in action.traces.traces]
+
+
+def test_pending_recheck_keeps_its_trace(setup, wait_until):
+    action, connection, _ = setup
+
+    connection.connection_state_changed.emit(ConnectionState.Connected)
+    connection.recording.state_changed.emit(RecordingState.Unknown)
+    assert outcomes(action) == []
+
+    wait_until(lambda: len(action.traces.traces) != 0)
+    assert outcomes(action) == [('connection', 'no match')]
+
+
+def test_idle_transition_without_a_pending_recheck_aborts_the_trace(setup):
+    action, connection, _ = setup
+
+    assert action.activate(TARGET, 'fallback')
+    connection.recording.state_changed.emit(RecordingState.Unknown)
+    assert outcomes(action) == [('fallback', 'aborted')]
+
+
+def test_display_change_during_a_switch_starts_a_fresh_trace(setup, wait_until):
+    action, connection, display_list = setup
+
+    assert action.activate(TARGET, 'fallback')
+    assert connection.recording.requests == ['stop']
+
+    display_list.is_settled = False
+    display_list.changed.emit(['Display 2'])
+    assert outcomes(action) == [('fallback', 'superseded')]
+
+    display_list.is_settled = True
+    display_list.settled.emit(['Display 2'])
+    wait_until(lambda: len(action.traces.traces) == 2)
+    assert outcomes(action)[1] == ('display change', 'no match')
+
+
+@pytest.mark.parametrize('state', [RecordingState.Starting, RecordingState.Stopping, RecordingState.Unknown])
+def test_unsettled_recordings_are_stopped_before_the_profile_change(setup, state):
+    action, connection, _ = setup
+    connection.recording.state = state
+
+    assert action.activate(TARGET, 'fallback')
+    assert connection.recording.requests == ['stop']
+    assert connection.profiles.requests == []
+    assert action.state == SwitchProfileAndSceneCollection.State.StoppingRecording
+
+
+def test_stopped_recording_goes_straight_to_the_profile_change(setup):
+    action, connection, _ = setup
+    connection.recording.state = RecordingState.Stopped
+
+    assert action.activate(TARGET, 'fallback')
+    assert connection.recording.requests == []
+    assert connection.profiles.requests == ['Docked Profile']
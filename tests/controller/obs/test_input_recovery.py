@@ -0,0 +1,115 @@
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from obs_scene_helper.controller.obs.input_recovery import InputRecovery, ToggleSetting
+from obs_scene_helper.controller.obs.inputs import Input
+
+
+class FakeInputs(QObject):
+    """ Applies the settings and acknowledges them on the next event loop iteration, unless told otherwise """
+
+    settings_changed = Signal(Input, dict, dict)
+
+    def __init__(self, entries: list[Input]):
+        super().__init__()
+        self.list = entries
+        self.batches = []  # type: list[list[tuple[str, dict]]]
+        self.silent = set()  # type: set[str]
+        self.wrong_acks = {}  # type: dict[str, int]
+        self.fail_batches = False
+
+    def set_settings_batch(self, changes: list[tuple[Input, dict]]):
+        if self.fail_batches:
+            return None
+
+        self.batches.append([(entry.name, settings) for entry, settings in changes])
+        for entry, settings in changes:
+            if entry.name not in self.silent:
+                QTimer.singleShot(0, lambda e=entry, s=settings: self._acknowledge(e, s))
+
+        return []
+
+    def _acknowledge(self, entry: Input, settings: dict):
+        old = entry.settings
+        if self.wrong_acks.get(entry.name, 0) > 0:
+            self.wrong_acks[entry.name] -= 1
+            settings = {k: not v for k, v in settings.items()}
+
+        # Like OBS, leave out the settings matching their default value (True)
+        reported = {k: v for k, v in (old | settings).items() if v is not True}
+        entry.settings = old | settings
+        self.settings_changed.emit(entry, old, reported)
+
+
+class FakeConnection:
+    def __init__(self, entries: list[Input]):
+        self.inputs = FakeInputs(entries)
+
+
+def make_recovery(entries: list[Input], max_retries: int = 1):
+    connection = FakeConnection(entries)
+    recovery = InputRecovery(connection, {'capture': ToggleSetting('cursor')}, ack_timeout_ms=50,
+                             max_retries=max_retries)
+    results = []
+    recovery.finished.connect(lambda recovered, failed: results.append(([x.name for x in recovered],
+                                                                         [x.name for x in failed])))
+    return connection.inputs, recovery, results
+
+
+def capture(name: str) -> Input:
+    return Input(name, name, 'capture', {})
+
+
+def test_steps_are_batched_for_all_inputs(app, wait_until):
+    entries = [capture('a'), capture('b'), capture('c'), Input('d', 'd', 'audio', {})]
+    inputs, recovery, results = make_recovery(entries)
+
+    assert recovery.recover()
+    wait_until(lambda: len(results) != 0)
+
+    assert sorted(results[0][0]) == ['a', 'b', 'c'] and results[0][1] == []
+    assert [sorted(x[0] for x in batch) for batch in inputs.batches] == [['a', 'b', 'c'], ['a', 'b', 'c']]
+    assert inputs.batches[0][0][1] == {'cursor': False}
+    assert inputs.batches[1][0][1] == {'cursor': True}
+    assert not recovery.busy
+
+
+def test_only_unacknowledged_inputs_are_retried_until_they_fail(app, wait_until):
+    inputs, recovery, results = make_recovery([capture('a'), capture('b')], max_retries=1)
+    inputs.silent.add('b')
+
+    recovery.recover()
+    wait_until(lambda: len(results) != 0)
+
+    assert results[0] == (['a'], ['b'])
+    # Initial attempt and a single retry for "b", "a" moved on to its second step in the meantime
+    assert sum(1 for batch in inputs.batches for name, _ in batch if name == 'b') == 2
+    assert sum(1 for batch in inputs.batches for name, _ in batch if name == 'a') == 2
+
+
+def test_mismatching_acknowledgement_is_retried(app, wait_until):
+    inputs, recovery, results = make_recovery([capture('a')], max_retries=2)
+    inputs.wrong_acks['a'] = 1
+
+    recovery.recover()
+    wait_until(lambda: len(results) != 0)
+
+    assert results[0] == (['a'], [])
+    assert [batch[0][1] for batch in inputs.batches] == [{'cursor': False}, {'cursor': False}, {'cursor': True}]
+
+
+def test_persistent_mismatch_fails(app, wait_until):
+    inputs, recovery, results = make_recovery([capture('a')], max_retries=1)
+    inputs.wrong_acks['a'] = 10
+
+    recovery.recover()
+    wait_until(lambda: len(results) != 0)
+    assert results[0] == ([], ['a'])
+
+
+def test_batch_error_fails_everything(app, wait_until):
+    inputs, recovery, results = make_recovery([capture('a'), capture('b')])
+    inputs.fail_batches = True
+
+    recovery.recover()
+    assert results == [([], ['a', 'b'])]
+    assert not recovery.busy
@@ -0,0 +1,141 @@
+import threading
+
+from types import SimpleNamespace
+
+import pytest
+
+from PySide6.QtCore import QObject, Signal
+
+from obs_scene_helper.controller.obs import scenes as scenes_module
+from obs_scene_helper.controller.obs.batch import BatchResult
+from obs_scene_helper.controller.obs.connection import ConnectionState
+from obs_scene_helper.controller.obs.scenes import Scenes
+
+
+def item(item_id: int, source: str, index: int, is_group: bool = False) -> dict:
+    return {'sceneItemId': item_id, 'sourceUuid': f'{source}-uuid', 'sourceName': source, 'sceneItemIndex': index,
+            'isGroup': is_group}
+
+
+class FakeObs:
+    """ Answers the scene list and the batched item requests, and records the threads sending them """
+
+    def __init__(self):
+        self.scenes = {'Main': [item(1, 'Camera', 0), item(2, 'Overlay', 1, True)],
+                       'Overlay': [item(1, 'Logo', 0)],
+                       'Other': []}
+        self.threads = set()  # type: set[int]
+
+    def get_scene_list(self):
+        self.threads.add(threading.get_ident())
+        return SimpleNamespace(scenes=[{'sceneUuid': f'{x}-uuid', 'sceneName': x} for x in ['Main', 'Other']],
+                               current_program_scene_name='Main')
+
+    def send_batch(self, _, requests):
+        self.threads.add(threading.get_ident())
+        res = []
+        for request in requests:
+            data = request.request_data
+            if request.request_type in ['GetSceneItemList', 'GetGroupSceneItemList']:
+                res.append(BatchResult(request.request_type, True, 100,
+                                       data={'sceneItems': self.scenes[data['sceneName']]}))
+            elif request.request_type == 'GetSceneItemEnabled':
+                res.append(BatchResult(request.request_type, True, 100, data={'sceneItemEnabled': False}))
+            elif request.request_type == 'GetSceneItemLocked':
+                res.append(BatchResult(request.request_type, True, 100, data={'sceneItemLocked': True}))
+            else:
+                res.append(BatchResult(request.request_type, True, 100,
+                                       data={'sceneItemTransform': {'positionX': 10.0}}))
+        return res
+
+
+class FakeConnection(QObject):
+    connection_state_changed = Signal(ConnectionState, str)
+
+    def __init__(self, fake_obs: FakeObs):
+        super().__init__()
+        self.ws = fake_obs
+        self.connection_state = ConnectionState.Disconnected
+
+    def connect_obs(self):
+        self.connection_state = ConnectionState.Connected
+        self.connection_state_changed.emit(self.connection_state, '')
+
+
+@pytest.fixture
+def fake_obs(app, monkeypatch):
+    res = FakeObs()
+    monkeypatch.setattr(scenes_module, 'send_batch', res.send_batch)
+    return res
+
+
+@pytest.fixture
+def scenes(fake_obs):
+    connection = FakeConnection(fake_obs)
+    res = Scenes(connection)
+    connection.connect_obs()
+    return res
+
+
+def event(**kwargs):
+    return SimpleNamespace(**kwargs)
+
+
+def on_event_thread(callback, data):
+    thread = threading.Thread(target=callback, args=(data,))
+    thread.start()
+    thread.join()
+
+
+def test_fetch_indexes_scenes_groups_and_items(scenes):
+    assert sorted(x.name for x in scenes.scenes.values()) == ['Main', 'Other', 'Overlay']
+    assert scenes.scene('Overlay').is_group
+    assert [x.source_name for x in scenes.items('Main')] == ['Camera', 'Overlay']
+    assert [x.source_name for x in scenes.items('Overlay')] == ['Logo']
+    assert scenes.find_item('Main', 'Camera').item_id == 1
+    assert scenes.current == 'Main'
+
+
+def test_events_are_handled_on_the_owning_thread(scenes, fake_obs, wait_until):
+    changes = []
+    scenes.items_changed.connect(lambda scene: changes.append((scene.name, threading.get_ident())))
+
+    on_event_thread(scenes.on_scene_item_created, event(scene_uuid='Other-uuid', scene_name='Other',
+                                                        scene_item_id=5, source_uuid='Camera-uuid',
+                                                        source_name='Camera', scene_item_index=0))
+    wait_until(lambda: len(changes) != 0)
+
+    assert changes == [('Other', threading.get_ident())]
+    assert fake_obs.threads == {threading.get_ident()}
+
+    # The item state is fetched separately
+    created = scenes.find_item('Other', 'Camera')
+    assert not created.enabled and created.locked and created.transform == {'positionX': 10.0}
+    assert sorted((x.scene_uuid, x.item_id) for x in scenes.items_for_source('Camera')) == \
+           [('Main-uuid', 1), ('Other-uuid', 5)]
+
+
+def test_items_are_removed_and_reindexed(scenes, wait_until):
+    on_event_thread(scenes.on_scene_item_list_reindexed, event(scene_uuid='Main-uuid', scene_items=[
+        {'sceneItemId': 1, 'sceneItemIndex': 1}, {'sceneItemId': 2, 'sceneItemIndex': 0}]))
+    wait_until(lambda: [x.source_name for x in scenes.items('Main')] == ['Overlay', 'Camera'])
+
+    on_event_thread(scenes.on_scene_item_removed, event(scene_uuid='Main-uuid', scene_name='Main', scene_item_id=1,
+                                                        source_name='Camera'))
+    wait_until(lambda: scenes.items_for_source('Camera') == [])
+    assert [x.source_name for x in scenes.items('Main')] == ['Overlay']
+
+
+def test_renames_and_removals_keep_the_index_current(scenes, wait_until):
+    scenes.on_scene_name_changed(event(scene_uuid='Main-uuid', old_scene_name='Main', scene_name='Live'))
+    scenes.on_input_name_changed(event(input_uuid='Camera-uuid', old_input_name='Camera', input_name='Webcam'))
+    wait_until(lambda: scenes.current == 'Live')
+
+    assert scenes.scene('Main') is None
+    assert scenes.find_item('Live', 'Webcam').item_id == 1
+    assert scenes.items_for_source('Camera') == []
+
+    scenes.on_scene_removed(event(scene_uuid='Live-uuid', scene_name='Live'))
+    wait_until(lambda: scenes.scene('Live') is None)
+    assert scenes.items_for_source('Webcam') == []
+    assert scenes.items_for_source('Logo') != []
@@ -0,0 +1,65 @@
+import json
+
+from PySide6.QtCore import QObject, QSettings, Signal
+
+from obs_scene_helper.controller.settings.settings import Settings
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.display.identity import DisplayIdentity
+
+
+class FakeDisplayList(QObject):
+    changed = Signal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.identities = [DisplayIdentity('Display 1')]
+
+    @property
+    def displays(self):
+        return [x.name for x in self.identities]
+
+
+def stored(key: str):
+    value = QSettings(Settings.ORG_NAME, Settings.APP_NAME).value(key, None)
+    return json.loads(value) if value is not None else None
+
+
+def test_changes_are_coalesced_and_only_dirty_sections_written(app, wait_until):
+    settings = Settings(FakeDisplayList())
+    settings.flush()
+    settings.wait()
+
+    written = Metrics.counter('settings.sections_written')
+    before = written.value
+
+    for i in range(20):
+        osh = settings.osh.copy(None)
+        osh.disk_forecast.action_at = i + 1
+        settings.osh.update(osh)
+
+    # Nothing is written until the window is over
+    assert written.value == before
+
+    wait_until(lambda: written.value != before and settings.save_timer.isActive() is False)
+    settings.wait()
+    assert written.value == before + 1
+    assert stored(Settings.OSH_KEY)['disk_forecast']['action_at'] == 20
+
+    settings.shutdown()
+
+
+def test_pending_changes_are_flushed_on_shutdown(app):
+    settings = Settings(FakeDisplayList())
+    osh = settings.osh.copy(None)
+    osh.telemetry.window = 123
+    settings.osh.update(osh)
+    assert settings.save_timer.isActive()
+
+    settings.shutdown()
+    assert stored(Settings.OSH_KEY)['telemetry']['window'] == 123
+
+    # Changes made after the writer stopped are written right away
+    osh = settings.osh.copy(None)
+    osh.telemetry.window = 321
+    settings.osh.update(osh)
+    assert stored(Settings.OSH_KEY)['telemetry']['window'] == 321
@@ -0,0 +1,24 @@
+from obs_scene_helper.controller.system.catalogue import Catalogue
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.catalogue.recorder import CatalogueRecorder
+from obs_scene_helper.model.catalogue.store import SegmentQuery
+
+
+def test_writes_are_batched_and_flushed_on_shutdown(app, tmp_path):
+    catalogue = Catalogue(str(tmp_path / 'catalogue.sqlite3'))
+    batches = Metrics.timing('cat.batch').count
+
+    recorder = CatalogueRecorder()
+    catalogue.submit(recorder.recording_state_changed('active', 0.0))
+    for i in range(100):
+        catalogue.submit(recorder.output_file_changed(f'/rec/{i:03}.mkv', float(i), 10))
+    catalogue.submit(recorder.recording_state_changed('stopped', 100.0, 10))
+
+    # Nothing is lost on shutdown, even if the batch window didn't pass yet
+    catalogue.shutdown()
+    assert Metrics.timing('cat.batch').count - batches < 5
+
+    segments = catalogue.find_segments(SegmentQuery(limit=10))
+    assert len(segments) == 10
+    assert segments[0].path == '/rec/099.mkv'
+    assert all(x.duration == 1.0 and x.size == 10 for x in segments)
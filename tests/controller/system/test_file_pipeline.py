@@ -0,0 +1,38 @@
+import hashlib
+
+from obs_scene_helper.controller.system.file_pipeline import FilePipeline
+from obs_scene_helper.model.pipeline.job_table import JobState
+from obs_scene_helper.model.pipeline.stages import PipelineConfig
+
+
+def test_files_are_processed_in_worker_processes(tmp_path, wait_until):
+    files = []
+    for i in range(3):
+        path = tmp_path / f'rec-{i}.mkv'
+        path.write_bytes(bytes([i]) * (3 * 1024 * 1024))
+        files.append(str(path))
+
+    pipeline = FilePipeline(PipelineConfig(chunk_size=256 * 1024), 2)
+    reports = []
+    pipeline.file_done.connect(reports.append)
+
+    for path in files:
+        pipeline.submit(path)
+    pipeline.submit(str(tmp_path / 'missing.mkv'))
+    assert not pipeline.idle
+
+    try:
+        wait_until(lambda: pipeline.idle, 30000)
+    finally:
+        pipeline.shutdown()
+
+    assert len(reports) == 4
+    by_path = {x.path: x for x in reports}
+    for i, path in enumerate(files):
+        assert by_path[path].success
+        assert by_path[path].digest == hashlib.sha256(bytes([i]) * (3 * 1024 * 1024)).hexdigest()
+        job = pipeline.table.job(path)
+        assert job.state == JobState.Done
+        assert job.done == job.total == 3 * 1024 * 1024
+
+    assert pipeline.table.job(str(tmp_path / 'missing.mkv')).state == JobState.Failed
@@ -0,0 +1,79 @@
+import threading
+import time
+
+from obs_scene_helper.controller.system.hooks import HookRunner
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.model.hooks.event import HookEvent, HookEventType
+
+
+def event(value: str) -> HookEvent:
+    return HookEvent(HookEventType.OutputFileChanged, value)
+
+
+def test_events_are_delivered_in_order_off_the_ui_thread(wait_until):
+    received = []
+
+    def hook(e: HookEvent):
+        received.append((e.value, threading.current_thread() is threading.main_thread()))
+
+    def failing(_):
+        raise RuntimeError('boom')
+
+    runner = HookRunner(1.0, {'ok': hook, 'failing': failing})
+    errors = Metrics.counter('hooks.errors').value
+    for i in range(20):
+        runner.notify(event(str(i)))
+
+    wait_until(lambda: runner.idle)
+    assert received == [(str(i), False) for i in range(20)]
+    assert Metrics.counter('hooks.errors').value == errors + 20
+    runner.shutdown()
+
+
+def test_stalled_hook_drops_events_until_it_returns(wait_until):
+    release = threading.Event()
+    slow_calls = []
+    fast_calls = []
+
+    def slow(e: HookEvent):
+        slow_calls.append(e.value)
+        release.wait(5)
+
+    runner = HookRunner(0.1, {'slow': slow, 'fast': lambda e: fast_calls.append(e.value)})
+    runner.notify(event('a'))
+    runner.notify(event('b'))
+
+    wait_until(lambda: runner._hooks['slow'].stalled)
+    runner.notify(event('c'))
+    wait_until(lambda: fast_calls == ['a', 'b', 'c'])
+
+    release.set()
+    wait_until(lambda: runner.idle)
+    time.sleep(0.05)
+    assert slow_calls == ['a']
+    assert not runner._hooks['slow'].stalled
+
+    runner.notify(event('d'))
+    wait_until(lambda: runner.idle)
+    assert slow_calls == ['a', 'd']
+    runner.shutdown()
+
+
+def test_hooks_are_loaded_from_the_hook_directory(tmp_path, wait_until):
+    (tmp_path / 'recorder.py').write_text('received = []\n\ndef on_event(e):\n    received.append(e.value)\n')
+    (tmp_path / 'no_hook.py').write_text('value = 1\n')
+    (tmp_path / 'broken.py').write_text('raise RuntimeError("boom")\n')
+    (tmp_path / 'notes.txt').write_text('not a hook\n')
+
+    runner = HookRunner(1.0, directory=str(tmp_path))
+    assert runner.names == [f'recorder ({tmp_path / "recorder.py"})']
+
+    runner.notify(event('a'))
+    wait_until(lambda: runner.idle)
+    assert runner._hooks[runner.names[0]].func.__globals__['received'] == ['a']
+    runner.shutdown()
+
+
+def test_missing_hook_directory_is_not_fatal():
+    runner = HookRunner(1.0, directory='/nonexistent/osh-hooks')
+    assert runner.names == []
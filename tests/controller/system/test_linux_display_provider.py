@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from obs_scene_helper.controller.system.provider.display_list.linux import LinuxProvider, scan_drm, display_names, \
+    display_identities
+from obs_scene_helper.model.display.identity import DisplayIdentity
+from obs_scene_helper.model.settings.preset import Preset, PresetList
+
+from tests.edid import make_edid
+
+
+def add_connector(root, name: str, status: str, edid: bytes = b''):
+    path = root / name
+    path.mkdir(exist_ok=True)
+    (path / 'status').write_text(status + '\n')
+    (path / 'edid').write_bytes(edid)
+
+
+@pytest.fixture
+def sysfs(tmp_path):
+    (tmp_path / 'card0').mkdir()
+    (tmp_path / 'version').write_text('drm 1.1.0\n')
+    add_connector(tmp_path, 'card0-eDP-1', 'connected', make_edid('BOE', 0x1, name=None))
+    add_connector(tmp_path, 'card0-HDMI-A-1', 'disconnected')
+    add_connector(tmp_path, 'card0-DP-1', 'connected', make_edid('DEL', 0xA0B1, name='DELL U2415', serial='ABC'))
+    return tmp_path
+
+
+def test_scan_drm(sysfs):
+    outputs = scan_drm(str(sysfs))
+    assert [x.connector for x in outputs] == ['DP-1', 'eDP-1']
+    assert outputs[0].edid.device_serial == 'ABC'
+    assert display_names(outputs) == ['DP-1', 'eDP-1']
+
+    identities = display_identities(outputs)
+    assert identities[0].manufacturer == 'DEL' and identities[0].model == 'A0B1' and identities[0].serial == 'ABC'
+
+
+def test_scan_missing_root(tmp_path):
+    assert scan_drm(str(tmp_path / 'missing')) == []
+    assert not LinuxProvider.is_available(str(tmp_path / 'missing'))
+
+
+def test_names_follow_the_xrandr_spelling(sysfs):
+    add_connector(sysfs, 'card0-HDMI-A-1', 'connected', make_edid('DEL', 0xA0B1, name='DELL U2415', serial='XYZ'))
+    outputs = scan_drm(str(sysfs))
+    assert display_names(outputs) == ['DP-1', 'HDMI-1', 'eDP-1']
+    assert [x.aliases for x in display_identities(outputs)] == [(), ('HDMI-A-1',), ()]
+
+
+@pytest.mark.parametrize('names', [['HDMI-1', 'eDP-1'], ['HDMI-A-1', 'eDP-1']])
+def test_presets_saved_with_the_qt_names_keep_matching(sysfs, names):
+    # Saved by the Qt provider, on X11 and on Wayland
+    add_connector(sysfs, 'card0-HDMI-A-1', 'connected', make_edid('GSM', 0x5B09, name='LG HDR 4K', serial='XYZ'))
+    os.remove(sysfs / 'card0-DP-1' / 'status')
+    legacy = Preset('1', 'docked', names, 'p', 'sc')
+    preset_list = PresetList([legacy], None)
+
+    identities = display_identities(scan_drm(str(sysfs)))
+    preset_list.migrate_fingerprints(identities)
+    assert preset_list.find_matching(identities) is legacy
+
+
+def test_invalid_edid_falls_back_to_connector(sysfs):
+    add_connector(sysfs, 'card0-DP-1', 'connected', b'garbage')
+    outputs = scan_drm(str(sysfs))
+    assert display_names(outputs) == ['DP-1', 'eDP-1']
+    assert display_identities(outputs)[0] == DisplayIdentity('DP-1')
+
+
+def test_provider_reports_changes(app, sysfs):
+    provider = LinuxProvider(root=str(sysfs), use_netlink=False)
+    assert provider.poll_timer.isActive()
+    assert provider.displays == ['DP-1', 'eDP-1']
+
+    changes = []
+    provider.changed.connect(lambda x: changes.append(list(x)))
+
+    provider.rescan()
+    assert changes == []
+
+    add_connector(sysfs, 'card0-HDMI-A-1', 'connected', make_edid('GSM', 0x5B09, name='LG HDR 4K'))
+    os.remove(sysfs / 'card0-DP-1' / 'status')
+    provider.rescan()
+    assert changes == [['HDMI-1', 'eDP-1']]
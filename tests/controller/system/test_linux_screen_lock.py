@@ -0,0 +1,96 @@
+import shutil
+import subprocess
+
+import pytest
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtDBus import QDBusConnection, QDBusMessage
+
+from obs_scene_helper.controller.system.provider.screen_lock.linux import LinuxScreenLockProvider, \
+    escape_bus_path_label
+
+DBUS_DAEMON = shutil.which('dbus-daemon')
+
+
+@pytest.fixture(scope='module')
+def bus_address():
+    if DBUS_DAEMON is None:
+        pytest.skip('dbus-daemon is not available')
+
+    daemon = subprocess.Popen([DBUS_DAEMON, '--session', '--nofork', '--print-address'], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True)
+    yield daemon.stdout.readline().strip()
+    daemon.kill()
+    daemon.wait()
+
+
+@pytest.fixture
+def buses(app, bus_address, request):
+    # A private bus plays both the system and the session one, the sender is a separate connection
+    names = [f'{request.node.name}-listener', f'{request.node.name}-sender']
+    yield [QDBusConnection.connectToBus(bus_address, x) for x in names]
+    for name in names:
+        QDBusConnection.disconnectFromBus(name)
+
+
+def send_and_wait(provider: LinuxScreenLockProvider, sender: QDBusConnection, path: str, interface: str, name: str,
+                  arguments=None):
+    events = []
+    loop = QEventLoop()
+
+    def on_event(event):
+        events.append(event)
+        loop.quit()
+
+    provider.screen_locked.connect(lambda: on_event('locked'))
+    provider.screen_unlocked.connect(lambda: on_event('unlocked'))
+
+    message = QDBusMessage.createSignal(path, interface, name)
+    if arguments is not None:
+        message.setArguments(arguments)
+    assert sender.send(message)
+
+    QTimer.singleShot(1000, loop.quit)
+    loop.exec()
+    provider.screen_locked.disconnect()
+    provider.screen_unlocked.disconnect()
+    return events
+
+
+def test_escape_bus_path_label():
+    assert escape_bus_path_label('2') == '_32'
+    assert escape_bus_path_label('c12') == 'c12'
+    assert escape_bus_path_label('a-b') == 'a_2db'
+    assert escape_bus_path_label('') == '_'
+
+
+def test_screensaver_signals(buses):
+    listener, sender = buses
+    provider = LinuxScreenLockProvider(session_bus=listener, system_bus=listener, session_id='2')
+
+    path, interface = '/org/freedesktop/ScreenSaver', 'org.freedesktop.ScreenSaver'
+    assert send_and_wait(provider, sender, path, interface, 'ActiveChanged', [True]) == ['locked']
+    assert provider.locked
+
+    # GNOME reporting the same transition
+    assert send_and_wait(provider, sender, '/org/gnome/ScreenSaver', 'org.gnome.ScreenSaver', 'ActiveChanged',
+                         [True]) == []
+
+    assert send_and_wait(provider, sender, path, interface, 'ActiveChanged', [False]) == ['unlocked']
+    assert not provider.locked
+
+
+def test_logind_signals(buses):
+    listener, sender = buses
+    provider = LinuxScreenLockProvider(session_bus=listener, system_bus=listener, session_id='2')
+
+    # Only the signals coming from logind are accepted
+    assert sender.registerService('org.freedesktop.login1')
+
+    interface = 'org.freedesktop.login1.Session'
+    assert send_and_wait(provider, sender, '/org/freedesktop/login1/session/_32', interface, 'Lock') == ['locked']
+
+    # Some other session
+    assert send_and_wait(provider, sender, '/org/freedesktop/login1/session/_33', interface, 'Unlock') == []
+
+    assert send_and_wait(provider, sender, '/org/freedesktop/login1/session/_32', interface, 'Unlock') == ['unlocked']
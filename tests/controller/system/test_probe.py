@@ -0,0 +1,76 @@
+import os
+import signal
+
+import pytest
+
+from PySide6.QtCore import QEventLoop, QTimer
+
+from obs_scene_helper.controller.system.provider.display_list.probe_client import ProbeClient
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+
+
+@pytest.fixture
+def client(app, monkeypatch):
+    # The probe server runs in a separate interpreter, which needs a headless Qt and our sources
+    monkeypatch.setenv('QT_QPA_PLATFORM', 'offscreen')
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(filter(None, [SRC_DIR, os.environ.get('PYTHONPATH')])))
+
+    res = ProbeClient(ProbeClient.interpreted_command())
+    yield res
+    res.stop()
+
+
+def request_and_wait(client: ProbeClient, timeout_ms: int = 15000, fresh: bool = False):
+    received = []
+    loop = QEventLoop()
+
+    def on_received(displays):
+        received.append(displays)
+        loop.quit()
+
+    client.displays_received.connect(on_received)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    client.request_displays(fresh)
+    loop.exec()
+    client.displays_received.disconnect(on_received)
+
+    assert len(received) == 1, 'No answer from the probe server'
+    return received[0]
+
+
+def test_displays_are_served_by_a_single_process(client):
+    assert isinstance(request_and_wait(client), list)
+    pid = client.pid
+
+    assert isinstance(request_and_wait(client), list)
+    assert client.pid == pid
+    assert client.running
+
+
+def test_server_is_restarted_after_a_crash(client):
+    request_and_wait(client)
+    pid = client.pid
+
+    os.kill(pid, signal.SIGKILL)
+
+    # The request is sent as soon as the new instance is ready
+    assert isinstance(request_and_wait(client), list)
+    assert client.pid != pid
+
+
+def test_stop(client):
+    request_and_wait(client)
+    client.stop()
+    assert not client.running
+    assert client.pid is None
+
+
+
+def test_fresh_request_is_answered_by_a_new_instance(client):
+    request_and_wait(client)
+    pid = client.pid
+
+    assert isinstance(request_and_wait(client, fresh=True), list)
+    assert client.pid != pid
+    assert client.running
@@ -0,0 +1,123 @@
+import shutil
+import sys
+import time
+
+import pytest
+
+from PySide6.QtCore import QCoreApplication, QSettings
+
+from obs_scene_helper.controller.system.log import Log
+from obs_scene_helper.controller.system.metrics import Metrics
+from obs_scene_helper.controller.system.script_launcher import ScriptLauncher
+
+SLEEP = [sys.executable, '-c', 'import sys, time; time.sleep(float(sys.argv[1])); print(sys.argv[2])']
+
+
+@pytest.fixture
+def backlog_settings(app, tmp_path):
+    return QSettings(str(tmp_path / 'backlog.ini'), QSettings.Format.IniFormat)
+
+
+def test_launches_are_queued_not_dropped(backlog_settings, wait_until):
+    launcher = ScriptLauncher(2, None, backlog_settings)
+    results = []
+    launcher.script_done.connect(results.append)
+
+    jobs = [launcher.launch(SLEEP + ['0.2', str(i)]) for i in range(5)]
+    assert launcher.running == 2
+    assert launcher.queued == 3
+    assert Metrics.gauge('scrlau.queued').max >= 3
+
+    wait_until(lambda: launcher.idle, 15000)
+    assert sorted(x.job_id for x in results) == sorted(x.job_id for x in jobs)
+    assert all(x.success for x in results)
+    assert len(launcher.backlog) == 0
+
+
+def test_timeout(backlog_settings, wait_until):
+    launcher = ScriptLauncher(1, 0.2, backlog_settings)
+    results = []
+    launcher.script_done.connect(results.append)
+
+    launcher.launch(SLEEP + ['10', 'late'])
+    wait_until(lambda: launcher.idle, 15000)
+    assert len(results) == 1
+    assert not results[0].success
+    assert results[0].timed_out
+
+
+def test_backlog_survives_restart(backlog_settings, tmp_path, wait_until):
+    launcher = ScriptLauncher(1, None, backlog_settings)
+    jobs = [launcher.launch(SLEEP + ['0.5', str(i)]) for i in range(3)]
+
+    # The app goes away with the jobs still queued: what is on disk at that moment is all the next session gets
+    restarted_path = tmp_path / 'restarted.ini'
+    shutil.copyfile(backlog_settings.fileName(), restarted_path)
+    wait_until(lambda: launcher.idle, 15000)
+    assert len(launcher.backlog) == 0
+
+    restarted = ScriptLauncher(2, None, QSettings(str(restarted_path), QSettings.Format.IniFormat))
+    assert [x.job_id for x in restarted.backlog.jobs] == [x.job_id for x in jobs]
+    assert restarted.running == 2
+
+    results = []
+    restarted.script_done.connect(results.append)
+    wait_until(lambda: restarted.idle, 15000)
+    assert sorted(x.job_id for x in results) == sorted(x.job_id for x in jobs)
+    assert len(restarted.backlog) == 0
+
+
+def test_output_is_streamed_and_rate_limited(backlog_settings, wait_until):
+    records = []
+    Log.INSTANCE.model.new_log_record.connect(lambda x: records.append(x) if x.name.endswith('scrlau.out') else None)
+
+    launcher = ScriptLauncher(1, None, backlog_settings)
+    results = []
+    launcher.script_done.connect(results.append)
+
+    # Progress-style output: carriage returns, and way more lines than are forwarded
+    chatty = [sys.executable, '-c', 'import sys\nfor i in range(5000): sys.stdout.write(f"frame={i}\\r")\nprint("end")']
+    job = launcher.launch(chatty)
+    wait_until(lambda: launcher.idle, 15000)
+    QCoreApplication.processEvents()
+
+    assert len(results) == 1 and results[0].success
+    assert results[0].logs.splitlines()[-1] == 'end'
+    assert len(results[0].logs.splitlines()) <= 51
+
+    messages = [x.getMessage() for x in records]
+    assert all(x.startswith(f'[{job.short_id}] ') for x in messages)
+    assert messages[0] == f'[{job.short_id}] frame=0'
+    assert 'suppressed' in messages[-2] and messages[-1].endswith('end')
+    assert len(messages) < 500
+
+
+def test_output_without_line_breaks_is_truncated(backlog_settings, wait_until):
+    launcher = ScriptLauncher(1, None, backlog_settings)
+    results = []
+    launcher.script_done.connect(results.append)
+
+    # A few megabytes on a single line
+    launcher.launch([sys.executable, '-c', 'import sys\nsys.stdout.write("x" * 5000000)\nprint()\nprint("end")'])
+    wait_until(lambda: launcher.idle, 15000)
+
+    assert len(results) == 1 and results[0].success
+    lines = results[0].logs.splitlines()
+    assert lines[-1] == 'end'
+    assert lines[-2].endswith('…') and len(lines[-2]) < 2000
+
+
+def test_timeout_kills_the_children_holding_the_output(backlog_settings, wait_until):
+    launcher = ScriptLauncher(1, 0.5, backlog_settings)
+    results = []
+    launcher.script_done.connect(results.append)
+
+    # Like a script starting ffmpeg: the child inherits the output pipe and outlives the timeout
+    child = 'import time; time.sleep(30)'
+    script = f'import subprocess, sys, time\nsubprocess.Popen([sys.executable, "-c", "{child}"])\ntime.sleep(30)'
+    started = time.monotonic()
+    launcher.launch([sys.executable, '-c', script])
+    wait_until(lambda: launcher.idle, 15000)
+
+    assert time.monotonic() - started < 10
+    assert len(results) == 1 and results[0].timed_out
@@ -0,0 +1,37 @@
+"""
+Synthetic EDID blobs for the display tests
+"""
+
+import struct
+
+from obs_scene_helper.model.display.edid import HEADER
+
+
+def make_descriptor(tag: int, text: str) -> bytes:
+    payload = text.encode('ascii')[:13]
+    if len(payload) < 13:
+        payload += b'\x0a' + b'\x20' * (12 - len(payload))
+    return b'\x00\x00\x00' + bytes([tag, 0]) + payload
+
+
+def make_edid(manufacturer='DEL', product_code=0xA0B1, serial_number=0, name=None, serial=None) -> bytes:
+    packed = 0
+    for letter in manufacturer:
+        packed = (packed << 5) | (ord(letter) - ord('A') + 1)
+
+    data = bytearray(HEADER + struct.pack('>H', packed) + struct.pack('<HI', product_code, serial_number))
+    data += bytes(54 - len(data))
+
+    descriptors = [b'\x01\x1d' + bytes(16)]  # Detailed timing descriptor
+    if name is not None:
+        descriptors.append(make_descriptor(0xFC, name))
+    if serial is not None:
+        descriptors.append(make_descriptor(0xFF, serial))
+    while len(descriptors) < 4:
+        descriptors.append(b'\x00\x00\x00\x10' + bytes(14))  # Dummy descriptor
+
+    for descriptor in descriptors:
+        data += descriptor
+
+    data += bytes(128 - len(data))
+    return bytes(data)
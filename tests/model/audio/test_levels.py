@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from obs_scene_helper.model.audio.levels import LevelHistory, decode_volume_meters, MIN_DB
+
+
+def _frame(name: str, *channels: tuple[float, float]) -> dict:
+    return {'inputName': name, 'inputLevelsMul': [[mag, peak, peak] for mag, peak in channels]}
+
+
+def test_decode_picks_loudest_channel():
+    names, magnitudes, peaks = decode_volume_meters([
+        _frame('mic', (0.1, 0.2), (0.3, 0.4)),
+        _frame('muted'),
+        _frame('desktop', (0.5, 0.6)),
+    ])
+
+    assert names == ['mic', 'desktop']
+    assert np.allclose(magnitudes, [0.3, 0.5])
+    assert np.allclose(peaks, [0.4, 0.6])
+
+
+def test_decode_empty():
+    names, magnitudes, peaks = decode_volume_meters([])
+    assert names == []
+    assert len(magnitudes) == 0 and len(peaks) == 0
+
+
+def test_statistics_window_and_silence():
+    history = LevelHistory(capacity=100)
+
+    # One second of a loud mic, followed by one second of silence, 20 frames per second
+    for i in range(40):
+        level = 1.0 if i < 20 else 0.0
+        history.append(i * 0.05, ['mic'], np.array([level]), np.array([level]))
+
+    stats = history.statistics(window=5.0, silence_threshold_db=-50)['mic']
+    assert stats.peak_db == pytest.approx(0.0)
+    assert stats.rms_db == pytest.approx(20 * np.log10(np.sqrt(0.5)), abs=0.01)
+    assert stats.current_db == pytest.approx(MIN_DB)
+    assert stats.silent_ratio == pytest.approx(0.5)
+    assert stats.silent_for == pytest.approx(1.0)
+    assert stats.loud_at == pytest.approx(0.0)
+    assert stats.updated_at == pytest.approx(1.95)
+
+    # Only the silent part
+    stats = history.statistics(window=0.5, silence_threshold_db=-50)['mic']
+    assert stats.peak_db == pytest.approx(MIN_DB)
+    assert stats.silent_ratio == pytest.approx(1.0)
+    assert stats.silent_for == pytest.approx(0.5)
+    assert stats.loud_at is None
+
+
+def test_ring_wraps_and_grows():
+    history = LevelHistory(capacity=10, rows=1)
+
+    for i in range(25):
+        # Inputs missing from a frame are recorded as silent
+        names = ['a', 'b'] if i % 2 == 0 else ['a']
+        history.append(float(i), names, np.full(len(names), 0.5), np.full(len(names), 0.5))
+
+    assert len(history) == 10
+    assert history.names == ['a', 'b']
+
+    stats = history.statistics(window=100.0, silence_threshold_db=-20)
+    assert stats['a'].silent_ratio == pytest.approx(0.0)
+    assert stats['b'].silent_ratio == pytest.approx(0.5)
+    assert stats['b'].silent_for == pytest.approx(0.0)
+
+    history.forget('b')
+    assert history.names == ['a']
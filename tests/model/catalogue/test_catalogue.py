@@ -0,0 +1,69 @@
+from obs_scene_helper.model.catalogue.recorder import CatalogueRecorder
+from obs_scene_helper.model.catalogue.store import connect, apply_batch, find_segments, known_presets, SegmentQuery
+from obs_scene_helper.model.catalogue.store import SessionStarted, SegmentStarted, SegmentEnded, SessionEnded
+
+DAY = 24 * 3600
+
+
+def test_recorder_sessions_and_segments():
+    recorder = CatalogueRecorder()
+    recorder.profile_changed('Default')
+    assert [type(x).__name__ for x in recorder.preset_activated('Desk', 'Work', 'Main', 0.0)] == ['EventRecorded']
+
+    ops = recorder.recording_state_changed('active', 1.0)
+    assert isinstance(ops[0], SessionStarted) and ops[0].preset == 'Desk' and ops[0].profile == 'Work'
+    session = recorder.session
+
+    ops = recorder.output_file_changed('/rec/a.mkv', 1.5)
+    assert ops == [SegmentStarted(session, '/rec/a.mkv', 1.5, 'Desk', 'Work', 'Main')]
+    assert recorder.output_file_changed('/rec/a.mkv', 1.6) == []
+
+    ops = recorder.output_file_changed('/rec/b.mkv', 10.0, previous_size=100)
+    assert ops[0] == SegmentEnded(session, '/rec/a.mkv', 10.0, 100)
+    assert isinstance(ops[1], SegmentStarted)
+
+    ops = recorder.recording_state_changed('stopped', 20.0, size=200)
+    assert ops[1:] == [SegmentEnded(session, '/rec/b.mkv', 20.0, 200), SessionEnded(session, 20.0)]
+    assert recorder.session is None
+
+    # No session to stop
+    assert recorder.recording_state_changed('stopped', 21.0) == []
+
+
+def test_store_queries(tmp_path):
+    conn = connect(str(tmp_path / 'catalogue.sqlite3'))
+
+    recorder = CatalogueRecorder()
+    ops = []
+    for day in range(3):
+        preset = 'Desk' if day % 2 == 0 else 'Laptop'
+        ops += recorder.preset_activated(preset, 'p', 'sc', day * DAY)
+        ops += recorder.recording_state_changed('active', day * DAY)
+        ops += recorder.output_file_changed(f'/rec/{day}-a.mkv', day * DAY)
+        ops += recorder.output_file_changed(f'/rec/{day}-b.mkv', day * DAY + 60, 1000)
+        ops += recorder.recording_state_changed('stopped', day * DAY + 60 + day * 600, 2000)
+    apply_batch(conn, ops)
+
+    # Reopening keeps the data
+    conn.close()
+    conn = connect(str(tmp_path / 'catalogue.sqlite3'))
+
+    everything = find_segments(conn, SegmentQuery())
+    assert [x.path for x in everything][:2] == ['/rec/2-b.mkv', '/rec/2-a.mkv']
+    assert len(everything) == 6
+
+    assert [x.path for x in find_segments(conn, SegmentQuery(since=DAY, until=2 * DAY))] == ['/rec/1-b.mkv',
+                                                                                           '/rec/1-a.mkv']
+    assert {x.path for x in find_segments(conn, SegmentQuery(preset='Desk'))} == {'/rec/0-a.mkv', '/rec/0-b.mkv',
+                                                                                  '/rec/2-a.mkv', '/rec/2-b.mkv'}
+    assert [x.path for x in find_segments(conn, SegmentQuery(min_duration=120))] == ['/rec/2-b.mkv', '/rec/1-b.mkv']
+    assert [x.path for x in find_segments(conn, SegmentQuery(text='1-'))] == ['/rec/1-b.mkv', '/rec/1-a.mkv']
+    assert find_segments(conn, SegmentQuery(text='%')) == []
+    assert known_presets(conn) == ['Desk', 'Laptop']
+
+    segment = find_segments(conn, SegmentQuery(text='0-a'))[0]
+    assert (segment.duration, segment.size, segment.profile) == (60, 1000, 'p')
+
+    plan = ' '.join(str(x) for x in conn.execute('EXPLAIN QUERY PLAN SELECT path FROM segments WHERE preset = ? '
+                                                 'ORDER BY started_at DESC', ('Desk',)))
+    assert 'segments_preset' in plan
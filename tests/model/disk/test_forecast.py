@@ -0,0 +1,58 @@
+from obs_scene_helper.model.disk.forecast import DiskForecaster, DiskSample, HorizonAlarm
+
+MB = 1000 * 1000
+
+
+def test_forecast_from_free_space_and_file_growth():
+    forecaster = DiskForecaster(window=60)
+    assert forecaster.time_to_full is None
+
+    # 10 MB/s according to the free space
+    for t in range(0, 10, 5):
+        forecaster.add(DiskSample(t, 2000 * MB - t * 10 * MB))
+    assert forecaster.rate is None  # Not enough history yet
+
+    for t in range(10, 121, 5):
+        forecaster.add(DiskSample(t, 2000 * MB - t * 10 * MB))
+    assert forecaster.rate == 10 * MB
+    assert forecaster.time_to_full == 80
+
+    # The file grows faster than the free space declines (e.g. something else freed some space), with a split
+    forecaster.reset()
+    sizes = [0, 100, 200, 300, 0, 100, 200]
+    for i, size in enumerate(sizes):
+        forecaster.add(DiskSample(i * 10, 900 * MB, size * MB))
+    assert forecaster.rate == 500 * MB / 60
+    assert forecaster.time_to_full == 900 * MB / (500 * MB / 60)
+
+    # Nothing written
+    forecaster.reset()
+    for i in range(10):
+        forecaster.add(DiskSample(i * 10, 900 * MB, 0))
+    assert forecaster.rate == 0
+    assert forecaster.time_to_full is None
+
+
+def test_window_drops_old_samples():
+    forecaster = DiskForecaster(window=30)
+    for t in range(0, 100, 10):
+        forecaster.add(DiskSample(t, 0 if t < 50 else 1000 - t))
+    assert forecaster.rate == 1.0
+
+
+def test_horizon_alarm():
+    alarm = HorizonAlarm([600, 1800])
+    assert alarm.update(None) is None
+    assert alarm.update(3600) is None
+    assert alarm.update(1700) == 1800
+    assert alarm.update(1600) is None
+
+    # Jumping over a horizon reports the smallest one
+    assert alarm.update(500) == 600
+    assert alarm.update(400) is None
+
+    # Re-armed once well above
+    assert alarm.update(650) is None
+    assert alarm.update(590) is None
+    assert alarm.update(800) is None
+    assert alarm.update(590) == 600
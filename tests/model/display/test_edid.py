@@ -0,0 +1,30 @@
+import pytest
+
+from obs_scene_helper.model.display.edid import InvalidEdid, parse_edid
+
+from tests.edid import make_edid
+
+
+def test_parse_edid():
+    edid = parse_edid(make_edid('DEL', 0xA0B1, 1234, 'DELL U2415', 'ABC123'))
+    assert edid.manufacturer == 'DEL'
+    assert edid.product_code == 0xA0B1
+    assert edid.serial_number == 1234
+    assert edid.name == 'DELL U2415'
+    assert edid.serial == 'ABC123'
+    assert edid.device_serial == 'ABC123'
+
+
+def test_parse_edid_without_descriptors():
+    edid = parse_edid(make_edid('GSM', 0x1, 42))
+    assert edid.name is None
+    assert edid.serial is None
+    assert edid.device_serial == '42'
+
+
+def test_parse_invalid_edid():
+    with pytest.raises(InvalidEdid):
+        parse_edid(b'')
+
+    with pytest.raises(InvalidEdid):
+        parse_edid(bytes(128))
@@ -0,0 +1,51 @@
+import pytest
+
+from obs_scene_helper.model.display.settle import SettleWindow
+
+
+def test_initial_window_until_enough_samples():
+    window = SettleWindow(initial=2.0, minimum=0.5, maximum=10.0, min_samples=3)
+    assert window.window == 2.0
+
+    for ts in [0.0, 0.1, 0.2]:
+        window.change(ts)
+
+    # Two gaps only
+    assert window.window == 2.0
+
+    window.change(0.3)
+    assert window.window == pytest.approx(0.5)  # 0.1 * 1.5 is clamped to the minimum
+
+
+def test_window_follows_largest_burst_gap():
+    window = SettleWindow(initial=2.0, minimum=0.5, maximum=10.0, margin=1.5, min_samples=3)
+    for ts in [0.0, 0.4, 1.6, 2.0]:
+        window.change(ts)
+
+    assert window.window == pytest.approx(1.8)
+
+
+def test_gaps_between_bursts_are_ignored():
+    window = SettleWindow(initial=2.0, minimum=0.5, maximum=10.0, margin=1.0, min_samples=2)
+    for ts in [0.0, 1.0, 100.0, 101.0]:
+        window.change(ts)
+
+    assert window.window == pytest.approx(1.0)
+
+
+def test_window_is_clamped_to_maximum():
+    window = SettleWindow(initial=2.0, minimum=0.5, maximum=10.0, margin=2.0, min_samples=1)
+    window.change(0.0)
+    window.change(9.0)
+    assert window.window == 10.0
+
+
+def test_old_samples_are_forgotten():
+    window = SettleWindow(initial=2.0, minimum=0.5, maximum=10.0, margin=1.0, samples=2, min_samples=1)
+    for ts in [0.0, 5.0, 6.0, 7.0]:
+        window.change(ts)
+
+    assert window.window == pytest.approx(1.0)
+
+    window.reset()
+    assert window.window == 2.0
@@ -0,0 +1,46 @@
+import numpy as np
+
+from obs_scene_helper.model.image.freeze import FreezeDetector
+
+STILL = np.array([0b10101010], dtype=np.uint8)
+NOISY = np.array([0b10101011], dtype=np.uint8)
+MOVING = np.array([0b01010101], dtype=np.uint8)
+
+
+def test_sources_are_flagged_once_after_the_window():
+    detector = FreezeDetector(window=30, max_distance=1)
+
+    assert detector.update({'cam': STILL, 'screen': STILL}, 0.0) == ([], [])
+    assert detector.update({'cam': NOISY, 'screen': MOVING}, 20.0) == ([], [])
+
+    # "screen" changed at 20 s, so only "cam" has been unchanged (within the allowed distance) for the whole window
+    assert detector.update({'cam': STILL, 'screen': MOVING}, 30.0) == (['cam'], [])
+    assert detector.is_frozen('cam') and not detector.is_frozen('screen')
+
+    # No repeated alerts while it stays frozen
+    assert detector.update({'cam': STILL, 'screen': MOVING}, 40.0) == ([], [])
+    assert detector.update({'cam': STILL, 'screen': MOVING}, 50.0) == (['screen'], [])
+
+
+def test_changed_picture_thaws_the_source():
+    detector = FreezeDetector(window=10, max_distance=0)
+    detector.update({'cam': STILL}, 0.0)
+    assert detector.update({'cam': STILL}, 10.0) == (['cam'], [])
+
+    assert detector.update({'cam': MOVING}, 15.0) == ([], ['cam'])
+    assert detector.update({'cam': MOVING}, 20.0) == ([], [])
+    assert detector.update({'cam': MOVING}, 25.0) == (['cam'], [])
+
+
+def test_missing_samples_keep_the_state_and_rearm_restarts_the_window():
+    detector = FreezeDetector(window=10, max_distance=0)
+    detector.update({'cam': STILL}, 0.0)
+
+    # The screenshot failed: nothing changes
+    assert detector.update({}, 8.0) == ([], [])
+    assert detector.update({'cam': STILL}, 10.0) == (['cam'], [])
+
+    detector.rearm(['cam', 'unknown'], 12.0)
+    assert not detector.is_frozen('cam')
+    assert detector.update({'cam': STILL}, 20.0) == ([], [])
+    assert detector.update({'cam': STILL}, 22.0) == (['cam'], [])
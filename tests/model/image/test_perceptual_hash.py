@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from obs_scene_helper.model.image.perceptual_hash import downscale, difference_hash, hamming_distance
+
+
+def test_downscale_averages_blocks():
+    image = np.array([[0, 2, 4, 6],
+                      [2, 4, 6, 8]], dtype=np.uint8)
+
+    assert np.array_equal(downscale(image, 1, 2), np.array([[2, 6]], dtype=np.float32))
+    assert np.array_equal(downscale(image, 2, 4), image.astype(np.float32))
+
+    with pytest.raises(ValueError):
+        downscale(image, 3, 2)
+
+
+def test_difference_hash_size():
+    image = np.random.default_rng(1).integers(0, 255, (18, 32), dtype=np.uint8)
+
+    assert difference_hash(image).shape == (8,)
+    assert difference_hash(image, 16).shape == (32,)
+
+
+def test_difference_hash_is_stable():
+    rng = np.random.default_rng(2)
+    image = rng.integers(0, 255, (18, 32), dtype=np.uint8)
+
+    # Same picture - same hash, even with a tiny amount of noise
+    noisy = np.clip(image.astype(np.int16) + rng.integers(-1, 2, image.shape), 0, 255).astype(np.uint8)
+    assert hamming_distance(difference_hash(image), difference_hash(image)) == 0
+    assert hamming_distance(difference_hash(image), difference_hash(noisy)) <= 4
+
+    # Different picture - different hash
+    other = rng.integers(0, 255, (18, 32), dtype=np.uint8)
+    assert hamming_distance(difference_hash(image), difference_hash(other)) > 8
+
+
+def test_hamming_distance_stacked():
+    first = np.array([[0b00000000], [0b11110000]], dtype=np.uint8)
+    second = np.array([[0b00000001], [0b00001111]], dtype=np.uint8)
+
+    assert hamming_distance(first, second).tolist() == [1, 8]
@@ -0,0 +1,34 @@
+import math
+
+from obs_scene_helper.model.metrics.metric import Counter, Gauge, Timing
+
+
+def test_counter():
+    counter = Counter('requests')
+    counter.increment()
+    counter.increment(2)
+    assert counter.value == 3
+
+
+def test_gauge():
+    gauge = Gauge('queue')
+    gauge.set(3)
+    gauge.set(1)
+    assert gauge.value == 1
+    assert gauge.max == 3
+
+
+def test_timing():
+    timing = Timing('latency')
+    assert math.isnan(timing.mean)
+    assert str(timing) == 'latency: no samples'
+
+    for value in [0.3, 0.1, 0.2]:
+        timing.add(value)
+
+    assert timing.count == 3
+    assert math.isclose(timing.mean, 0.2)
+    assert timing.min == 0.1
+    assert timing.max == 0.3
+    assert timing.last == 0.2
+    assert str(timing) == 'latency: last 200 ms, mean 200 ms, min 100 ms, max 300 ms (3 samples)'
@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+
+from obs_scene_helper.model.metrics.obs_stats import FIELDS, make_sample, summarize, interval_skip
+from obs_scene_helper.model.metrics.series import SeriesBuffer
+
+
+def test_series_buffer_wraps_around():
+    series = SeriesBuffer(['a', 'b'], 4)
+    assert len(series) == 0
+    assert math.isnan(series.latest('a'))
+    assert series.aggregate('a').count == 0
+
+    for i in range(6):
+        series.append(float(i), {'a': i} if i != 4 else {'b': 1.0})
+
+    assert len(series) == 4
+    assert list(series.timestamps()) == [2.0, 3.0, 4.0, 5.0]
+    assert np.array_equal(series.values('a'), [2.0, 3.0, np.nan, 5.0], equal_nan=True)
+
+    aggregate = series.aggregate('a', window=2.5)
+    assert (aggregate.count, aggregate.min, aggregate.max, aggregate.total, aggregate.last) == (2, 3.0, 5.0, 8.0, 5.0)
+    assert series.aggregate('b').total == 1.0
+
+
+def stats(render_skipped: int, render_total: int, output_skipped: int, output_total: int) -> dict:
+    return {'cpuUsage': 10.0, 'memoryUsage': 500.0, 'activeFps': 60.0, 'averageFrameRenderTime': 2.0,
+            'availableDiskSpace': 1000.0, 'renderSkippedFrames': render_skipped, 'renderTotalFrames': render_total,
+            'outputSkippedFrames': output_skipped, 'outputTotalFrames': output_total}
+
+
+def test_samples_and_summary():
+    series = SeriesBuffer(FIELDS, 100)
+    previous = {}
+
+    # 60 frames per sample, 6 of them skipped by the encoder in the last two samples, 1 MB per sample
+    for i, skipped in enumerate([0, 0, 6, 12]):
+        record_status = {'outputActive': True, 'outputBytes': i * 10 ** 6}
+        series.append(float(i), make_sample(stats(0, i * 60, skipped, i * 60), record_status, previous))
+
+    snapshot = summarize(series, 10.0)
+    assert snapshot.cpu == 10.0
+    assert snapshot.render_skip == 0.0
+    assert snapshot.output_skip == 12 / 180 * 100
+    assert snapshot.output_frames == 180
+    assert snapshot.record_bitrate == 8000.0
+    assert np.array_equal(interval_skip(series, 'output_skipped', 'output_frames'), [np.nan, 0, 10, 10],
+                          equal_nan=True)
+
+    # OBS restarted: the totals start from zero, no difference for that sample
+    sample = make_sample(stats(0, 10, 0, 10), {'outputActive': False}, previous)
+    assert 'render_frames' not in sample
+    assert 'record_bytes' not in sample
+    assert make_sample(stats(0, 20, 0, 20), {'outputActive': False}, previous)['render_frames'] == 10
@@ -0,0 +1,35 @@
+import pytest
+
+from obs_scene_helper.model.metrics.trace import SpanKind, Trace, TraceBuffer
+
+
+def test_trace_spans():
+    trace = Trace(1, 'switch')
+    trace.enter('GracePeriod', SpanKind.Timer, now=0.0)
+    trace.enter('StoppingRecording', SpanKind.OBS, now=5.0)
+    trace.enter('GracePeriod', SpanKind.Timer, now=5.5)
+    assert not trace.finished
+    assert trace.current.name == 'GracePeriod'
+
+    trace.finish('activated', now=6.0)
+    assert trace.finished
+    assert trace.current is None
+    assert trace.duration == pytest.approx(6.0)
+    assert trace.by_phase() == pytest.approx({'GracePeriod': 5.5, 'StoppingRecording': 0.5})
+
+    by_kind = trace.by_kind()
+    assert by_kind[SpanKind.Timer] == pytest.approx(5.5)
+    assert by_kind[SpanKind.OBS] == pytest.approx(0.5)
+    assert by_kind[SpanKind.Local] == 0.0
+
+
+def test_trace_buffer_keeps_last_entries():
+    buffer = TraceBuffer(2)
+    traces = [buffer.new_trace('switch') for _ in range(3)]
+    assert [x.trace_id for x in traces] == [1, 2, 3]
+
+    for trace in traces:
+        buffer.add(trace)
+
+    assert buffer.full
+    assert [buffer[i].trace_id for i in range(len(buffer))] == [2, 3]
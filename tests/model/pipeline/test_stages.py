@@ -0,0 +1,67 @@
+import hashlib
+import multiprocessing
+import sys
+
+from obs_scene_helper.model.pipeline.stages import PipelineConfig, process_file
+from obs_scene_helper.model.pipeline.throttle import BandwidthLimiter
+
+
+def test_bandwidth_limiter():
+    unlimited = BandwidthLimiter(0)
+    assert unlimited.consume(10 ** 9, 0.0) == 0.0
+
+    limiter = BandwidthLimiter(100.0)
+    assert limiter.consume(50, 0.0) == 0.5
+
+    # Reading right away has to wait for the previous chunk as well
+    assert limiter.consume(50, 0.0) == 1.0
+
+    # The budget doesn't accumulate while idle
+    assert limiter.consume(100, 10.0) == 1.0
+
+
+def test_bandwidth_limiter_shared_between_readers():
+    free_at = multiprocessing.Value('d', 0.0)
+    first = BandwidthLimiter(100.0, free_at)
+    second = BandwidthLimiter(100.0, free_at)
+
+    # Both readers draw from the same budget
+    assert first.consume(50, 1.0) == 0.5
+    assert second.consume(50, 1.0) == 1.0
+    assert first.consume(100, 1.5) == 1.5
+    assert free_at.value == 3.0
+
+
+def test_process_file(tmp_path):
+    data = bytes(range(256)) * 1000
+    path = tmp_path / 'rec.mkv'
+    path.write_bytes(data)
+
+    progress = []
+    sleeps = []
+    config = PipelineConfig(min_size=1000, bandwidth=100000.0, chunk_size=100000,
+                            command=f'"{sys.executable}" -c "import sys; assert sys.argv[1].endswith(\'.mkv\')"')
+    report = process_file(str(path), config, lambda done, total: progress.append((done, total)), sleeps.append,
+                          clock=lambda: 0.0)
+
+    assert report.success, report.summary
+    assert report.size == len(data)
+    assert report.digest == hashlib.sha256(data).hexdigest()
+    assert (tmp_path / 'rec.mkv.sha256').read_text() == f'{report.digest} *rec.mkv\n'
+    assert progress == [(100000, 256000), (200000, 256000), (256000, 256000)]
+    assert sleeps == [1.0, 2.0, 2.56]
+
+
+def test_process_file_failures(tmp_path):
+    path = tmp_path / 'short.mkv'
+    path.write_bytes(b'x' * 10)
+
+    failing = f'"{sys.executable}" -c "raise SystemExit(3)"'
+    report = process_file(str(path), PipelineConfig(hash_algorithm='', min_size=100, command=failing))
+    assert not report.success
+    assert [x.stage for x in report.results if not x.success] == ['size', 'command']
+    assert report.results[-1].message.startswith('Exit code 3')
+
+    missing = process_file(str(tmp_path / 'missing.mkv'), PipelineConfig())
+    assert not missing.success
+    assert missing.results[0].stage == 'read'
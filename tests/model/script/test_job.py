@@ -0,0 +1,42 @@
+import json
+
+from pytest_mock import MockerFixture
+
+from obs_scene_helper.model.script.job import Job, JobBacklog
+
+
+def test_job_to_and_from_dict_conversion():
+    original = Job('1', ['script.sh', 'file.mkv'], 10.0)
+    assert original.to_dict() == {'job_id': '1', 'command': ['script.sh', 'file.mkv'], 'created_at': 10.0}
+    assert Job.from_dict(json.loads(json.dumps(original.to_dict()))) == original
+
+
+def test_job_make():
+    first = Job.make(['a'])
+    second = Job.make(['a'])
+    assert first.job_id != second.job_id
+    assert len(first.short_id) == 8
+
+
+def test_backlog(mocker: MockerFixture):
+    on_change_callback = mocker.Mock()
+    backlog = JobBacklog([], on_change_callback)
+
+    jobs = [Job(str(i), ['script.sh', f'{i}.mkv'], float(i)) for i in range(3)]
+    for job in jobs:
+        backlog.add(job)
+    assert on_change_callback.call_count == 3
+    assert backlog.jobs == jobs
+
+    backlog.remove('1')
+    assert backlog.jobs == [jobs[0], jobs[2]]
+
+    # Unknown jobs are ignored
+    on_change_callback.reset_mock()
+    backlog.remove('1')
+    on_change_callback.assert_not_called()
+
+    # Order is preserved across restarts
+    restored = JobBacklog.from_dict(json.loads(json.dumps(backlog.to_dict())), None)
+    assert restored.jobs == [jobs[0], jobs[2]]
+    assert JobBacklog.from_dict({}, None).jobs == []
@@ -0,0 +1,31 @@
+from obs_scene_helper.model.script.output import LineThrottle, OutputTail
+
+
+def test_throttle_allows_bursts_then_limits_the_rate():
+    throttle = LineThrottle(rate=10.0, burst=5)
+
+    # 100 lines within 10 ms: only the burst gets through
+    allowed = [throttle.allow(i * 0.0001) for i in range(100)]
+    assert sum(allowed) == 5
+    assert throttle.take_suppressed() == 95
+    assert throttle.take_suppressed() == 0
+
+    # Refills at the configured rate
+    assert throttle.allow(0.11)
+    assert not throttle.allow(0.11)
+    assert throttle.allow(0.22)
+
+    # Never accumulates more than the burst
+    assert sum(throttle.allow(100.0 + i * 0.0001) for i in range(20)) == 5
+
+
+def test_output_tail():
+    tail = OutputTail(max_lines=3, max_line_length=5)
+    assert tail.add('12345678\n') == '12345…'
+
+    for line in ['a\n', 'b\r\n', 'c']:
+        tail.add(line)
+
+    assert tail.lines == ['a', 'b', 'c']
+    assert tail.total_lines == 4
+    assert str(tail) == '[1 earlier lines omitted]\na\nb\nc'
@@ -3,12 +3,13 @@ import pytest
 from pytest_mock import MockerFixture
 
 from obs_scene_helper.model.settings.all_displays import AllDisplays
+from obs_scene_helper.model.display.identity import DisplayIdentity, fingerprint_of
 
 
 def test_to_and_from_dict_conversion():
     original = AllDisplays(['1', '2'], None)
     encoded = original.to_dict()
-    assert encoded == {'all_displays': ['1', '2']}
+    assert encoded == {'all_displays': ['1', '2'], 'fingerprints': {}}
 
     # Ensure we can convert to JSON and back
     encoded_json = json.dumps(encoded)
@@ -68,3 +69,24 @@ def test_update(mocker: MockerFixture):
     original.update(['1'])
     on_change_callback.assert_not_called()
     assert len(original.all_displays) == 4
+
+
+def test_fingerprints(mocker: MockerFixture):
+    on_change_callback = mocker.Mock()
+    all_displays = AllDisplays(['1'], on_change_callback)
+    assert all_displays.fingerprint_for('1') == fingerprint_of('1')
+
+    dell = DisplayIdentity('2', 'DEL', 'DELL U2415', 'ABC')
+    all_displays.update([DisplayIdentity('1'), dell])
+    on_change_callback.assert_called_once()
+    assert all_displays.fingerprint_for('2') == dell.fingerprint
+
+    # A different monitor seen under the same name
+    on_change_callback.reset_mock()
+    lg = DisplayIdentity('2', 'GSM', 'LG HDR 4K', 'XYZ')
+    all_displays.update([lg])
+    on_change_callback.assert_called_once()
+    assert all_displays.fingerprint_for('2') == lg.fingerprint
+
+    decoded = AllDisplays.from_dict(all_displays.to_dict(), None)
+    assert decoded.fingerprint_for('2') == lg.fingerprint
@@ -0,0 +1,14 @@
+from obs_scene_helper.model.settings.osh import OSH
+
+
+def test_hash_size_fits_the_thumbnail():
+    assert OSH.FrozenSources(thumbnail_size=32, hash_size=8).effective_hash_size == 8
+    assert OSH.FrozenSources(thumbnail_size=16, hash_size=16).effective_hash_size == 15
+    assert OSH.FrozenSources(thumbnail_size=2, hash_size=8).effective_hash_size == 1
+
+
+def test_frozen_sources_only_reported_by_default():
+    osh = OSH.make_default(None)
+    assert not osh.frozen_sources.auto_fix
+    settings = {'macos': {}, 'frozen_sources': {'enabled': True}}
+    assert not OSH.from_json_dict(settings, None).frozen_sources.auto_fix
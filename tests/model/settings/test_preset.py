@@ -1,15 +1,19 @@
 import json
+import time
+
 import pytest
 from pytest_mock import MockerFixture
 
 from obs_scene_helper.model.settings.preset import *
+from obs_scene_helper.model.display.identity import DisplayIdentity, fingerprints_of
 
 
 def test_preset_to_and_from_dict_conversion():
     original = Preset('1', 'n', ['d1', 'd2'], 'p', 'sc')
     encoded = original.to_dict()
 
-    assert encoded == {'uuid': '1', 'name': 'n', 'displays': ['d1', 'd2'], 'profile': 'p', 'scene_collection': 'sc'}
+    assert encoded == {'uuid': '1', 'name': 'n', 'displays': ['d1', 'd2'],
+                       'fingerprints': fingerprints_of(['d1', 'd2']), 'profile': 'p', 'scene_collection': 'sc'}
 
     # Ensure we can convert to JSON and back
     encoded_json = json.dumps(encoded)
@@ -204,3 +208,171 @@ def test_preset_list_to_and_from_dict_conversion():
 def test_str_convertible():
     p = Preset('1', 'n', ['d1', 'd2'], 'p', 'sc')
     assert p.name == str(p)
+
+
+def test_preset_list_display_key_is_case_and_order_insensitive():
+    preset = Preset('1', 'n', ['Dell U2720Q', 'built-in'], 'p', 'sc')
+    preset_list = PresetList([preset], None)
+
+    assert preset_list.find_matching(['BUILT-IN', 'dell u2720q']) is preset
+    assert preset_list.find_matching(['Built-in']) is None
+
+    with pytest.raises(NonUniquePreset):
+        preset_list.add(Preset('2', 'n2', ['built-in', 'DELL U2720Q'], 'p', 'sc'))
+
+
+def test_preset_list_index_follows_updates_and_removals():
+    p1 = Preset('1', 'n1', ['d1'], 'p', 'sc')
+    p2 = Preset('2', 'n2', ['d2'], 'p', 'sc')
+    preset_list = PresetList([p1, p2], None)
+
+    preset_list.update(p1, Preset('x', 'n3', ['d3'], 'p', 'sc'))
+    assert preset_list.find_matching(['d1']) is None
+    assert preset_list.find_matching(['d3']) is p1
+
+    # The old name and display set are free again
+    preset_list.add(Preset('3', 'n1', ['d1'], 'p', 'sc'))
+
+    preset_list.remove(p2)
+    assert preset_list.find_matching(['d2']) is None
+    preset_list.add(Preset('4', 'n2', ['d2'], 'p', 'sc'))
+
+
+def test_preset_list_many_presets():
+    # Presets for all the combinations of docks and monitors
+    count = 5000
+    presets = [Preset(str(i), f'preset {i}', [f'Dock {i % 50}', f'Monitor {i // 50}', 'Built-in'], 'p', 'sc')
+               for i in range(count)]
+
+    preset_list = PresetList([], None)
+    for preset in presets:
+        preset_list.add(preset)
+
+    for i in range(count):
+        assert preset_list.find_matching(['built-in', f'monitor {i // 50}', f'dock {i % 50}']) is presets[i]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('count', [100, 1000, 5000, 20000])
+def test_preset_list_benchmark(capsys, count):
+    presets = [Preset(str(i), f'preset {i}', [f'Dock {i % 50}', f'Monitor {i // 50}', 'Built-in'], 'p', 'sc')
+               for i in range(count)]
+    lookups = [['built-in', f'monitor {i // 50}', f'dock {i % 50}'] for i in range(count)]
+
+    started = time.perf_counter()
+    preset_list = PresetList([], None)
+    for preset in presets:
+        preset_list.add(preset)
+    added = time.perf_counter()
+    for i, lookup in enumerate(lookups):
+        assert preset_list.find_matching(lookup) is presets[i]
+    matched = time.perf_counter()
+
+    with capsys.disabled():
+        print(f"\n{count} presets: add {(added - started) / count * 1e6:.1f} us/preset, "
+              f"find_matching {(matched - added) / count * 1e6:.1f} us/lookup")
+
+
+def test_preset_list_rank():
+    docked = Preset('1', 'docked', ['Built-in', 'Dell'], 'p', 'sc')
+    office = Preset('2', 'office', ['Built-in', 'Dell', 'LG'], 'p', 'sc')
+    mobile = Preset('3', 'mobile', ['Built-in'], 'p', 'sc')
+    tv = Preset('4', 'tv', ['TV'], 'p', 'sc')
+    preset_list = PresetList([docked, office, mobile, tv], None)
+
+    # An extra virtual display: "docked" is still the closest match
+    ranked = preset_list.rank(['built-in', 'dell', 'Virtual'])
+    assert [x.preset for x in ranked] == [docked, office, mobile]
+    assert ranked[0].score == pytest.approx(2 / 2.5)
+    assert (ranked[0].matched, ranked[0].missing, ranked[0].extra) == (2, 0, 1)
+    assert '"docked" scored 0.80' in ranked[0].explain()
+
+    # Extra displays can be penalized harder
+    ranked = preset_list.rank(['built-in', 'dell', 'Virtual'], MatchWeights(extra=2.0))
+    assert ranked[0].preset is docked
+    assert ranked[0].score == pytest.approx(0.5)
+
+    assert preset_list.rank(['Projector']) == []
+
+
+def test_preset_list_find_best_match():
+    docked = Preset('1', 'docked', ['Built-in', 'Dell'], 'p', 'sc')
+    preset_list = PresetList([docked], None)
+
+    assert preset_list.find_best_match(['DELL', 'built-in']).score == 1.0
+
+    # Exact matches only by default
+    assert preset_list.find_best_match(['Built-in', 'Dell', 'Virtual']) is None
+    assert preset_list.find_best_match(['Built-in', 'Dell', 'Virtual'], min_score=0.75).preset is docked
+    assert preset_list.find_best_match(['Built-in', 'Dell (2)'], min_score=0.75) is None
+
+    # The display index follows removals
+    preset_list.remove(docked)
+    assert preset_list.find_best_match(['Built-in', 'Dell', 'Virtual'], min_score=0.0) is None
+
+
+def test_preset_legacy_dict_gets_name_fingerprints():
+    decoded = Preset.from_dict({'uuid': '1', 'name': 'n', 'displays': ['d2', 'd1'], 'profile': 'p',
+                                'scene_collection': 'sc'})
+    assert decoded.displays == ['d1', 'd2']
+    assert decoded.fingerprints == fingerprints_of(['d1', 'd2'])
+
+
+def test_preset_matches_by_fingerprint():
+    dell = DisplayIdentity('\\\\.\\DISPLAY2', 'DEL', 'DELL U2415', 'ABC')
+    preset = Preset('1', 'docked', ['DELL U2415'], 'p', 'sc', [dell.fingerprint])
+    preset_list = PresetList([preset], None)
+
+    # Same monitor, reported under a different name
+    assert preset_list.find_matching([DisplayIdentity('\\\\.\\DISPLAY3', 'DEL', 'DELL U2415', 'ABC')]) is preset
+
+    # Same name, different monitor
+    assert preset_list.find_matching([DisplayIdentity(dell.name, 'DEL', 'DELL U2415', 'XYZ')]) is None
+
+
+def test_preset_list_migrate_fingerprints(mocker: MockerFixture):
+    legacy = Preset.from_dict({'uuid': '1', 'name': 'n', 'displays': ['Built-in', 'DISPLAY2'], 'profile': 'p',
+                               'scene_collection': 'sc'})
+    on_change_callback = mocker.Mock()
+    preset_list = PresetList([legacy], on_change_callback)
+
+    identities = [DisplayIdentity('built-in'), DisplayIdentity('DISPLAY2', 'DEL', 'DELL U2415', 'ABC')]
+    assert preset_list.find_matching(identities) is None
+
+    preset_list.migrate_fingerprints(identities)
+    on_change_callback.assert_called_once()
+    assert legacy.fingerprints == [fingerprints_of(['Built-in'])[0], identities[1].fingerprint]
+
+    # Matched by the hardware fingerprint from now on, no matter the name
+    assert preset_list.find_matching([identities[0], DisplayIdentity('DISPLAY7', 'DEL', 'DELL U2415', 'ABC')]) is legacy
+    assert preset_list.find_matching(['Built-in', 'DISPLAY2']) is None
+
+    # Already migrated
+    on_change_callback.reset_mock()
+    preset_list.migrate_fingerprints(identities)
+    on_change_callback.assert_not_called()
+
+
+def test_preset_migrate_fingerprints_needs_an_unambiguous_name():
+    legacy = Preset('1', 'n', ['DP-1', 'HDMI-1'], 'p', 'sc')
+
+    # Two connected displays answer to "DP-1"
+    identities = [DisplayIdentity('DP-1', 'DEL', 'DELL U2415', 'ABC'), DisplayIdentity('dp-1', 'GSM', 'LG', 'XYZ'),
+                  DisplayIdentity('HDMI-1', 'GSM', 'LG', 'XYZ')]
+    assert legacy.migrate_fingerprints(identities)
+    assert legacy.fingerprints == [fingerprints_of(['DP-1'])[0], identities[2].fingerprint]
+
+
+def test_identical_monitors_without_serials_are_interchangeable():
+    twins = [DisplayIdentity('DP-1', 'DEL', 'DELL U2415'), DisplayIdentity('DP-2', 'DEL', 'DELL U2415')]
+    assert twins[0].fingerprint == twins[1].fingerprint
+
+    legacy = Preset('1', 'n', ['DP-1', 'DP-2'], 'p', 'sc')
+    preset_list = PresetList([legacy], None)
+    preset_list.migrate_fingerprints(twins)
+    assert legacy.fingerprints == [twins[0].fingerprint] * 2
+
+    # Matched by count, whatever the connectors
+    assert preset_list.find_matching([DisplayIdentity('HDMI-1', 'DEL', 'DELL U2415'),
+                                      DisplayIdentity('DP-3', 'DEL', 'DELL U2415')]) is legacy
+    assert preset_list.find_matching(twins[:1]) is None
@@ -0,0 +1,49 @@
+import math
+
+from obs_scene_helper.model.switch.fallback import FallbackDecision, FallbackPolicy
+
+
+def make_policy() -> FallbackPolicy:
+    return FallbackPolicy(max_drop=5.0, restore_below=1.0, restore_after=60.0, cooldown=120.0)
+
+
+def test_falls_back_once_and_restores_after_a_quiet_period():
+    policy = make_policy()
+
+    assert policy.update(0.0, 4.0) is None
+    assert policy.update(2.0, math.nan) is None
+    assert policy.update(4.0, 8.0) == FallbackDecision.Fallback
+    assert policy.update(6.0, 9.0) is None
+
+    # Between the limits: neither dropping enough to matter nor quiet enough to go back
+    assert policy.update(130.0, 3.0) is None
+    assert policy.update(140.0, 0.5) is None
+    assert policy.update(180.0, 2.0) is None
+    assert policy.update(190.0, 0.5) is None
+    assert policy.update(249.0, 0.5) is None
+    assert policy.update(250.0, 0.5) == FallbackDecision.Restore
+    assert not policy.fallen_back
+
+
+def test_cooldown_delays_the_switches():
+    policy = make_policy()
+    assert policy.update(0.0, 10.0) == FallbackDecision.Fallback
+
+    # Quiet for long enough, but still cooling down
+    assert policy.update(10.0, 0.0) is None
+    assert policy.update(100.0, 0.0) is None
+    assert policy.update(120.0, 0.0) == FallbackDecision.Restore
+
+    # Dropping again right after switching back
+    assert policy.update(130.0, 10.0) is None
+    assert policy.update(240.0, 10.0) == FallbackDecision.Fallback
+
+
+def test_restoring_can_be_disabled():
+    policy = FallbackPolicy(max_drop=5.0, restore_below=1.0, restore_after=0.0, cooldown=0.0)
+    assert policy.update(0.0, 10.0) == FallbackDecision.Fallback
+    assert policy.update(1000.0, 0.0) is None
+
+    policy.reset()
+    assert not policy.fallen_back
+    assert policy.update(1001.0, 10.0) == FallbackDecision.Fallback
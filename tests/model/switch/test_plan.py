@@ -0,0 +1,40 @@
+import pytest
+
+from obs_scene_helper.model.settings.preset import Preset
+from obs_scene_helper.model.switch.plan import Step, plan_switch
+
+TARGET = Preset('uuid', 'Docked', ['Display 1'], 'Docked Profile', 'Docked Scenes')
+
+
+def test_already_active():
+    plan = plan_switch('Docked Profile', 'Docked Scenes', True, TARGET, True, 5.0)
+    assert plan.noop
+    assert plan.expected_gap == 0.0
+
+
+@pytest.mark.parametrize('can_split,expected', [
+    (True, [Step.SplitRecordFile, Step.SetSceneCollection]),
+    (False, [Step.SetSceneCollection]),
+])
+def test_scene_collection_swap_while_recording(can_split, expected):
+    plan = plan_switch('Docked Profile', 'Other Scenes', True, TARGET, can_split, 5.0)
+    assert plan.steps == expected
+    assert plan.expected_gap == 0.0
+
+
+def test_profile_change_while_recording_needs_restart():
+    plan = plan_switch('Other Profile', 'Docked Scenes', True, TARGET, True, 4.5)
+    assert plan.steps == [Step.StopRecording, Step.SetProfile, Step.StartRecording]
+    assert plan.expected_gap == 4.5
+
+    plan = plan_switch('Other Profile', 'Other Scenes', True, TARGET, True, 4.5)
+    assert plan.steps == [Step.StopRecording, Step.SetProfile, Step.SetSceneCollection, Step.StartRecording]
+
+
+def test_not_recording():
+    plan = plan_switch('Other Profile', 'Other Scenes', False, TARGET, True, 4.5)
+    assert plan.steps == [Step.SetProfile, Step.SetSceneCollection, Step.StartRecording]
+    assert plan.expected_gap == 0.0
+
+    plan = plan_switch('Docked Profile', 'Other Scenes', False, TARGET, True, 4.5)
+    assert plan.steps == [Step.SetSceneCollection, Step.StartRecording]